@@ -0,0 +1,189 @@
+"""
+Benchmark of rendering a Schedule of Activities table into a DOCX document with `table_to_docx`.
+
+A synthetic SoA of the given size is rendered with the previous python-docx object API based rendering,
+and with the rows of the table written as WordprocessingML by `DocxTableWriter`.
+Both documents are checked to be identical.
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Callable, Mapping
+
+from docx.shared import Inches
+from lxml import etree
+
+from clinical_mdr_api.services.studies.study_flowchart import DOCX_STYLES
+from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+from clinical_mdr_api.services.utils.table_f import (
+    Ref,
+    SimpleFootnote,
+    TableCell,
+    TableRow,
+    TableWithFootnotes,
+    table_to_docx,
+)
+
+
+def previous_table_to_docx(
+    table: TableWithFootnotes,
+    styles: Mapping[str, tuple[str, Any]] | None = None,
+    template: str | None = None,
+) -> DocxBuilder:
+    """Rendering of the table through the python-docx object API, as before `DocxTableWriter`."""
+    # pylint: disable=protected-access
+    num_cols = sum((c.span for c in table.rows[0].cells))
+    docx = DocxBuilder(
+        styles=styles, landscape=True, margins=[0.5, 0.5, 0.5, 0.5], template=template
+    )
+    x_table = docx.create_table(
+        num_rows=sum(1 for row in table.rows if not row.hide),
+        num_columns=num_cols,
+    )
+    x_table.columns[0].width = Inches(4)
+    x_cells = x_table._cells
+    x_rows = x_table.rows
+
+    for r, t_row in enumerate((row for row in table.rows if not row.hide)):
+        num_merge, merge_to = 0, None
+        if r < table.num_header_rows:
+            docx.repeat_table_header(x_rows[r])
+
+        for c, t_cell in enumerate(t_row.cells):
+            x_cell = x_cells[r * num_cols + c]
+            if num_merge:
+                merge_to.merge(x_cell)
+                num_merge -= 1
+                continue
+            if t_cell.span < 1:
+                continue
+
+            num_merge = t_cell.span - 1
+            merge_to = x_cell
+            x_para = x_cell.paragraphs[0]
+            if t_cell.text:
+                x_para.text = t_cell.text
+            style_name = styles.get(t_cell.style, [None])[0] if styles else None
+            if style_name:
+                x_para.style = style_name
+            if t_cell.vertical:
+                docx.set_vertical_cell_direction(x_cell, "btLr")
+            if t_cell.footnotes:
+                run = x_para.add_run(" ".join(t_cell.footnotes))
+                run.font.bold = True
+                run.font.superscript = True
+
+    if table.footnotes:
+        style_name = styles.get("footnote", [None])[0] if styles else None
+        for symbol, footnote in table.footnotes.items():
+            x_para = docx.document.add_paragraph(style=style_name)
+            run = x_para.add_run(symbol)
+            run.font.bold = True
+            run.font.superscript = True
+            x_para.add_run(footnote.text_plain)
+
+    return docx
+
+
+def mk_soa_table(num_rows: int, num_columns: int) -> TableWithFootnotes:
+    """Returns a protocol SoA like table, with epochs spanning several visits and a checkmark every third cell"""
+    epochs_row = TableRow([TableCell("Study epoch", style="header1")])
+    for column in range(1, num_columns, 4):
+        span = min(4, num_columns - column)
+        epochs_row.cells.append(
+            TableCell(f"Epoch {column // 4 + 1}", span=span, style="header1")
+        )
+        epochs_row.cells.extend(TableCell(span=0) for _ in range(span - 1))
+    visits_row = TableRow(
+        [TableCell("Visit short name", style="header2")]
+        + [
+            TableCell(f"V{column}", style="header2", vertical=column % 10 == 0)
+            for column in range(1, num_columns)
+        ]
+    )
+
+    rows = [epochs_row, visits_row]
+    for row in range(num_rows):
+        rows.append(
+            TableRow(
+                [
+                    TableCell(
+                        f"Activity {row}",
+                        style="activity",
+                        footnotes=["a"] if row % 25 == 0 else None,
+                    )
+                ]
+                + [
+                    (
+                        TableCell(
+                            "X",
+                            style="activitySchedule",
+                            refs=[Ref("StudyActivitySchedule", f"{row}-{column}")],
+                        )
+                        if (row + column) % 3 == 0
+                        else TableCell(style="activitySchedule")
+                    )
+                    for column in range(1, num_columns)
+                ],
+                hide=row % 50 == 49,
+            )
+        )
+
+    return TableWithFootnotes(
+        rows=rows,
+        footnotes={
+            "a": SimpleFootnote(
+                uid="StudySoAFootnote_000001",
+                text_html="<p>Footnote</p>",
+                text_plain="Footnote",
+            )
+        },
+        num_header_rows=2,
+        num_header_cols=1,
+    )
+
+
+def document_xml(docx: DocxBuilder) -> bytes:
+    # pylint: disable=protected-access
+    return etree.tostring(docx.document._element.body)
+
+
+def measure(
+    render: Callable[..., DocxBuilder], table: TableWithFootnotes, runs: int
+) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render(table, DOCX_STYLES).get_document_stream()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--columns", type=int, default=80)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    table = mk_soa_table(args.rows, args.columns)
+    assert document_xml(table_to_docx(table, DOCX_STYLES)) == document_xml(
+        previous_table_to_docx(table, DOCX_STYLES)
+    ), "The table is rendered differently"
+
+    for implementation, render in (
+        ("previous", previous_table_to_docx),
+        ("writer", table_to_docx),
+    ):
+        durations = measure(render, table, runs=args.runs)
+        print(
+            f"{args.rows} x {args.columns} SoA ({implementation}): "
+            f"median {statistics.median(durations) * 1000:.1f} ms, "
+            f"min {min(durations) * 1000:.1f} ms, "
+            f"max {max(durations) * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of rendering the JSON responses of the USDM and study metadata listing endpoints.
+
+The content of both endpoints is fetched once from the database, then rendered with the previous
+`jsonable_encoder` and `json.dumps` path, and with `FastJSONResponse`, compact and pretty-printed.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.models.utils import json_response
+from clinical_mdr_api.services.ddf.usdm_service import USDMService
+from clinical_mdr_api.services.listings.listings_study import (
+    StudyMetadataListingService,
+)
+from common.auth.dependencies import dummy_access_token_claims, dummy_auth_object
+
+
+def previous_render(content: Any) -> bytes:
+    """Rendering of the endpoints before `FastJSONResponse`, always pretty-printed."""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=4,
+        separators=(", ", ": "),
+    ).encode("utf-8")
+
+
+def measure(render: Callable[[Any], bytes], content: Any, runs: int) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render(content)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("study_uid")
+    parser.add_argument("project_id")
+    parser.add_argument("study_number")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with request_cycle_context(
+        {"auth": dummy_auth_object(dummy_access_token_claims())}
+    ):
+        cases = [
+            ("USDM", USDMService(study_uid=args.study_uid).get_by_uid(args.study_uid)),
+            (
+                "study metadata listing",
+                StudyMetadataListingService().get_study_metadata(
+                    args.project_id, args.study_number
+                ),
+            ),
+        ]
+
+    renderers = [
+        ("previous", previous_render),
+        ("fast", lambda content: json_response(content).body),
+        ("fast pretty", lambda content: json_response(content, pretty=True).body),
+    ]
+    for name, content in cases:
+        assert json.loads(previous_render(content)) == json.loads(
+            json_response(content).body
+        ), f"{name} is rendered differently"
+
+        for renderer, render in renderers:
+            durations = measure(render, content, runs=args.runs)
+            print(
+                f"{name} ({renderer}): "
+                f"median {statistics.median(durations) * 1000:.1f} ms, "
+                f"min {min(durations) * 1000:.1f} ms, "
+                f"max {max(durations) * 1000:.1f} ms, "
+                f"{len(render(content))} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
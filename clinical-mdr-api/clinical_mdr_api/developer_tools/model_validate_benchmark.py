@@ -0,0 +1,203 @@
+"""
+Microbenchmark of `models.utils.BaseModel.model_validate`.
+
+The models are validated from in-memory stand-ins of neomodel nodes, so that only the CPU time of the extraction is measured.
+With `--baseline <git revision>`, the same measure is also run against the `clinical_mdr_api` package of that revision,
+checked out in a temporary git worktree.
+"""
+
+import argparse
+import hashlib
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from copy import copy
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from clinical_mdr_api.models.concepts.activities.activity import (
+    ActivityGroupingHierarchySimpleModel,
+)
+from clinical_mdr_api.models.controlled_terminologies.configuration import CTConfigOGM
+from clinical_mdr_api.services.user_info import UserInfoService
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+
+
+class Node:
+    """In-memory stand-in of a neomodel node with its fetched relations."""
+
+    def __init__(self, relations: dict | None = None, **properties):
+        self._relations = relations or {}
+        self.__dict__.update(properties)
+
+
+def ct_config_node(idx: int) -> Node:
+    return Node(
+        uid=f"CTConfig_{idx:06}",
+        relations={
+            "latest_version_relationship": Node(
+                start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                end_date=None,
+                status="Final",
+                version="1.0",
+                change_description="Approved version",
+                author_id="unknown-user",
+            ),
+            "has_latest_value": Node(
+                study_field_name=f"field_{idx}",
+                study_field_data_type="codelist_select",
+                study_field_null_value_code=None,
+                study_field_grouping="study_population",
+                study_field_name_api=f"field_{idx}_api",
+                is_dictionary_term=False,
+                relations={
+                    "has_configured_codelist": Node(uid=f"CTCodelist_{idx:06}"),
+                    "has_configured_term": [],
+                },
+            ),
+        },
+    )
+
+
+def activity_node(idx: int, groupings: int = 3) -> Node:
+    def grouping(group: int) -> Node:
+        activity_group = Node(
+            name=f"group_{group}", relations={"has_version": [Node(uid=f"G_{group}")]}
+        )
+        activity_subgroup = Node(
+            name=f"subgroup_{group}",
+            relations={"has_version": [Node(uid=f"SG_{group}")]},
+        )
+        return Node(
+            relations={
+                "in_subgroup": [
+                    Node(
+                        relations={
+                            "in_group": [activity_group],
+                            "has_group": [activity_subgroup],
+                        }
+                    )
+                ]
+            }
+        )
+
+    return Node(
+        uid=f"Activity_{idx:06}",
+        relations={
+            "has_latest_value": Node(
+                name=f"activity_{idx}",
+                relations={
+                    "has_grouping": [grouping(group) for group in range(groupings)]
+                },
+            )
+        },
+    )
+
+
+def measure(model, nodes: list[Node], runs: int) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for node in nodes:
+            model.model_validate(node)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def run_baseline(revision: str, nodes: int, runs: int):
+    """Runs this benchmark against the package of the given git revision, checked out in a temporary worktree."""
+
+    repository_dir = Path(
+        subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=PROJECT_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    )
+    with tempfile.TemporaryDirectory() as worktree_dir:
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", worktree_dir, revision],
+            cwd=repository_dir,
+            check=True,
+        )
+        try:
+            baseline_project_dir = Path(worktree_dir) / PROJECT_DIR.relative_to(
+                repository_dir
+            )
+            # The benchmark itself is run from this checkout, as it may not exist at the baseline revision
+            subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    f"--nodes={nodes}",
+                    f"--runs={runs}",
+                    f"--label={revision}",
+                ],
+                cwd=baseline_project_dir,
+                env={**os.environ, "PYTHONPATH": str(baseline_project_dir)},
+                check=True,
+            )
+        finally:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", worktree_dir],
+                cwd=repository_dir,
+                check=True,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--baseline",
+        help="git revision to compare against, e.g. the commit before a change",
+    )
+    parser.add_argument("--label", default="current", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    cases = [
+        ("CTConfigOGM", CTConfigOGM, [ct_config_node(i) for i in range(args.nodes)]),
+        (
+            "ActivityGroupingHierarchySimpleModel",
+            ActivityGroupingHierarchySimpleModel,
+            [activity_node(i) for i in range(args.nodes)],
+        ),
+    ]
+
+    # Looking up author usernames needs the database, which is not part of the measure
+    with mock.patch.object(
+        UserInfoService, "get_author_username_from_id", side_effect=lambda uid: uid
+    ):
+        for name, model, nodes in cases:
+            # Equal digests across revisions mean that the models are validated the same way
+            validated = model.model_validate(copy(nodes[0]))
+            if not isinstance(validated, list):
+                validated = [validated]
+            digest = hashlib.sha256(
+                "".join(item.model_dump_json() for item in validated).encode()
+            ).hexdigest()[:12]
+
+            durations = measure(model, nodes, runs=args.runs)
+            print(
+                f"{name} ({args.label}): "
+                f"median {statistics.median(durations) * 1000:.1f} ms, "
+                f"min {min(durations) * 1000:.1f} ms, "
+                f"max {max(durations) * 1000:.1f} ms "
+                f"for {len(nodes)} nodes, output digest {digest}",
+                flush=True,
+            )
+
+    if args.baseline:
+        run_baseline(args.baseline, nodes=args.nodes, runs=args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark of extracting the ODM data of a study event, form, item group or item with `OdmDataExtractor`.
+
+The data is extracted with the set-based lookups of the related ODM data, and with the previous lookups of
+each reference on its own. Both the duration and the number of database round trips are measured.
+
+The ODM elements and their descriptions, aliases, vendor extensions and references are looked up set-based,
+so those round trips don't grow with the number of forms, item groups and items anymore. The unit definitions,
+CT terms, codelist attributes, dictionary terms, activities, activity groups and activity subgroups they refer to
+are still looked up one at a time, once per distinct UID, so the round trips still grow with the number of
+distinct concepts referenced.
+"""
+
+import argparse
+import statistics
+import time
+from contextlib import ExitStack
+from unittest import mock
+
+from neomodel import db
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.domains._utils import ObjectStatus
+from clinical_mdr_api.domains.concepts.utils import TargetType
+from clinical_mdr_api.services.concepts.concept_generic_service import (
+    ConceptGenericService,
+)
+from clinical_mdr_api.services.concepts.odms.odm_data_extractor import OdmDataExtractor
+from clinical_mdr_api.services.concepts.odms.odm_forms import OdmFormService
+from clinical_mdr_api.services.concepts.odms.odm_item_groups import OdmItemGroupService
+from clinical_mdr_api.services.concepts.odms.odm_items import OdmItemService
+from clinical_mdr_api.services.concepts.odms.odm_study_events import (
+    OdmStudyEventService,
+)
+from common.auth.dependencies import dummy_access_token_claims, dummy_auth_object
+
+
+def previous_lookups() -> ExitStack:
+    """Patches the ODM services to look up the related data of each reference on its own, as before."""
+    stack = ExitStack()
+    for service in (
+        OdmStudyEventService,
+        OdmFormService,
+        OdmItemGroupService,
+        OdmItemService,
+    ):
+        stack.enter_context(
+            mock.patch.object(
+                service,
+                "_transform_aggregate_roots_to_pydantic_models",
+                ConceptGenericService._transform_aggregate_roots_to_pydantic_models,
+            )
+        )
+    stack.enter_context(
+        mock.patch.object(
+            OdmDataExtractor,
+            "_get_target",
+            staticmethod(lambda service, target_uid: service.get_by_uid(target_uid)),
+        )
+    )
+    return stack
+
+
+def extract(target_uid: str, target_type: TargetType, status: str) -> dict:
+    odm_data = OdmDataExtractor(target_uid, target_type, status)
+    return {
+        name: getattr(odm_data, name)
+        for name in (
+            "odm_forms",
+            "odm_item_groups",
+            "odm_items",
+            "odm_conditions",
+            "odm_methods",
+            "odm_vendor_elements",
+            "ref_odm_vendor_attributes",
+            "unit_definitions",
+        )
+    }
+
+
+def count_round_trips(target_uid: str, target_type: TargetType, status: str) -> int:
+    with mock.patch.object(db, "cypher_query", wraps=db.cypher_query) as cypher_query:
+        extract(target_uid, target_type, status)
+    return cypher_query.call_count
+
+
+def measure(target_uid: str, target_type: TargetType, status: str, runs: int):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        extract(target_uid, target_type, status)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("target_uid")
+    parser.add_argument(
+        "--target-type",
+        choices=[
+            target_type.value
+            for target_type in TargetType
+            if target_type != TargetType.STUDY
+        ],
+        default=TargetType.STUDY_EVENT.value,
+    )
+    parser.add_argument(
+        "--status",
+        choices=[status.name for status in ObjectStatus],
+        default=ObjectStatus.LATEST_FINAL.name,
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    target_type = TargetType(args.target_type)
+
+    with request_cycle_context(
+        {"auth": dummy_auth_object(dummy_access_token_claims())}
+    ):
+        bulk = extract(args.target_uid, target_type, args.status)
+        with previous_lookups():
+            previous = extract(args.target_uid, target_type, args.status)
+        assert bulk == previous, "The ODM data is extracted differently"
+
+        print(
+            f"{len(bulk['odm_forms'])} forms, "
+            f"{len(bulk['odm_item_groups'])} item groups, "
+            f"{len(bulk['odm_items'])} items"
+        )
+        for implementation, lookups in (
+            ("previous", previous_lookups),
+            ("bulk", ExitStack),
+        ):
+            with lookups():
+                round_trips = count_round_trips(
+                    args.target_uid, target_type, args.status
+                )
+                durations = measure(
+                    args.target_uid, target_type, args.status, runs=args.runs
+                )
+            print(
+                f"{target_type.value} ({implementation}): "
+                f"median {statistics.median(durations) * 1000:.1f} ms, "
+                f"min {min(durations) * 1000:.1f} ms, "
+                f"max {max(durations) * 1000:.1f} ms, "
+                f"{round_trips} round trips"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of building a SoA table, with the database reads run sequentially vs. concurrently.
+
+The database is reached through `NetworkSimulator`, which adds a latency to every network packet,
+to compare both strategies under realistic round-trip times.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import urllib.parse
+
+from neomodel import config as neomodel_config
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.developer_tools.networksimulator import NetworkSimulator
+from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
+    SoALayout,
+)
+from clinical_mdr_api.services.studies.study_flowchart import StudyFlowchartService
+from common import config
+from common.auth.dependencies import dummy_access_token_claims, dummy_auth_object
+
+
+def proxy_database(proxy_port: int, latency: float) -> NetworkSimulator:
+    """Starts a network simulator in front of the database, and redirects the database connections to it."""
+
+    url = urllib.parse.urlsplit(neomodel_config.DATABASE_URL)
+    simulator = NetworkSimulator(url.hostname, url.port or 7687, proxy_port, latency)
+    threading.Thread(target=simulator.wait_for_connection, daemon=True).start()
+
+    credentials = url.netloc.rsplit("@", 1)[0] + "@" if "@" in url.netloc else ""
+    neomodel_config.DATABASE_URL = urllib.parse.urlunsplit(
+        url._replace(netloc=f"{credentials}localhost:{proxy_port}")
+    )
+    return simulator
+
+
+def measure(study_uid: str, layout: SoALayout, runs: int) -> list[float]:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        StudyFlowchartService().build_flowchart_table(
+            study_uid=study_uid, study_value_version=None, layout=layout
+        )
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("study_uid")
+    parser.add_argument(
+        "--layout",
+        choices=[layout.value for layout in SoALayout],
+        default=SoALayout.PROTOCOL.value,
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=5, help="added latency in milliseconds"
+    )
+    parser.add_argument("--proxy-port", type=int, default=7688)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    simulator = proxy_database(args.proxy_port, args.latency / 1000.0)
+    layout = SoALayout(args.layout)
+
+    with request_cycle_context(
+        {"auth": dummy_auth_object(dummy_access_token_claims())}
+    ):
+        for concurrency in (1, args.concurrency):
+            config.DB_READ_CONCURRENCY = concurrency
+            # Warm up connections of all threads, so that they are not part of the measures
+            measure(args.study_uid, layout, runs=2)
+
+            requests_before = simulator.nbr_requests
+            durations = measure(args.study_uid, layout, runs=args.runs)
+            print(
+                f"DB_READ_CONCURRENCY={concurrency}: "
+                f"median {statistics.median(durations) * 1000:.1f} ms, "
+                f"min {min(durations) * 1000:.1f} ms, "
+                f"max {max(durations) * 1000:.1f} ms, "
+                f"{(simulator.nbr_requests - requests_before) / args.runs:.0f} packets sent per run"
+            )
+
+    simulator.running = False
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,17 @@ from clinical_mdr_api.domain_repositories.generic_repository import (
 from clinical_mdr_api.domain_repositories.models.brand import Brand
 from clinical_mdr_api.domains.brands.brand import BrandAR
 from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 from common import config
 
 
 class BrandRepository:
-    cache_store_item_by_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
-    )
     lock_store_item_by_uid = Lock()
+    cache_store_item_by_uid = register_cache(
+        "BrandRepository.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
+    )
 
     def generate_uid(self) -> str:
         return Brand.get_next_free_uid_and_increment_counter()
@@ -55,7 +58,7 @@ class BrandRepository:
             return brand
         return None
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["brand"])
     def save(self, brand: BrandAR) -> None:
         repository_closure_data = brand.repository_closure_data
 
@@ -95,7 +98,7 @@ class BrandRepository:
 
         return brand_ars
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def delete(self, uid: str):
         brand = Brand.nodes.first_or_none(uid=uid)
         if brand is not None:
@@ -15,15 +15,18 @@ from clinical_mdr_api.domains.clinical_programmes.clinical_programme import (
     ClinicalProgrammeAR,
 )
 from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 from common import config
 from common.exceptions import BusinessLogicException, NotFoundException
 
 
 class ClinicalProgrammeRepository:
-    cache_store_item_by_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
-    )
     lock_store_item_by_uid = Lock()
+    cache_store_item_by_uid = register_cache(
+        "ClinicalProgrammeRepository.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
+    )
 
     def generate_uid(self) -> str:
         return ClinicalProgramme.get_next_free_uid_and_increment_counter()
@@ -71,7 +74,9 @@ class ClinicalProgrammeRepository:
 
             clinical_programme.delete()
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["clinical_programme_ar"]
+    )
     def save(
         self, clinical_programme_ar: ClinicalProgrammeAR, update: bool = False
     ) -> None:
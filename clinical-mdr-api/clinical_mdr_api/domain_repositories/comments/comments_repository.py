@@ -24,15 +24,18 @@ from clinical_mdr_api.domains.comments.comments import (
     CommentTopicAR,
 )
 from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 from common import config, exceptions
 from common.utils import convert_to_datetime, validate_max_skip_clause
 
 
 class CommentsRepository:
-    cache_store_item_by_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
-    )
     lock_store_item_by_uid = Lock()
+    cache_store_item_by_uid = register_cache(
+        "CommentsRepository.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
+    )
 
     def generate_topic_uid(self) -> str:
         return CommentTopic.get_next_free_uid_and_increment_counter()
@@ -106,7 +109,7 @@ class CommentsRepository:
             return topic
         return None
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save_comment_thread(self, item: CommentThreadAR) -> None:
         repository_closure_data = item.repository_closure_data
 
@@ -131,7 +134,7 @@ class CommentsRepository:
         else:
             raise NotImplementedError
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item_latest"])
     def edit_comment_thread(
         self,
         item_latest: CommentThreadAR,
@@ -177,7 +180,7 @@ class CommentsRepository:
         node_previous.save()
         node_latest.previous_version.connect(node_previous)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save_comment_reply(self, item: CommentReplyAR) -> None:
         repository_closure_data = item.repository_closure_data
 
@@ -198,7 +201,7 @@ class CommentsRepository:
         else:
             raise NotImplementedError
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item_latest"])
     def edit_comment_reply(
         self, item_latest: CommentReplyAR, item_previous: CommentReplyAR
     ) -> None:
@@ -475,7 +478,7 @@ class CommentsRepository:
             node.deleted_at = datetime.now()
             node.save()
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def delete_comment_reply(self, uid: str):
         node = CommentReply.nodes.first_or_none(uid=uid)
         if node is not None:
@@ -24,6 +24,7 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
     LibraryVO,
 )
 from clinical_mdr_api.models.concepts.activities.activity_group import ActivityGroup
+from clinical_mdr_api.repositories._utils import FulltextIndex
 from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime
 
@@ -31,6 +32,11 @@ from common.utils import convert_to_datetime
 class ActivityGroupRepository(ConceptGenericRepository[ActivityGroupAR]):
     root_class = ActivityGroupRoot
     value_class = ActivityGroupValue
+    fulltext_index = FulltextIndex(
+        name="fulltext_ActivityGroupValue",
+        alias="concept_value",
+        match_alias="concept_value",
+    )
     return_model = ActivityGroup
 
     def _create_aggregate_root_instance_from_cypher_result(
@@ -53,6 +53,7 @@ from clinical_mdr_api.models.concepts.activities.activity_item import (
 from clinical_mdr_api.models.concepts.unit_definitions.unit_definition import (
     UnitDefinitionSimpleModel,
 )
+from clinical_mdr_api.repositories._utils import FulltextIndex
 from common.config import REQUESTED_LIBRARY_NAME
 from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime, version_string_to_tuple
@@ -61,6 +62,11 @@ from common.utils import convert_to_datetime, version_string_to_tuple
 class ActivityInstanceRepository(ConceptGenericRepository[ActivityInstanceAR]):
     root_class = ActivityInstanceRoot
     value_class = ActivityInstanceValue
+    fulltext_index = FulltextIndex(
+        name="fulltext_ActivityInstanceValue",
+        alias="concept_value",
+        match_alias="concept_value",
+    )
     aggregate_class = ActivityInstanceAR
     value_object_class = ActivityInstanceVO
     return_model = ActivityInstance
@@ -27,6 +27,7 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
 )
 from clinical_mdr_api.models.concepts.activities.activity import Activity
 from clinical_mdr_api.models.utils import GenericFilteringReturn
+from clinical_mdr_api.repositories._utils import FulltextIndex
 from common.config import REQUESTED_LIBRARY_NAME
 from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime, version_string_to_tuple
@@ -59,6 +60,11 @@ def _get_display_version(versions: list[dict]) -> dict | None:
 class ActivityRepository(ConceptGenericRepository[ActivityAR]):
     root_class = ActivityRoot
     value_class = ActivityValue
+    fulltext_index = FulltextIndex(
+        name="fulltext_ActivityValue",
+        alias="concept_value",
+        match_alias="concept_value",
+    )
     return_model = Activity
     filter_query_parameters = {}
 
@@ -851,6 +857,14 @@ class ActivityRepository(ConceptGenericRepository[ActivityAR]):
             query += "OPTIONAL MATCH (concept_value)-[:HAS_GROUPING]->(activity_grouping:ActivityGrouping)"
         return query
 
+    def estimated_count_label(
+        self, only_specific_status: str = ObjectStatus.LATEST.name, **kwargs
+    ) -> str | None:
+        # Activities are listed once per grouping when not grouped by groupings
+        if kwargs.get("group_by_groupings") is False:
+            return None
+        return super().estimated_count_label(only_specific_status, **kwargs)
+
     def generic_alias_clause(self, **kwargs):
         return f"""
             DISTINCT concept_root, concept_value, {"" if kwargs.get("group_by_groupings") else "activity_grouping,"}
@@ -29,6 +29,7 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
 from clinical_mdr_api.models.concepts.activities.activity_sub_group import (
     ActivitySubGroup,
 )
+from clinical_mdr_api.repositories._utils import FulltextIndex
 from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime, version_string_to_tuple
 
@@ -36,6 +37,11 @@ from common.utils import convert_to_datetime, version_string_to_tuple
 class ActivitySubGroupRepository(ConceptGenericRepository[ActivitySubGroupAR]):
     root_class = ActivitySubGroupRoot
     value_class = ActivitySubGroupValue
+    fulltext_index = FulltextIndex(
+        name="fulltext_ActivitySubGroupValue",
+        alias="concept_value",
+        match_alias="concept_value",
+    )
     return_model = ActivitySubGroup
 
     def _create_aggregate_root_instance_from_cypher_result(
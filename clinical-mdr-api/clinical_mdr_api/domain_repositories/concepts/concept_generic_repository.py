@@ -218,6 +218,18 @@ class ConceptGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType]
     def generic_match_clause_all_versions(self):
         return self.generic_match_clause()
 
+    # pylint: disable=unused-argument
+    def estimated_count_label(
+        self, only_specific_status: str = ObjectStatus.LATEST.name, **kwargs
+    ) -> str | None:
+        """
+        Returns the label whose number of nodes is the number of items listed without any filter,
+        or None when the generic match clause does not return exactly one row per root node.
+        """
+        if only_specific_status != ObjectStatus.LATEST.name:
+            return None
+        return self.root_class.__label__
+
     def create_query_filter_statement(
         self, library: str | None = None, **kwargs
     ) -> tuple[str, dict]:
@@ -303,6 +315,12 @@ class ConceptGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType]
             total_count=total_count,
             return_model=self.return_model,
             format_filter_sort_keys=self.format_filter_sort_keys,
+            fulltext_index=self.fulltext_index,
+            estimated_count_label=(
+                self.estimated_count_label(**kwargs)
+                if not filter_statements and not return_all_versions
+                else None
+            ),
         )
 
         query.parameters.update(filter_query_parameters)
@@ -313,12 +331,7 @@ class ConceptGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType]
             result_array, attributes_names
         )
 
-        count_result, _ = db.cypher_query(
-            query=query.count_query, params=query.parameters
-        )
-        total_amount = (
-            count_result[0][0] if len(count_result) > 0 and total_count else 0
-        )
+        total_amount = query.get_total_count() if total_count else 0
 
         return extracted_items, total_amount
 
@@ -398,6 +411,7 @@ class ConceptGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType]
                 self.return_model
             ),
             format_filter_sort_keys=self.format_filter_sort_keys,
+            fulltext_index=self.fulltext_index,
         )
 
         query.parameters.update(filter_query_parameters)
@@ -413,7 +427,7 @@ class ConceptGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType]
             else []
         )
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save(self, item: _AggregateRootType) -> None:
         if item.uid is not None and item.repository_closure_data is None:
             self._create(item)
@@ -4,9 +4,6 @@ from clinical_mdr_api.domain_repositories._generic_repository_interface import (
 from clinical_mdr_api.domain_repositories.concepts.odms.odm_generic_repository import (
     OdmGenericRepository,
 )
-from clinical_mdr_api.domain_repositories.models.controlled_terminology import (
-    CTTermRoot,
-)
 from clinical_mdr_api.domain_repositories.models.generic import (
     Library,
     VersionRelationship,
@@ -14,14 +11,11 @@ from clinical_mdr_api.domain_repositories.models.generic import (
     VersionValue,
 )
 from clinical_mdr_api.domain_repositories.models.odm import (
-    OdmAliasRoot,
-    OdmDescriptionRoot,
     OdmFormRoot,
     OdmFormValue,
     OdmStudyEventRoot,
 )
 from clinical_mdr_api.domains._utils import ObjectStatus
-from clinical_mdr_api.domains.concepts.concept_base import ConceptARBase
 from clinical_mdr_api.domains.concepts.odms.form import (
     OdmFormAR,
     OdmFormRefVO,
@@ -174,36 +168,18 @@ apoc.coll.toSet([vendor_attribute in vendor_attributes | vendor_attribute.uid])
 apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_element_attribute.uid]) AS vendor_element_attribute_uids
 """
 
-    def _get_or_create_value(
-        self, root: VersionRoot, ar: ConceptARBase
-    ) -> VersionValue:
-        new_value = super()._get_or_create_value(root, ar)
-
-        root.has_scope.disconnect_all()
-        root.has_description.disconnect_all()
-        root.has_alias.disconnect_all()
-
-        if ar.concept_vo.scope_uid is not None:
-            scope = CTTermRoot.nodes.get_or_none(uid=ar.concept_vo.scope_uid)
-            root.has_scope.connect(scope)
-
-        if ar.concept_vo.description_uids is not None:
-            for description_uid in ar.concept_vo.description_uids:
-                description = OdmDescriptionRoot.nodes.get_or_none(uid=description_uid)
-                root.has_description.connect(description)
-
-        if ar.concept_vo.alias_uids is not None:
-            for alias_uid in ar.concept_vo.alias_uids:
-                alias = OdmAliasRoot.nodes.get_or_none(uid=alias_uid)
-                root.has_alias.connect(alias)
-
-        return new_value
+    def _get_related_uids(self, ar: OdmFormAR) -> dict[str, list[str]]:
+        return {
+            "has_scope": (
+                [ar.concept_vo.scope_uid] if ar.concept_vo.scope_uid is not None else []
+            ),
+            "has_description": ar.concept_vo.description_uids or [],
+            "has_alias": ar.concept_vo.alias_uids or [],
+        }
 
     def _create_new_value_node(self, ar: OdmFormAR) -> OdmFormValue:
         value_node = super()._create_new_value_node(ar=ar)
 
-        value_node.save()
-
         value_node.oid = ar.concept_vo.oid
         value_node.sdtm_version = ar.concept_vo.sdtm_version
         value_node.repeating = ar.concept_vo.repeating
@@ -243,6 +219,33 @@ apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_
 
         rel = form_root.form_ref.relationship(study_event_root)
 
+        return self._create_form_ref_vo(uid, study_event_uid, form_value, rel)
+
+    def find_with_study_event_relations(
+        self, study_event_uids: list[str]
+    ) -> dict[tuple[str, str], OdmFormRefVO]:
+        """
+        Set-based equivalent of `find_by_uid_with_study_event_relation` for all forms of the given study events.
+
+        :param study_event_uids: The UIDs of the study events.
+        :return: The form references, by UID of the form and UID of the study event.
+        """
+        return {
+            (uid, study_event_uid): self._create_form_ref_vo(
+                uid, study_event_uid, form_value, rel
+            )
+            for (uid, study_event_uid), (
+                form_value,
+                rel,
+            ) in self._find_related_latest_values(
+                OdmStudyEventRoot, "form_ref", study_event_uids
+            ).items()
+        }
+
+    @staticmethod
+    def _create_form_ref_vo(
+        uid: str, study_event_uid: str, form_value: OdmFormValue, rel
+    ) -> OdmFormRefVO:
         return OdmFormRefVO.from_repository_values(
             uid=uid,
             name=form_value.name,
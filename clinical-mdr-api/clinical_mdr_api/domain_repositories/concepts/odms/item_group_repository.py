@@ -4,9 +4,6 @@ from clinical_mdr_api.domain_repositories._generic_repository_interface import (
 from clinical_mdr_api.domain_repositories.concepts.odms.odm_generic_repository import (
     OdmGenericRepository,
 )
-from clinical_mdr_api.domain_repositories.models.controlled_terminology import (
-    CTTermRoot,
-)
 from clinical_mdr_api.domain_repositories.models.generic import (
     Library,
     VersionRelationship,
@@ -14,14 +11,11 @@ from clinical_mdr_api.domain_repositories.models.generic import (
     VersionValue,
 )
 from clinical_mdr_api.domain_repositories.models.odm import (
-    OdmAliasRoot,
-    OdmDescriptionRoot,
     OdmFormRoot,
     OdmItemGroupRoot,
     OdmItemGroupValue,
 )
 from clinical_mdr_api.domains._utils import ObjectStatus
-from clinical_mdr_api.domains.concepts.concept_base import ConceptARBase
 from clinical_mdr_api.domains.concepts.odms.item_group import (
     OdmItemGroupAR,
     OdmItemGroupRefVO,
@@ -186,37 +180,16 @@ apoc.coll.toSet([vendor_attribute in vendor_attributes | vendor_attribute.uid])
 apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_element_attribute.uid]) AS vendor_element_attribute_uids
 """
 
-    def _get_or_create_value(
-        self, root: VersionRoot, ar: ConceptARBase
-    ) -> VersionValue:
-        new_value = super()._get_or_create_value(root, ar)
-
-        root.has_description.disconnect_all()
-        root.has_alias.disconnect_all()
-        root.has_sdtm_domain.disconnect_all()
-
-        if ar.concept_vo.description_uids is not None:
-            for description_uid in ar.concept_vo.description_uids:
-                description = OdmDescriptionRoot.nodes.get_or_none(uid=description_uid)
-                root.has_description.connect(description)
-
-        if ar.concept_vo.alias_uids is not None:
-            for alias_uid in ar.concept_vo.alias_uids:
-                alias = OdmAliasRoot.nodes.get_or_none(uid=alias_uid)
-                root.has_alias.connect(alias)
-
-        if ar.concept_vo.sdtm_domain_uids is not None:
-            for sdtm_domain_uid in ar.concept_vo.sdtm_domain_uids:
-                sdtm_domain = CTTermRoot.nodes.get_or_none(uid=sdtm_domain_uid)
-                root.has_sdtm_domain.connect(sdtm_domain)
-
-        return new_value
+    def _get_related_uids(self, ar: OdmItemGroupAR) -> dict[str, list[str]]:
+        return {
+            "has_description": ar.concept_vo.description_uids or [],
+            "has_alias": ar.concept_vo.alias_uids or [],
+            "has_sdtm_domain": ar.concept_vo.sdtm_domain_uids or [],
+        }
 
     def _create_new_value_node(self, ar: OdmItemGroupAR) -> OdmItemGroupValue:
         value_node = super()._create_new_value_node(ar=ar)
 
-        value_node.save()
-
         value_node.oid = ar.concept_vo.oid
         value_node.repeating = ar.concept_vo.repeating
         value_node.is_reference_data = ar.concept_vo.is_reference_data
@@ -266,6 +239,33 @@ apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_
 
         rel = item_group_root.item_group_ref.relationship(form_root)
 
+        return self._create_item_group_ref_vo(uid, form_uid, item_group_value, rel)
+
+    def find_with_form_relations(
+        self, form_uids: list[str]
+    ) -> dict[tuple[str, str], OdmItemGroupRefVO]:
+        """
+        Set-based equivalent of `find_by_uid_with_form_relation` for all item groups of the given forms.
+
+        :param form_uids: The UIDs of the forms.
+        :return: The item group references, by UID of the item group and UID of the form.
+        """
+        return {
+            (uid, form_uid): self._create_item_group_ref_vo(
+                uid, form_uid, item_group_value, rel
+            )
+            for (uid, form_uid), (
+                item_group_value,
+                rel,
+            ) in self._find_related_latest_values(
+                OdmFormRoot, "item_group_ref", form_uids
+            ).items()
+        }
+
+    @staticmethod
+    def _create_item_group_ref_vo(
+        uid: str, form_uid: str, item_group_value: OdmItemGroupValue, rel
+    ) -> OdmItemGroupRefVO:
         return OdmItemGroupRefVO.from_repository_values(
             uid=uid,
             oid=item_group_value.oid,
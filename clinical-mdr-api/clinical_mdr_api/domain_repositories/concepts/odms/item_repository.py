@@ -1,3 +1,5 @@
+from neomodel import db
+
 from clinical_mdr_api.domain_repositories._generic_repository_interface import (
     _AggregateRootType,
 )
@@ -6,7 +8,6 @@ from clinical_mdr_api.domain_repositories.concepts.odms.odm_generic_repository i
 )
 from clinical_mdr_api.domain_repositories.models.concepts import UnitDefinitionRoot
 from clinical_mdr_api.domain_repositories.models.controlled_terminology import (
-    CTCodelistRoot,
     CTTermRoot,
 )
 from clinical_mdr_api.domain_repositories.models.generic import (
@@ -16,14 +17,12 @@ from clinical_mdr_api.domain_repositories.models.generic import (
     VersionValue,
 )
 from clinical_mdr_api.domain_repositories.models.odm import (
-    OdmAliasRoot,
-    OdmDescriptionRoot,
     OdmItemGroupRoot,
     OdmItemRoot,
+    OdmItemTermRelationship,
     OdmItemValue,
 )
 from clinical_mdr_api.domains._utils import ObjectStatus
-from clinical_mdr_api.domains.concepts.concept_base import ConceptARBase
 from clinical_mdr_api.domains.concepts.odms.item import (
     OdmItemAR,
     OdmItemRefVO,
@@ -202,36 +201,20 @@ apoc.coll.toSet([vendor_attribute in vendor_attributes | vendor_attribute.uid])
 apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_element_attribute.uid]) AS vendor_element_attribute_uids
 """
 
-    def _get_or_create_value(
-        self, root: VersionRoot, ar: ConceptARBase
-    ) -> VersionValue:
-        new_value = super()._get_or_create_value(root, ar)
-
-        root.has_description.disconnect_all()
-        root.has_alias.disconnect_all()
-        root.has_codelist.disconnect_all()
-
-        if ar.concept_vo.description_uids is not None:
-            for description_uid in ar.concept_vo.description_uids:
-                description = OdmDescriptionRoot.nodes.get_or_none(uid=description_uid)
-                root.has_description.connect(description)
-
-        if ar.concept_vo.alias_uids is not None:
-            for alias_uid in ar.concept_vo.alias_uids:
-                alias = OdmAliasRoot.nodes.get_or_none(uid=alias_uid)
-                root.has_alias.connect(alias)
-
-        if ar.concept_vo.codelist_uid is not None:
-            codelist = CTCodelistRoot.nodes.get_or_none(uid=ar.concept_vo.codelist_uid)
-            root.has_codelist.connect(codelist)
-
-        return new_value
+    def _get_related_uids(self, ar: OdmItemAR) -> dict[str, list[str]]:
+        return {
+            "has_description": ar.concept_vo.description_uids or [],
+            "has_alias": ar.concept_vo.alias_uids or [],
+            "has_codelist": (
+                [ar.concept_vo.codelist_uid]
+                if ar.concept_vo.codelist_uid is not None
+                else []
+            ),
+        }
 
     def _create_new_value_node(self, ar: OdmItemAR) -> OdmItemValue:
         value_node = super()._create_new_value_node(ar=ar)
 
-        value_node.save()
-
         value_node.oid = ar.concept_vo.oid
         value_node.prompt = ar.concept_vo.prompt
         value_node.datatype = ar.concept_vo.datatype
@@ -291,6 +274,33 @@ apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_
 
         rel = item_root.item_ref.relationship(item_group_root)
 
+        return self._create_item_ref_vo(uid, item_group_uid, item_value, rel)
+
+    def find_with_item_group_relations(
+        self, item_group_uids: list[str]
+    ) -> dict[tuple[str, str], OdmItemRefVO]:
+        """
+        Set-based equivalent of `find_by_uid_with_item_group_relation` for all items of the given item groups.
+
+        :param item_group_uids: The UIDs of the item groups.
+        :return: The item references, by UID of the item and UID of the item group.
+        """
+        return {
+            (uid, item_group_uid): self._create_item_ref_vo(
+                uid, item_group_uid, item_value, rel
+            )
+            for (uid, item_group_uid), (
+                item_value,
+                rel,
+            ) in self._find_related_latest_values(
+                OdmItemGroupRoot, "item_ref", item_group_uids
+            ).items()
+        }
+
+    @staticmethod
+    def _create_item_ref_vo(
+        uid: str, item_group_uid: str, item_value: OdmItemValue, rel
+    ) -> OdmItemRefVO:
         return OdmItemRefVO.from_repository_values(
             uid=uid,
             oid=item_value.oid,
@@ -310,35 +320,51 @@ apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_
     def _get_latest_version_for_status(
         self, root: VersionRoot, value: VersionValue, status: LibraryItemStatus
     ) -> VersionRelationship:
-        all_rels = root.has_version.all_relationships(value)
+        return self._select_latest_version(
+            root.has_version.all_relationships(value), status
+        )
+
+    @staticmethod
+    def _select_latest_version(
+        all_rels: list[VersionRelationship], status: LibraryItemStatus
+    ) -> VersionRelationship:
         rels = [rel for rel in all_rels if rel.status == status.value]
         if len(rels) == 0:
             raise RuntimeError(f"No HAS_VERSION was found with status {status}")
         latest = max(rels, key=lambda r: version_string_to_tuple(r.version))
         return latest
 
+    @classmethod
+    def _select_term_version(
+        cls,
+        term_uid: str,
+        all_rels: list[VersionRelationship],
+        has_latest_draft: bool,
+        has_latest_final: bool,
+    ) -> VersionRelationship:
+        if has_latest_draft:
+            rel_data = cls._select_latest_version(all_rels, LibraryItemStatus.DRAFT)
+            if rel_data and not rel_data.end_date:
+                return rel_data
+
+        if has_latest_final:
+            rel_data = cls._select_latest_version(all_rels, LibraryItemStatus.FINAL)
+            if not rel_data.end_date:
+                return rel_data
+
+        raise NotFoundException(
+            msg=f"No DRAFT or FINAL found for CT Term with UID '{term_uid}'."
+        )
+
     def find_term_with_item_relation_by_item_uid(self, uid: str, term_uid: str):
         def _get_relationship():
-            if ct_term_attributes_value_draft:
-                rel_data = self._get_latest_version_for_status(
-                    ct_term_attributes_root,
-                    ct_term_attributes_value,
-                    LibraryItemStatus.DRAFT,
-                )
-                if rel_data and not rel_data.end_date:
-                    return rel_data
-
-            if ct_term_attributes_value_final:
-                rel_data = self._get_latest_version_for_status(
-                    ct_term_attributes_root,
-                    ct_term_attributes_value,
-                    LibraryItemStatus.FINAL,
-                )
-                if not rel_data.end_date:
-                    return rel_data
-
-            raise NotFoundException(
-                msg=f"No DRAFT or FINAL found for CT Term with UID '{ct_term_root.uid}'."
+            return self._select_term_version(
+                ct_term_root.uid,
+                ct_term_attributes_root.has_version.all_relationships(
+                    ct_term_attributes_value
+                ),
+                bool(ct_term_attributes_value_draft),
+                bool(ct_term_attributes_value_final),
             )
 
         item_root = self.root_class.nodes.get_or_none(uid=uid)
@@ -370,6 +396,64 @@ apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_
             )
         return None
 
+    def find_terms_with_item_relations(
+        self, item_uids: list[str]
+    ) -> dict[tuple[str, str], OdmItemTermVO]:
+        """
+        Set-based equivalent of `find_term_with_item_relation_by_item_uid` for all terms of the given items.
+
+        :param item_uids: The UIDs of the items.
+        :return: The terms with their relationship to the item, by UID of the item and UID of the term.
+        """
+        if not item_uids:
+            return {}
+
+        rs, _ = db.cypher_query(
+            """
+            MATCH (item_root:OdmItemRoot)-[rel:HAS_CODELIST_TERM]->(term_root:CTTermRoot)
+            WHERE item_root.uid IN $item_uids
+            MATCH (term_root)-[:HAS_NAME_ROOT]->(:CTTermNameRoot)-[:LATEST]->(term_name_value)
+            MATCH (term_root)-[:HAS_ATTRIBUTES_ROOT]->(term_attributes_root:CTTermAttributesRoot)
+            -[:LATEST]->(term_attributes_value)
+            WITH item_root, rel, term_root, term_name_value, term_attributes_root, term_attributes_value,
+            EXISTS { (term_attributes_root)-[:LATEST_DRAFT]->() } AS has_latest_draft,
+            EXISTS { (term_attributes_root)-[:LATEST_FINAL]->() } AS has_latest_final
+            OPTIONAL MATCH (term_attributes_root)-[version:HAS_VERSION]->(term_attributes_value)
+            RETURN item_root.uid, term_root.uid, rel, term_name_value.name, has_latest_draft, has_latest_final,
+            collect(version)
+            """,
+            {"item_uids": item_uids},
+            resolve_objects=False,
+        )
+
+        terms: dict[tuple[str, str], OdmItemTermVO] = {}
+        for (
+            uid,
+            term_uid,
+            rel,
+            name,
+            has_latest_draft,
+            has_latest_final,
+            versions,
+        ) in rs:
+            if (uid, term_uid) in terms:
+                continue
+            rel = OdmItemTermRelationship.inflate(rel)
+            terms[uid, term_uid] = OdmItemTermVO.from_repository_values(
+                uid=uid,
+                name=name,
+                mandatory=rel.mandatory,
+                order=rel.order,
+                display_text=rel.display_text,
+                version=self._select_term_version(
+                    term_uid,
+                    [VersionRelationship.inflate(version) for version in versions],
+                    has_latest_draft,
+                    has_latest_final,
+                ).version,
+            )
+        return terms
+
     def find_unit_definition_with_item_relation_by_item_uid(
         self, uid: str, unit_definition_uid: str
     ):
@@ -383,10 +467,37 @@ apoc.coll.toSet([vendor_element_attribute in vendor_element_attributes | vendor_
         rel = item_root.has_unit_definition.relationship(unit_definition_root)
 
         if rel:
-            return OdmItemUnitDefinitionVO.from_repository_values(
-                uid=uid,
-                name=unit_definition_value.name,
-                mandatory=rel.mandatory,
-                order=rel.order,
-            )
+            return self._create_item_unit_definition_vo(uid, unit_definition_value, rel)
         return None
+
+    def find_unit_definitions_with_item_relations(
+        self, item_uids: list[str]
+    ) -> dict[tuple[str, str], OdmItemUnitDefinitionVO]:
+        """
+        Set-based equivalent of `find_unit_definition_with_item_relation_by_item_uid` for all unit definitions of the given items.
+
+        :param item_uids: The UIDs of the items.
+        :return: The unit definitions with their relationship to the item, by UID of the item and UID of the unit definition.
+        """
+        return {
+            (uid, unit_definition_uid): self._create_item_unit_definition_vo(
+                uid, unit_definition_value, rel
+            )
+            for (unit_definition_uid, uid), (
+                unit_definition_value,
+                rel,
+            ) in self._find_related_latest_values(
+                OdmItemRoot, "has_unit_definition", item_uids
+            ).items()
+        }
+
+    @staticmethod
+    def _create_item_unit_definition_vo(
+        uid: str, unit_definition_value: VersionValue, rel
+    ) -> OdmItemUnitDefinitionVO:
+        return OdmItemUnitDefinitionVO.from_repository_values(
+            uid=uid,
+            name=unit_definition_value.name,
+            mandatory=rel.mandatory,
+            order=rel.order,
+        )
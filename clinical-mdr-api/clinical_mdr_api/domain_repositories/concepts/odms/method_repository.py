@@ -13,14 +13,10 @@ from clinical_mdr_api.domain_repositories.models.generic import (
     VersionValue,
 )
 from clinical_mdr_api.domain_repositories.models.odm import (
-    OdmAliasRoot,
-    OdmDescriptionRoot,
-    OdmFormalExpressionRoot,
     OdmMethodRoot,
     OdmMethodValue,
 )
 from clinical_mdr_api.domains._utils import ObjectStatus
-from clinical_mdr_api.domains.concepts.concept_base import ConceptARBase
 from clinical_mdr_api.domains.concepts.odms.method import OdmMethodAR, OdmMethodVO
 from clinical_mdr_api.domains.versioned_object_aggregate import (
     LibraryItemMetadataVO,
@@ -123,39 +119,16 @@ apoc.coll.toSet([description in descriptions | description.uid]) AS description_
 apoc.coll.toSet([alias in aliases | alias.uid]) AS alias_uids
 """
 
-    def _get_or_create_value(
-        self, root: VersionRoot, ar: ConceptARBase
-    ) -> VersionValue:
-        new_value = super()._get_or_create_value(root, ar)
-
-        root.has_formal_expression.disconnect_all()
-        root.has_description.disconnect_all()
-        root.has_alias.disconnect_all()
-
-        if ar.concept_vo.formal_expression_uids is not None:
-            for formal_expression_uid in ar.concept_vo.formal_expression_uids:
-                formal_expression = OdmFormalExpressionRoot.nodes.get_or_none(
-                    uid=formal_expression_uid
-                )
-                root.has_formal_expression.connect(formal_expression)
-
-        if ar.concept_vo.description_uids is not None:
-            for description_uid in ar.concept_vo.description_uids:
-                description = OdmDescriptionRoot.nodes.get_or_none(uid=description_uid)
-                root.has_description.connect(description)
-
-        if ar.concept_vo.alias_uids is not None:
-            for alias_uid in ar.concept_vo.alias_uids:
-                alias = OdmAliasRoot.nodes.get_or_none(uid=alias_uid)
-                root.has_alias.connect(alias)
-
-        return new_value
+    def _get_related_uids(self, ar: OdmMethodAR) -> dict[str, list[str]]:
+        return {
+            "has_formal_expression": ar.concept_vo.formal_expression_uids or [],
+            "has_description": ar.concept_vo.description_uids or [],
+            "has_alias": ar.concept_vo.alias_uids or [],
+        }
 
     def _create_new_value_node(self, ar: OdmMethodAR) -> OdmMethodValue:
         value_node = super()._create_new_value_node(ar=ar)
 
-        value_node.save()
-
         value_node.oid = ar.concept_vo.oid
         value_node.method_type = ar.concept_vo.method_type
 
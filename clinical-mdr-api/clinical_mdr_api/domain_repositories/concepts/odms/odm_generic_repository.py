@@ -1,7 +1,8 @@
 from abc import ABC
-from typing import Any
+from collections import defaultdict
+from typing import Any, Iterable
 
-from neomodel import db
+from neomodel import OUTGOING, StructuredRel, db
 
 from clinical_mdr_api.domain_repositories._generic_repository_interface import (
     _AggregateRootType,
@@ -18,6 +19,11 @@ from clinical_mdr_api.domain_repositories.models.concepts import UnitDefinitionR
 from clinical_mdr_api.domain_repositories.models.controlled_terminology import (
     CTTermRoot,
 )
+from clinical_mdr_api.domain_repositories.models.generic import (
+    VersionRelationship,
+    VersionRoot,
+    VersionValue,
+)
 from clinical_mdr_api.domain_repositories.models.odm import (
     OdmFormRoot,
     OdmItemGroupRoot,
@@ -99,21 +105,14 @@ class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
             result_array, attributes_names
         )
 
-        count_result, _ = db.cypher_query(
-            query=query.count_query, params=query.parameters
-        )
-        total_amount = (
-            count_result[0][0] if len(count_result) > 0 and total_count else 0
-        )
+        total_amount = query.get_total_count() if total_count else 0
 
         return extracted_items, total_amount
 
     @classmethod
-    def _get_origin_and_relation_node(
-        cls, uid: str, relation_uid: str | None, relationship_type: RelationType
-    ):
-        root_class_node = cls.root_class.nodes.get_or_none(uid=uid)
-
+    def _get_relation_mapping(
+        cls, relationship_type: RelationType
+    ) -> tuple[type[VersionRoot], str]:
         relation_mapping = {
             RelationType.ACTIVITY_GROUP: (ActivityGroupRoot, "has_activity_group"),
             RelationType.ACTIVITY_SUB_GROUP: (
@@ -141,7 +140,28 @@ class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
             relationship_type not in relation_mapping, msg="Invalid relation type."
         )
 
-        relation_node_cls, origin_label = relation_mapping[relationship_type]
+        return relation_mapping[relationship_type]
+
+    @classmethod
+    def _get_odm_element_class(
+        cls, odm_element_type: RelationType
+    ) -> type[VersionRoot]:
+        BusinessLogicException.raise_if(
+            odm_element_type
+            not in (RelationType.FORM, RelationType.ITEM_GROUP, RelationType.ITEM),
+            msg="Invalid ODM element type.",
+        )
+
+        odm_element_class, _ = cls._get_relation_mapping(odm_element_type)
+        return odm_element_class
+
+    @classmethod
+    def _get_origin_and_relation_node(
+        cls, uid: str, relation_uid: str | None, relationship_type: RelationType
+    ):
+        root_class_node = cls.root_class.nodes.get_or_none(uid=uid)
+
+        relation_node_cls, origin_label = cls._get_relation_mapping(relationship_type)
         relation_node = relation_node_cls.nodes.get_or_none(uid=relation_uid)
 
         BusinessLogicException.raise_if(
@@ -151,7 +171,9 @@ class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
 
         return getattr(root_class_node, origin_label), relation_node
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["uid", "relation_uid"]
+    )
     def add_relation(
         self,
         uid: str,
@@ -171,6 +193,288 @@ class OdmGenericRepository(ConceptGenericRepository[_AggregateRootType], ABC):
             origin.connect(relation_node)
 
     @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def add_relations(
+        self,
+        relations: list[tuple[str, str, dict | None]],
+        relationship_type: RelationType,
+    ) -> None:
+        """
+        Set-based equivalent of `add_relation`, creating all the given relations with a single query.
+
+        :param relations: The uid of the origin node, the uid of the related node, and the relationship properties, of each relation.
+        :param relationship_type: The type of all the relations.
+        """
+        if not relations:
+            return
+
+        relation_node_cls, origin_label = self._get_relation_mapping(relationship_type)
+        definition = getattr(self.root_class, origin_label).definition
+        relation_model = definition["model"] or StructuredRel
+        if definition["direction"] == OUTGOING:
+            pattern = f"(origin)-[{{rel}}:{definition['relation_type']}]->(related)"
+        else:
+            pattern = f"(origin)<-[{{rel}}:{definition['relation_type']}]-(related)"
+
+        # As with `add_relation`, the last relation between two nodes replaces the previous ones
+        parameters_by_pair = {
+            (uid, relation_uid): relation_model.deflate(parameters or {})
+            for uid, relation_uid, parameters in relations
+        }
+        rs, _ = db.cypher_query(
+            f"""
+            UNWIND $relations AS relation
+            MATCH (origin:{self.root_class.__label__} {{uid: relation.uid}})
+            MATCH (related:{relation_node_cls.__label__} {{uid: relation.relation_uid}})
+            CALL {{
+                WITH origin, related
+                MATCH {pattern.format(rel="existing")}
+                DELETE existing
+            }}
+            CREATE {pattern.format(rel="rel")}
+            SET rel = relation.parameters
+            RETURN relation.uid, relation.relation_uid
+            """,
+            {
+                "relations": [
+                    {"uid": uid, "relation_uid": relation_uid, "parameters": parameters}
+                    for (uid, relation_uid), parameters in parameters_by_pair.items()
+                ]
+            },
+        )
+
+        missing_pairs = parameters_by_pair.keys() - {tuple(row) for row in rs}
+        BusinessLogicException.raise_if(
+            missing_pairs,
+            msg=f"Objects of relations with UIDs '{sorted(missing_pairs)}' don't exist.",
+        )
+
+    def _get_related_uids(self, ar: _AggregateRootType) -> dict[str, list[str]]:
+        """
+        Returns the UIDs of the nodes the root node of the given ODM element is related to, by name of the relationship of `root_class`.
+
+        These relationships are replaced whenever a value node of the ODM element is created or reused.
+        """
+        return {}
+
+    def _get_or_create_value(
+        self, root: VersionRoot, ar: _AggregateRootType
+    ) -> VersionValue:
+        new_value = super()._get_or_create_value(root, ar)
+
+        for relationship_name, related_uids in self._get_related_uids(ar).items():
+            relationship = getattr(root, relationship_name)
+            relationship.disconnect_all()
+            for related_uid in related_uids:
+                relationship.connect(
+                    relationship.definition["node_class"].nodes.get_or_none(
+                        uid=related_uid
+                    )
+                )
+
+        return new_value
+
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def create_all(self, items: list[_AggregateRootType]) -> None:
+        """
+        Set-based equivalent of `save` for new draft ODM elements, creating all of them with one query,
+        plus one query per relationship returned by `_get_related_uids`.
+
+        :param items: The new ODM elements, with a UID, which were never saved.
+        """
+        if not items:
+            return
+
+        root_labels = ":".join(self.root_class.inherited_labels())
+        value_labels = ":".join(self.value_class.inherited_labels())
+        db.cypher_query(
+            f"""
+            UNWIND $items AS item
+            MATCH (library:Library {{name: item.library_name}})
+            CREATE (library)-[:{self.root_class.LIBRARY_REL_LABEL}]->(root:{root_labels} {{uid: item.uid}})
+            CREATE (root)-[:LATEST]->(value:{value_labels})
+            SET value = item.value
+            CREATE (root)-[version:HAS_VERSION]->(value)
+            SET version = item.version
+            CREATE (root)-[:LATEST_DRAFT]->(value)
+            """,
+            {
+                "items": [
+                    {
+                        "uid": item.uid,
+                        "library_name": item.library.name,
+                        "value": self.value_class.deflate(
+                            self._create_new_value_node(item).__properties__,
+                            skip_empty=True,
+                        ),
+                        "version": VersionRelationship.deflate(
+                            self._library_item_metadata_vo_to_datadict(
+                                item.item_metadata
+                            ),
+                            skip_empty=True,
+                        ),
+                    }
+                    for item in items
+                ]
+            },
+        )
+
+        relations: dict[str, list[dict[str, str]]] = defaultdict(list)
+        for item in items:
+            for relationship_name, related_uids in self._get_related_uids(item).items():
+                for related_uid in related_uids:
+                    relations[relationship_name].append(
+                        {"uid": item.uid, "relation_uid": related_uid}
+                    )
+
+        for relationship_name, relationship_relations in relations.items():
+            relationship = getattr(self.root_class, relationship_name)
+            relationship.lookup_node_class()
+            definition = relationship.definition
+            if definition["direction"] == OUTGOING:
+                pattern = f"-[:{definition['relation_type']}]->"
+            else:
+                pattern = f"<-[:{definition['relation_type']}]-"
+            rs, _ = db.cypher_query(
+                f"""
+                UNWIND $relations AS relation
+                MATCH (origin:{self.root_class.__label__} {{uid: relation.uid}})
+                MATCH (related:{definition["node_class"].__label__} {{uid: relation.relation_uid}})
+                CREATE (origin){pattern}(related)
+                RETURN relation.uid, relation.relation_uid
+                """,
+                {"relations": relationship_relations},
+            )
+
+            missing_pairs = {
+                (relation["uid"], relation["relation_uid"])
+                for relation in relationship_relations
+            } - {tuple(row) for row in rs}
+            BusinessLogicException.raise_if(
+                missing_pairs,
+                msg=f"Objects of relations with UIDs '{sorted(missing_pairs)}' don't exist.",
+            )
+
+    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    def approve_all(self, items: list[_AggregateRootType]) -> None:
+        """
+        Set-based equivalent of `save` for ODM elements which were approved since they were last saved,
+        approving all of them with one query.
+
+        Approving doesn't change the value of an ODM element, so only its version relationships are written.
+
+        :param items: The approved ODM elements.
+        """
+        if not items:
+            return
+
+        db.cypher_query(
+            f"""
+            UNWIND $items AS item
+            MATCH (root:{self.root_class.__label__} {{uid: item.uid}})-[:LATEST]->(value)
+            CALL {{
+                WITH root
+                MATCH (root)-[latest_final:LATEST_FINAL]->()
+                DELETE latest_final
+            }}
+            CALL {{
+                WITH root, item
+                MATCH (root)-[previous_version:HAS_VERSION]->()
+                WHERE previous_version.end_date IS NULL
+                SET previous_version.end_date = item.version.start_date
+            }}
+            CREATE (root)-[version:HAS_VERSION]->(value)
+            SET version = item.version
+            CREATE (root)-[:LATEST_FINAL]->(value)
+            """,
+            {
+                "items": [
+                    {
+                        "uid": item.uid,
+                        "version": VersionRelationship.deflate(
+                            self._library_item_metadata_vo_to_datadict(
+                                item.item_metadata
+                            ),
+                            skip_empty=True,
+                        ),
+                    }
+                    for item in items
+                ]
+            },
+        )
+
+    def find_all_by_uids(self, uids: Iterable[str]) -> dict[str, _AggregateRootType]:
+        """
+        Set-based equivalent of `find_by_uid_2` for the latest versions of several ODM elements.
+
+        :param uids: The UIDs of the ODM elements.
+        :return: The ODM elements which exist, by UID.
+        """
+        uids = list(uids)
+        if not uids:
+            return {}
+
+        items, _ = self.find_all(filter_by={"uid": {"v": uids, "op": "eq"}})
+        return {item.uid: item for item in items}
+
+    @staticmethod
+    def _find_related_latest_values(
+        origin_class: type[VersionRoot],
+        relationship_name: str,
+        origin_uids: Iterable[str],
+    ) -> dict[tuple[str, str], tuple[VersionValue, StructuredRel]]:
+        """
+        Set-based lookup of the nodes related to the given origin nodes through the relationship `relationship_name`
+        of `origin_class`, as done one node at a time by the `find_by_uid_with_*_relation` methods.
+
+        :param origin_class: The root class of the origin nodes.
+        :param relationship_name: The name of the relationship of `origin_class`.
+        :param origin_uids: The UIDs of the origin nodes.
+        :return: The latest value of the related node and the relationship, by UID of the related node and UID of the origin node.
+        """
+        origin_uids = list(origin_uids)
+        if not origin_uids:
+            return {}
+
+        relationship = getattr(origin_class, relationship_name)
+        relationship.lookup_node_class()
+        definition = relationship.definition
+        related_class = definition["node_class"]
+        latest_value = related_class.has_latest_value
+        latest_value.lookup_node_class()
+        relation_model = definition["model"] or StructuredRel
+
+        if definition["direction"] == OUTGOING:
+            pattern = f"-[rel:{definition['relation_type']}]->"
+        else:
+            pattern = f"<-[rel:{definition['relation_type']}]-"
+        rs, _ = db.cypher_query(
+            f"""
+            MATCH (origin:{origin_class.__label__}){pattern}(related:{related_class.__label__})
+            WHERE origin.uid IN $origin_uids
+            MATCH (related)-[:{latest_value.definition["relation_type"]}]->(value)
+            RETURN related.uid, origin.uid, value, rel
+            """,
+            {"origin_uids": origin_uids},
+            resolve_objects=False,
+        )
+
+        related_latest_values: dict[
+            tuple[str, str], tuple[VersionValue, StructuredRel]
+        ] = {}
+        for related_uid, origin_uid, value, rel in rs:
+            # As with `relationship`, the first relationship between two nodes is used
+            related_latest_values.setdefault(
+                (related_uid, origin_uid),
+                (
+                    latest_value.definition["node_class"].inflate(value),
+                    relation_model.inflate(rel),
+                ),
+            )
+        return related_latest_values
+
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["uid", "relation_uid"]
+    )
     def remove_relation(
         self,
         uid: str,
@@ -1,5 +1,7 @@
 import json
 
+from neomodel import db
+
 from clinical_mdr_api.domain_repositories._generic_repository_interface import (
     _AggregateRootType,
 )
@@ -240,6 +242,81 @@ vendor_element.uid AS vendor_element_uid
         else:
             raise BusinessLogicException(msg="Invalid ODM element type.")
 
+        if vendor_element_attribute:
+            parent_uid = rel.end_node().belongs_to_vendor_element.get_or_none().uid
+        else:
+            parent_uid = rel.end_node().belongs_to_vendor_namespace.get_or_none().uid
+
+        return self._create_vendor_attribute_relation_vo(
+            uid, vendor_attribute_value, rel, parent_uid, vendor_element_attribute
+        )
+
+    def find_with_odm_element_relations(
+        self,
+        odm_element_uids: list[str],
+        odm_element_type: RelationType,
+        vendor_element_attribute: bool = True,
+    ) -> dict[
+        tuple[str, str],
+        OdmVendorAttributeRelationVO | OdmVendorElementAttributeRelationVO,
+    ]:
+        """
+        Set-based equivalent of `find_by_uid_with_odm_element_relation` for all vendor attributes of the given ODM elements.
+
+        :param odm_element_uids: The UIDs of the ODM elements.
+        :param odm_element_type: The type of the ODM elements.
+        :param vendor_element_attribute: Whether to look up the vendor element attributes instead of the vendor attributes.
+        :return: The vendor attributes with their relationship to the ODM element, by UID of the vendor attribute and UID of the ODM element.
+        """
+        related_latest_values = self._find_related_latest_values(
+            self._get_odm_element_class(odm_element_type),
+            (
+                "has_vendor_element_attribute"
+                if vendor_element_attribute
+                else "has_vendor_attribute"
+            ),
+            odm_element_uids,
+        )
+        if not related_latest_values:
+            return {}
+
+        parent_class = (
+            OdmVendorElementRoot if vendor_element_attribute else OdmVendorNamespaceRoot
+        )
+        rs, _ = db.cypher_query(
+            f"""
+            MATCH (parent:{parent_class.__label__})-[:HAS_VENDOR_ATTRIBUTE]->(vendor_attribute_root:OdmVendorAttributeRoot)
+            WHERE vendor_attribute_root.uid IN $uids
+            RETURN vendor_attribute_root.uid, parent.uid
+            """,
+            {"uids": list({uid for uid, _ in related_latest_values})},
+        )
+        parent_uids: dict[str, str] = {}
+        for uid, parent_uid in rs:
+            parent_uids.setdefault(uid, parent_uid)
+
+        return {
+            (uid, odm_element_uid): self._create_vendor_attribute_relation_vo(
+                uid,
+                vendor_attribute_value,
+                rel,
+                parent_uids.get(uid),
+                vendor_element_attribute,
+            )
+            for (uid, odm_element_uid), (
+                vendor_attribute_value,
+                rel,
+            ) in related_latest_values.items()
+        }
+
+    @staticmethod
+    def _create_vendor_attribute_relation_vo(
+        uid: str,
+        vendor_attribute_value: OdmVendorAttributeValue,
+        rel,
+        parent_uid: str | None,
+        vendor_element_attribute: bool,
+    ) -> OdmVendorAttributeRelationVO | OdmVendorElementAttributeRelationVO:
         if vendor_element_attribute:
             return OdmVendorElementAttributeRelationVO.from_repository_values(
                 uid=uid,
@@ -247,9 +324,7 @@ vendor_element.uid AS vendor_element_uid
                 data_type=vendor_attribute_value.data_type,
                 value_regex=vendor_attribute_value.value_regex,
                 value=rel.value,
-                vendor_element_uid=rel.end_node()
-                .belongs_to_vendor_element.get_or_none()
-                .uid,
+                vendor_element_uid=parent_uid,
             )
 
         return OdmVendorAttributeRelationVO.from_repository_values(
@@ -259,7 +334,5 @@ vendor_element.uid AS vendor_element_uid
             data_type=vendor_attribute_value.data_type,
             value_regex=vendor_attribute_value.value_regex,
             value=rel.value,
-            vendor_namespace_uid=rel.end_node()
-            .belongs_to_vendor_namespace.get_or_none()
-            .uid,
+            vendor_namespace_uid=parent_uid,
         )
@@ -185,6 +185,36 @@ apoc.coll.toSet([vendor_attribute in vendor_attributes | vendor_attribute.uid])
         else:
             raise BusinessLogicException(msg="Invalid ODM element type.")
 
+        return self._create_vendor_element_relation_vo(uid, vendor_element_value, rel)
+
+    def find_with_odm_element_relations(
+        self, odm_element_uids: list[str], odm_element_type: RelationType
+    ) -> dict[tuple[str, str], OdmVendorElementRelationVO]:
+        """
+        Set-based equivalent of `find_by_uid_with_odm_element_relation` for all vendor elements of the given ODM elements.
+
+        :param odm_element_uids: The UIDs of the ODM elements.
+        :param odm_element_type: The type of the ODM elements.
+        :return: The vendor elements with their relationship to the ODM element, by UID of the vendor element and UID of the ODM element.
+        """
+        return {
+            key: self._create_vendor_element_relation_vo(
+                key[0], vendor_element_value, rel
+            )
+            for key, (
+                vendor_element_value,
+                rel,
+            ) in self._find_related_latest_values(
+                self._get_odm_element_class(odm_element_type),
+                "has_vendor_element",
+                odm_element_uids,
+            ).items()
+        }
+
+    @staticmethod
+    def _create_vendor_element_relation_vo(
+        uid: str, vendor_element_value: OdmVendorElementValue, rel
+    ) -> OdmVendorElementRelationVO:
         return OdmVendorElementRelationVO.from_repository_values(
             uid=uid,
             compatible_types=vendor_element_value.compatible_types,
@@ -8,6 +8,7 @@ from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_get_all_qu
     create_codelist_name_aggregate_instances_from_cypher_result,
     format_codelist_filter_sort_keys,
     list_codelist_wildcard_properties,
+    prefetch_author_usernames,
 )
 from clinical_mdr_api.domain_repositories.models._utils import (
     format_generic_header_values,
@@ -24,6 +25,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    FulltextIndex,
     validate_filters_and_add_search_string,
 )
 from common.exceptions import ValidationException
@@ -201,29 +203,24 @@ class CTCodelistAggregatedRepository:
             total_count=total_count,
             wildcard_properties_list=list_codelist_wildcard_properties(),
             format_filter_sort_keys=format_codelist_filter_sort_keys,
+            fulltext_index=self._fulltext_index(is_sponsor),
         )
 
         query.parameters.update(filter_query_parameters)
         result_array, attributes_names = query.execute()
 
-        codelists_ars = []
-        for codelist in result_array:
-            codelist_dictionary = {}
-            for codelist_property, attribute_name in zip(codelist, attributes_names):
-                codelist_dictionary[attribute_name] = codelist_property
-            codelists_ars.append(
-                self._create_codelist_aggregate_instances_from_cypher_result(
-                    codelist_dictionary
-                )
+        codelist_dictionaries = [
+            dict(zip(attributes_names, codelist)) for codelist in result_array
+        ]
+        prefetch_author_usernames(codelist_dictionaries)
+        codelists_ars = [
+            self._create_codelist_aggregate_instances_from_cypher_result(
+                codelist_dictionary
             )
+            for codelist_dictionary in codelist_dictionaries
+        ]
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=codelists_ars, total=total)
 
@@ -286,6 +283,7 @@ class CTCodelistAggregatedRepository:
             alias_clause=alias_clause,
             wildcard_properties_list=list_codelist_wildcard_properties(),
             format_filter_sort_keys=format_codelist_filter_sort_keys,
+            fulltext_index=self._fulltext_index(is_sponsor),
         )
 
         query.full_query = query.build_header_query(
@@ -302,6 +300,16 @@ class CTCodelistAggregatedRepository:
             else []
         )
 
+    @staticmethod
+    def _fulltext_index(is_sponsor: bool) -> FulltextIndex:
+        # Sponsor match clauses project their rows through WITH and CALL,
+        # the found nodes can then only be filtered after the match clause
+        return FulltextIndex(
+            name="fulltext_CTCodelistNameValue",
+            alias="value_node_name",
+            match_alias=None if is_sponsor else "codelist_name_value",
+        )
+
     def _generate_generic_match_clause(
         self,
         library_name: str | None = None,
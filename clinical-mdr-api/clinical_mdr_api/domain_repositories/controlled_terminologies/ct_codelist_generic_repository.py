@@ -208,13 +208,7 @@ class CTCodelistGenericRepository(
             result_array, attributes_names
         )
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=extracted_items, total=total)
 
@@ -386,7 +380,7 @@ class CTCodelistGenericRepository(
             return versions
         return None
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save(self, item: _AggregateRootType) -> None:
         if item.uid is not None and item.repository_closure_data is None:
             self._create(item)
@@ -407,7 +401,9 @@ class CTCodelistGenericRepository(
             return True
         return False
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["codelist_uid", "term_uid"]
+    )
     def add_term(
         self, codelist_uid: str, term_uid: str, author_id: str, order: int
     ) -> None:
@@ -469,7 +465,9 @@ class CTCodelistGenericRepository(
         db.cypher_query(query, {"codelist_uid": codelist_uid, "term_uid": term_uid})
         TemplateParameterTermRoot.generate_node_uids_if_not_present()
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["codelist_uid", "term_uid"]
+    )
     def remove_term(self, codelist_uid: str, term_uid: str, author_id: str) -> None:
         """
         Method removes term identified by term_uid from the codelist identified by codelist_uid.
@@ -116,6 +116,21 @@ def create_term_filter_statement(
     return filter_statement, filter_query_parameters
 
 
+def prefetch_author_usernames(items: list[dict]) -> None:
+    """
+    Announces the authors of all versions contained in the cypher query output,
+    so that their usernames are resolved together.
+
+    :param items
+    """
+    UserInfoService.prefetch_author_usernames(
+        value.get("author_id")
+        for item in items
+        for key, value in item.items()
+        if key.startswith("rel_data") and isinstance(value, dict)
+    )
+
+
 def create_simple_term_instances_from_cypher_result(
     term_dict: dict,
 ) -> TermWithCodelistMetadata:
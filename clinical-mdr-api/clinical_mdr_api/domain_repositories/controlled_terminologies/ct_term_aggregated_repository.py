@@ -8,6 +8,7 @@ from clinical_mdr_api.domain_repositories.controlled_terminologies.ct_get_all_qu
     create_term_name_aggregate_instances_from_cypher_result,
     format_term_filter_sort_keys,
     list_term_wildcard_properties,
+    prefetch_author_usernames,
 )
 from clinical_mdr_api.domain_repositories.models._utils import (
     format_generic_header_values,
@@ -22,6 +23,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    FulltextIndex,
     validate_filters_and_add_search_string,
 )
 from common.exceptions import ValidationException
@@ -202,29 +204,20 @@ class CTTermAggregatedRepository:
             total_count=total_count,
             wildcard_properties_list=list_term_wildcard_properties(),
             format_filter_sort_keys=format_term_filter_sort_keys,
+            fulltext_index=self._fulltext_index(is_sponsor),
         )
 
         query.parameters.update(filter_query_parameters)
         result_array, attributes_names = query.execute()
 
-        terms_ars = []
-        for term in result_array:
-            term_dictionary = {}
-            for term_property, attribute_name in zip(term, attributes_names):
-                term_dictionary[attribute_name] = term_property
-            terms_ars.append(
-                self._create_term_aggregate_instances_from_cypher_result(
-                    term_dictionary
-                )
-            )
+        term_dictionaries = [dict(zip(attributes_names, term)) for term in result_array]
+        prefetch_author_usernames(term_dictionaries)
+        terms_ars = [
+            self._create_term_aggregate_instances_from_cypher_result(term_dictionary)
+            for term_dictionary in term_dictionaries
+        ]
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=terms_ars, total=total)
 
@@ -283,6 +276,7 @@ class CTTermAggregatedRepository:
             alias_clause=alias_clause,
             wildcard_properties_list=list_term_wildcard_properties(),
             format_filter_sort_keys=format_term_filter_sort_keys,
+            fulltext_index=self._fulltext_index(is_sponsor),
         )
 
         query.full_query = query.build_header_query(
@@ -299,6 +293,16 @@ class CTTermAggregatedRepository:
             else []
         )
 
+    @staticmethod
+    def _fulltext_index(is_sponsor: bool) -> FulltextIndex:
+        # Sponsor match clauses project their rows through WITH and CALL,
+        # the found nodes can then only be filtered after the match clause
+        return FulltextIndex(
+            name="fulltext_CTTermNameValue",
+            alias="value_node_name",
+            match_alias=None if is_sponsor else "term_name_value",
+        )
+
     def _generate_generic_match_clause(
         self,
         codelist_uid: str | None = None,
@@ -261,13 +261,7 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
             result_array, attributes_names
         )
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=extracted_items, total=total)
 
@@ -485,7 +479,7 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
             return versions
         return None
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save(self, item: _AggregateRootType) -> None:
         if item.uid is not None and item.repository_closure_data is None:
             self._create(item)
@@ -498,7 +492,9 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
     def _is_repository_related_to_ct(self) -> bool:
         return True
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["term_uid", "parent_uid"]
+    )
     def add_parent(
         self, term_uid: str, parent_uid: str, relationship_type: TermParentType
     ) -> None:
@@ -531,7 +527,9 @@ class CTTermGenericRepository(LibraryItemRepositoryImplBase[_AggregateRootType],
         else:
             ct_term_root_node.has_parent_subtype.connect(ct_term_root_parent_node)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(
+        caches=["cache_store_item_by_uid"], uid_args=["term_uid", "parent_uid"]
+    )
     def remove_parent(
         self, term_uid: str, parent_uid: str, relationship_type: TermParentType
     ) -> None:
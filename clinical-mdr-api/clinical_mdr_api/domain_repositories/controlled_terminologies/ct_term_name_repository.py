@@ -147,13 +147,7 @@ class CTTermNameRepository(
                 self._create_simple_term_instances_from_cypher_result(term_dictionary)
             )
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=terms_ars, total=total)
 
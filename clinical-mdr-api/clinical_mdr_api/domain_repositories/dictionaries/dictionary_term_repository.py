@@ -46,6 +46,7 @@ from clinical_mdr_api.repositories._utils import (
     CypherQueryBuilder,
     FilterDict,
     FilterOperator,
+    FulltextIndex,
     sb_clear_cache,
     validate_filters_and_add_search_string,
 )
@@ -59,6 +60,11 @@ class DictionaryTermGenericRepository(
 ):
     root_class = DictionaryTermRoot
     value_class = DictionaryTermValue
+    fulltext_index = FulltextIndex(
+        name="fulltext_DictionaryTermValue",
+        alias="dictionary_term_value",
+        match_alias="dictionary_term_value",
+    )
     specific_root_class_mapping = {
         "snomed": SnomedTermRoot,
         "med-rt": MEDRTTermRoot,
@@ -243,6 +249,7 @@ class DictionaryTermGenericRepository(
             filter_operator=filter_operator,
             total_count=total_count,
             return_model=DictionaryCodelist,
+            fulltext_index=self.fulltext_index,
         )
 
         query.parameters.update({"codelist_uid": codelist_uid})
@@ -251,12 +258,7 @@ class DictionaryTermGenericRepository(
             result_array, attributes_names
         )
 
-        count_result, _ = db.cypher_query(
-            query=query.count_query, params=query.parameters
-        )
-        total_amount = (
-            count_result[0][0] if len(count_result) > 0 and total_count else 0
-        )
+        total_amount = query.get_total_count() if total_count else 0
 
         return extracted_items, total_amount
 
@@ -306,6 +308,7 @@ class DictionaryTermGenericRepository(
             filter_operator=filter_operator,
             match_clause=match_clause,
             alias_clause=alias_clause,
+            fulltext_index=self.fulltext_index,
         )
 
         query.parameters.update({"codelist_uid": codelist_uid})
@@ -332,7 +335,7 @@ class DictionaryTermGenericRepository(
         """
         return self.find_by_uid_2(uid=term_uid, for_update=for_update)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save(self, item: _AggregateRootType) -> None:
         if item.uid is not None and item.repository_closure_data is None:
             self._create(item)
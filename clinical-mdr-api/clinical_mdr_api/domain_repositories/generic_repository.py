@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Mapping, Type
 
 from cachetools import TTLCache
@@ -13,6 +14,7 @@ from clinical_mdr_api.domain_repositories.models.study_audit_trail import StudyA
 from clinical_mdr_api.domain_repositories.models.study_field import StudyField
 from clinical_mdr_api.domain_repositories.models.study_selections import StudySelection
 from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 from common import config
 from common.exceptions import ValidationException
 
@@ -38,8 +40,11 @@ class RepositoryImpl:
     Results from a repository should be used to build aggregate root (AR) objects.
     """
 
-    cache_store_item_by_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
+    lock_store_item_by_uid = Lock()
+    cache_store_item_by_uid = register_cache(
+        "RepositoryImpl.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
     )
 
     value_class: type
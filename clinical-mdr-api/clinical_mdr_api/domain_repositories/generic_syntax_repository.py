@@ -415,7 +415,7 @@ class GenericSyntaxRepository(
         # Finds template type in database based on root node uid
         return CTTermRoot.nodes.get(uid=uid)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def patch_indications(self, uid: str, indication_uids: list[str] | None) -> None:
         root = self.root_class.nodes.get(uid=uid)
         root.has_indication.disconnect_all()
@@ -423,7 +423,7 @@ class GenericSyntaxRepository(
             indication = self._get_indication(indication)
             root.has_indication.connect(indication)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def patch_categories(self, uid: str, category_uids: list[str] | None) -> None:
         root = self.root_class.nodes.get(uid=uid)
         root.has_category.disconnect_all()
@@ -431,7 +431,7 @@ class GenericSyntaxRepository(
             category = self._get_category(category)
             root.has_category.connect(category)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def patch_subcategories(
         self, uid: str, sub_category_uids: list[str] | None
     ) -> None:
@@ -441,7 +441,7 @@ class GenericSyntaxRepository(
             sub_category = self._get_category(sub_category)
             root.has_subcategory.connect(sub_category)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def patch_activities(self, uid: str, activity_uids: list[str] | None) -> None:
         root = self.root_class.nodes.get(uid=uid)
         root.has_activity.disconnect_all()
@@ -449,7 +449,7 @@ class GenericSyntaxRepository(
             activity = self._get_activity(activity)
             root.has_activity.connect(activity)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def patch_activity_groups(
         self, uid: str, activity_group_uids: list[str] | None
     ) -> None:
@@ -459,7 +459,7 @@ class GenericSyntaxRepository(
             group = self._get_activity_group(group)
             root.has_activity_group.connect(group)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
     def patch_activity_subgroups(
         self, uid: str, activity_subgroup_uids: list[str] | None
     ) -> None:
@@ -40,8 +40,13 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
 from clinical_mdr_api.repositories._utils import (
     ComparisonOperator,
     FilterOperator,
+    FulltextIndex,
+    build_fulltext_query,
+    find_fulltext_matches,
     sb_clear_cache,
+    validate_fulltext_search_values,
 )
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 from clinical_mdr_api.services.user_info import UserInfoService
 from clinical_mdr_api.utils import convert_to_plain, validate_dict
 from common import config
@@ -51,7 +56,10 @@ from common.exceptions import (
     ValidationException,
 )
 from common.utils import (
+    build_keyset_predicate,
     convert_to_datetime,
+    decode_page_token,
+    encode_page_token,
     validate_max_skip_clause,
     version_string_to_tuple,
 )
@@ -64,11 +72,18 @@ MATCH_NODE_BY_ID = "MATCH (node) WHERE elementId(node)=$id RETURN node"
 class LibraryItemRepositoryImplBase(
     RepositoryImpl, GenericRepository[_AggregateRootType], abc.ABC
 ):
-    cache_store_item_by_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
-    )
     lock_store_item_by_uid = Lock()
+    # Shared by all library item repositories, whose aggregates embed data of related items,
+    # e.g. activities hold the names of their groups, so any write clears the whole cache
+    cache_store_item_by_uid = register_cache(
+        "LibraryItemRepositoryImplBase.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
+        evict_by_uid=False,
+    )
     has_library = True
+    # Full-text index of value nodes, resolving wildcard filters with the 'search' operator
+    fulltext_index: FulltextIndex | None = None
 
     @abc.abstractmethod
     def _create_aggregate_root_instance_from_version_root_relationship_and_value(
@@ -170,7 +185,7 @@ class LibraryItemRepositoryImplBase(
             itm.__WRITE_LOCK__ = None
             itm.save()
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["ar"])
     def _get_or_create_value(
         self, root: VersionRoot, ar: _AggregateRootType
     ) -> VersionValue:
@@ -328,7 +343,7 @@ class LibraryItemRepositoryImplBase(
             and new_status == LibraryItemStatus.DRAFT
         )
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["root"])
     def _recreate_relationship(
         self,
         root: VersionRoot,
@@ -356,7 +371,7 @@ class LibraryItemRepositoryImplBase(
         has_version_rel.connect(value, parameters)
         self._db_create_relationship(relation, value)
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["root"])
     def _close_previous_versions(
         self,
         root: VersionRoot,
@@ -677,6 +692,9 @@ class LibraryItemRepositoryImplBase(
             all_version_nodes_and_relationships = [
                 (_[1], _[2]) for _ in self._get_item_versions(root)[0]
             ]
+            UserInfoService.prefetch_author_usernames(
+                rel.author_id for _, rel in all_version_nodes_and_relationships
+            )
             if return_study_count:
                 result = [
                     self._create_aggregate_root_instance_from_version_root_relationship_and_value(
@@ -1074,7 +1092,7 @@ class LibraryItemRepositoryImplBase(
             minor_version=int(minor),
         )
 
-    @sb_clear_cache(caches=["cache_store_item_by_uid"])
+    @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
     def save(self, item: _AggregateRootType) -> None:
         if item.repository_closure_data is RETRIEVED_READ_ONLY_MARK:
             raise NotImplementedError(
@@ -1436,8 +1454,6 @@ class LibraryItemRepositoryImplBase(
         validate_dict(sort_by, "sort_by")
         validate_max_skip_clause(page_number=page_number, page_size=page_size)
 
-        aggregates = []
-
         where_stmt, params = self._where_stmt_optimized(
             filter_by, filter_operator, version_specific_uids=version_specific_uids
         )
@@ -1453,6 +1469,7 @@ class LibraryItemRepositoryImplBase(
             sort_by=sort_by,
             for_audit_trail=for_audit_trail,
             include_retired_versions=include_retired_versions,
+            rank_by_fulltext_score="fulltext_scores" in params,
         )
 
         if status:
@@ -1554,6 +1571,110 @@ class LibraryItemRepositoryImplBase(
                         total_result.append(latest_result[0])
                 result = total_result
 
+        aggregates = self._create_read_only_ars_optimized(result, library_name)
+
+        count_result = []
+        if total_count:
+            count_result, _ = db.cypher_query(
+                query=match_stmt + "RETURN count(DISTINCT ver_rel)", params=params
+            )
+        total_amount = (
+            count_result[0][0] if len(count_result) > 0 and total_count else 0
+        )
+        return aggregates, total_amount
+
+    def get_all_optimized_by_page_token(
+        self,
+        *,
+        page_token: str | None = None,
+        page_size: int,
+        status: LibraryItemStatus | None = None,
+        library_name: str | None = None,
+        return_study_count: bool | None = False,
+        sort_by: dict | None = None,
+        filter_by: dict | None = None,
+        filter_operator: FilterOperator | None = FilterOperator.AND,
+        total_count: bool = False,
+    ) -> tuple[list, int, str | None]:
+        """
+        Returns a page of items like `get_all_optimized`, with keyset pagination.
+
+        The page starts right after the last item of the page `page_token` was returned for,
+        or at the first item when it is None or empty. Instead of skipping all items of the previous pages,
+        the page is found with a predicate on the sort keys of that item, so that deep pages
+        are as fast as the first one, and items are neither skipped nor repeated when items
+        are created or deleted while paging.
+
+        Returns the items, their total count if requested, and the token of the next page, which is None on the last page.
+        """
+        validate_dict(filter_by, "filters")
+        validate_dict(sort_by, "sort_by")
+        ValidationException.raise_if(
+            page_size <= 0, msg="page_size must be greater than 0."
+        )
+
+        page_keys = self._page_keys(sort_by)
+        sort_signature = ",".join(
+            f"{field}:{'asc' if ascending else 'desc'}"
+            for field, ascending in (sort_by or {"uid": False}).items()
+        )
+
+        where_stmt, params = self._where_stmt_optimized(filter_by, filter_operator)
+        match_stmt, return_stmt = self._find_cypher_query_optimized(
+            with_status=bool(status),
+            return_study_count=return_study_count,
+            where_stmt=where_stmt,
+            page_keys=page_keys,
+        )
+
+        if status:
+            params["status"] = status.value
+        # All items are counted, not only the ones after the page token
+        count_stmt = match_stmt + "RETURN count(DISTINCT ver_rel)"
+        count_params = dict(params)
+
+        if page_token:
+            keyset_predicate, keyset_params = build_keyset_predicate(
+                page_keys,
+                decode_page_token(page_token, sort_signature, len(page_keys)),
+            )
+            match_stmt += f" WITH * WHERE {keyset_predicate} "
+            params |= keyset_params
+
+        params["page_size"] = page_size
+
+        try:
+            result, _ = db.cypher_query(
+                match_stmt + return_stmt, params=params, resolve_objects=True
+            )
+        except NodeClassNotDefined as exc:
+            raise NotFoundException(
+                msg="Resource doesn't exist - it was likely deleted in a concurrent transaction."
+            ) from exc
+
+        next_page_token = (
+            encode_page_token(sort_signature, result[-1][-1])
+            if len(result) == page_size
+            else None
+        )
+        aggregates = self._create_read_only_ars_optimized(
+            [row[:-1] for row in result], library_name
+        )
+
+        count_result = []
+        if total_count:
+            count_result, _ = db.cypher_query(query=count_stmt, params=count_params)
+        total_amount = count_result[0][0] if count_result else 0
+        return aggregates, total_amount, next_page_token
+
+    def _create_read_only_ars_optimized(
+        self, result: list, library_name: str | None = None
+    ) -> list:
+        UserInfoService.prefetch_author_usernames(
+            getattr(row[2], "author_id", None) for row in result
+        )
+
+        aggregates = []
         for (
             library,
             root,
@@ -1600,16 +1721,7 @@ class LibraryItemRepositoryImplBase(
 
             ar.repository_closure_data = RETRIEVED_READ_ONLY_MARK
             aggregates.append(ar)
-
-        count_result = []
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=match_stmt + "RETURN count(DISTINCT ver_rel)", params=params
-            )
-        total_amount = (
-            count_result[0][0] if len(count_result) > 0 and total_count else 0
-        )
-        return aggregates, total_amount
+        return aggregates
 
     def get_all_by_uid(
         self,
@@ -1844,7 +1956,24 @@ class LibraryItemRepositoryImplBase(
         where_stmt = ""
 
         if filter_by:
-            if "*" in filter_by:
+            if (
+                "*" in filter_by
+                and filter_by["*"].get("op") == ComparisonOperator.SEARCH.value
+                and self.fulltext_index
+                and config.FULLTEXT_SEARCH_ENABLED
+            ):
+                validate_fulltext_search_values(filter_by["*"]["v"])
+                if fulltext_query := build_fulltext_query(filter_by["*"]["v"]):
+                    scores = find_fulltext_matches(
+                        self.fulltext_index.name, fulltext_query
+                    )
+                    params["fulltext_element_ids"] = list(scores)
+                    params["fulltext_scores"] = scores
+                    where_stmt += "elementId(value) IN $fulltext_element_ids"
+                else:
+                    # Like an empty 'contains' filter, blank search values match everything
+                    where_stmt += "true"
+            elif "*" in filter_by:
                 for _, cypher_name in mapping.items():
                     if (
                         "op" in filter_by["*"]
@@ -1965,8 +2094,34 @@ END
 
         return "WHERE " + where_stmt, params
 
-    def _sort_stmt(self, sort_by: dict | None = None):
+    def _page_keys(self, sort_by: dict | None = None) -> list[tuple[str, bool]]:
+        """
+        Returns the Cypher expressions of the sort keys with their ascending flag, ending with the uid,
+        as used by `get_all_optimized_by_page_token`.
+        """
         if not sort_by:
+            return [("root.uid", False)]
+
+        mapping = self.basemodel_to_cypher_mapping_optimized()
+        page_keys = []
+        for sort_field, direction in sort_by.items():
+            ValidationException.raise_if(
+                sort_field not in mapping,
+                msg=f"Unsupported sorting parameter: {sort_field}. "
+                f"Supported parameters are: {list(mapping)}",
+            )
+            page_keys.append((mapping[sort_field], bool(direction)))
+
+        if "root.uid" not in [key for key, _ in page_keys]:
+            page_keys.append(("root.uid", page_keys[-1][1]))
+        return page_keys
+
+    def _sort_stmt(
+        self, sort_by: dict | None = None, rank_by_fulltext_score: bool = False
+    ):
+        if not sort_by:
+            if rank_by_fulltext_score:
+                return "ORDER BY $fulltext_scores[elementId(value)] DESC, root.uid DESC"
             return "ORDER BY root.uid DESC"
 
         mapping = self.basemodel_to_cypher_mapping_optimized()
@@ -2111,6 +2266,8 @@ END
         uid: str | None = None,
         for_audit_trail: bool = False,
         include_retired_versions: bool = False,
+        rank_by_fulltext_score: bool = False,
+        page_keys: list[tuple[str, bool]] | None = None,
     ):
         """
         Default behavior
@@ -2141,6 +2298,10 @@ END
                         This allows you to UNION a query getting a term at a date with a specific status,
                         with a second query which returns the latest final regardless of status.
                         - This flag, renders the status, version and specific_date unusable when calling find_cypher_query_optimized
+            page_keys
+                - Sort keys of keyset pagination, see get_all_optimized_by_page_token.
+                    Results are sorted by these keys and limited to $page_size,
+                    and their values are returned in an additional page_key column.
 
 
 
@@ -2423,9 +2584,15 @@ END
                 {instance_template_return}
             """
 
-        if not for_audit_trail:
+        if page_keys:
+            return_stmt += f"""
+                ,[{", ".join(key for key, _ in page_keys)}] AS page_key
+                ORDER BY {", ".join(f"{key} {'ASC' if ascending else 'DESC'}" for key, ascending in page_keys)}
+                LIMIT $page_size
+            """
+        elif not for_audit_trail:
             if not uid and not issubclass(self.root_class, CTTermNameRoot):
-                return_stmt += f" {self._sort_stmt(sort_by)} "
+                return_stmt += f" {self._sort_stmt(sort_by, rank_by_fulltext_score)} "
 
                 if with_pagination:
                     return_stmt += " SKIP $page_number * $page_size LIMIT $page_size "
@@ -15,6 +15,7 @@ from clinical_mdr_api.domain_repositories.models.project import Project
 from clinical_mdr_api.domain_repositories.models.study import StudyRoot
 from clinical_mdr_api.domains.projects.project import ProjectAR
 from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 from common import config
 from common.exceptions import (
     AlreadyExistsException,
@@ -24,18 +25,24 @@ from common.exceptions import (
 
 
 class ProjectRepository:
-    cache_store_item_by_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
-    )
     lock_store_item_by_uid = Lock()
-    cache_store_item_by_study_uid = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
+    cache_store_item_by_uid = register_cache(
+        "ProjectRepository.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
     )
     lock_store_item_by_study_uid = Lock()
-    cache_store_item_by_project_number = TTLCache(
-        maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL
+    cache_store_item_by_study_uid = register_cache(
+        "ProjectRepository.cache_store_item_by_study_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_study_uid,
     )
     lock_store_item_by_project_number = Lock()
+    cache_store_item_by_project_number = register_cache(
+        "ProjectRepository.cache_store_item_by_project_number",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_project_number,
+    )
 
     def project_number_exists(self, project_number: str) -> bool:
         project = Project.nodes.first_or_none(project_number=project_number)
@@ -1,8 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from neomodel import db
-
 from clinical_mdr_api.domain_repositories.concepts.utils import (
     list_concept_wildcard_properties,
 )
@@ -206,16 +204,7 @@ class StandardDataModelRepository(ABC):
             result_array, attributes_names
         )
 
-        count_result, _ = db.cypher_query(
-            query=query.count_query, params=query.parameters
-        )
-        if len(count_result) > 0 and total_count:
-            if query.union_match_clause:
-                total_amount = count_result[0][0] + count_result[1][0]
-            else:
-                total_amount = count_result[0][0]
-        else:
-            total_amount = 0
+        total_amount = query.get_total_count() if total_count else 0
 
         return extracted_items, total_amount
 
@@ -2407,16 +2407,7 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
                 study_dictionary[attribute_name] = study_property
             studies.append(study_dictionary)
 
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
-            else:
-                total = 0
-        else:
-            total = 0
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(
             items=self._retrieve_all_snapshots_from_cypher_query_result(
@@ -2558,16 +2549,7 @@ MATCH (sr:StudyRoot)-[:LATEST]->(sv)
             for study_property, attribute_name in zip(study, attributes_names):
                 study_dictionary[attribute_name] = study_property
             studies.append(study_dictionary)
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
-            else:
-                total = 0
-        else:
-            total = 0
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(
             items=self._retrieve_all_snapshots_from_cypher_query_result(studies),
@@ -1,9 +1,14 @@
 import datetime
 from dataclasses import dataclass
 
+from neomodel import db
+
 from clinical_mdr_api.domain_repositories.generic_repository import (
     manage_previous_connected_study_selection_relationships,
 )
+from clinical_mdr_api.domain_repositories.models._utils import (
+    convert_to_tz_aware_datetime,
+)
 from clinical_mdr_api.domain_repositories.models.activities import (
     ActivityRoot,
     ActivityValue,
@@ -24,6 +29,7 @@ from clinical_mdr_api.domains.study_selections.study_selection_activity import (
     StudySelectionActivityAR,
     StudySelectionActivityVO,
 )
+from common.exceptions import BusinessLogicException
 from common.utils import convert_to_datetime
 
 
@@ -429,6 +435,91 @@ class StudySelectionActivityRepository(
                 ],
             )
 
+    def save_new_selections(
+        self,
+        study_uid: str,
+        selections: list[tuple[int, StudySelectionActivityVO]],
+    ) -> None:
+        """
+        Persists new study activity selections in a single query.
+
+        This is a set-based counterpart of `save` for aggregates to which selections were only appended,
+        it creates for each selection the same nodes and relationships as `_add_new_selection`
+        with a `Create` audit trail entry.
+
+        Args:
+            study_uid (str): The uid of the study the selections are added to.
+            selections (list[tuple[int, StudySelectionActivityVO]]): The new selections with their order.
+        """
+        if not selections:
+            return
+        query = """
+            MATCH (sr:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)
+            UNWIND $selections AS selection
+            MATCH (:ActivityRoot {uid: selection.activity_uid})-[:HAS_VERSION {version: selection.activity_version}]->(av:ActivityValue)
+            WITH sr, sv, selection, head(collect(DISTINCT av)) AS av
+            MATCH (soa_group:StudySoAGroup {uid: selection.study_soa_group_uid})
+            WHERE NOT (soa_group)<-[:BEFORE]-(:StudyAction)
+            CREATE (sr)-[:AUDIT_TRAIL]->(action:StudyAction:Create {author_id: selection.author_id, date: selection.date})
+            CREATE (action)-[:AFTER]->(sa:StudySelection:StudyActivity {
+                uid: selection.uid,
+                order: selection.order,
+                show_activity_in_protocol_flowchart: selection.show_activity_in_protocol_flowchart,
+                accepted_version: selection.accepted_version
+            })
+            CREATE (sv)-[:HAS_STUDY_ACTIVITY]->(sa)
+            CREATE (sa)-[:HAS_SELECTED_ACTIVITY]->(av)
+            CREATE (sa)-[:STUDY_ACTIVITY_HAS_STUDY_SOA_GROUP]->(soa_group)
+            WITH sa, selection
+            CALL {
+                WITH sa, selection
+                MATCH (subgroup:StudyActivitySubGroup {uid: selection.study_activity_subgroup_uid})
+                WHERE NOT (subgroup)<-[:BEFORE]-(:StudyAction)
+                CREATE (sa)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_SUBGROUP]->(subgroup)
+            }
+            CALL {
+                WITH sa, selection
+                MATCH (group:StudyActivityGroup {uid: selection.study_activity_group_uid})
+                WHERE NOT (group)<-[:BEFORE]-(:StudyAction)
+                CREATE (sa)-[:STUDY_ACTIVITY_HAS_STUDY_ACTIVITY_GROUP]->(group)
+            }
+            RETURN sa.uid
+        """
+        rows, _ = db.cypher_query(
+            query,
+            {
+                "study_uid": study_uid,
+                "selections": [
+                    {
+                        "uid": selection.study_selection_uid,
+                        "order": order,
+                        "show_activity_in_protocol_flowchart": bool(
+                            selection.show_activity_in_protocol_flowchart
+                        ),
+                        "accepted_version": selection.accepted_version,
+                        "activity_uid": selection.activity_uid,
+                        "activity_version": selection.activity_version,
+                        "study_soa_group_uid": selection.study_soa_group_uid,
+                        "study_activity_subgroup_uid": selection.study_activity_subgroup_uid,
+                        "study_activity_group_uid": selection.study_activity_group_uid,
+                        "author_id": selection.author_id,
+                        "date": convert_to_tz_aware_datetime(selection.start_date),
+                    }
+                    for order, selection in selections
+                ],
+            },
+        )
+        saved_uids = {row[0] for row in rows}
+        missing_uids = [
+            selection.study_selection_uid
+            for _, selection in selections
+            if selection.study_selection_uid not in saved_uids
+        ]
+        BusinessLogicException.raise_if(
+            missing_uids,
+            msg=f"Study Activities with UIDs '{', '.join(missing_uids)}' could not be saved, their Activity version or Study SoA Group was not found.",
+        )
+
     def generate_uid(self) -> str:
         return StudyActivity.get_next_free_uid_and_increment_counter()
 
@@ -1,7 +1,10 @@
 import datetime
+import threading
+from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable
+from typing import Any, Iterable
 
+from cachetools import LRUCache
 from neomodel import DoesNotExist, RelationshipManager, db
 
 from clinical_mdr_api.domain_repositories.models.study import StudyRoot, StudyValue
@@ -22,6 +25,7 @@ from clinical_mdr_api.models.study_selections.study_selection import (
     SoAFootnoteReference,
 )
 from clinical_mdr_api.services._utils import ensure_transaction
+from common import config
 from common.auth.user import user
 from common.exceptions import NotFoundException
 from common.telemetry import trace_calls
@@ -45,6 +49,42 @@ class SoALayout(Enum):
     OPERATIONAL = "operational"
 
 
+@dataclass(frozen=True)
+class AuditTrailStamp:
+    """Number of actions in the audit trail of a study and date of the latest one, any study change alters it"""
+
+    action_count: int
+    last_action_date: Any = None
+
+
+@dataclass(frozen=True)
+class DraftSoAVersion:
+    """
+    Versions the SoA of the latest draft of a study depends on:
+    the audit trail stamp of the study and the start date of the latest version of any library item,
+    e.g. of an activity or CT term shown in the SoA
+    """
+
+    audit_trail: AuditTrailStamp
+    library_date: Any = None
+
+
+@dataclass
+class DraftSoATable:
+    """SoA table of the latest draft of a study, and the versions it was built at"""
+
+    table: str
+    version: DraftSoAVersion
+
+
+# SoA tables of the latest draft of studies by (study uid, layout, time unit), kept in the memory of the worker
+_draft_tables: LRUCache = LRUCache(
+    maxsize=config.SOA_DRAFT_TABLE_CACHE_MAX_BYTES,
+    getsizeof=lambda draft_table: len(draft_table.table),
+)
+_draft_tables_lock = threading.Lock()
+
+
 class StudySoARepository:
     @staticmethod
     def _study_value_query(
@@ -312,3 +352,124 @@ class StudySoARepository:
         )
         action.save()
         study_root.audit_trail.connect(action)
+
+    @trace_calls(args=[1], kwargs=["study_uid"])
+    def get_draft_soa_version(self, study_uid: str) -> DraftSoAVersion | None:
+        """
+        Returns the versions the SoA of the latest draft of a study depends on, None if the study doesn't exist
+        """
+
+        results, _ = db.cypher_query(
+            """
+            MATCH (sr:StudyRoot {uid: $study_uid})
+            CALL {
+                WITH sr
+                OPTIONAL MATCH (sr)-[:AUDIT_TRAIL]->(sa:StudyAction)
+                RETURN count(sa) AS action_count, max(sa.date) AS last_action_date
+            }
+            CALL {
+                OPTIONAL MATCH ()-[hv:HAS_VERSION]->()
+                WHERE hv.start_date IS NOT NULL
+                WITH hv ORDER BY hv.start_date DESC LIMIT 1
+                RETURN hv.start_date AS library_date
+            }
+            RETURN action_count, last_action_date, library_date
+            """,
+            {"study_uid": study_uid},
+        )
+
+        if not results:
+            return None
+
+        action_count, last_action_date, library_date = results[0]
+        return DraftSoAVersion(
+            AuditTrailStamp(action_count, last_action_date), library_date
+        )
+
+    @staticmethod
+    def load_draft_table(
+        study_uid: str, layout: SoALayout, time_unit: str | None
+    ) -> DraftSoATable | None:
+        """Returns the SoA table of the latest draft of a study last built by this worker, if any"""
+
+        with _draft_tables_lock:
+            return _draft_tables.get((study_uid, layout, time_unit))
+
+    @staticmethod
+    def save_draft_table(
+        study_uid: str,
+        layout: SoALayout,
+        time_unit: str | None,
+        draft_table: DraftSoATable,
+    ) -> None:
+        """Keeps the SoA table of the latest draft of a study in the memory of this worker"""
+
+        with _draft_tables_lock:
+            try:
+                _draft_tables[(study_uid, layout, time_unit)] = draft_table
+            except ValueError:
+                # Larger than the whole cache
+                pass
+
+    @trace_calls(args=[1], kwargs=["study_uid"])
+    def get_activity_schedule_changes(
+        self, study_uid: str, since: AuditTrailStamp, until: AuditTrailStamp
+    ) -> list[tuple[str, str]] | None:
+        """
+        Returns the (StudyActivity.uid, StudyVisit.uid) pairs of StudyActivitySchedules created or deleted
+        between two audit trail stamps of a study.
+
+        Returns None when any other change happened in between, or when the actions in between don't add up
+        to the difference of the stamps (e.g. a transaction committed an action dated before the first stamp).
+        """
+
+        results, _ = db.cypher_query(
+            """
+            MATCH (:StudyRoot {uid: $study_uid})-[:AUDIT_TRAIL]->(sa:StudyAction)
+            WHERE ($since IS NULL OR sa.date > $since) AND sa.date <= $until
+            OPTIONAL MATCH (sa)-[:BEFORE|AFTER]->(sas:StudyActivitySchedule)
+            OPTIONAL MATCH (sas)<-[:STUDY_ACTIVITY_HAS_SCHEDULE]-(activity:StudyActivity)
+            OPTIONAL MATCH (sas)<-[:STUDY_VISIT_HAS_SCHEDULE]-(visit:StudyVisit)
+            WITH sa, collect(DISTINCT [activity.uid, visit.uid]) AS cells
+            RETURN [cell IN cells WHERE cell[0] IS NOT NULL AND cell[1] IS NOT NULL] AS cells
+            """,
+            {
+                "study_uid": study_uid,
+                "since": since.last_action_date,
+                "until": until.last_action_date,
+            },
+        )
+
+        if len(results) != until.action_count - since.action_count:
+            return None
+
+        changes = []
+        for (cells,) in results:
+            if not cells:
+                return None
+            changes.extend(
+                (activity_uid, visit_uid) for activity_uid, visit_uid in cells
+            )
+        return changes
+
+    @trace_calls(args=[1], kwargs=["study_uid"])
+    def get_activity_schedules_of_activities(
+        self, study_uid: str, study_activity_uids: Iterable[str]
+    ) -> dict[tuple[str, str], str]:
+        """Returns StudyActivitySchedule.uid by (StudyActivity.uid, StudyVisit.uid) in the latest draft of a study"""
+
+        results, _ = db.cypher_query(
+            """
+            MATCH (:StudyRoot {uid: $study_uid})-[:LATEST]->(sv:StudyValue)-[:HAS_STUDY_ACTIVITY_SCHEDULE]->(sas:StudyActivitySchedule)
+            MATCH (sas)<-[:STUDY_ACTIVITY_HAS_SCHEDULE]-(sa:StudyActivity)<-[:HAS_STUDY_ACTIVITY]-(sv)
+            WHERE sa.uid IN $study_activity_uids
+            MATCH (sas)<-[:STUDY_VISIT_HAS_SCHEDULE]-(svi:StudyVisit)<-[:HAS_STUDY_VISIT]-(sv)
+            RETURN DISTINCT sa.uid, svi.uid, sas.uid
+            """,
+            {"study_uid": study_uid, "study_activity_uids": list(study_activity_uids)},
+        )
+
+        return {
+            (study_activity_uid, study_visit_uid): schedule_uid
+            for study_activity_uid, study_visit_uid, schedule_uid in results
+        }
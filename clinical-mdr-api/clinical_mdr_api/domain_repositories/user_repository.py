@@ -7,8 +7,11 @@ from neomodel import db
 
 from clinical_mdr_api.domain_repositories.models.user import User as UserNode
 from clinical_mdr_api.models.user import UserInfo, UserInfoPatchInput
+from clinical_mdr_api.repositories.cache_invalidation import register_cache
 
-cache_get_user = TTLCache(maxsize=1000, ttl=10)
+cache_get_user = register_cache(
+    "UserRepository.cache_get_user", TTLCache(maxsize=1000, ttl=10)
+)
 
 
 class UserRepository:
@@ -55,6 +58,16 @@ class UserRepository:
 
         return [self._transform_to_model(item[0]) for item in rs[0]]
 
+    def get_all_usernames(self) -> dict[str, str | None]:
+        rs = db.cypher_query(
+            """
+            MATCH (n:User)
+            RETURN n.user_id, n.username
+            """
+        )
+
+        return {user_id: username for user_id, username in rs[0]}
+
     @cached(cache=cache_get_user, key=lambda _self, user_id: user_id)
     def get_user(self, user_id: str) -> UserInfo:
         rs = db.cypher_query(
@@ -156,13 +156,7 @@ class QueryService:
         res = (result_array, attributes_names)
         result = utils.db_result_to_list(res)
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=result, total=total)
 
@@ -210,13 +204,7 @@ class QueryService:
         res = (result_array, attributes_names)
         result = utils.db_result_to_list(res)
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=result, total=total)
 
@@ -263,13 +251,7 @@ class QueryService:
         res = (result_array, attributes_names)
         result = utils.db_result_to_list(res)
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=result, total=total)
 
@@ -334,13 +316,7 @@ class QueryService:
         res = (result_array, attributes_names)
         result = utils.db_result_to_list(res)
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=result, total=total)
 
@@ -403,13 +379,7 @@ class QueryService:
         res = (result_array, attributes_names)
         result = utils.db_result_to_list(res)
 
-        total = 0
-        if total_count:
-            count_result, _ = db.cypher_query(
-                query=query.count_query, params=query.parameters
-            )
-            if len(count_result) > 0:
-                total = count_result[0][0]
+        total = query.get_total_count() if total_count else 0
 
         return GenericFilteringReturn.create(items=result, total=total)
 
@@ -16,6 +16,7 @@ from pydantic import ValidationError
 from starlette.middleware import Middleware
 from starlette_context.middleware import RawContextMiddleware
 
+from clinical_mdr_api.models.utils import FastJSONResponse
 from clinical_mdr_api.utils.api_version import get_api_version
 from common import config, exceptions
 from common.auth.config import OAUTH_ENABLED, SWAGGER_UI_INIT_OAUTH
@@ -103,6 +104,9 @@ app = FastAPI(
     title=config.settings.app_name,
     version=get_api_version(),
     swagger_ui_parameters={"docExpansion": "none"},
+    default_response_class=(
+        FastJSONResponse if config.FAST_JSON_RESPONSE_ENABLED else JSONResponse
+    ),
     description="""
 ## NOTICE
 
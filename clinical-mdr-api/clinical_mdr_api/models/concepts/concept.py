@@ -1,6 +1,6 @@
 from abc import ABC
 from datetime import datetime
-from typing import Annotated, Callable, Self
+from typing import Annotated, Callable, Generic, Self, TypeVar
 
 from pydantic import ConfigDict, Field
 
@@ -18,6 +18,7 @@ from clinical_mdr_api.domains.concepts.unit_definitions.unit_definition import (
 )
 from clinical_mdr_api.domains.controlled_terminologies.ct_term_name import CTTermNameAR
 from clinical_mdr_api.models import _generic_descriptions
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.libraries.library import Library
 from clinical_mdr_api.models.utils import BaseModel, PatchInputModel, PostInputModel
 
@@ -188,6 +189,16 @@ class ExtendedConceptPatchInput(PatchInputModel):
     library_name: Annotated[str | None, Field(min_length=1)] = None
 
 
+_ConceptType = TypeVar("_ConceptType")
+
+
+class ConceptBatchOutput(BaseModel, Generic[_ConceptType]):
+    response_code: Annotated[
+        int, Field(description="The HTTP response code related to the created item")
+    ]
+    content: Annotated[_ConceptType | BatchErrorResponse, Field()]
+
+
 class SimpleConcept(Concept):
     template_parameter: Annotated[bool, Field()]
 
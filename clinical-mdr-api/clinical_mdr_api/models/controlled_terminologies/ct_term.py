@@ -14,6 +14,7 @@ from clinical_mdr_api.models.controlled_terminologies.ct_term_codelist import (
     CTTermCodelist,
 )
 from clinical_mdr_api.models.controlled_terminologies.ct_term_name import CTTermName
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.libraries.library import Library
 from clinical_mdr_api.models.utils import BaseModel, PostInputModel
 from common import config
@@ -130,6 +131,13 @@ class CTTermCreateInput(PostInputModel):
     library_name: Annotated[str, Field(min_length=1)]
 
 
+class CTTermBatchOutput(BaseModel):
+    response_code: Annotated[
+        int, Field(description="The HTTP response code related to the created term")
+    ]
+    content: Annotated[CTTerm | BatchErrorResponse, Field()]
+
+
 class CTTermNameAndAttributes(BaseModel):
     @classmethod
     def from_ct_term_ars(
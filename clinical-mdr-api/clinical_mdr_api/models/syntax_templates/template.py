@@ -0,0 +1,16 @@
+from typing import Annotated, Generic, TypeVar
+
+from pydantic import Field
+
+from clinical_mdr_api.models.error import BatchErrorResponse
+from clinical_mdr_api.models.utils import BaseModel
+
+_TemplateType = TypeVar("_TemplateType")
+
+
+class SyntaxTemplateBatchOutput(BaseModel, Generic[_TemplateType]):
+    response_code: Annotated[
+        int,
+        Field(description="The HTTP response code related to the created template"),
+    ]
+    content: Annotated[_TemplateType | BatchErrorResponse, Field()]
@@ -1,16 +1,20 @@
 import datetime
-import json
 import re
 from copy import copy
+from enum import Enum
+from itertools import chain
+from operator import attrgetter
 from types import NoneType, UnionType
-from typing import Annotated, Any, Callable, Generic, Iterable, Self, TypeVar
+from typing import Annotated, Any, Callable, Generic, Iterable, Iterator, Self, TypeVar
 
 import nh3
 from annotated_types import MinLen
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict, Field, ValidationInfo, field_validator
-from pydantic.fields import PydanticUndefined
-from starlette.responses import Response
+from pydantic.fields import FieldInfo, PydanticUndefined
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
 
 from clinical_mdr_api.domains.concepts.unit_definitions.unit_definition import (
     UnitDefinitionAR,
@@ -100,145 +104,194 @@ class BaseModel(PydanticBaseModel):
         It is now possible to declare a source property on a Field()
         call to specify the location where this method should get a
         field's value from.
-        """
-
-        def _extract_part_from_node(node_to_extract, path, extract_from_relationship):
-            """
-            Traverse specified path in the node_to_extract.
-            The possible paths for the traversal are stored in the node _relations dictionary.
-            """
-            if extract_from_relationship:
-                path += "_relationship"
-            if not hasattr(node_to_extract, "_relations"):
-                return None
-            if path not in node_to_extract._relations.keys():
-                # it means that the field is Optional and None was set to be a default value
-                if field.default is None:
-                    return None
-                raise RuntimeError(
-                    f"{path} is not present in node relations (did you forget to fetch it?)"
-                )
-            if node_to_extract._relations[path] == []:
-                return None
 
-            return node_to_extract._relations[path]
-
-        def _get_value_from_source_field(model_field, db_node, db_field):
-            value = getattr(db_node, db_field)
-
-            # In case of author_username model field, we need to lookup the User node using the `source` field value as `User.user_id`
-            if model_field == "author_username":
-                value = UserInfoService.get_author_username_from_id(value)
-
-            return value
+        How each field is extracted is resolved once per model class, see `_ModelValidatePlan`.
+        """
+        plan = _MODEL_VALIDATE_PLANS.get(cls)
+        if plan is None:
+            plan = _MODEL_VALIDATE_PLANS[cls] = _ModelValidatePlan(cls)
 
         ret = []
-        for name, field in cls.model_fields.items():
-            jse = field.json_schema_extra or {}
-            source = jse.get("source")
-            if jse.get("exclude_from_model_validate"):
+        value = None
+        for step in plan.steps:
+            if step.kind is _FieldKind.NESTED_MODEL:
+                # added copy to not override properties in main obj
+                value = step.model.model_validate(copy(obj))
+                # if some value of nested model is initialized then set the whole nested object
+                if isinstance(value, list):
+                    setattr(obj, step.name, value)
+                # if all values of nested model are None set the whole object to None
+                elif any(value.model_dump().values()):
+                    setattr(obj, step.name, value)
+                else:
+                    setattr(obj, step.name, None)
                 continue
-            if not source:
-                if issubclass(get_field_type(field.annotation), BaseModel):
-                    # get out of recursion
-                    if get_field_type(field.annotation) is cls:
-                        continue
-                    # added copy to not override properties in main obj
-                    value = get_field_type(field.annotation).model_validate(copy(obj))
-                    # if some value of nested model is initialized then set the whole nested object
-                    if isinstance(value, list):
-                        if value:
-                            setattr(obj, name, value)
-                        else:
-                            setattr(obj, name, [])
-                    else:
-                        if any(value.dict().values()):
-                            setattr(obj, name, value)
-                        # if all values of nested model are None set the whole object to None
-                        else:
-                            setattr(obj, name, None)
+            if step.kind is _FieldKind.DEFAULT_NONE:
                 # Quick fix to provide default None value to fields that allow it
                 # Not the best place to do this...
-                elif field.default == PydanticUndefined and not hasattr(obj, name):
-                    setattr(obj, name, None)
+                if not hasattr(obj, step.name):
+                    setattr(obj, step.name, None)
                 continue
-            if "." in source or "|" in source:
-                orig_source = source
-                # split by . that implicates property on node or | that indicates property on the relationship
-                parts = re.split(r"[.|]", source)
-                source = parts[-1]
-                last_traversal = parts[-2]
-                node = obj
-                parts = parts[:-1]
-                for _, part in enumerate(parts):
-                    extract_from_relationship = False
-                    if part == last_traversal and "|" in orig_source:
-                        extract_from_relationship = True
-                    # if node is a list of nodes we want to extract property/relationship
-                    # from all nodes in list of nodes
-                    if isinstance(node, list):
-                        return_node = []
-                        for item in node:
-                            extracted = _extract_part_from_node(
-                                node_to_extract=item,
-                                path=part,
-                                extract_from_relationship=extract_from_relationship,
-                            )
-                            return_node.extend(extracted)
-                        node = return_node
-                    else:
-                        node = _extract_part_from_node(
-                            node_to_extract=node,
-                            path=part,
-                            extract_from_relationship=extract_from_relationship,
-                        )
-                    if node is None:
-                        break
-            else:
-                node = obj
+
+            node = obj
+            for path in step.traversal:
+                # if node is a list of nodes we want to extract property/relationship
+                # from all nodes in list of nodes
+                if isinstance(node, list):
+                    return_node = []
+                    for item in node:
+                        return_node.extend(step.extract_part(item, path))
+                    node = return_node
+                else:
+                    node = step.extract_part(node, path)
+                if node is None:
+                    break
+
             if node is not None:
                 # if node is a list we want to
                 # extract property from each element of list and return list of property values
                 if isinstance(node, list):
-                    value = [
-                        _get_value_from_source_field(name, n, source) for n in node
-                    ]
+                    value = [step.get_value(n) for n in node]
                 else:
-                    value = _get_value_from_source_field(name, node, source)
-
+                    value = step.get_value(node)
             else:
                 value = None
+
             # if obtained value is a list and field type is not List
             # it means that we are building some list[BaseModel] but its fields are not of list type
-
-            if isinstance(value, list) and not get_sub_fields(field):
+            if isinstance(value, list) and not step.is_list:
                 # if ret array is not instantiated
                 # it means that the first property out of the whole list [BaseModel] is being instantiated
                 if not ret:
                     for val in value:
                         temp_obj = copy(obj)
-                        setattr(temp_obj, name, val)
+                        setattr(temp_obj, step.name, val)
                         ret.append(temp_obj)
                 # if ret exists it means that some properties out of whole list [BaseModel] are already instantiated
                 else:
                     for val, item in zip(value, ret):
-                        setattr(item, name, val)
+                        setattr(item, step.name, val)
             else:
-                setattr(obj, name, value)
+                setattr(obj, step.name, value)
         # Nothing to return and the value returned by the query
         # is an empty list => return an empty list
         if not ret and isinstance(value, list) and not value:
             return []
         # Returning single BaseModel
-        if not ret and (
-            not isinstance(value, list) or (isinstance(value, list) and value)
-        ):
+        if not ret:
             return super().model_validate(obj)
         # if ret exists it means that the list of BaseModels is being returned
-        objs_to_return = []
-        for item in ret:
-            objs_to_return.append(super().model_validate(item))
-        return objs_to_return
+        return [super(BaseModel, cls).model_validate(item) for item in ret]
+
+
+class _FieldKind(Enum):
+    SOURCE = "source"
+    NESTED_MODEL = "nested_model"
+    DEFAULT_NONE = "default_none"
+
+
+class _FieldStep:
+    """How `BaseModel.model_validate` extracts the value of a single field from an ORM node."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "model",
+        "traversal",
+        "attribute",
+        "is_list",
+        "optional",
+        "get_value",
+    )
+
+    def __init__(self, name: str, field: FieldInfo):
+        self.name = name
+        self.model = None
+        self.traversal: tuple[str, ...] = ()
+        self.attribute = None
+        self.is_list = False
+        self.optional = field.default is None
+        self.get_value = None
+
+        jse = field.json_schema_extra or {}
+        source = jse.get("source")
+        if source:
+            self.kind = _FieldKind.SOURCE
+            self.is_list = bool(get_sub_fields(field))
+            parts = re.split(r"[.|]", source)
+            self.attribute = parts[-1]
+            if len(parts) > 1:
+                # `|` indicates a property on the relationship of the last traversal
+                last_traversal = parts[-2]
+                self.traversal = tuple(
+                    (
+                        f"{part}_relationship"
+                        if part == last_traversal and "|" in source
+                        else part
+                    )
+                    for part in parts[:-1]
+                )
+            attribute = self.attribute
+            if name == "author_username":
+                # lookup the User node using the `source` field value as `User.user_id`
+                self.get_value = (
+                    lambda node: UserInfoService.get_author_username_from_id(
+                        getattr(node, attribute)
+                    )
+                )
+            else:
+                self.get_value = attrgetter(attribute)
+        elif issubclass(field_type := get_field_type(field.annotation), BaseModel):
+            self.kind = _FieldKind.NESTED_MODEL
+            self.model = field_type
+        else:
+            self.kind = _FieldKind.DEFAULT_NONE
+
+    def extract_part(self, node_to_extract, path: str):
+        """
+        Traverse specified path in the node_to_extract.
+        The possible paths for the traversal are stored in the node _relations dictionary.
+        """
+        relations = getattr(node_to_extract, "_relations", None)
+        if relations is None:
+            return None
+        if path not in relations:
+            # it means that the field is Optional and None was set to be a default value
+            if self.optional:
+                return None
+            raise RuntimeError(
+                f"{path} is not present in node relations (did you forget to fetch it?)"
+            )
+        if relations[path] == []:
+            return None
+        return relations[path]
+
+
+class _ModelValidatePlan:
+    """The steps extracting the fields of a model class, built once from its field definitions."""
+
+    __slots__ = ("steps",)
+
+    def __init__(self, model: type[BaseModel]):
+        steps = []
+        for name, field in model.model_fields.items():
+            jse = field.json_schema_extra or {}
+            if jse.get("exclude_from_model_validate"):
+                continue
+            step = _FieldStep(name, field)
+            # get out of recursion
+            if step.kind is _FieldKind.NESTED_MODEL and step.model is model:
+                continue
+            if (
+                step.kind is _FieldKind.DEFAULT_NONE
+                and field.default != PydanticUndefined
+            ):
+                continue
+            steps.append(step)
+        self.steps: tuple[_FieldStep, ...] = tuple(steps)
+
+
+_MODEL_VALIDATE_PLANS: dict[type[BaseModel], _ModelValidatePlan] = {}
 
 
 class InputModel(BaseModel):
@@ -330,6 +383,41 @@ class CustomPage(BaseModel, Generic[T]):
         return cls(total=total, items=items, page=page, size=size)
 
 
+class CustomPageWithPageToken(CustomPage[T], Generic[T]):
+    """
+    A page of a paginated query, which can also be requested by page token.
+
+    Attributes:
+        next_page_token (str | None): The token of the next page, if the page was requested by page token
+            and isn't the last one.
+    """
+
+    next_page_token: Annotated[
+        str | None,
+        Field(
+            description="Token to pass as `page_token` to get the next page, "
+            "returned when the page was requested by `page_token` and isn't the last one."
+        ),
+    ] = None
+
+    @classmethod
+    def create(
+        cls,
+        items: list[T],
+        total: int,
+        page: int,
+        size: int,
+        next_page_token: str | None = None,
+    ) -> Self:
+        return cls(
+            total=total,
+            items=items,
+            page=page,
+            size=size,
+            next_page_token=next_page_token,
+        )
+
+
 class GenericFilteringReturn(BaseModel, Generic[T]):
     """
     A generic class used as a return type for filtered queries.
@@ -350,17 +438,108 @@ class GenericFilteringReturn(BaseModel, Generic[T]):
 EmptyGenericFilteringResult = GenericFilteringReturn.create([], 0)
 
 
-class PrettyJSONResponse(Response):
-    media_type = "application/json"
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serializing its content with pydantic-core.
+
+    Pydantic models are serialized straight to JSON bytes, without building the intermediate
+    dictionaries of `jsonable_encoder`, when the endpoint returns this response directly.
+    """
+
+    indent: int | None = None
 
     def render(self, content: Any) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=4,
-            separators=(", ", ": "),
-        ).encode("utf-8")
+        return to_json(
+            content, indent=self.indent, by_alias=True, fallback=jsonable_encoder
+        )
+
+
+class PrettyJSONResponse(FastJSONResponse):
+    indent = 4
+
+
+def json_response(content: Any, pretty: bool = False) -> FastJSONResponse:
+    """Returns the content as a `FastJSONResponse`, indented if `pretty` is set."""
+    if pretty:
+        return PrettyJSONResponse(content)
+    return FastJSONResponse(content)
+
+
+def iter_json(content: Any, nested_fields: Iterable[str] = ()) -> Iterator[bytes]:
+    """
+    Serializes the content to the same JSON bytes as `FastJSONResponse`, in chunks.
+
+    The values of the `nested_fields` of dictionaries and pydantic models are descended into,
+    one item of a list at a time, and each of their members is yielded as a chunk of its own,
+    so that large documents can be streamed section by section.
+    """
+    chunk = bytearray()
+    for part in _iter_json_parts(content, frozenset(nested_fields)):
+        if part is None:
+            if chunk:
+                yield bytes(chunk)
+                chunk.clear()
+        else:
+            chunk += part
+    if chunk:
+        yield bytes(chunk)
+
+
+def _to_json(content: Any) -> bytes:
+    return to_json(content, by_alias=True, fallback=jsonable_encoder)
+
+
+def _iter_json_parts(
+    content: Any, nested_fields: frozenset[str]
+) -> Iterator[bytes | None]:
+    # None marks the end of a chunk
+    if isinstance(content, list) and content:
+        yield b"["
+        for idx, item in enumerate(content):
+            if idx:
+                yield b","
+            yield from _iter_json_parts(item, nested_fields)
+        yield b"]"
+    elif isinstance(content, dict) and content:
+        yield b"{"
+        for idx, (key, value) in enumerate(content.items()):
+            if idx:
+                yield b","
+            yield _to_json(key) + b":"
+            if key in nested_fields:
+                yield from _iter_json_parts(value, nested_fields)
+            else:
+                yield _to_json(value)
+            yield None
+        yield b"}"
+    elif isinstance(content, PydanticBaseModel):
+        serializer = type(content).__pydantic_serializer__
+        separator = b""
+        yield b"{"
+        for name, field in chain(
+            type(content).model_fields.items(),
+            type(content).model_computed_fields.items(),
+        ):
+            value = getattr(content, name)
+            if name in nested_fields and isinstance(
+                value, (list, dict, PydanticBaseModel)
+            ):
+                key = field.serialization_alias or getattr(field, "alias", None) or name
+                yield separator + _to_json(key) + b":"
+                yield from _iter_json_parts(value, nested_fields)
+            else:
+                member = serializer.to_json(
+                    content, include={name}, by_alias=True, fallback=jsonable_encoder
+                )[1:-1]
+                # Fields excluded from serialization are left out
+                if not member:
+                    continue
+                yield separator + member
+            separator = b","
+            yield None
+        yield b"}"
+    else:
+        yield _to_json(content)
 
 
 def strip_whitespace(value: Any) -> Any:
@@ -1,6 +1,9 @@
 import functools
+import inspect
 import logging
 import re
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Annotated, Any, Callable
@@ -17,11 +20,14 @@ from clinical_mdr_api.models.concepts.activities.activity import (
 from clinical_mdr_api.models.concepts.concept import VersionProperties
 from clinical_mdr_api.models.controlled_terminologies.ct_term import SimpleTermModel
 from clinical_mdr_api.models.standard_data_models.sponsor_model import SponsorModelBase
+from clinical_mdr_api.repositories.cache_invalidation import cache_invalidation_bus
+from common import config
 from common.exceptions import ValidationException
 from common.utils import get_field_type, get_sub_fields, validate_max_skip_clause
 
 # Re-used regex
 nested_regex = re.compile(r"\.")
+query_options_regex = re.compile(r"\s*CYPHER(\s+\w+=\w+)*\s")
 
 log = logging.getLogger(__name__)
 
@@ -36,6 +42,7 @@ class ComparisonOperator(Enum):
     LESS_THAN_OR_EQUAL_TO = "le"
     BETWEEN = "bw"
     IN = "in"
+    SEARCH = "search"
 
 
 comparison_operator_to_neomodel = {
@@ -357,6 +364,72 @@ def is_date(string):
         return False
 
 
+@dataclass(frozen=True)
+class FulltextIndex:
+    """
+    Full-text index declared in FULLTEXT_INDEXES of neo4j-mdr-db/db_schema.py.
+
+    name : name of the index in the database.
+    alias : Cypher alias of the indexed node, available after the alias clause of the query.
+    match_alias : Cypher variable of the indexed node in the match clause.
+        When provided, the matched nodes are looked up by id before running the match clause
+        instead of being filtered after it.
+    """
+
+    name: str
+    alias: str
+    match_alias: str | None = None
+
+
+def build_fulltext_query(values: list[str]) -> str:
+    """
+    Builds a Lucene query matching any of the given values.
+
+    Each word of a value must match the beginning of an indexed word,
+    whole words are boosted to rank exact matches first.
+    """
+    clauses = []
+    for value in values:
+        words = re.findall(r"\w+", value.lower())
+        if words:
+            clauses.append(
+                "(" + " AND ".join(f"({word}^2 OR {word}*)" for word in words) + ")"
+            )
+    return " OR ".join(clauses)
+
+
+def find_fulltext_matches(index_name: str, fulltext_query: str) -> dict[str, float]:
+    """
+    Returns the element ids of the nodes matching a Lucene query in a full-text index, with their relevance scores.
+    All matching nodes are returned: the hits are filtered further by the calling query (e.g. latest versions, status),
+    which then applies the pagination and counts the results.
+    """
+    result, _ = db.cypher_query(
+        """
+        CALL db.index.fulltext.queryNodes($index_name, $fulltext_query) YIELD node, score
+        RETURN elementId(node), score
+        """,
+        {"index_name": index_name, "fulltext_query": fulltext_query},
+    )
+    return {element_id: score for element_id, score in result}
+
+
+def split_query_options(query: str) -> tuple[str, str]:
+    """
+    Splits the leading query options of a Cypher query, e.g. `CYPHER runtime=slotted`, from its statement.
+    """
+    query_options = query_options_regex.match(query)
+    prefix = query_options.group() if query_options else ""
+    return prefix, query[len(prefix) :]
+
+
+def validate_fulltext_search_values(values: list[Any]) -> None:
+    ValidationException.raise_if(
+        any(not isinstance(value, str) for value in values),
+        msg="Wildcard filtering only supports a search value of type string",
+    )
+
+
 class GenericFilteringReturn:
     def __init__(self, items: list[Any], total: int):
         self.items = items
@@ -460,12 +533,20 @@ class CypherQueryBuilder:
         format_filter_sort_keys: Callable. In some cases, the returned model property
             keys differ from the property keys defined in the database.
             To cover these cases, a conversion function can be provided.
+        estimated_count_label : str. Label whose number of nodes is the total count of results
+            when no filter is applied. With ESTIMATED_TOTAL_COUNT_ENABLED, the total count is then
+            read from the count store statistics instead of being counted.
+        fulltext_index : FulltextIndex. When provided, a wildcard filter with the 'search' operator
+            is resolved through this full-text index, and results are ranked by relevance
+            unless sort_by is given. Otherwise the 'search' operator behaves like 'contains'.
 
     Output properties :
         full_query : Complete cypher query with all clauses. See build_full_query
             method definition for more details.
         count_query : Cypher query with match, filter clauses, and results count. See
             build_count_query method definition for more details.
+        paged_query : Cypher query returning the page of results together with the results count.
+            See build_paged_query method definition for more details.
         parameters : Parameters object to pass along with the cypher query.
 
     Internal properties :
@@ -491,6 +572,8 @@ class CypherQueryBuilder:
         wildcard_properties_list: list[str] | None = None,
         format_filter_sort_keys: Callable | None = None,
         union_match_clause: str | None = None,
+        fulltext_index: FulltextIndex | None = None,
+        estimated_count_label: str | None = None,
     ):
         if wildcard_properties_list is None:
             wildcard_properties_list = []
@@ -508,10 +591,14 @@ class CypherQueryBuilder:
         self.return_model = return_model
         self.wildcard_properties_list = wildcard_properties_list
         self.format_filter_sort_keys = format_filter_sort_keys
+        self.fulltext_index = fulltext_index if config.FULLTEXT_SEARCH_ENABLED else None
+        self.fulltext_ranked = False
+        self.estimated_count_label = estimated_count_label
         self.filter_clause = ""
         self.sort_clause = ""
         self.pagination_clause = ""
         self.parameters = {}
+        self._total: int | None = None
 
         # Auto-generate internal clauses
         if filter_by is not None:
@@ -526,10 +613,13 @@ class CypherQueryBuilder:
         if self.sort_by:
             self.sort_by = validate_sort_by_is_dict(sort_by=self.sort_by)
             self.build_sort_clause()
+        elif self.fulltext_ranked:
+            self.build_fulltext_sort_clause()
 
         # Auto-generate final queries
         self.build_full_query()
         self.build_count_query()
+        self.build_paged_query()
 
     def _handle_nested_base_model_filtering(
         self, _predicates, _alias, _parsed_operator, _query_param_name, elm
@@ -589,15 +679,31 @@ class CypherQueryBuilder:
             _parsed_operator = "="
 
             if _alias == "*":
+                if (
+                    ComparisonOperator(_operator) == ComparisonOperator.SEARCH
+                    and self.fulltext_index
+                ):
+                    if _predicate := self.build_fulltext_predicate(_values):
+                        filter_predicates.append(_predicate)
+                    continue
                 # Parse operator to use in filter for wildcard
                 _parsed_operator = " CONTAINS "
-                # Only accept requests with default operator (set to equal by FilterDict class) or specified contains operator
+                # Only accept requests with default operator (set to equal by FilterDict class),
+                # specified contains operator, or search operator falling back to contains
                 ValidationException.raise_if(
-                    ComparisonOperator(_operator) != ComparisonOperator.EQUALS
-                    and ComparisonOperator(_operator) != ComparisonOperator.CONTAINS,
-                    msg="Only the default 'contains' operator is supported for wildcard filtering.",
+                    ComparisonOperator(_operator)
+                    not in (
+                        ComparisonOperator.EQUALS,
+                        ComparisonOperator.CONTAINS,
+                        ComparisonOperator.SEARCH,
+                    ),
+                    msg="Only the default 'contains' and the 'search' operators are supported for wildcard filtering.",
                 )
             else:
+                ValidationException.raise_if(
+                    ComparisonOperator(_operator) == ComparisonOperator.SEARCH,
+                    msg="The 'search' operator is only supported for wildcard filtering.",
+                )
                 # Parse operator to use in filter for the current label
                 if ComparisonOperator(_operator) == ComparisonOperator.CONTAINS:
                     _parsed_operator = " CONTAINS "
@@ -829,9 +935,51 @@ class CypherQueryBuilder:
                 filter_predicates.append(_predicate)
 
         # Set clause
-        self.filter_clause = (
-            _filter_clause
-            + f" {self.filter_operator.value.upper()} ".join(list(filter_predicates))
+        if filter_predicates:
+            self.filter_clause = (
+                _filter_clause
+                + f" {self.filter_operator.value.upper()} ".join(
+                    list(filter_predicates)
+                )
+            )
+
+    def build_fulltext_predicate(self, values: list[Any]) -> str | None:
+        """
+        Looks up the nodes matching the search values in the full-text index,
+        and returns the predicate restricting the results to them.
+        When the filters are combined with AND, the match clause is anchored on the found nodes.
+        """
+        validate_fulltext_search_values(values)
+        fulltext_query = build_fulltext_query(values)
+        if not fulltext_query:
+            # Like an empty 'contains' filter, blank search values match everything
+            return None
+
+        scores = find_fulltext_matches(self.fulltext_index.name, fulltext_query)
+        self.parameters["fulltext_element_ids"] = list(scores)
+        self.parameters["fulltext_scores"] = scores
+        self.fulltext_ranked = True
+
+        if (
+            self.fulltext_index.match_alias
+            and self.filter_operator == FilterOperator.AND
+            and not self.union_match_clause
+        ):
+            self.match_clause = self.anchor_match_clause(
+                self.match_clause, self.fulltext_index.match_alias
+            )
+        return f"elementId({self.fulltext_index.alias}) IN $fulltext_element_ids"
+
+    @staticmethod
+    def anchor_match_clause(match_clause: str, match_alias: str) -> str:
+        """
+        Binds the given variable of the match clause to the nodes found in the full-text index,
+        so that the match clause starts from them instead of scanning all nodes of a label.
+        """
+        prefix, statement = split_query_options(match_clause)
+        return (
+            f"{prefix}MATCH ({match_alias}) WHERE elementId({match_alias}) IN $fulltext_element_ids "
+            + statement
         )
 
     def build_pagination_clause(self) -> None:
@@ -879,6 +1027,19 @@ class CypherQueryBuilder:
         # Set clause
         self.sort_clause = _sort_clause + ",".join(sort_by_statements)
 
+    def build_fulltext_sort_clause(self) -> None:
+        sort_by_statements = [
+            f"$fulltext_scores[elementId({self.fulltext_index.alias})] DESC"
+        ]
+        if self.implicit_sort_by is not None:
+            sort_by_statements.append(
+                self.format_filter_sort_keys(self.implicit_sort_by)
+                if self.format_filter_sort_keys
+                else self.implicit_sort_by
+            )
+        # Set clause
+        self.sort_clause = "ORDER BY " + ",".join(sort_by_statements)
+
     def build_full_query(self) -> None:
         """
         The generated query will have the following pattern :
@@ -944,7 +1105,7 @@ class CypherQueryBuilder:
                     _with_alias_clause,
                     self.filter_clause,
                     _return_count_clause,
-                    "UNION",
+                    "UNION ALL",
                     self.union_match_clause,
                     _with_alias_clause,
                     self.filter_clause,
@@ -952,6 +1113,28 @@ class CypherQueryBuilder:
                 ]
             )
 
+    def build_paged_query(self) -> None:
+        """
+        The generated query returns the same rows as the full query, with the results count
+        in an additional _total_count column, in a single execution :
+            CALL { count query } to count all results once
+            > CALL { full query } to get the sorted page of results
+            > RETURN * to return results along with the count
+        """
+        prefix, count_query = split_query_options(self.count_query)
+        _, full_query = split_query_options(self.full_query)
+
+        # Set clause
+        self.paged_query = " ".join(
+            [
+                f"{prefix}CALL {{ {count_query} }}",
+                "WITH sum(total_count) AS _total_count",
+                f"CALL {{ {full_query} }}",
+                "RETURN *",
+                self.sort_clause,
+            ]
+        )
+
     def build_header_query(self, header_alias: str, page_size: int) -> str:
         """
         Mandatory inputs :
@@ -1019,42 +1202,151 @@ class CypherQueryBuilder:
         return re.sub(nested_regex, "_", alias)
 
     def execute(self) -> tuple[Any, Any]:
+        """
+        Runs the full query.
+        When the total count is requested, the paged query is run instead,
+        so that get_total_count does not need another query.
+        """
+        with_total = (
+            self.total_count
+            and config.SINGLE_QUERY_TOTAL_COUNT_ENABLED
+            and not self._is_count_estimated()
+        )
         try:
             result_array, attributes_names = db.cypher_query(
-                query=self.full_query, params=self.parameters
+                query=self.paged_query if with_total else self.full_query,
+                params=self.parameters,
             )
         except CypherSyntaxError as _ex:
             raise ValidationException(
                 msg="Unsupported filtering or sort parameters specified"
             ) from _ex
+
+        if with_total:
+            index = attributes_names.index("_total_count")
+            # The count is lost when the page is empty, it is then counted again only if needed
+            if result_array or self.page_number <= 1:
+                self._total = result_array[0][index] if result_array else 0
+            result_array = [row[:index] + row[index + 1 :] for row in result_array]
+            attributes_names = attributes_names[:index] + attributes_names[index + 1 :]
         return result_array, attributes_names
 
+    def get_total_count(self) -> int:
+        """
+        Returns the total count of results, ignoring pagination.
+        """
+        if self._total is None:
+            if self._is_count_estimated():
+                count_result, _ = db.cypher_query(
+                    query=f"MATCH (node:{self.estimated_count_label}) RETURN count(node)"
+                )
+            else:
+                count_result, _ = db.cypher_query(
+                    query=self.count_query, params=self.parameters
+                )
+            self._total = sum(row[0] for row in count_result)
+        return self._total
+
+    def _is_count_estimated(self) -> bool:
+        return bool(
+            self.estimated_count_label
+            and config.ESTIMATED_TOTAL_COUNT_ENABLED
+            and not self.filter_clause
+        )
 
-def sb_clear_cache(caches: list[str] | None = None):
+
+# Invalidations collected by the outermost call decorated with `sb_clear_cache`,
+# by id of the cache: the cache and the uids to evict from it, or None to clear it
+_pending_cache_invalidations: ContextVar[
+    dict[int, tuple[Any, set[str] | None]] | None
+] = ContextVar("pending_cache_invalidations", default=None)
+
+
+def sb_clear_cache(caches: list[str] | None = None, uid_args: list[str] | None = None):
     """
     Decorator that will clear the specified caches after the wrapped function execution.
+
+    The invalidation is broadcast to all worker processes through the cache invalidation bus.
+    Nested calls to decorated functions add their uids (or the whole cache) to the invalidations of the outermost call,
+    which invalidates each cache once when it finishes.
+
+    Args:
+        caches (list[str] | None): Names of the cache attributes of the repository to clear.
+        uid_args (list[str] | None): Names of the wrapped function arguments holding the uids of the affected items,
+            either as plain strings or as objects with a `uid` attribute.
+            When provided, only the cache entries of these uids are evicted instead of clearing the whole cache,
+            unless the cache is registered with `evict_by_uid=False`.
     """
     if caches is None:
         caches = []
 
     def decorator(function):
+        signature = inspect.signature(function)
+
         @functools.wraps(function)
         def wrapper(self, *args, **kwargs):
+            pending = _pending_cache_invalidations.get()
+            token = None
+            if pending is None:
+                pending = {}
+                token = _pending_cache_invalidations.set(pending)
             try:
                 result = function(self, *args, **kwargs)
                 return result
             finally:
-                for cache_name in caches:
-                    cache = getattr(self, cache_name, None)
-                    if cache:
+                uids = (
+                    _get_uids_from_arguments(signature, uid_args, self, *args, **kwargs)
+                    if uid_args is not None
+                    else None
+                )
+                for cache in (getattr(self, cache_name, None) for cache_name in caches):
+                    if cache is not None:
+                        _add_pending_cache_invalidation(pending, cache, uids)
+                if token is not None:
+                    _pending_cache_invalidations.reset(token)
+                    for cache, cache_uids in pending.values():
+                        cache_uids = (
+                            sorted(cache_uids) if cache_uids is not None else None
+                        )
                         log.info(
-                            "Clear cache '%s.%s' of size: %s",
-                            type(self).__name__,
-                            cache_name,
+                            "Clear cache '%s' of size: %s for uids: %s",
+                            cache_invalidation_bus.get_name(cache)
+                            or type(self).__name__,
                             cache.currsize,
+                            cache_uids if cache_uids is not None else "all",
                         )
-                        cache.clear()
+                        cache_invalidation_bus.invalidate(cache, cache_uids)
 
         return wrapper
 
     return decorator
+
+
+def _add_pending_cache_invalidation(
+    pending: dict[int, tuple[Any, set[str] | None]],
+    cache: Any,
+    uids: list[str] | None,
+):
+    if id(cache) not in pending:
+        pending[id(cache)] = (cache, set(uids) if uids is not None else None)
+        return
+    pending_uids = pending[id(cache)][1]
+    if pending_uids is not None:
+        pending[id(cache)] = (
+            cache,
+            pending_uids | set(uids) if uids is not None else None,
+        )
+
+
+def _get_uids_from_arguments(
+    signature: inspect.Signature, uid_args: list[str], *args, **kwargs
+) -> list[str]:
+    bound_arguments = signature.bind_partial(*args, **kwargs).arguments
+    uids = []
+    for arg_name in uid_args:
+        value = bound_arguments.get(arg_name)
+        if value is not None and not isinstance(value, str):
+            value = getattr(value, "uid", None)
+        if value is not None:
+            uids.append(value)
+    return uids
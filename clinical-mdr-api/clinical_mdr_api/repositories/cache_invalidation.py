@@ -0,0 +1,300 @@
+"""
+Cluster-wide invalidation of the per-process repository caches.
+
+Every repository keeps its own `cachetools.TTLCache` in the memory of the worker process.
+Clearing such a cache after a write only affects the worker that handled the write,
+so the clear is additionally broadcast to all other workers through a pluggable transport.
+
+Caches have to be registered under a name that is identical in every worker process:
+
+    cache_store_item_by_uid = register_cache(
+        "BrandRepository.cache_store_item_by_uid",
+        TTLCache(maxsize=config.CACHE_MAX_SIZE, ttl=config.CACHE_TTL),
+        lock=lock_store_item_by_uid,
+    )
+
+Invalidations are then triggered by the `sb_clear_cache` decorator in `repositories/_utils.py`.
+"""
+
+import abc
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, MutableMapping
+
+from common import config
+
+log = logging.getLogger(__name__)
+
+CacheInvalidationCallback = Callable[[dict[str, Any]], None]
+
+
+class CacheInvalidationBackend(abc.ABC):
+    """
+    Transport used to broadcast cache invalidation messages to all worker processes.
+    """
+
+    @abc.abstractmethod
+    def start(self, callback: CacheInvalidationCallback) -> None:
+        """
+        Starts delivering received invalidation messages to the given callback.
+        """
+
+    @abc.abstractmethod
+    def publish(self, message: dict[str, Any]) -> None:
+        """
+        Broadcasts the given invalidation message to all subscribers.
+        """
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the backend.
+        """
+
+
+class InProcessCacheInvalidationBackend(CacheInvalidationBackend):
+    """
+    Delivers invalidation messages synchronously to all subscribers living in the current process.
+
+    This is the default backend, suitable for a single worker process.
+    """
+
+    def __init__(self):
+        self._callbacks: list[CacheInvalidationCallback] = []
+        self._lock = threading.Lock()
+
+    def start(self, callback: CacheInvalidationCallback) -> None:
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def publish(self, message: dict[str, Any]) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(message)
+
+    def close(self) -> None:
+        with self._lock:
+            self._callbacks.clear()
+
+
+class RedisCacheInvalidationBackend(CacheInvalidationBackend):
+    """
+    Broadcasts invalidation messages to all worker processes, in all pods, through a Redis pub/sub channel.
+
+    The `redis` package is an optional dependency, only needed when this backend is configured
+    and no client is passed explicitly.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        *,
+        url: str | None = None,
+        channel: str = config.CACHE_INVALIDATION_CHANNEL,
+        poll_timeout: float = 1.0,
+    ):
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url)
+        self._client = client
+        self._channel = channel
+        self._poll_timeout = poll_timeout
+        self._pubsub = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._subscribed = threading.Event()
+
+    def start(self, callback: CacheInvalidationCallback) -> None:
+        self._thread = threading.Thread(
+            target=self._listen,
+            args=(callback,),
+            name="cache-invalidation-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def wait_until_subscribed(self, timeout: float | None = None) -> bool:
+        return self._subscribed.wait(timeout)
+
+    def _listen(self, callback: CacheInvalidationCallback) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self._pubsub is None:
+                    self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                    self._pubsub.subscribe(self._channel)
+                    self._subscribed.set()
+                message = self._pubsub.get_message(timeout=self._poll_timeout)
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception(
+                    "Cache invalidation listener failed to read from channel '%s'",
+                    self._channel,
+                )
+                self._pubsub = None
+                self._stopped.wait(self._poll_timeout)
+                continue
+
+            if not message or message.get("type") != "message":
+                continue
+            data = message["data"]
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            try:
+                callback(json.loads(data))
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.exception("Failed to apply cache invalidation message: %s", data)
+
+    def publish(self, message: dict[str, Any]) -> None:
+        try:
+            self._client.publish(self._channel, json.dumps(message))
+        except Exception:  # pylint: disable=broad-exception-caught
+            # A failed broadcast must not fail the write that triggered it,
+            # other workers will still pick up the change once their entries expire.
+            log.exception(
+                "Failed to publish cache invalidation message to channel '%s'",
+                self._channel,
+            )
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_timeout * 2)
+        if self._pubsub is not None:
+            self._pubsub.close()
+
+
+@dataclass
+class _RegisteredCache:
+    cache: MutableMapping
+    lock: Any = None
+    shared_key_markers: tuple = field(default_factory=tuple)
+    evict_by_uid: bool = True
+
+
+class CacheInvalidationBus:
+    """
+    Registry of named caches that applies invalidations locally and broadcasts them to other workers.
+
+    A cache entry is invalidated either as a whole (`uids=None`), or only for the given uids.
+    In the latter case every entry whose key contains one of the uids is evicted, together with the entries
+    whose key contains one of the `shared_key_markers` of the cache (e.g. cached list queries).
+    Caches registered with `evict_by_uid=False` are always invalidated as a whole.
+    """
+
+    def __init__(self, backend: CacheInvalidationBackend):
+        self.backend = backend
+        self.origin = uuid.uuid4().hex
+        self._caches: dict[str, _RegisteredCache] = {}
+        self._names_by_cache_id: dict[int, str] = {}
+        self.backend.start(self._on_message)
+
+    def register(
+        self,
+        name: str,
+        cache: MutableMapping,
+        lock=None,
+        shared_key_markers: Iterable[str] = (),
+        evict_by_uid: bool = True,
+    ) -> MutableMapping:
+        self._caches[name] = _RegisteredCache(
+            cache=cache,
+            lock=lock,
+            shared_key_markers=tuple(shared_key_markers),
+            evict_by_uid=evict_by_uid,
+        )
+        self._names_by_cache_id[id(cache)] = name
+        return cache
+
+    def get_name(self, cache: MutableMapping) -> str | None:
+        return self._names_by_cache_id.get(id(cache))
+
+    def invalidate(self, cache: MutableMapping, uids: list[str] | None = None) -> None:
+        """
+        Invalidates the given cache in the current process and broadcasts the invalidation to all other workers.
+        """
+        name = self.get_name(cache)
+        if name is None:
+            _evict(_RegisteredCache(cache=cache), uids)
+            return
+        _evict(self._caches[name], uids)
+        self.backend.publish({"origin": self.origin, "cache": name, "uids": uids})
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        if message.get("origin") == self.origin:
+            return
+        registered_cache = self._caches.get(message.get("cache"))
+        if registered_cache is None:
+            log.debug(
+                "Ignoring invalidation of unknown cache '%s'", message.get("cache")
+            )
+            return
+        _evict(registered_cache, message.get("uids"))
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+def _evict(registered_cache: _RegisteredCache, uids: list[str] | None) -> None:
+    cache = registered_cache.cache
+    lock = registered_cache.lock
+    if lock is not None:
+        lock.acquire()
+    try:
+        if uids is None or not registered_cache.evict_by_uid:
+            cache.clear()
+            return
+        for key in list(cache.keys()):
+            if any(uid in key for uid in uids) or any(
+                marker in key for marker in registered_cache.shared_key_markers
+            ):
+                cache.pop(key, None)
+    finally:
+        if lock is not None:
+            lock.release()
+
+
+def get_configured_backend() -> CacheInvalidationBackend:
+    backend = config.CACHE_INVALIDATION_BACKEND.lower()
+    if backend == "redis":
+        return RedisCacheInvalidationBackend(url=config.CACHE_INVALIDATION_REDIS_URL)
+    if backend != "local":
+        log.warning(
+            "Unknown cache invalidation backend '%s', falling back to 'local'",
+            config.CACHE_INVALIDATION_BACKEND,
+        )
+    return InProcessCacheInvalidationBackend()
+
+
+cache_invalidation_bus = CacheInvalidationBus(get_configured_backend())
+
+
+def register_cache(
+    name: str,
+    cache: MutableMapping,
+    lock=None,
+    shared_key_markers: Iterable[str] = (),
+    evict_by_uid: bool = True,
+) -> MutableMapping:
+    """
+    Registers a cache in the process-wide cache invalidation bus and returns it unchanged.
+
+    Args:
+        name (str): Name of the cache, must be the same in all worker processes.
+        cache (MutableMapping): The cache to register.
+        lock: Lock guarding the cache, acquired while evicting entries.
+        shared_key_markers (Iterable[str]): Entries whose key contains one of these markers
+            are evicted on every invalidation, even when the invalidation is limited to some uids.
+        evict_by_uid (bool): Whether invalidations limited to some uids only evict the entries of these uids.
+            Must be False for caches whose entries hold data of other items than the ones in their key,
+            e.g. aggregates embedding the names of related items, which are then cleared on every invalidation.
+    """
+    return cache_invalidation_bus.register(
+        name,
+        cache,
+        lock=lock,
+        shared_key_markers=shared_key_markers,
+        evict_by_uid=evict_by_uid,
+    )
@@ -1,5 +1,10 @@
+import gzip
+
 from neomodel import db
 
+# Version of the format of persisted package changes, to be increased whenever the computed changes are altered
+CT_PACKAGE_CHANGES_FORMAT_VERSION = 2
+
 CODELIST_DATA_RETRIEVAL_SPECIFIC_QUERY = """
 MATCH (old_package:CTPackage {name:$old_package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
 (codelist_attr_val)<-[old_versions:HAS_VERSION]-(codelist_attr_root)<-[:HAS_ATTRIBUTES_ROOT]-(old_codelist_root {uid:$codelist_uid})
@@ -75,10 +80,18 @@ WITH collect(diff) as items_diffs, added_items, removed_items, new_items_map
 RETURN added_items, removed_items, items_diffs, new_items_map
 """
 
+# The package data is only read from the package and the versions as of its effective date,
+# so that the changes between two packages don't change after they were imported and can be persisted.
+# Later imports add versions, e.g. retiring a codelist or a term, to value nodes of previous packages,
+# and the codelists of a term out of the package include sponsor codelists.
 PACKAGE_CODELISTS_DATA_RETRIEVAL = """
 MATCH (package:CTPackage {name:$package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
 (codelist_attr_val)<-[versions:HAS_VERSION]-(codelist_attr_root)<-[:HAS_ATTRIBUTES_ROOT]-(codelist_root)
-WITH codelist_root, codelist_attr_val, max(versions.start_date) AS latest_date
+WITH codelist_root, codelist_attr_val,
+    coalesce(
+        max(CASE WHEN date(versions.start_date) <= package.effective_date THEN versions.start_date END),
+        min(versions.start_date)
+    ) AS latest_date
 WITH collect(apoc.map.fromValues([codelist_root.uid, {
     uid: codelist_root.uid,
     value_node:codelist_attr_val,
@@ -87,13 +100,18 @@ RETURN apoc.map.mergeList(items) AS items_map
 """
 
 PACKAGE_TERMS_DATA_RETRIEVAL = """
-MATCH (package:CTPackage {name:$package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_TERM]->
-(package_term:CTPackageTerm)-[:CONTAINS_ATTRIBUTES]->(term_attr_val:CTTermAttributesValue)<-[versions:HAS_VERSION]-
-(term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(term_root:CTTermRoot)
+MATCH (package:CTPackage {name:$package_name})-[:CONTAINS_CODELIST]->(package_codelist:CTPackageCodelist)-[:CONTAINS_ATTRIBUTES]->
+(:CTCodelistAttributesValue)<-[:HAS_VERSION]-(:CTCodelistAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(codelist_root:CTCodelistRoot)
+WITH DISTINCT package, package_codelist, codelist_root
+MATCH (package_codelist)-[:CONTAINS_TERM]->(package_term:CTPackageTerm)-[:CONTAINS_ATTRIBUTES]->
+(term_attr_val:CTTermAttributesValue)<-[versions:HAS_VERSION]-(term_attr_root:CTTermAttributesRoot)<-[:HAS_ATTRIBUTES_ROOT]-(term_root:CTTermRoot)
 WITH term_root,
-    [(codelist_root)-[:HAS_TERM]->(term_root) | codelist_root.uid] AS codelists,
+    apoc.coll.sort(collect(DISTINCT codelist_root.uid)) AS codelists,
     term_attr_val,
-    max(versions.start_date) AS latest_date
+    coalesce(
+        max(CASE WHEN date(versions.start_date) <= package.effective_date THEN versions.start_date END),
+        min(versions.start_date)
+    ) AS latest_date
 WITH collect(apoc.map.fromValues([term_root.uid, {
     uid: term_root.uid,
     value_node:term_attr_val,
@@ -403,6 +421,70 @@ def get_ct_packages_changes(old_package_name: str, new_package_name: str) -> dic
     return output
 
 
+@db.transaction
+def load_persisted_ct_packages_changes(
+    old_package_name: str, new_package_name: str
+) -> str | None:
+    """
+    Loads the JSON of the persisted changes between two packages, if any.
+
+    The changes are only returned if they were persisted in the current format, for the packages as they were imported.
+    """
+    rs, _ = db.cypher_query(
+        """
+        MATCH (old_package:CTPackage {name:$old_package_name})-[:HAS_PACKAGE_CHANGES]->
+        (changes:CTPackageChanges {to_package:$new_package_name, format_version:$format_version})
+        MATCH (new_package:CTPackage {name:$new_package_name})
+        WHERE changes.from_import_date = old_package.import_date
+        AND changes.to_import_date = new_package.import_date
+        RETURN changes.changes
+        """,
+        {
+            "old_package_name": old_package_name,
+            "new_package_name": new_package_name,
+            "format_version": CT_PACKAGE_CHANGES_FORMAT_VERSION,
+        },
+    )
+    if not rs:
+        return None
+    return gzip.decompress(rs[0][0]).decode("utf-8")
+
+
+@db.transaction
+def save_persisted_ct_packages_changes(
+    old_package_name: str, new_package_name: str, changes: str
+) -> None:
+    """
+    Persists the JSON of the changes between two packages, compressed, replacing the previous one.
+
+    The changes are merged on the pair of packages and the format version, so that concurrent requests
+    computing the same changes update a single node. Changes persisted in other formats are removed.
+    """
+    db.cypher_query(
+        """
+        MATCH (old_package:CTPackage {name:$old_package_name})
+        MATCH (new_package:CTPackage {name:$new_package_name})
+        MERGE (old_package)-[:HAS_PACKAGE_CHANGES]->(changes:CTPackageChanges {
+            to_package: new_package.name,
+            format_version: $format_version
+        })
+        SET changes.from_import_date = old_package.import_date,
+            changes.to_import_date = new_package.import_date,
+            changes.changes = $changes
+        WITH old_package, new_package
+        OPTIONAL MATCH (old_package)-[:HAS_PACKAGE_CHANGES]->(outdated:CTPackageChanges {to_package:new_package.name})
+        WHERE outdated.format_version <> $format_version
+        DETACH DELETE outdated
+        """,
+        {
+            "old_package_name": old_package_name,
+            "new_package_name": new_package_name,
+            "format_version": CT_PACKAGE_CHANGES_FORMAT_VERSION,
+            "changes": gzip.compress(changes.encode("utf-8"), compresslevel=6),
+        },
+    )
+
+
 @db.transaction
 def get_package_changes_by_year():
     query = """
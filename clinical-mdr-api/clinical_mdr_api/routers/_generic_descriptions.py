@@ -61,6 +61,15 @@ Functionality : provided together with `page_size`, selects a page to retrieve f
 Errors: `page_size` not provided, `page_number` must be equal or greater than 1.
 """
 
+PAGE_TOKEN = """
+Token of the page to return, as returned in `next_page_token` of the previous page.\n
+Functionality: pages requested by token are selected after the last item of the previous page instead of skipping
+the items of the previous pages, so that deep pages are as fast as the first one,
+and items are neither skipped nor repeated while items are added or removed.
+Pass an empty token to get the first page. `page_number` is then ignored.\n
+Errors: `page_size` is 0, the token was returned for another sorting.
+"""
+
 PAGE_SIZE = f"""
 Number of items to be returned per page.\n
 Default: {config.DEFAULT_PAGE_SIZE}\n
@@ -100,6 +109,10 @@ Wildcard filtering is also supported. To do this, provide `*` value for `field_n
 
 Wildcard only supports string search (with implicit `contains` operator) on fields of type string.\n
 
+Wildcard filtering also has a full-text search mode, using the `search` operator: `{"*":{"v":["blood press"], "op":"search"}}`.
+It matches items whose names contain words starting with each of the searched words, and ranks them by relevance unless `sort_by` is provided.
+It is backed by a full-text index on activities, CT terms, CT codelists, syntax templates and dictionary terms; on other endpoints it behaves like `contains`.\n
+
 Finally, you can filter on items that have an empty value for a field. To achieve this, set the value of `v` list to an empty array - `[]`.\n
 
 Complex filtering example:\n
@@ -181,6 +194,10 @@ STUDY_VALUE_VERSION_QUERY = Query(
     pattern=FLOAT_REGEX,
 )
 
+PRETTY_JSON_QUERY = Query(
+    description="If set to 'true', the returned JSON is indented to be human-readable.",
+)
+
 ERROR_400 = {"model": ErrorResponse, "description": "Error"}
 ERROR_403 = {"model": ErrorResponse, "description": "Forbidden"}
 ERROR_404 = {"model": ErrorResponse, "description": "Entity not found"}
@@ -6,6 +6,7 @@ from clinical_mdr_api.domain_repositories.user_repository import UserRepository
 from clinical_mdr_api.models.user import UserInfo, UserInfoPatchInput
 from clinical_mdr_api.routers import _generic_descriptions
 from clinical_mdr_api.services._meta_repository import MetaRepository
+from clinical_mdr_api.services.user_info import UserInfoService
 from common import exceptions
 from common.auth import rbac
 
@@ -85,6 +86,7 @@ def patch_user(user_id: str, payload: UserInfoPatchInput) -> UserInfo:
     user_repository = UserRepository()
     user = user_repository.patch_user(user_id, payload)
     if user:
+        UserInfoService.forget_username(user_id)
         return user
     raise exceptions.NotFoundException(msg=f"User with ID '{user_id}' doesn't exist.")
 
@@ -18,6 +18,7 @@ from clinical_mdr_api.models.concepts.activities.activity import (
 from clinical_mdr_api.models.concepts.activities.activity_instance import (
     ActivityInstanceDetail,
 )
+from clinical_mdr_api.models.concepts.concept import ConceptBatchOutput
 from clinical_mdr_api.models.utils import CustomPage, GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
@@ -739,6 +740,39 @@ def create(
     return activity_service.create(concept_input=activity_create_input)
 
 
+@router.post(
+    "/activities/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new activities, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each activity is created as by the creation of a single activity, then approved if 'approve' is set.
+ - Each activity is created, and approved, in its own transaction.
+ - The result of each activity is returned in the order of the request, with its HTTP response code.
+ - An activity that can't be created doesn't prevent the creation of the other activities.
+ - An activity that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} activities specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_batch(
+    activity_create_inputs: Annotated[
+        list[ActivityCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created activities")
+    ] = False,
+) -> list[ConceptBatchOutput[Activity]]:
+    activity_service = ActivityService()
+    return activity_service.create_batch(activity_create_inputs, approve=approve)
+
+
 @router.post(
     "/activities/sponsor-activities",
     dependencies=[rbac.LIBRARY_WRITE],
@@ -14,6 +14,7 @@ from clinical_mdr_api.models.concepts.activities.activity_group import (
     ActivityGroupOverview,
     SimpleSubGroup,
 )
+from clinical_mdr_api.models.concepts.concept import ConceptBatchOutput
 from clinical_mdr_api.models.utils import CustomPage
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
@@ -570,6 +571,41 @@ def create(
     return activity_group_service.create(concept_input=activity_create_input)
 
 
+@router.post(
+    "/activity-groups/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new activity groups, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each activity group is created as by the creation of a single activity group, then approved if 'approve' is set.
+ - Each activity group is created, and approved, in its own transaction.
+ - The result of each activity group is returned in the order of the request, with its HTTP response code.
+ - An activity group that can't be created doesn't prevent the creation of the other activity groups.
+ - An activity group that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} activity groups specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_batch(
+    activity_group_create_inputs: Annotated[
+        list[ActivityGroupCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created activity groups")
+    ] = False,
+) -> list[ConceptBatchOutput[ActivityGroup]]:
+    activity_group_service = ActivityGroupService()
+    return activity_group_service.create_batch(
+        activity_group_create_inputs, approve=approve
+    )
+
+
 @router.put(
     "/activity-groups/{activity_group_uid}",
     dependencies=[rbac.LIBRARY_WRITE],
@@ -13,6 +13,7 @@ from clinical_mdr_api.models.concepts.activities.activity_instance import (
     ActivityInstanceOverview,
     ActivityInstancePreviewInput,
 )
+from clinical_mdr_api.models.concepts.concept import ConceptBatchOutput
 from clinical_mdr_api.models.utils import CustomPage
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
@@ -540,6 +541,41 @@ def create(
     )
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new activity instances, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each activity instance is created as by the creation of a single activity instance, then approved if 'approve' is set.
+ - Each activity instance is created, and approved, in its own transaction.
+ - The result of each activity instance is returned in the order of the request, with its HTTP response code.
+ - An activity instance that can't be created doesn't prevent the creation of the other activity instances.
+ - An activity instance that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} activity instances specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_batch(
+    activity_instance_create_inputs: Annotated[
+        list[ActivityInstanceCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created activity instances")
+    ] = False,
+) -> list[ConceptBatchOutput[ActivityInstance]]:
+    activity_instance_service = ActivityInstanceService()
+    return activity_instance_service.create_batch(
+        activity_instance_create_inputs, approve=approve
+    )
+
+
 @router.post(
     "/preview",
     summary="Previews the creation of a new activity instance.",
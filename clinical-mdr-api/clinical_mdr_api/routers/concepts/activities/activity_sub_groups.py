@@ -12,6 +12,7 @@ from clinical_mdr_api.models.concepts.activities.activity_sub_group import (
     ActivitySubGroupEditInput,
     ActivitySubGroupOverview,
 )
+from clinical_mdr_api.models.concepts.concept import ConceptBatchOutput
 from clinical_mdr_api.models.utils import CustomPage
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
@@ -446,6 +447,41 @@ def create(
     return activity_subgroup_service.create(concept_input=activity_create_input)
 
 
+@router.post(
+    "/activity-sub-groups/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new activity subgroups, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each activity subgroup is created as by the creation of a single activity subgroup, then approved if 'approve' is set.
+ - Each activity subgroup is created, and approved, in its own transaction.
+ - The result of each activity subgroup is returned in the order of the request, with its HTTP response code.
+ - An activity subgroup that can't be created doesn't prevent the creation of the other activity subgroups.
+ - An activity subgroup that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} activity subgroups specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_batch(
+    activity_subgroup_create_inputs: Annotated[
+        list[ActivitySubGroupCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created activity subgroups")
+    ] = False,
+) -> list[ConceptBatchOutput[ActivitySubGroup]]:
+    activity_subgroup_service = ActivitySubGroupService()
+    return activity_subgroup_service.create_batch(
+        activity_subgroup_create_inputs, approve=approve
+    )
+
+
 @router.put(
     "/activity-sub-groups/{activity_subgroup_uid}",
     dependencies=[rbac.LIBRARY_WRITE],
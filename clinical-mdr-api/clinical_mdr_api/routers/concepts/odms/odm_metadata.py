@@ -85,6 +85,11 @@ def get_odm_document(
         stylesheet,
         mapper_file,
     )
+    if not pdf and mapper_file is None:
+        return StreamingResponse(
+            odm_xml_export_service.iter_odm_document(), media_type="application/xml"
+        )
+
     rs = odm_xml_export_service.get_odm_document()
 
     if pdf:
@@ -131,6 +136,14 @@ def get_odm_csv(target_uid: str, target_type: TargetType):
     "/xmls/import",
     dependencies=[rbac.LIBRARY_WRITE],
     summary="Import ODM XML",
+    description="""
+The definitions of the file are read one at a time.
+New forms, item groups, items, conditions and methods are created and approved in batches of `batch_size` definitions,
+along with their vendor extensions and the relations between definitions.
+
+By default, each batch is committed on its own, and the error of a failing import tells how many definitions were stored.
+With `commit_batches=false`, the whole import is stored in a single transaction: a failing import stores nothing.
+""",
     status_code=201,
     responses={
         403: _generic_descriptions.ERROR_403,
@@ -150,11 +163,44 @@ def store_odm_xml(
     mapper_file: Annotated[
         UploadFile | None, File(description=MAPPER_DESCRIPTION)
     ] = None,
+    batch_size: Annotated[
+        int | None,
+        Query(
+            description="Number of definitions stored together, and committed together unless 'commit_batches' is 'false'.",
+            ge=1,
+        ),
+    ] = None,
+    commit_batches: Annotated[
+        bool,
+        Query(
+            description="If set to 'true', the default, each batch is committed on its own, "
+            "so a failing import keeps the batches already stored. "
+            "If set to 'false', the whole import is stored in a single transaction.",
+        ),
+    ] = True,
+    dry_run: Annotated[
+        bool,
+        Query(
+            description="If set to 'true', the import is validated and its result returned, but nothing is stored.",
+        ),
+    ] = False,
 ):
     if exporter == ExporterType.OSB:
-        odm_xml_importer_service = OdmXmlImporterService(xml_file, mapper_file)
+        odm_xml_importer_service = OdmXmlImporterService(
+            xml_file,
+            mapper_file,
+            batch_size=batch_size,
+            commit_batches=commit_batches,
+            dry_run=dry_run,
+        )
     else:
-        odm_xml_importer_service = OdmClinicalXmlImporterService(xml_file, mapper_file)
+        odm_xml_importer_service = OdmClinicalXmlImporterService(
+            xml_file,
+            mapper_file,
+            batch_size=batch_size,
+            commit_batches=commit_batches,
+            dry_run=dry_run,
+        )
 
     return odm_xml_importer_service.store_odm_xml()
 
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Body, Depends, Path, Query, Request
 from pydantic.types import Json
 
 from clinical_mdr_api.domains.versioned_object_aggregate import LibraryItemStatus
+from clinical_mdr_api.models.concepts.concept import ConceptBatchOutput
 from clinical_mdr_api.models.concepts.unit_definitions.unit_definition import (
     UnitDefinitionModel,
     UnitDefinitionPatchInput,
@@ -384,6 +385,42 @@ def post(
     return service.create(unit_definition_post_input)
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new unit definitions, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each unit definition is created as by the creation of a single unit definition, then approved if 'approve' is set.
+ - Each unit definition is created, and approved, in its own transaction.
+ - The result of each unit definition is returned in the order of the request, with its HTTP response code.
+ - A unit definition that can't be created doesn't prevent the creation of the other unit definitions.
+ - A unit definition that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} unit definitions specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def post_batch(
+    service: Annotated[UnitDefinitionService, Depends(UnitDefinitionService)],
+    unit_definition_post_inputs: Annotated[
+        list[UnitDefinitionPostInput],
+        Body(
+            description="The concepts that shall be created.",
+            max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS,
+        ),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created unit definitions")
+    ] = False,
+) -> list[ConceptBatchOutput[UnitDefinitionModel]]:
+    return service.create_batch(unit_definition_post_inputs, approve=approve)
+
+
 @router.patch(
     "/{unit_definition_uid}",
     dependencies=[rbac.LIBRARY_WRITE],
@@ -8,6 +8,7 @@ from starlette.requests import Request
 
 from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     CTTerm,
+    CTTermBatchOutput,
     CTTermCreateInput,
     CTTermNameAndAttributes,
     CTTermNewOrder,
@@ -60,6 +61,39 @@ def create(
     return ct_term_service.create(term_input)
 
 
+@router.post(
+    "/terms/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new ct terms, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each term is created as by the creation of a single term, then its names and attributes are approved if 'approve' is set.
+ - Each term is created, and approved, in its own transaction.
+ - The result of each term is returned in the order of the request, with its HTTP response code.
+ - A term that can't be created doesn't prevent the creation of the other terms.
+ - A term that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} terms specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_batch(
+    term_inputs: Annotated[
+        list[CTTermCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the names and attributes of the created terms")
+    ] = False,
+) -> list[CTTermBatchOutput]:
+    ct_term_service = CTTermService()
+    return ct_term_service.create_batch(term_inputs, approve=approve)
+
+
 @router.get(
     "/terms",
     dependencies=[rbac.LIBRARY_READ],
@@ -2,13 +2,14 @@ import re
 from pathlib import Path as PathFromPathLib
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Path, Request
+from fastapi import APIRouter, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
     SoALayout,
 )
-from clinical_mdr_api.models.utils import PrettyJSONResponse
+from clinical_mdr_api.models.utils import FastJSONResponse, json_response
 from clinical_mdr_api.routers import _generic_descriptions
 from clinical_mdr_api.services.ddf.usdm_service import USDMService
 from clinical_mdr_api.services.studies.study_design_figure import (
@@ -29,7 +30,8 @@ templates = Jinja2Templates(directory=str(M11_TEMPLATES_DIR_PATH))
 @router.get(
     path="/{study_uid}",
     dependencies=[rbac.STUDY_READ],
-    response_class=PrettyJSONResponse,
+    response_class=FastJSONResponse,
+    response_model=dict[str, Any],
     status_code=200,
     responses={
         403: _generic_descriptions.ERROR_403,
@@ -51,11 +53,23 @@ Possible errors:
 """,
 )
 def get_study(
-    study_uid: Annotated[str, Path(description="The unique uid of the study.")]
-) -> dict[str, Any]:
+    study_uid: Annotated[str, Path(description="The unique uid of the study.")],
+    pretty: Annotated[bool, _generic_descriptions.PRETTY_JSON_QUERY] = False,
+    stream: Annotated[
+        bool,
+        Query(
+            description="Stream the study one section of the study design at a time. "
+            "The streamed JSON is never pretty-printed."
+        ),
+    ] = False,
+) -> FastJSONResponse | StreamingResponse:
     usdm_service = USDMService(study_uid=study_uid)
+    if stream:
+        return StreamingResponse(
+            usdm_service.iter_json(study_uid), media_type="application/json"
+        )
     ddf_study_wrapper = usdm_service.get_by_uid(study_uid)
-    return ddf_study_wrapper
+    return json_response(ddf_study_wrapper, pretty=pretty)
 
 
 @router.get(
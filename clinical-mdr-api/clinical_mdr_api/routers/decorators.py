@@ -5,6 +5,9 @@ import functools
 # pylint: disable=unused-import
 from clinical_mdr_api.routers.export import allow_exports
 
+# pylint: disable=unused-import
+from clinical_mdr_api.routers.study_version_cache import cache_study_version_response
+
 # pylint: disable=unused-import
 from clinical_mdr_api.services.decorators import validate_if_study_is_not_locked
 from common import config
@@ -1,20 +1,32 @@
 import collections
 import csv
 import functools
+import inspect
 import io
+import itertools
+import tempfile
+import textwrap
 from copy import copy
 from typing import Any
 
 import yaml
 from dict2xml import dict2xml
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from openpyxl import Workbook
 
 from clinical_mdr_api.models import utils
 from clinical_mdr_api.models.utils import BaseModel
+from common import config
 
 REGISTERED_EXPORT_FORMATS = {}
 
+# Size of the chunks in which exports are streamed to the client
+EXPORT_CHUNK_SIZE = 64 * 1024
+# Number of items fetched at once when all items of a paginated endpoint are exported
+EXPORT_PAGE_SIZE = config.MAX_PAGE_SIZE
+# Exported XLSX files larger than this are spooled to disk instead of being kept in memory
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 
 def register_export_format(name: str):
     """Decorator used to register an export function.
@@ -118,14 +130,25 @@ def _convert_data_to_rows(data: dict, headers: list[Any]):
         yield rs
 
 
-def _convert_data_to_list(data: dict, headers: list[Any]) -> list[Any]:
-    """Generate a list of dictionaries based on given data."""
-    # First, convert received headers to a more usable representation
-    dict_headers = _convert_headers_to_dict(headers)
-    result = []
-    for value in _extract_values_from_data(data, dict_headers):
-        result.append(value)
-    return result
+def _iter_chunks(stream, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yields the content of a file-like object in chunks."""
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+def _buffered(chunks, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Joins small string chunks together, to avoid sending each of them separately."""
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
 
 
 @register_export_format("text/csv")
@@ -133,13 +156,18 @@ def _export_to_csv(data: dict, headers: list[Any]):
     """Export given data to CSV.
 
     The generated CSV content will only contain items listed in
-    headers.
+    headers. It is yielded in chunks as the data is consumed.
     """
     stream = io.StringIO()
     writer = csv.writer(stream, delimiter=",", quoting=csv.QUOTE_ALL)
     for row in _convert_data_to_rows(data, headers):
         writer.writerow(row)
-    return stream.getvalue()
+        if stream.tell() >= EXPORT_CHUNK_SIZE:
+            yield stream.getvalue()
+            stream.seek(0)
+            stream.truncate()
+    if stream.tell():
+        yield stream.getvalue()
 
 
 @register_export_format(
@@ -149,15 +177,17 @@ def _export_to_xslx(data: dict, headers: list[Any]):
     """Export given data to XLSX.
 
     The generated content will only contain items listed in headers.
+    The workbook is written in write-only mode, which doesn't keep the cells in memory,
+    to a temporary file that is spooled to disk when large.
     """
-    stream = io.BytesIO()
-    workbook = Workbook()
-    # grab the active worksheet
-    worksheet = workbook.active
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Sheet")
     for row in _convert_data_to_rows(data, headers):
         worksheet.append(row)
-    workbook.save(stream)
-    return stream.getvalue()
+    with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE) as stream:
+        workbook.save(stream)
+        stream.seek(0)
+        yield from _iter_chunks(stream)
 
 
 @register_export_format("text/xml")
@@ -165,12 +195,28 @@ def _export_to_xml(data: dict, headers: list[Any]):
     """Export given data to XML.
 
     The generated content will only contain items listed in headers.
+    Each item is serialized on its own, as the data is consumed.
     """
-    export_dict = {"item": _convert_data_to_list(data, headers)}
+    return _buffered(_iter_xml_chunks(data, headers))
+
+
+def _iter_xml_chunks(data: dict, headers: list[Any]):
     # If data is a single BaseModel instance we don't won't to wrap the export into <items> tags
-    if isinstance(data, BaseModel):
-        return dict2xml(export_dict, indent="  ")
-    return dict2xml(export_dict, wrap="items", indent="  ")
+    wrap = not isinstance(data, BaseModel)
+    if wrap:
+        yield "<items>\n"
+    dict_headers = _convert_headers_to_dict(headers)
+    values = _extract_values_from_data(data, dict_headers)
+    first_value = next(values, None)
+    # An empty list is exported as a single empty <item> element
+    items = itertools.chain([first_value], values) if first_value is not None else [[]]
+    for index, value in enumerate(items):
+        item = dict2xml({"item": value}, indent="  ")
+        if index:
+            yield "\n"
+        yield textwrap.indent(item, "  ") if wrap else item
+    if wrap:
+        yield "\n</items>"
 
 
 @register_export_format("application/x-yaml")
@@ -186,6 +232,9 @@ def export(export_format: str, data: dict, export_definition: dict, *args, **kwa
     Use this function when you want to export data to given data. It
     will return a StreamingResponse instance or the given data if
     format is not supported.
+
+    Data can be any iterable of items, e.g. a generator fetching the items
+    page by page, it is consumed while the response is streamed.
     """
     if export_format in export_definition:
         headers = export_definition[export_format]
@@ -196,37 +245,87 @@ def export(export_format: str, data: dict, export_definition: dict, *args, **kwa
             data = data.items
         extra_headers = export_definition.get("include_if_exists")
         headers = copy(headers)
-        if extra_headers and data:
-            headers += [
-                extra_header
-                for extra_header in extra_headers
-                if extra_header in data[0]
-            ]
+        if extra_headers and not isinstance(data, BaseModel):
+            data = iter(data)
+            first_item = next(data, None)
+            if first_item is not None:
+                data = itertools.chain([first_item], data)
+                headers += [
+                    extra_header
+                    for extra_header in extra_headers
+                    if extra_header in first_item
+                ]
 
         result = REGISTERED_EXPORT_FORMATS[export_format](
             data, headers, *args, **kwargs
         )
-        response = StreamingResponse(iter([result]), media_type=export_format)
+        if isinstance(result, str | bytes):
+            result = [result]
+        response = StreamingResponse(result, media_type=export_format)
         response.headers["Content-Disposition"] = "attachment; filename=export"
         return response
     return data
 
 
+def _iter_page_items(func, args, kwargs: dict, first_page: utils.CustomPage):
+    """
+    Yields the items of the given page, then fetches and yields the following pages.
+
+    The first page is fetched by the caller before the response starts, so that its errors are returned as such.
+    Fetching stops at the first page with fewer items than the page size, or repeating the previous page,
+    e.g. of an endpoint ignoring `page_number`.
+    Items are yielded as returned by the endpoint, e.g. the versions of an item all share its uid.
+    """
+    page = first_page
+    page_number = kwargs["page_number"]
+    while True:
+        yield from page.items
+        if len(page.items) < EXPORT_PAGE_SIZE:
+            return
+        previous_items = page.items
+        page_number += 1
+        page = func(*args, **{**kwargs, "page_number": page_number})
+        if page.items == previous_items:
+            return
+
+
 def allow_exports(export_definition: dict):
-    """Decorator used to add export functionality to list type endpoint."""
+    """Decorator used to add export functionality to list type endpoint.
+
+    When all items of a paginated endpoint are exported (`page_size=0`), they are fetched
+    page by page while the export is streamed, instead of being loaded all at once.
+    """
+
+    formats = {*export_definition.get("formats", []), *export_definition.keys()}
 
     def decorator(func):
+        return_type = inspect.signature(func).return_annotation
+        paginated = inspect.isclass(return_type) and issubclass(
+            return_type, utils.CustomPage
+        )
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             request = kwargs.get("request")
             accept = None
             if request:
                 accept = request.headers.get("accept", "application/json")
-            result = func(*args, **kwargs)
-            formats = export_definition.get("formats", [])
-            formats.extend(export_definition.keys())
-            if accept and accept in formats:
+            exported = accept and accept in formats
+            if exported and paginated and kwargs.get("page_size") == 0:
+                kwargs = {**kwargs, "page_number": 1, "page_size": EXPORT_PAGE_SIZE}
+                if "total_count" in kwargs:
+                    kwargs["total_count"] = False
+                if "page_token" in kwargs:
+                    kwargs["page_token"] = None
+                result = func(*args, **kwargs)
+                if isinstance(result, utils.CustomPage):
+                    result = _iter_page_items(func, args, kwargs, result)
+            else:
+                result = func(*args, **kwargs)
+            if exported and not isinstance(result, Response):
                 result = export(accept, result, export_definition)
+                if isinstance(result, Response):
+                    result.headers.update(getattr(request.state, "export_headers", {}))
             return result
 
         return wrapper
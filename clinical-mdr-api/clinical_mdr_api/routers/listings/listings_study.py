@@ -3,8 +3,8 @@ from typing import Annotated
 from fastapi import APIRouter, Query
 
 from clinical_mdr_api.models.listings.listings_study import StudyMetadataListingModel
-from clinical_mdr_api.models.utils import PrettyJSONResponse
-from clinical_mdr_api.routers import _generic_descriptions
+from clinical_mdr_api.models.utils import FastJSONResponse, json_response
+from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.listings.listings_study import (
     StudyMetadataListingService,
 )
@@ -19,7 +19,8 @@ router = APIRouter()
     "/studies/study-metadata",
     dependencies=[rbac.STUDY_READ],
     summary="Retrieve study metadata of a specific study",
-    response_class=PrettyJSONResponse,
+    response_class=FastJSONResponse,
+    response_model=StudyMetadataListingModel,
     status_code=200,
     responses={
         403: _generic_descriptions.ERROR_403,
@@ -32,6 +33,7 @@ router = APIRouter()
         },
     },
 )
+@decorators.cache_study_version_response
 def get_study_metadata(
     project_id: Annotated[str, Query(description="Project ID of study requested")],
     study_number: Annotated[str, Query(description="Study number of study requested")],
@@ -48,8 +50,10 @@ def get_study_metadata(
             r"format in YYYY-MM-DDThh:mm:ssZ. ",
         ),
     ] = None,
-) -> StudyMetadataListingModel:
+    pretty: Annotated[bool, _generic_descriptions.PRETTY_JSON_QUERY] = False,
+) -> FastJSONResponse:
     study_metadata_listing_service = StudyMetadataListingService()
-    return study_metadata_listing_service.get_study_metadata(
+    study_metadata = study_metadata_listing_service.get_study_metadata(
         project_id, study_number, subpart_acronym, study_value_version, datetime
     )
+    return json_response(study_metadata, pretty=pretty)
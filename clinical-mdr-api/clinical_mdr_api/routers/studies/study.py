@@ -3807,6 +3807,7 @@ def get_all_selected_activities_for_all_studies(
         ],
     }
 )
+@decorators.cache_study_version_response
 # pylint: disable=unused-argument
 def get_all_selected_activities(
     request: Request,  # request is actually required by the allow_exports decorator
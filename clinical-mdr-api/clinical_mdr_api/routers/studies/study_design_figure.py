@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import Path, Query
 from fastapi.responses import Response
 
-from clinical_mdr_api.routers import _generic_descriptions
+from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.routers import studies_router as router
 from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_design_figure import (
@@ -36,6 +36,7 @@ class SVGResponse(Response):
         404: _generic_descriptions.ERROR_404,
     },
 )
+@decorators.cache_study_version_response
 def get_study_flowchart_html(
     response: Response,
     study_uid: Annotated[str, StudyUID],
@@ -1,11 +1,10 @@
 """Study chart router."""
 
 import io
-import os
 from typing import Annotated
 
 from fastapi import Path, Query
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, Response
 from starlette.requests import Request
 
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
@@ -51,6 +50,7 @@ TIME_UNIT_QUERY = Query(
         404: _generic_descriptions.ERROR_404,
     },
 )
+@decorators.cache_study_version_response
 def get_study_flowchart_coordinates(
     study_uid: Annotated[str, STUDY_UID_PATH],
     study_value_version: Annotated[
@@ -74,6 +74,7 @@ def get_study_flowchart_coordinates(
     },
     response_model_exclude_none=True,
 )
+@decorators.cache_study_version_response
 def get_study_flowchart(
     study_uid: Annotated[str, STUDY_UID_PATH],
     study_value_version: Annotated[
@@ -107,6 +108,7 @@ def get_study_flowchart(
         404: _generic_descriptions.ERROR_404,
     },
 )
+@decorators.cache_study_version_response
 def get_study_flowchart_html(
     study_uid: Annotated[str, STUDY_UID_PATH],
     study_value_version: Annotated[
@@ -147,6 +149,7 @@ def get_study_flowchart_html(
         404: _generic_descriptions.ERROR_404,
     },
 )
+@decorators.cache_study_version_response
 def get_study_flowchart_docx(
     study_uid: Annotated[str, STUDY_UID_PATH],
     study_value_version: Annotated[
@@ -154,7 +157,7 @@ def get_study_flowchart_docx(
     ] = None,
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
     layout: Annotated[SoALayout, LAYOUT_QUERY] = SoALayout.PROTOCOL,
-) -> StreamingResponse:
+) -> Response:
     stream = (
         StudyFlowchartService()
         .get_study_flowchart_docx(
@@ -170,7 +173,7 @@ def get_study_flowchart_docx(
     filename = f"{study_id or study_uid} {layout.value} SoA.docx"
     mime_type = MIME_TYPE_DOCX
 
-    return _streaming_response(stream, filename, mime_type)
+    return _file_response(stream, filename, mime_type)
 
 
 @router.get(
@@ -183,13 +186,14 @@ def get_study_flowchart_docx(
         404: _generic_descriptions.ERROR_404,
     },
 )
+@decorators.cache_study_version_response
 def get_operational_soa_xlsx(
     study_uid: Annotated[str, STUDY_UID_PATH],
     study_value_version: Annotated[
         str | None, _generic_descriptions.STUDY_VALUE_VERSION_QUERY
     ] = None,
     time_unit: Annotated[str | None, TIME_UNIT_QUERY] = None,
-) -> StreamingResponse:
+) -> Response:
     layout = SoALayout.OPERATIONAL
     xlsx = StudyFlowchartService().get_operational_soa_xlsx(
         study_uid=study_uid,
@@ -205,7 +209,7 @@ def get_operational_soa_xlsx(
     filename = f"{study_id or study_uid} {layout.value} SoA.xlsx"
     mime_type = MIME_TYPE_XLSX
 
-    return _streaming_response(stream, filename, mime_type)
+    return _file_response(stream, filename, mime_type)
 
 
 @router.get(
@@ -218,6 +222,7 @@ def get_operational_soa_xlsx(
         404: _generic_descriptions.ERROR_404,
     },
 )
+@decorators.cache_study_version_response
 def get_operational_soa_html(
     study_uid: Annotated[str, STUDY_UID_PATH],
     study_value_version: Annotated[
@@ -309,6 +314,7 @@ def get_detailed_soa_history(
         ],
     }
 )
+@decorators.cache_study_version_response
 # pylint: disable=unused-argument
 def export_detailed_soa_content(
     request: Request,  # request is actually required by the allow_exports decorator
@@ -370,6 +376,7 @@ def export_detailed_soa_content(
         ],
     }
 )
+@decorators.cache_study_version_response
 # pylint: disable=unused-argument
 def export_operational_soa_content(
     request: Request,  # request is actually required by the allow_exports decorator
@@ -418,6 +425,7 @@ def export_operational_soa_content(
         ],
     }
 )
+@decorators.cache_study_version_response
 # pylint: disable=unused-argument
 def export_protocol_soa_content(
     request: Request,  # request is actually required by the allow_exports decorator
@@ -444,23 +452,17 @@ def _get_study_id(study_uid, study_value_version):
     return study.current_metadata.identification_metadata.study_id
 
 
-def _streaming_response(
-    stream: io.BytesIO, filename: str, mime_type: str
-) -> StreamingResponse:
-    """Returns StreamingResponse from a stream, with filename, size, and mime-type HTTP headers."""
+def _file_response(stream: io.BytesIO, filename: str, mime_type: str) -> Response:
+    """Returns Response with the content of a stream, with filename, size, and mime-type HTTP headers.
 
-    # determine the size of the binary data
-    filesize = stream.seek(0, os.SEEK_END)
-    stream.seek(0)
+    The document is already fully rendered in memory, so a plain Response is used,
+    which unlike StreamingResponse can be cached for locked study versions."""
 
     # response with document info HTTP headers
-    response = StreamingResponse(
-        stream,
+    return Response(
+        content=stream.getvalue(),
         media_type=mime_type,
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": f"{filesize:d}",
         },
     )
-
-    return response
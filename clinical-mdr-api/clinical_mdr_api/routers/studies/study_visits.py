@@ -111,6 +111,7 @@ Possible errors:
         ],
     }
 )
+@decorators.cache_study_version_response
 # pylint: disable=unused-argument
 def get_all(
     request: Request,  # request is actually required by the allow_exports decorator,
@@ -0,0 +1,352 @@
+"""
+Response cache for reads of locked or released study versions.
+
+A read with `study_value_version` targets a `HAS_VERSION` snapshot of the study,
+which never changes once the study version has been locked or released.
+Responses of such reads are therefore cached without any invalidation,
+keyed by the endpoint and its normalized parameters.
+
+Cached entries are content-addressed: the ETag of an entry is the SHA-256 digest of its serialized payload.
+Payloads are JSON documents, holding either the data returned by the endpoint or the body and headers of its response,
+so that reading an entry never executes code, even from a directory writable by others.
+Entries are kept in a size-bounded in-memory LRU cache, and optionally in a size-bounded directory shared by all workers.
+"""
+
+import base64
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable
+
+from cachetools import LRUCache
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+
+from common import config
+
+log = logging.getLogger(__name__)
+
+_REQUEST_PARAM = "study_version_cache_request"
+_RESPONSE_PARAM = "study_version_cache_response"
+
+
+class ImmutableResponseCache:
+    """
+    Content-addressed cache of serialized responses, with in-memory LRU and optional on-disk storage.
+
+    The in-memory LRU is bounded by the total size of the payloads, `max_memory_bytes`.
+
+    On disk, `objects/<etag>` holds the serialized payloads and `keys/<key digest>` the ETag of the payload of a key.
+    The least recently used payloads are deleted once the directory grows beyond `max_disk_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        directory: str | None = None,
+        max_disk_bytes: int = 0,
+    ):
+        self._memory: LRUCache = LRUCache(
+            maxsize=max_memory_bytes, getsizeof=lambda entry: len(entry[1])
+        )
+        self._lock = threading.Lock()
+        self._directory = Path(directory) if directory else None
+        self._max_disk_bytes = max_disk_bytes
+
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        """
+        Returns the ETag and the serialized payload cached for the given key, if any.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None or self._directory is None:
+            return entry
+
+        try:
+            etag = self._key_path(key).read_text(encoding="utf-8")
+            object_path = self._object_path(etag)
+            payload = object_path.read_bytes()
+            # Mark the payload as recently used for the disk eviction
+            os.utime(object_path)
+        except OSError:
+            return None
+
+        entry = (etag, payload)
+        self._set_in_memory(key, entry)
+        return entry
+
+    def set(self, key: str, payload: bytes) -> str:
+        """
+        Caches the serialized payload for the given key and returns its ETag.
+        """
+        etag = hashlib.sha256(payload).hexdigest()
+        self._set_in_memory(key, (etag, payload))
+
+        if self._directory is not None:
+            try:
+                object_path = self._object_path(etag)
+                if not object_path.exists():
+                    _write_atomically(object_path, payload)
+                _write_atomically(self._key_path(key), etag.encode("utf-8"))
+                self._evict_from_disk()
+            except OSError:
+                log.exception("Failed to store cached response in %s", self._directory)
+        return etag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def _set_in_memory(self, key: str, entry: tuple[str, bytes]) -> None:
+        with self._lock:
+            try:
+                self._memory[key] = entry
+            except ValueError:
+                # Larger than the whole in-memory budget, only kept on disk
+                pass
+
+    def _key_path(self, key: str) -> Path:
+        return self._directory / "keys" / hashlib.sha256(key.encode()).hexdigest()
+
+    def _object_path(self, etag: str) -> Path:
+        return self._directory / "objects" / etag
+
+    def _evict_from_disk(self) -> None:
+        if not self._max_disk_bytes:
+            return
+        objects = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry)
+            for entry in (self._directory / "objects").iterdir()
+        ]
+        total_size = sum(size for _, size, _ in objects)
+        for _, size, entry in sorted(objects, key=lambda item: item[0]):
+            if total_size <= self._max_disk_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= size
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+        file.write(content)
+    os.replace(file.name, path)
+
+
+study_version_response_cache = ImmutableResponseCache(
+    max_memory_bytes=config.STUDY_VERSION_CACHE_MAX_MEMORY_BYTES,
+    directory=config.STUDY_VERSION_CACHE_DIR,
+    max_disk_bytes=config.STUDY_VERSION_CACHE_MAX_DISK_BYTES,
+)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, list | tuple | set):
+        return [_normalize(item) for item in value]
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
+
+
+def _cache_key(endpoint: Callable, kwargs: dict[str, Any], accept: str | None) -> str:
+    params = {
+        name: _normalize(value)
+        for name, value in kwargs.items()
+        if not isinstance(value, Request | Response)
+    }
+    return json.dumps(
+        [f"{endpoint.__module__}.{endpoint.__qualname__}", params, accept],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _representation_etag(etag: str, accept: str | None) -> str:
+    # Exports rendered by `allow_exports` from the same cached data are different representations,
+    # they must not share an ETag.
+    if not accept:
+        return f'"{etag}"'
+    digest = hashlib.sha256(f"{accept}\n{etag}".encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(request: Request | None, etag: str) -> bool:
+    if request is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _get_type_adapter(func: Callable) -> TypeAdapter | None:
+    """
+    Returns the adapter serializing the data returned by the endpoint, from its return annotation.
+    """
+    return_type = inspect.signature(func).return_annotation
+    if return_type is inspect.Signature.empty or (
+        inspect.isclass(return_type) and issubclass(return_type, Response)
+    ):
+        return None
+    try:
+        return TypeAdapter(return_type)
+    except Exception:  # pylint: disable=broad-exception-caught
+        log.warning("Responses of %s can't be cached", func.__qualname__)
+        return None
+
+
+def _serialize(result: Any, adapter: TypeAdapter | None) -> bytes | None:
+    """
+    Serializes a response or the data returned by an endpoint to JSON, returns None if it can't be cached.
+    """
+    if isinstance(result, Response):
+        content = {
+            "response": {
+                "status_code": result.status_code,
+                "headers": [
+                    [name, value]
+                    for name, value in result.headers.items()
+                    if name != "content-length"
+                ],
+                "body": base64.b64encode(result.body).decode("ascii"),
+            }
+        }
+    elif adapter is not None:
+        content = {"data": adapter.dump_python(result, mode="json")}
+    else:
+        return None
+    return json.dumps(content).encode("utf-8")
+
+
+def _deserialize(payload: bytes, adapter: TypeAdapter | None) -> Any:
+    """
+    Returns the response or the data serialized by `_serialize`.
+
+    Raises `ValueError` if the payload doesn't match the endpoint, e.g. after its return type changed.
+    """
+    content = json.loads(payload)
+    if "response" in content:
+        response = content["response"]
+        return Response(
+            content=base64.b64decode(response["body"]),
+            status_code=response["status_code"],
+            headers=dict(response["headers"]),
+        )
+    if adapter is None:
+        raise ValueError("Cached data of an endpoint not returning data")
+    return adapter.validate_python(content["data"])
+
+
+def _find_param(signature: inspect.Signature, annotation: type) -> str | None:
+    for name, param in signature.parameters.items():
+        if inspect.isclass(param.annotation) and issubclass(
+            param.annotation, annotation
+        ):
+            return name
+    return None
+
+
+def cache_study_version_response(func: Callable) -> Callable:
+    """
+    Decorator caching the result of a read endpoint whenever `study_value_version` is provided.
+
+    Both plain results (e.g. Pydantic models) and non-streaming `Response` objects are supported.
+    The response carries an `ETag` header, and `304 Not Modified` is returned when it matches `If-None-Match`.
+    Entries are cached per `Accept` header, as it selects the export format of `allow_exports`.
+
+    When combined with `allow_exports`, this decorator must be applied first (i.e. placed below it),
+    so that the exported formats are rendered from the cached data.
+    """
+    signature = inspect.signature(func)
+    # FastAPI injects a single parameter per special type, so the endpoint's own parameters are reused
+    request_param = _find_param(signature, Request)
+    response_param = _find_param(signature, Response)
+    extra_params = [
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+        for name, annotation, existing in (
+            (_REQUEST_PARAM, Request, request_param),
+            (_RESPONSE_PARAM, Response, response_param),
+        )
+        if existing is None
+    ]
+    request_param = request_param or _REQUEST_PARAM
+    response_param = response_param or _RESPONSE_PARAM
+
+    get_type_adapter = functools.cache(lambda: _get_type_adapter(func))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        request: Request = kwargs.pop(_REQUEST_PARAM, kwargs.get(request_param))
+        response: Response = kwargs.pop(_RESPONSE_PARAM, kwargs.get(response_param))
+
+        if not config.STUDY_VERSION_CACHE_ENABLED or not kwargs.get(
+            "study_value_version"
+        ):
+            return func(*args, **kwargs)
+
+        accept = request.headers.get("accept") if request is not None else None
+        key = _cache_key(
+            func, signature.bind_partial(*args, **kwargs).arguments, accept
+        )
+        adapter = get_type_adapter()
+        entry = study_version_response_cache.get(key)
+        result = None
+        if entry is None:
+            result = func(*args, **kwargs)
+            if isinstance(result, StreamingResponse):
+                # The body of a streaming response can only be consumed once
+                return result
+            payload = _serialize(result, adapter)
+            if payload is None:
+                return result
+            etag = study_version_response_cache.set(key, payload)
+        else:
+            etag, payload = entry
+
+        etag = _representation_etag(etag, accept)
+        headers = {"ETag": etag, "Vary": "Accept"}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        if result is None:
+            try:
+                result = _deserialize(payload, adapter)
+            except (ValueError, KeyError, TypeError, ValidationError):
+                log.warning("Ignoring invalid cached response of %s", func.__qualname__)
+                result = func(*args, **kwargs)
+                payload = _serialize(result, adapter)
+                if payload is not None:
+                    headers["ETag"] = _representation_etag(
+                        study_version_response_cache.set(key, payload), accept
+                    )
+
+        if isinstance(result, Response):
+            result.headers.update(headers)
+        else:
+            if response is not None:
+                response.headers.update(headers)
+            if request is not None:
+                # Picked up by `allow_exports` when the result is rendered to another format
+                request.state.export_headers = headers
+        return result
+
+    # Let FastAPI inject the request and response objects used for the ETag handling
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            *signature.parameters.values(),
+            *extra_params,
+        ]
+    )
+    return wrapper
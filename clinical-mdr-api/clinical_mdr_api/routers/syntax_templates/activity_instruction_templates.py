@@ -20,10 +20,11 @@ from clinical_mdr_api.models.syntax_templates.activity_instruction_template impo
     ActivityInstructionTemplateVersion,
     ActivityInstructionTemplateWithCount,
 )
+from clinical_mdr_api.models.syntax_templates.template import SyntaxTemplateBatchOutput
 from clinical_mdr_api.models.syntax_templates.template_parameter import (
     TemplateParameter,
 )
-from clinical_mdr_api.models.utils import CustomPage
+from clinical_mdr_api.models.utils import CustomPage, CustomPageWithPageToken
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.syntax_pre_instances.activity_instruction_pre_instances import (
@@ -153,6 +154,9 @@ def get_activity_instruction_templates(
     page_number: Annotated[
         int | None, Query(ge=1, description=_generic_descriptions.PAGE_NUMBER)
     ] = config.DEFAULT_PAGE_NUMBER,
+    page_token: Annotated[
+        str | None, Query(description=_generic_descriptions.PAGE_TOKEN)
+    ] = None,
     page_size: Annotated[
         int | None,
         Query(
@@ -174,20 +178,37 @@ def get_activity_instruction_templates(
     total_count: Annotated[
         bool | None, Query(description=_generic_descriptions.TOTAL_COUNT)
     ] = False,
-) -> CustomPage[ActivityInstructionTemplate]:
-    results = Service().get_all(
-        status=status,
-        return_study_count=True,
-        page_number=page_number,
-        page_size=page_size,
-        total_count=total_count,
-        filter_by=filters,
-        filter_operator=FilterOperator.from_str(operator),
-        sort_by=sort_by,
-    )
-
-    return CustomPage.create(
-        items=results.items, total=results.total, page=page_number, size=page_size
+) -> CustomPageWithPageToken[ActivityInstructionTemplate]:
+    if page_token is not None:
+        results, next_page_token = Service().get_all_by_page_token(
+            page_token=page_token,
+            page_size=page_size,
+            status=status,
+            return_study_count=True,
+            sort_by=sort_by,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            total_count=total_count,
+        )
+    else:
+        results = Service().get_all(
+            status=status,
+            return_study_count=True,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            sort_by=sort_by,
+        )
+        next_page_token = None
+
+    return CustomPageWithPageToken.create(
+        items=results.items,
+        total=results.total,
+        page=page_number,
+        size=page_size,
+        next_page_token=next_page_token,
     )
 
 
@@ -501,6 +522,38 @@ def create_activity_instruction_template(
     return Service().create(activity_instruction_template)
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
+    summary="Creates new activity instruction templates, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each activity instruction template is created as by the creation of a single activity instruction template, then approved if 'approve' is set.
+ - Each activity instruction template is created, and approved, in its own transaction.
+ - The result of each activity instruction template is returned in the order of the request, with its HTTP response code.
+ - An activity instruction template that can't be created doesn't prevent the creation of the other activity instruction templates.
+ - An activity instruction template that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} activity instruction templates specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_activity_instruction_templates_batch(
+    activity_instruction_templates: Annotated[
+        list[ActivityInstructionTemplateCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created activity instruction templates")
+    ] = False,
+) -> list[SyntaxTemplateBatchOutput[ActivityInstructionTemplate]]:
+    return Service().create_batch(activity_instruction_templates, approve=approve)
+
+
 @router.patch(
     "/{activity_instruction_template_uid}",
     dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
@@ -17,10 +17,11 @@ from clinical_mdr_api.models.syntax_templates.endpoint_template import (
     EndpointTemplateVersion,
     EndpointTemplateWithCount,
 )
+from clinical_mdr_api.models.syntax_templates.template import SyntaxTemplateBatchOutput
 from clinical_mdr_api.models.syntax_templates.template_parameter import (
     TemplateParameter,
 )
-from clinical_mdr_api.models.utils import CustomPage
+from clinical_mdr_api.models.utils import CustomPage, CustomPageWithPageToken
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.syntax_pre_instances.endpoint_pre_instances import (
@@ -150,6 +151,9 @@ def get_endpoint_templates(
     page_number: Annotated[
         int | None, Query(ge=1, description=_generic_descriptions.PAGE_NUMBER)
     ] = config.DEFAULT_PAGE_NUMBER,
+    page_token: Annotated[
+        str | None, Query(description=_generic_descriptions.PAGE_TOKEN)
+    ] = None,
     page_size: Annotated[
         int | None,
         Query(
@@ -171,20 +175,37 @@ def get_endpoint_templates(
     total_count: Annotated[
         bool | None, Query(description=_generic_descriptions.TOTAL_COUNT)
     ] = False,
-) -> CustomPage[EndpointTemplate]:
-    results = Service().get_all(
-        status=status,
-        return_study_count=True,
-        page_number=page_number,
-        page_size=page_size,
-        total_count=total_count,
-        filter_by=filters,
-        filter_operator=FilterOperator.from_str(operator),
-        sort_by=sort_by,
-    )
-
-    return CustomPage.create(
-        items=results.items, total=results.total, page=page_number, size=page_size
+) -> CustomPageWithPageToken[EndpointTemplate]:
+    if page_token is not None:
+        results, next_page_token = Service().get_all_by_page_token(
+            page_token=page_token,
+            page_size=page_size,
+            status=status,
+            return_study_count=True,
+            sort_by=sort_by,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            total_count=total_count,
+        )
+    else:
+        results = Service().get_all(
+            status=status,
+            return_study_count=True,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            sort_by=sort_by,
+        )
+        next_page_token = None
+
+    return CustomPageWithPageToken.create(
+        items=results.items,
+        total=results.total,
+        page=page_number,
+        size=page_size,
+        next_page_token=next_page_token,
     )
 
 
@@ -493,6 +514,38 @@ def create_endpoint_template(
     return Service().create(endpoint_template)
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
+    summary="Creates new endpoint templates, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each endpoint template is created as by the creation of a single endpoint template, then approved if 'approve' is set.
+ - Each endpoint template is created, and approved, in its own transaction.
+ - The result of each endpoint template is returned in the order of the request, with its HTTP response code.
+ - An endpoint template that can't be created doesn't prevent the creation of the other endpoint templates.
+ - An endpoint template that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} endpoint templates specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_endpoint_templates_batch(
+    endpoint_templates: Annotated[
+        list[EndpointTemplateCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created endpoint templates")
+    ] = False,
+) -> list[SyntaxTemplateBatchOutput[EndpointTemplate]]:
+    return Service().create_batch(endpoint_templates, approve=approve)
+
+
 @router.patch(
     "/{endpoint_template_uid}",
     dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
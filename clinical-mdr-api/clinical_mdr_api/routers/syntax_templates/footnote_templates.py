@@ -19,10 +19,11 @@ from clinical_mdr_api.models.syntax_templates.footnote_template import (
     FootnoteTemplateVersion,
     FootnoteTemplateWithCount,
 )
+from clinical_mdr_api.models.syntax_templates.template import SyntaxTemplateBatchOutput
 from clinical_mdr_api.models.syntax_templates.template_parameter import (
     TemplateParameter,
 )
-from clinical_mdr_api.models.utils import CustomPage
+from clinical_mdr_api.models.utils import CustomPage, CustomPageWithPageToken
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.syntax_pre_instances.footnote_pre_instances import (
@@ -149,6 +150,9 @@ def get_footnote_templates(
     page_number: Annotated[
         int | None, Query(ge=1, description=_generic_descriptions.PAGE_NUMBER)
     ] = config.DEFAULT_PAGE_NUMBER,
+    page_token: Annotated[
+        str | None, Query(description=_generic_descriptions.PAGE_TOKEN)
+    ] = None,
     page_size: Annotated[
         int | None,
         Query(
@@ -170,20 +174,37 @@ def get_footnote_templates(
     total_count: Annotated[
         bool | None, Query(description=_generic_descriptions.TOTAL_COUNT)
     ] = False,
-) -> CustomPage[FootnoteTemplate]:
-    results = Service().get_all(
-        status=status,
-        return_study_count=True,
-        page_number=page_number,
-        page_size=page_size,
-        total_count=total_count,
-        filter_by=filters,
-        filter_operator=FilterOperator.from_str(operator),
-        sort_by=sort_by,
-    )
-
-    return CustomPage.create(
-        items=results.items, total=results.total, page=page_number, size=page_size
+) -> CustomPageWithPageToken[FootnoteTemplate]:
+    if page_token is not None:
+        results, next_page_token = Service().get_all_by_page_token(
+            page_token=page_token,
+            page_size=page_size,
+            status=status,
+            return_study_count=True,
+            sort_by=sort_by,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            total_count=total_count,
+        )
+    else:
+        results = Service().get_all(
+            status=status,
+            return_study_count=True,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            sort_by=sort_by,
+        )
+        next_page_token = None
+
+    return CustomPageWithPageToken.create(
+        items=results.items,
+        total=results.total,
+        page=page_number,
+        size=page_size,
+        next_page_token=next_page_token,
     )
 
 
@@ -492,6 +513,38 @@ def create_footnote_template(
     return Service().create(footnote_template)
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
+    summary="Creates new footnote templates, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each footnote template is created as by the creation of a single footnote template, then approved if 'approve' is set.
+ - Each footnote template is created, and approved, in its own transaction.
+ - The result of each footnote template is returned in the order of the request, with its HTTP response code.
+ - A footnote template that can't be created doesn't prevent the creation of the other footnote templates.
+ - A footnote template that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} footnote templates specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_footnote_templates_batch(
+    footnote_templates: Annotated[
+        list[FootnoteTemplateCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created footnote templates")
+    ] = False,
+) -> list[SyntaxTemplateBatchOutput[FootnoteTemplate]]:
+    return Service().create_batch(footnote_templates, approve=approve)
+
+
 @router.patch(
     "/{footnote_template_uid}",
     dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
@@ -19,10 +19,11 @@ from clinical_mdr_api.models.syntax_templates.objective_template import (
     ObjectiveTemplateVersion,
     ObjectiveTemplateWithCount,
 )
+from clinical_mdr_api.models.syntax_templates.template import SyntaxTemplateBatchOutput
 from clinical_mdr_api.models.syntax_templates.template_parameter import (
     TemplateParameter,
 )
-from clinical_mdr_api.models.utils import CustomPage
+from clinical_mdr_api.models.utils import CustomPage, CustomPageWithPageToken
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.syntax_pre_instances.objective_pre_instances import (
@@ -136,6 +137,9 @@ def get_objective_templates(
     page_number: Annotated[
         int | None, Query(ge=1, description=_generic_descriptions.PAGE_NUMBER)
     ] = config.DEFAULT_PAGE_NUMBER,
+    page_token: Annotated[
+        str | None, Query(description=_generic_descriptions.PAGE_TOKEN)
+    ] = None,
     page_size: Annotated[
         int | None,
         Query(
@@ -157,20 +161,37 @@ def get_objective_templates(
     total_count: Annotated[
         bool | None, Query(description=_generic_descriptions.TOTAL_COUNT)
     ] = False,
-) -> CustomPage[ObjectiveTemplate]:
-    results = Service().get_all(
-        status=status,
-        return_study_count=True,
-        page_number=page_number,
-        page_size=page_size,
-        total_count=total_count,
-        filter_by=filters,
-        filter_operator=FilterOperator.from_str(operator),
-        sort_by=sort_by,
-    )
-
-    return CustomPage.create(
-        items=results.items, total=results.total, page=page_number, size=page_size
+) -> CustomPageWithPageToken[ObjectiveTemplate]:
+    if page_token is not None:
+        results, next_page_token = Service().get_all_by_page_token(
+            page_token=page_token,
+            page_size=page_size,
+            status=status,
+            return_study_count=True,
+            sort_by=sort_by,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            total_count=total_count,
+        )
+    else:
+        results = Service().get_all(
+            status=status,
+            return_study_count=True,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            sort_by=sort_by,
+        )
+        next_page_token = None
+
+    return CustomPageWithPageToken.create(
+        items=results.items,
+        total=results.total,
+        page=page_number,
+        size=page_size,
+        next_page_token=next_page_token,
     )
 
 
@@ -457,6 +478,38 @@ def create_objective_template(
     return Service().create(objective_template)
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
+    summary="Creates new objective templates, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each objective template is created as by the creation of a single objective template, then approved if 'approve' is set.
+ - Each objective template is created, and approved, in its own transaction.
+ - The result of each objective template is returned in the order of the request, with its HTTP response code.
+ - An objective template that can't be created doesn't prevent the creation of the other objective templates.
+ - An objective template that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} objective templates specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_objective_templates_batch(
+    objective_templates: Annotated[
+        list[ObjectiveTemplateCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created objective templates")
+    ] = False,
+) -> list[SyntaxTemplateBatchOutput[ObjectiveTemplate]]:
+    return Service().create_batch(objective_templates, approve=approve)
+
+
 @router.patch(
     "/{objective_template_uid}",
     dependencies=[rbac.LIBRARY_WRITE_OR_STUDY_WRITE],
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Body, Path, Query, Request
 from pydantic.types import Json
 
 from clinical_mdr_api.domains.versioned_object_aggregate import LibraryItemStatus
+from clinical_mdr_api.models.syntax_templates.template import SyntaxTemplateBatchOutput
 from clinical_mdr_api.models.syntax_templates.template_parameter import (
     ComplexTemplateParameter,
 )
@@ -17,7 +18,7 @@ from clinical_mdr_api.models.syntax_templates.timeframe_template import (
     TimeframeTemplateVersion,
     TimeframeTemplateWithCount,
 )
-from clinical_mdr_api.models.utils import CustomPage
+from clinical_mdr_api.models.utils import CustomPage, CustomPageWithPageToken
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.routers import _generic_descriptions, decorators
 from clinical_mdr_api.services.syntax_templates.timeframe_templates import (
@@ -121,6 +122,9 @@ def get_timeframe_templates(
     page_number: Annotated[
         int | None, Query(ge=1, description=_generic_descriptions.PAGE_NUMBER)
     ] = config.DEFAULT_PAGE_NUMBER,
+    page_token: Annotated[
+        str | None, Query(description=_generic_descriptions.PAGE_TOKEN)
+    ] = None,
     page_size: Annotated[
         int | None,
         Query(
@@ -142,19 +146,37 @@ def get_timeframe_templates(
     total_count: Annotated[
         bool | None, Query(description=_generic_descriptions.TOTAL_COUNT)
     ] = False,
-) -> CustomPage[TimeframeTemplate]:
-    data = Service().get_all(
-        status=status,
-        return_study_count=True,
-        page_number=page_number,
-        page_size=page_size,
-        total_count=total_count,
-        filter_by=filters,
-        filter_operator=FilterOperator.from_str(operator),
-        sort_by=sort_by,
-    )
-    return CustomPage.create(
-        items=data.items, total=data.total, page=page_number, size=page_size
+) -> CustomPageWithPageToken[TimeframeTemplate]:
+    if page_token is not None:
+        data, next_page_token = Service().get_all_by_page_token(
+            page_token=page_token,
+            page_size=page_size,
+            status=status,
+            return_study_count=True,
+            sort_by=sort_by,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            total_count=total_count,
+        )
+    else:
+        data = Service().get_all(
+            status=status,
+            return_study_count=True,
+            page_number=page_number,
+            page_size=page_size,
+            total_count=total_count,
+            filter_by=filters,
+            filter_operator=FilterOperator.from_str(operator),
+            sort_by=sort_by,
+        )
+        next_page_token = None
+
+    return CustomPageWithPageToken.create(
+        items=data.items,
+        total=data.total,
+        page=page_number,
+        size=page_size,
+        next_page_token=next_page_token,
     )
 
 
@@ -421,6 +443,38 @@ def create_timeframe_template(
     return Service().create(timeframe_template)
 
 
+@router.post(
+    "/batch",
+    dependencies=[rbac.LIBRARY_WRITE],
+    summary="Creates new timeframe templates, and optionally approves them.",
+    description=f"""
+Business logic:
+ - Each timeframe template is created as by the creation of a single timeframe template, then approved if 'approve' is set.
+ - Each timeframe template is created, and approved, in its own transaction.
+ - The result of each timeframe template is returned in the order of the request, with its HTTP response code.
+ - A timeframe template that can't be created doesn't prevent the creation of the other timeframe templates.
+ - A timeframe template that can't be approved is not created either, its error is returned.
+
+Possible errors:
+ - More than {config.LIBRARY_ITEM_BATCH_MAX_ITEMS} timeframe templates specified.
+""",
+    status_code=207,
+    responses={
+        403: _generic_descriptions.ERROR_403,
+    },
+)
+def create_timeframe_templates_batch(
+    timeframe_templates: Annotated[
+        list[TimeframeTemplateCreateInput],
+        Body(max_length=config.LIBRARY_ITEM_BATCH_MAX_ITEMS),
+    ],
+    approve: Annotated[
+        bool, Query(description="Approve the created timeframe templates")
+    ] = False,
+) -> list[SyntaxTemplateBatchOutput[TimeframeTemplate]]:
+    return Service().create_batch(timeframe_templates, approve=approve)
+
+
 @router.patch(
     "/{timeframe_template_uid}",
     dependencies=[rbac.LIBRARY_WRITE],
@@ -1,5 +1,8 @@
+import contextvars
 import functools
+import threading
 from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from time import time
@@ -26,6 +29,7 @@ from clinical_mdr_api.repositories._utils import (
     FilterOperator,
 )
 from clinical_mdr_api.utils import extract_parameters
+from common import config
 from common.exceptions import ValidationException
 from common.telemetry import trace_calls
 from common.utils import get_field_type
@@ -1111,3 +1115,54 @@ class AggregatedTransactionProxy(neomodel.sync_.core.TransactionProxy):
 def ensure_transaction(db: neomodel.sync_.core.Database) -> Callable:
     """decorator to ensure a database transaction: starts a new transaction if not already in an active transaction"""
     return AggregatedTransactionProxy(db)
+
+
+_read_executor: ThreadPoolExecutor | None = None
+_read_executor_lock = threading.Lock()
+_in_read_executor: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "in_read_executor", default=False
+)
+
+
+def _get_read_executor() -> ThreadPoolExecutor:
+    # A long-lived pool, as neomodel keeps one driver and session per thread
+    global _read_executor  # pylint: disable=global-statement
+    with _read_executor_lock:
+        if _read_executor is None:
+            _read_executor = ThreadPoolExecutor(
+                max_workers=config.DB_READ_CONCURRENCY,
+                thread_name_prefix="db-read",
+            )
+    return _read_executor
+
+
+def _run_in_read_executor(call: Callable[[], Any]) -> Any:
+    _in_read_executor.set(True)
+    return call()
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> list[Any]:
+    """
+    Runs independent read-only calls concurrently, each in its own database session, and returns their results in order.
+
+    Calls run in the context (e.g. request context, telemetry span) of the caller.
+    They run sequentially when concurrency is disabled (DB_READ_CONCURRENCY <= 1),
+    from within another concurrent call, or inside an active transaction whose uncommitted changes
+    would not be visible from other sessions.
+
+    If several calls fail, the exception of the first one (in order of arguments) is raised.
+    """
+    if (
+        len(calls) < 2
+        or config.DB_READ_CONCURRENCY <= 1
+        or _in_read_executor.get()
+        or getattr(neomodel.sync_.core.db, "_active_transaction", None) is not None
+    ):
+        return [call() for call in calls]
+
+    executor = _get_read_executor()
+    futures = [
+        executor.submit(contextvars.copy_context().run, _run_in_read_executor, call)
+        for call in calls
+    ]
+    return [future.result() for future in futures]
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Generic, Sequence, TypeVar
 
+from fastapi import status
 from neomodel import db
 from pydantic import BaseModel
 
@@ -17,6 +18,7 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
 from clinical_mdr_api.models.concepts.activities.activity import (
     ActivityHierarchySimpleModel,
 )
+from clinical_mdr_api.models.concepts.concept import ConceptBatchOutput
 from clinical_mdr_api.models.concepts.unit_definitions.unit_definition import (
     UnitDefinitionModel,
 )
@@ -24,6 +26,7 @@ from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     SimpleCTTermAttributes,
     SimpleTermModel,
 )
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.utils import GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.services._meta_repository import MetaRepository
@@ -34,7 +37,11 @@ from clinical_mdr_api.services._utils import (
 )
 from clinical_mdr_api.utils import normalize_string
 from common.auth.user import user
-from common.exceptions import BusinessLogicException, NotFoundException
+from common.exceptions import (
+    BusinessLogicException,
+    MDRApiBaseException,
+    NotFoundException,
+)
 from common.utils import get_field_type
 
 _AggregateRootType = TypeVar("_AggregateRootType")
@@ -158,6 +165,17 @@ class ConceptGenericService(Generic[_AggregateRootType], ABC):
     ) -> BaseModel:
         raise NotImplementedError
 
+    def _transform_aggregate_roots_to_pydantic_models(
+        self, item_ars: list[_AggregateRootType]
+    ) -> list[BaseModel]:
+        """
+        Transforms the aggregate roots of a listing, which services can override to look up related data in bulk.
+        """
+        return [
+            self._transform_aggregate_root_to_pydantic_model(item_ar)
+            for item_ar in item_ars
+        ]
+
     @abstractmethod
     def _create_aggregate_root(
         self,
@@ -230,10 +248,9 @@ class ConceptGenericService(Generic[_AggregateRootType], ABC):
         )
 
         all_concepts = GenericFilteringReturn.create(items, total)
-        all_concepts.items = [
-            self._transform_aggregate_root_to_pydantic_model(concept_ar)
-            for concept_ar in all_concepts.items
-        ]
+        all_concepts.items = self._transform_aggregate_roots_to_pydantic_models(
+            all_concepts.items
+        )
 
         return all_concepts
 
@@ -667,6 +684,41 @@ class ConceptGenericService(Generic[_AggregateRootType], ABC):
             )
         return response_model
 
+    def create_batch(
+        self, concept_inputs: Sequence[BaseModel], approve: bool = False
+    ) -> list[ConceptBatchOutput]:
+        """
+        Creates the items, and approves each created item if `approve` is set.
+
+        Each item is created and approved in its own transaction, so that a failing item is rolled back entirely,
+        its draft included if its approval failed, without preventing the creation of the other items.
+        The result of each item is returned in the order of the inputs, with the error of the items that failed.
+        """
+        results = []
+        for concept_input in concept_inputs:
+            try:
+                item = self._create_batch_item(concept_input, approve)
+                results.append(
+                    ConceptBatchOutput(
+                        response_code=status.HTTP_201_CREATED, content=item
+                    )
+                )
+            except MDRApiBaseException as error:
+                results.append(
+                    ConceptBatchOutput.model_construct(
+                        response_code=error.status_code,
+                        content=BatchErrorResponse(message=str(error)),
+                    )
+                )
+        return results
+
+    @db.transaction
+    def _create_batch_item(self, concept_input: BaseModel, approve: bool) -> BaseModel:
+        item = self.non_transactional_create(concept_input)
+        if approve:
+            item = self.non_transactional_approve(item.uid)
+        return item
+
     @db.transaction
     def approve(self, uid: str, cascade_edit_and_approve: bool = False) -> BaseModel:
         return self.non_transactional_approve(uid, cascade_edit_and_approve)
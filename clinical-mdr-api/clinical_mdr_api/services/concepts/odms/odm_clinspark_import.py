@@ -47,7 +47,14 @@ class OdmClinicalXmlImporterService(OdmXmlImporterService):
 
     db_ct_codelist_attributes: list[CTCodelistAttributes]
 
-    def __init__(self, xml_file: UploadFile, mapper_file: UploadFile | None):
+    def __init__(
+        self,
+        xml_file: UploadFile,
+        mapper_file: UploadFile | None,
+        batch_size: int | None = None,
+        commit_batches: bool = True,
+        dry_run: bool = False,
+    ):
         self.ct_term_name_service = CTTermNameService()
         self.ct_codelist_attributes_service = CTCodelistAttributesService()
         self.ct_codelist_name_service = CTCodelistNameService()
@@ -58,15 +65,21 @@ class OdmClinicalXmlImporterService(OdmXmlImporterService):
         self.unit_definition_uids_by = {}
         self.measurement_unit_names_by_oid = {}
 
-        super().__init__(xml_file, mapper_file)
+        super().__init__(
+            xml_file,
+            mapper_file,
+            batch_size=batch_size,
+            commit_batches=commit_batches,
+            dry_run=dry_run,
+        )
 
-    def store_odm_xml(self):
+    def _store_odm_xml(self):
         self._set_unit_definitions()
         self._set_unit_definition_uids_by()
         self._set_measurement_unit_names_by_oid()
         self._set_codelists()
 
-        return super().store_odm_xml()
+        return super()._store_odm_xml()
 
     def _set_unit_definitions(self):
         measurement_unit_names = {
@@ -327,18 +340,7 @@ class OdmClinicalXmlImporterService(OdmXmlImporterService):
 
         item_unit_definitions = self._get_item_unit_definition_inputs(item_def)
 
-        codelist = next(
-            (
-                codelist
-                for codelist in self.codelists
-                if item_def.getElementsByTagName("CodeListRef")
-                and codelist.getAttribute("OID")
-                == item_def.getElementsByTagName("CodeListRef")[0].getAttribute(
-                    "CodeListOID"
-                )
-            ),
-            None,
-        )
+        codelist = self._get_codelist(item_def)
 
         codelist_uid = next(
             (
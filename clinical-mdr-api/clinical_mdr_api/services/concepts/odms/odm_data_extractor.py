@@ -12,6 +12,9 @@ from clinical_mdr_api.models.controlled_terminologies.ct_codelist_attributes imp
 )
 from clinical_mdr_api.services.concepts.odms.odm_conditions import OdmConditionService
 from clinical_mdr_api.services.concepts.odms.odm_forms import OdmFormService
+from clinical_mdr_api.services.concepts.odms.odm_generic_service import (
+    OdmGenericService,
+)
 from clinical_mdr_api.services.concepts.odms.odm_item_groups import OdmItemGroupService
 from clinical_mdr_api.services.concepts.odms.odm_items import OdmItemService
 from clinical_mdr_api.services.concepts.odms.odm_methods import OdmMethodService
@@ -36,7 +39,7 @@ from clinical_mdr_api.services.controlled_terminologies.ct_codelist_attributes i
 from clinical_mdr_api.services.controlled_terminologies.ct_term_attributes import (
     CTTermAttributesService,
 )
-from common.exceptions import BusinessLogicException
+from common.exceptions import BusinessLogicException, NotFoundException
 
 
 class OdmDataExtractor:
@@ -102,19 +105,21 @@ class OdmDataExtractor:
         self.status = status
 
         if target_type == TargetType.STUDY_EVENT:
-            study_event = self.study_event_service.get_by_uid(target_uid)
+            study_event = self._get_target(self.study_event_service, target_uid)
             self.target_name = study_event.name
             self.set_forms_of_target(study_event)
         elif target_type == TargetType.FORM:
-            self.odm_forms.append(self.form_service.get_by_uid(target_uid))
+            self.odm_forms.append(self._get_target(self.form_service, target_uid))
             self.target_name = self.odm_forms[0].name
             self.set_item_groups_of_forms(self.odm_forms)
         elif target_type == TargetType.ITEM_GROUP:
-            self.odm_item_groups.append(self.item_group_service.get_by_uid(target_uid))
+            self.odm_item_groups.append(
+                self._get_target(self.item_group_service, target_uid)
+            )
             self.target_name = self.odm_item_groups[0].name
             self.set_items_of_item_groups(self.odm_item_groups)
         elif target_type == TargetType.ITEM:
-            self.odm_items.append(self.item_service.get_by_uid(target_uid))
+            self.odm_items.append(self._get_target(self.item_service, target_uid))
             self.target_name = self.odm_items[0].name
             self.set_unit_definitions_of_items(self.odm_items)
             self.set_codelists_of_items(self.odm_items)
@@ -129,6 +134,21 @@ class OdmDataExtractor:
         self.set_vendor_elements()
         self.set_ref_vendor_attributes()
 
+    @staticmethod
+    def _get_target(service: OdmGenericService, target_uid: str):
+        """
+        Gets the target like `get_by_uid` does, but as a listing, so that its references are looked up in bulk.
+        """
+        targets = service.get_all_concepts(
+            filter_by={"uid": {"v": [target_uid], "op": "eq"}}
+        ).items
+
+        NotFoundException.raise_if_not(
+            targets,
+            msg=f"{service.aggregate_class.__name__} with UID '{target_uid}' doesn't exist or there's no version with requested status or version number.",
+        )
+        return targets[0]
+
     def set_ref_vendor_attributes(self):
         vendor_attributes = self.vendor_attribute_service.get_all_concepts(
             filter_by={
@@ -1,3 +1,5 @@
+from functools import cache
+
 from neomodel import db
 
 from clinical_mdr_api.domain_repositories.concepts.odms.form_repository import (
@@ -61,6 +63,41 @@ class OdmFormService(OdmGenericService[OdmFormAR]):
             ),
         )
 
+    def _transform_aggregate_roots_to_pydantic_models(
+        self, item_ars: list[OdmFormAR]
+    ) -> list[OdmForm]:
+        item_group_refs = (
+            self._repos.odm_item_group_repository.find_with_form_relations(
+                [item_ar.uid for item_ar in item_ars]
+            )
+        )
+        ref_vendor_attributes = self._find_ref_vendor_attributes(
+            item_group_refs.values()
+        )
+        find_term_callback = cache(
+            self._repos.ct_term_attributes_repository.find_by_uid
+        )
+        find_activity_group_by_uid = cache(
+            self._repos.activity_group_repository.find_by_uid_2
+        )
+        odm_element_relations = self._find_odm_element_relations(
+            item_ars, RelationType.FORM
+        )
+
+        return [
+            OdmForm.from_odm_form_ar(
+                odm_form_ar=item_ar,
+                find_term_callback=find_term_callback,
+                find_activity_group_by_uid=find_activity_group_by_uid,
+                find_odm_vendor_attribute_by_uid=ref_vendor_attributes.get,
+                find_odm_item_group_by_uid_with_form_relation=lambda uid, form_uid: item_group_refs.get(
+                    (uid, form_uid)
+                ),
+                **odm_element_relations,
+            )
+            for item_ar in item_ars
+        ]
+
     def _create_aggregate_root(
         self, concept_input: OdmFormPostInput, library
     ) -> OdmFormAR:
@@ -253,6 +290,27 @@ class OdmFormService(OdmGenericService[OdmFormAR]):
                 disconnect_all=True,
             )
 
+        for item_group_uid, parameters in self._get_item_group_relations(
+            odm_form_item_group_post_input
+        ):
+            self._repos.odm_form_repository.add_relation(
+                uid=uid,
+                relation_uid=item_group_uid,
+                relationship_type=RelationType.ITEM_GROUP,
+                parameters=parameters,
+            )
+
+        odm_form_ar = self._find_by_uid_or_raise_not_found(normalize_string(uid))
+
+        return self._transform_aggregate_root_to_pydantic_model(odm_form_ar)
+
+    def _get_item_group_relations(
+        self, odm_form_item_group_post_input: list[OdmFormItemGroupPostInput]
+    ) -> list[tuple[str, dict]]:
+        """
+        Validates the vendor attributes of the given item group references,
+        and returns the UID of the item group and the properties of the relationship of each of them.
+        """
         vendor_attribute_patterns = self.get_regex_patterns_of_attributes(
             [
                 attribute.uid
@@ -270,6 +328,7 @@ class OdmFormService(OdmGenericService[OdmFormAR]):
             VendorAttributeCompatibleType.ITEM_GROUP_REF,
         )
 
+        relations = []
         for item_group in odm_form_item_group_post_input:
             if item_group.vendor:
                 self.can_connect_vendor_attributes(item_group.vendor.attributes)
@@ -278,21 +337,19 @@ class OdmFormService(OdmGenericService[OdmFormAR]):
                     vendor_attribute_patterns,
                 )
 
-            self._repos.odm_form_repository.add_relation(
-                uid=uid,
-                relation_uid=item_group.uid,
-                relationship_type=RelationType.ITEM_GROUP,
-                parameters={
-                    "order_number": item_group.order_number,
-                    "mandatory": strtobool(item_group.mandatory),
-                    "collection_exception_condition_oid": item_group.collection_exception_condition_oid,
-                    "vendor": to_dict(item_group.vendor),
-                },
+            relations.append(
+                (
+                    item_group.uid,
+                    {
+                        "order_number": item_group.order_number,
+                        "mandatory": strtobool(item_group.mandatory),
+                        "collection_exception_condition_oid": item_group.collection_exception_condition_oid,
+                        "vendor": to_dict(item_group.vendor),
+                    },
+                )
             )
 
-        odm_form_ar = self._find_by_uid_or_raise_not_found(normalize_string(uid))
-
-        return self._transform_aggregate_root_to_pydantic_model(odm_form_ar)
+        return relations
 
     @db.transaction
     def add_vendor_elements(
@@ -1,5 +1,6 @@
 import re
 from abc import ABC
+from typing import Callable, Iterable
 
 from clinical_mdr_api.domain_repositories.concepts.odms.form_repository import (
     FormRepository,
@@ -11,8 +12,11 @@ from clinical_mdr_api.domain_repositories.concepts.odms.item_repository import (
     ItemRepository,
 )
 from clinical_mdr_api.domains.concepts.odms.form import OdmFormAR
-from clinical_mdr_api.domains.concepts.odms.item import OdmItemAR
-from clinical_mdr_api.domains.concepts.odms.item_group import OdmItemGroupAR
+from clinical_mdr_api.domains.concepts.odms.item import OdmItemAR, OdmItemRefVO
+from clinical_mdr_api.domains.concepts.odms.item_group import (
+    OdmItemGroupAR,
+    OdmItemGroupRefVO,
+)
 from clinical_mdr_api.domains.concepts.odms.vendor_attribute import OdmVendorAttributeAR
 from clinical_mdr_api.domains.concepts.utils import (
     RelationType,
@@ -421,3 +425,78 @@ class OdmGenericService(ConceptGenericService[_AggregateRootType], ABC):
                 )
                 item.soft_delete()
                 description_service.repository.save(item)
+
+    def _find_odm_element_relations(
+        self, item_ars: list[_AggregateRootType], odm_element_type: RelationType
+    ) -> dict[str, Callable]:
+        """
+        Looks up the descriptions, aliases and vendor extensions of the given ODM elements with a fixed number of queries.
+
+        Args:
+            item_ars (list[_AggregateRootType]): The ODM elements.
+            odm_element_type (RelationType): The type of the ODM elements.
+
+        Returns:
+            dict[str, Callable]: The lookup callbacks of the ODM element models, by name of their argument.
+        """
+        odm_element_uids = [item_ar.uid for item_ar in item_ars]
+        descriptions = self._repos.odm_description_repository.find_all_by_uids(
+            {uid for item_ar in item_ars for uid in item_ar.concept_vo.description_uids}
+        )
+        aliases = self._repos.odm_alias_repository.find_all_by_uids(
+            {uid for item_ar in item_ars for uid in item_ar.concept_vo.alias_uids}
+        )
+        vendor_elements = (
+            self._repos.odm_vendor_element_repository.find_with_odm_element_relations(
+                odm_element_uids, odm_element_type
+            )
+        )
+        vendor_attributes = {
+            vendor_element_attribute: self._repos.odm_vendor_attribute_repository.find_with_odm_element_relations(
+                odm_element_uids, odm_element_type, vendor_element_attribute
+            )
+            for vendor_element_attribute in (False, True)
+        }
+
+        def find_odm_vendor_element_by_uid_with_odm_element_relation(
+            uid: str, odm_element_uid: str, _odm_element_type: RelationType
+        ):
+            return vendor_elements.get((uid, odm_element_uid))
+
+        def find_odm_vendor_attribute_by_uid_with_odm_element_relation(
+            uid: str,
+            odm_element_uid: str,
+            _odm_element_type: RelationType,
+            vendor_element_attribute: bool = True,
+        ):
+            return vendor_attributes[vendor_element_attribute].get(
+                (uid, odm_element_uid)
+            )
+
+        return {
+            "find_odm_description_by_uid": descriptions.get,
+            "find_odm_alias_by_uid": aliases.get,
+            "find_odm_vendor_element_by_uid_with_odm_element_relation": find_odm_vendor_element_by_uid_with_odm_element_relation,
+            "find_odm_vendor_attribute_by_uid_with_odm_element_relation": find_odm_vendor_attribute_by_uid_with_odm_element_relation,
+        }
+
+    def _find_ref_vendor_attributes(
+        self, ref_vos: Iterable[OdmItemGroupRefVO | OdmItemRefVO]
+    ) -> dict[str, OdmVendorAttributeAR]:
+        """
+        Looks up the vendor attributes set on the given references to item groups or items with one query.
+
+        Args:
+            ref_vos (Iterable[OdmItemGroupRefVO | OdmItemRefVO]): The references.
+
+        Returns:
+            dict[str, OdmVendorAttributeAR]: The vendor attributes, by UID.
+        """
+        return self._repos.odm_vendor_attribute_repository.find_all_by_uids(
+            {
+                attribute["uid"]
+                for ref_vo in ref_vos
+                if ref_vo.vendor
+                for attribute in ref_vo.vendor["attributes"]
+            }
+        )
@@ -1,3 +1,5 @@
+from functools import cache
+
 from neomodel import db
 
 from clinical_mdr_api.domain_repositories.concepts.odms.item_group_repository import (
@@ -65,6 +67,35 @@ class OdmItemGroupService(OdmGenericService[OdmItemGroupAR]):
             ),
         )
 
+    def _transform_aggregate_roots_to_pydantic_models(
+        self, item_ars: list[OdmItemGroupAR]
+    ) -> list[OdmItemGroup]:
+        item_refs = self._repos.odm_item_repository.find_with_item_group_relations(
+            [item_ar.uid for item_ar in item_ars]
+        )
+        ref_vendor_attributes = self._find_ref_vendor_attributes(item_refs.values())
+        find_term_by_uid = cache(self._repos.ct_term_attributes_repository.find_by_uid)
+        find_activity_subgroup_by_uid = cache(
+            self._repos.activity_subgroup_repository.find_by_uid_2
+        )
+        odm_element_relations = self._find_odm_element_relations(
+            item_ars, RelationType.ITEM_GROUP
+        )
+
+        return [
+            OdmItemGroup.from_odm_item_group_ar(
+                odm_item_group_ar=item_ar,
+                find_term_by_uid=find_term_by_uid,
+                find_activity_subgroup_by_uid=find_activity_subgroup_by_uid,
+                find_odm_vendor_attribute_by_uid=ref_vendor_attributes.get,
+                find_odm_item_by_uid_with_item_group_relation=lambda uid, item_group_uid: item_refs.get(
+                    (uid, item_group_uid)
+                ),
+                **odm_element_relations,
+            )
+            for item_ar in item_ars
+        ]
+
     def _create_aggregate_root(
         self, concept_input: OdmItemGroupPostInput, library
     ) -> OdmItemGroupAR:
@@ -277,6 +308,27 @@ class OdmItemGroupService(OdmGenericService[OdmItemGroupAR]):
                 disconnect_all=True,
             )
 
+        for item_uid, parameters in self._get_item_relations(
+            odm_item_group_item_post_input
+        ):
+            self._repos.odm_item_group_repository.add_relation(
+                uid=uid,
+                relation_uid=item_uid,
+                relationship_type=RelationType.ITEM,
+                parameters=parameters,
+            )
+
+        odm_item_group_ar = self._find_by_uid_or_raise_not_found(normalize_string(uid))
+
+        return self._transform_aggregate_root_to_pydantic_model(odm_item_group_ar)
+
+    def _get_item_relations(
+        self, odm_item_group_item_post_input: list[OdmItemGroupItemPostInput]
+    ) -> list[tuple[str, dict]]:
+        """
+        Validates the vendor attributes of the given item references,
+        and returns the UID of the item and the properties of the relationship of each of them.
+        """
         vendor_attribute_patterns = self.get_regex_patterns_of_attributes(
             [
                 attribute.uid
@@ -294,6 +346,7 @@ class OdmItemGroupService(OdmGenericService[OdmItemGroupAR]):
             VendorAttributeCompatibleType.ITEM_REF,
         )
 
+        relations = []
         for item in odm_item_group_item_post_input:
             if item.vendor:
                 self.can_connect_vendor_attributes(item.vendor.attributes)
@@ -302,26 +355,24 @@ class OdmItemGroupService(OdmGenericService[OdmItemGroupAR]):
                     vendor_attribute_patterns,
                 )
 
-            self._repos.odm_item_group_repository.add_relation(
-                uid=uid,
-                relation_uid=item.uid,
-                relationship_type=RelationType.ITEM,
-                parameters={
-                    "order_number": item.order_number,
-                    "mandatory": strtobool(item.mandatory),
-                    "key_sequence": item.key_sequence,
-                    "method_oid": item.method_oid,
-                    "imputation_method_oid": item.imputation_method_oid,
-                    "role": item.role,
-                    "role_codelist_oid": item.role_codelist_oid,
-                    "collection_exception_condition_oid": item.collection_exception_condition_oid,
-                    "vendor": to_dict(item.vendor),
-                },
+            relations.append(
+                (
+                    item.uid,
+                    {
+                        "order_number": item.order_number,
+                        "mandatory": strtobool(item.mandatory),
+                        "key_sequence": item.key_sequence,
+                        "method_oid": item.method_oid,
+                        "imputation_method_oid": item.imputation_method_oid,
+                        "role": item.role,
+                        "role_codelist_oid": item.role_codelist_oid,
+                        "collection_exception_condition_oid": item.collection_exception_condition_oid,
+                        "vendor": to_dict(item.vendor),
+                    },
+                )
             )
 
-        odm_item_group_ar = self._find_by_uid_or_raise_not_found(normalize_string(uid))
-
-        return self._transform_aggregate_root_to_pydantic_model(odm_item_group_ar)
+        return relations
 
     @db.transaction
     def add_vendor_elements(
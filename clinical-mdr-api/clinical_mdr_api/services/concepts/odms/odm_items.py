@@ -1,3 +1,5 @@
+from functools import cache
+
 from neomodel import db
 
 from clinical_mdr_api.domain_repositories.concepts.odms.item_repository import (
@@ -65,6 +67,52 @@ class OdmItemService(OdmGenericService[OdmItemAR]):
             ),
         )
 
+    def _transform_aggregate_roots_to_pydantic_models(
+        self, item_ars: list[OdmItemAR]
+    ) -> list[OdmItem]:
+        item_uids = [item_ar.uid for item_ar in item_ars]
+        unit_definitions = (
+            self._repos.odm_item_repository.find_unit_definitions_with_item_relations(
+                item_uids
+            )
+        )
+        terms = self._repos.odm_item_repository.find_terms_with_item_relations(
+            item_uids
+        )
+        find_unit_definition_by_uid = cache(
+            self._repos.unit_definition_repository.find_by_uid_2
+        )
+        find_dictionary_term_by_uid = cache(
+            self._repos.dictionary_term_generic_repository.find_by_uid
+        )
+        find_term_by_uid = cache(self._repos.ct_term_name_repository.find_by_uid)
+        find_codelist_attribute_by_codelist_uid = cache(
+            self._repos.ct_codelist_attribute_repository.find_by_uid
+        )
+        find_activity_by_uid = cache(self._repos.activity_repository.find_by_uid_2)
+        odm_element_relations = self._find_odm_element_relations(
+            item_ars, RelationType.ITEM
+        )
+
+        return [
+            OdmItem.from_odm_item_ar(
+                odm_item_ar=item_ar,
+                find_unit_definition_by_uid=find_unit_definition_by_uid,
+                find_unit_definition_with_item_relation_by_item_uid=lambda uid, unit_definition_uid: unit_definitions.get(
+                    (uid, unit_definition_uid)
+                ),
+                find_dictionary_term_by_uid=find_dictionary_term_by_uid,
+                find_term_by_uid=find_term_by_uid,
+                find_codelist_attribute_by_codelist_uid=find_codelist_attribute_by_codelist_uid,
+                find_term_with_item_relation_by_item_uid=lambda uid, term_uid: terms.get(
+                    (uid, term_uid)
+                ),
+                find_activity_by_uid=find_activity_by_uid,
+                **odm_element_relations,
+            )
+            for item_ar in item_ars
+        ]
+
     def _create_aggregate_root(
         self, concept_input: OdmItemPostInput, library
     ) -> OdmItemAR:
@@ -260,6 +308,22 @@ class OdmItemService(OdmGenericService[OdmItemAR]):
                 disconnect_all=True,
             )
 
+        for term_uid, parameters in self._get_term_relations(input_terms):
+            self._repos.odm_item_repository.add_relation(
+                uid=item_uid,
+                relation_uid=term_uid,
+                relationship_type=RelationType.TERM,
+                parameters=parameters,
+            )
+
+    def _get_term_relations(
+        self, input_terms: list[OdmItemTermRelationshipInput]
+    ) -> list[tuple[str, dict]]:
+        """
+        Returns the UID of the term and the properties of the relationship of each given term relation.
+
+        The display text is only kept when it differs from the preferred name of the term.
+        """
         (
             items,
             prop_names,
@@ -269,12 +333,10 @@ class OdmItemService(OdmGenericService[OdmItemAR]):
 
         terms = [dict(zip(prop_names, item)) for item in items]
 
-        for input_term in input_terms:
-            self._repos.odm_item_repository.add_relation(
-                uid=item_uid,
-                relation_uid=input_term.uid,
-                relationship_type=RelationType.TERM,
-                parameters={
+        return [
+            (
+                input_term.uid,
+                {
                     "mandatory": input_term.mandatory,
                     "order": input_term.order,
                     "display_text": (
@@ -288,6 +350,8 @@ class OdmItemService(OdmGenericService[OdmItemAR]):
                     ),
                 },
             )
+            for input_term in input_terms
+        ]
 
     def _manage_unit_definitions(
         self,
@@ -303,16 +367,33 @@ class OdmItemService(OdmGenericService[OdmItemAR]):
                 disconnect_all=True,
             )
 
-        for unit_definition in unit_definitions:
+        for unit_definition_uid, parameters in self._get_unit_definition_relations(
+            unit_definitions
+        ):
             self._repos.odm_item_repository.add_relation(
                 uid=item_uid,
-                relation_uid=unit_definition.uid,
+                relation_uid=unit_definition_uid,
                 relationship_type=RelationType.UNIT_DEFINITION,
-                parameters={
+                parameters=parameters,
+            )
+
+    @staticmethod
+    def _get_unit_definition_relations(
+        unit_definitions: list[OdmItemUnitDefinitionRelationshipInput],
+    ) -> list[tuple[str, dict]]:
+        """
+        Returns the UID of the unit definition and the properties of the relationship of each given unit definition relation.
+        """
+        return [
+            (
+                unit_definition.uid,
+                {
                     "mandatory": unit_definition.mandatory,
                     "order": unit_definition.order,
                 },
             )
+            for unit_definition in unit_definitions
+        ]
 
     def calculate_item_length_value(
         self,
@@ -38,6 +38,23 @@ class OdmStudyEventService(OdmGenericService[OdmStudyEventAR]):
             find_odm_form_by_uid_with_study_event_relation=self._repos.odm_form_repository.find_by_uid_with_study_event_relation,
         )
 
+    def _transform_aggregate_roots_to_pydantic_models(
+        self, item_ars: list[OdmStudyEventAR]
+    ) -> list[OdmStudyEvent]:
+        form_refs = self._repos.odm_form_repository.find_with_study_event_relations(
+            [item_ar.uid for item_ar in item_ars]
+        )
+
+        return [
+            OdmStudyEvent.from_odm_study_event_ar(
+                odm_study_event_ar=item_ar,
+                find_odm_form_by_uid_with_study_event_relation=lambda uid, study_event_uid: form_refs.get(
+                    (uid, study_event_uid)
+                ),
+            )
+            for item_ar in item_ars
+        ]
+
     def _create_aggregate_root(
         self, concept_input: OdmStudyEventPostInput, library
     ) -> OdmStudyEventAR:
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from time import time
-from typing import Any
+from typing import Any, Iterator
 from xml.dom.minidom import Document
 
 from fastapi import UploadFile
@@ -52,6 +52,7 @@ from clinical_mdr_api.services.concepts.odms.odm_xml_stylesheets import (
     OdmXmlStylesheetService,
 )
 from clinical_mdr_api.services.utils.odm_xml_mapper import map_xml
+from clinical_mdr_api.services.utils.odm_xml_writer import OdmXmlWriter
 from common.exceptions import BusinessLogicException
 
 
@@ -132,24 +133,23 @@ class OdmXmlExporterService:
         Raises:
             BusinessLogicException: If an error occurs while generating the PDF.
         """
-        doc = self._generate_odm_xml(self.odm, self.xml_document)
+        if self.mapper_file:
+            doc = self._generate_odm_xml(self.odm, self.xml_document)
 
-        map_xml(self.xml_document, self.mapper_file)
+            map_xml(self.xml_document, self.mapper_file)
 
-        rs = doc.toprettyxml(encoding="utf-8")
+            rs = doc.toprettyxml(encoding="utf-8")
+        else:
+            rs = OdmXmlWriter(self.odm, self.stylesheet).write()
 
         if self.pdf:
             try:
-                stylesheet_filename = OdmXmlStylesheetService.get_xml_filename_by_name(
+                transform = OdmXmlStylesheetService.get_compiled_stylesheet(
                     self.stylesheet
                 )
 
                 parser = etree.XMLParser(resolve_entities=False)
                 dom = etree.fromstring(rs, parser=parser)
-                xslt = etree.parse(stylesheet_filename, parser=parser)
-                transform = etree.XSLT(
-                    xslt, access_control=etree.XSLTAccessControl.DENY_ALL
-                )
 
                 rs = HTML(string=etree.tostring(transform(dom))).write_pdf()
             except Exception as exc:
@@ -157,6 +157,21 @@ class OdmXmlExporterService:
 
         return rs
 
+    def iter_odm_document(self) -> Iterator[bytes]:
+        """
+        Gets an ODM XML document incrementally, so that it can be streamed while it is being written.
+
+        A mapper file is applied to the whole document, so it can't be used with this method.
+
+        Returns:
+            Iterator[bytes]: The generated XML document, in chunks.
+        """
+        BusinessLogicException.raise_if(
+            self.mapper_file,
+            msg="A mapper file can't be applied to a streamed ODM XML document.",
+        )
+        return OdmXmlWriter(self.odm, self.stylesheet).iter_chunks()
+
     def _generate_odm_xml(self, odm_element, current_xml_element):
         """
         Generates an ODM XML document from an ODM element.
@@ -1,5 +1,8 @@
+import logging
 import re
+from collections import defaultdict
 from time import time
+from typing import Callable
 from xml.dom import minicompat, minidom
 
 from fastapi import UploadFile
@@ -8,7 +11,17 @@ from neomodel import db
 from clinical_mdr_api.domain_repositories.concepts.odms.odm_generic_repository import (
     OdmGenericRepository,
 )
+from clinical_mdr_api.domain_repositories.library_item_repository import (
+    LibraryItemRepositoryImplBase,
+)
 from clinical_mdr_api.domains._utils import get_iso_lang_data
+from clinical_mdr_api.domains.concepts.odms.condition import OdmConditionAR
+from clinical_mdr_api.domains.concepts.odms.description import OdmDescriptionAR
+from clinical_mdr_api.domains.concepts.odms.form import OdmFormAR
+from clinical_mdr_api.domains.concepts.odms.item import OdmItemAR
+from clinical_mdr_api.domains.concepts.odms.item_group import OdmItemGroupAR
+from clinical_mdr_api.domains.concepts.odms.method import OdmMethodAR
+from clinical_mdr_api.domains.concepts.odms.odm_ar_base import OdmARBase
 from clinical_mdr_api.domains.concepts.utils import (
     ENG_LANGUAGE,
     RelationType,
@@ -25,15 +38,11 @@ from clinical_mdr_api.models.concepts.odms.odm_common_models import (
     OdmVendorElementRelationPostInput,
     OdmVendorRelationPostInput,
 )
-from clinical_mdr_api.models.concepts.odms.odm_condition import (
-    OdmCondition,
-    OdmConditionPostInput,
-)
+from clinical_mdr_api.models.concepts.odms.odm_condition import OdmConditionPostInput
 from clinical_mdr_api.models.concepts.odms.odm_description import (
     OdmDescriptionPostInput,
 )
 from clinical_mdr_api.models.concepts.odms.odm_form import (
-    OdmForm,
     OdmFormItemGroupPostInput,
     OdmFormPostInput,
 )
@@ -41,20 +50,15 @@ from clinical_mdr_api.models.concepts.odms.odm_formal_expression import (
     OdmFormalExpressionPostInput,
 )
 from clinical_mdr_api.models.concepts.odms.odm_item import (
-    OdmItem,
     OdmItemPostInput,
     OdmItemTermRelationshipInput,
     OdmItemUnitDefinitionRelationshipInput,
 )
 from clinical_mdr_api.models.concepts.odms.odm_item_group import (
-    OdmItemGroup,
     OdmItemGroupItemPostInput,
     OdmItemGroupPostInput,
 )
-from clinical_mdr_api.models.concepts.odms.odm_method import (
-    OdmMethod,
-    OdmMethodPostInput,
-)
+from clinical_mdr_api.models.concepts.odms.odm_method import OdmMethodPostInput
 from clinical_mdr_api.models.concepts.odms.odm_study_event import (
     OdmStudyEvent,
     OdmStudyEventFormPostInput,
@@ -110,12 +114,15 @@ from clinical_mdr_api.services.concepts.unit_definitions.unit_definition import
 from clinical_mdr_api.services.controlled_terminologies.ct_term_attributes import (
     CTTermAttributesService,
 )
-from clinical_mdr_api.services.utils.odm_xml_mapper import map_xml
+from clinical_mdr_api.services.utils.odm_xml_mapper import read_mapping_rules
+from clinical_mdr_api.services.utils.odm_xml_reader import OdmXmlReader
 from clinical_mdr_api.utils import normalize_string
-from common import exceptions
+from common import config, exceptions
 from common.auth.user import user
 from common.utils import strtobool
 
+log = logging.getLogger(__name__)
+
 
 class OdmXmlImporterService:
     _repos: MetaRepository
@@ -134,14 +141,23 @@ class OdmXmlImporterService:
     unit_definition_service: UnitDefinitionService
     ct_term_attributes_service: CTTermAttributesService
 
-    xml_document: minidom.Document
-    form_defs: minicompat.NodeList
-    item_group_defs: minicompat.NodeList
-    item_defs: minicompat.NodeList
-    condition_defs: minicompat.NodeList
-    method_defs: minicompat.NodeList
-    codelists: minicompat.NodeList
-    measurement_units: minicompat.NodeList
+    xml_reader: OdmXmlReader
+    codelists: list[minidom.Element]
+    codelists_by_oid: dict[str, minidom.Element]
+    measurement_units: list[minidom.Element]
+    item_group_domains: list[str]
+    study_name: str | None
+    def_counts: dict[str, int]
+
+    batch_size: int
+    commit_batches: bool
+    dry_run: bool
+    committed_def_counts: dict[str, int]
+    pending_relations: dict[
+        tuple[OdmGenericRepository, RelationType], list[tuple[str, str, dict | None]]
+    ]
+    pending_concepts: dict[OdmGenericRepository, dict[str, OdmARBase]]
+    pending_descriptions: dict[str, OdmDescriptionAR]
 
     namespace_prefixes: dict[str, str]
 
@@ -149,14 +165,16 @@ class OdmXmlImporterService:
     db_vendor_attributes: list[OdmVendorAttribute]
     db_vendor_elements: list[OdmVendorElement]
     db_study_events: list[OdmStudyEvent]
-    db_forms: list[OdmForm]
-    db_item_groups: list[OdmItemGroup]
-    db_items: list[OdmItem]
-    db_conditions: list[OdmCondition]
-    db_methods: list[OdmMethod]
+    db_forms: list[OdmFormAR]
+    db_item_groups: list[OdmItemGroupAR]
+    db_items: list[OdmItemAR]
+    db_conditions: list[OdmConditionAR]
+    db_methods: list[OdmMethodAR]
     db_ct_term_attributes: list[CTTermAttributes]
     db_unit_definitions: list[UnitDefinitionModel]
     measurement_unit_names_by_oid: dict[str, str]
+    item_uids_by_oid: dict[str, str]
+    item_group_uids_by_oid: dict[str, str]
 
     mapper_file: UploadFile | None = None
 
@@ -170,8 +188,16 @@ class OdmXmlImporterService:
     EXCLUDED_OSB_VENDOR_ELEMENTS = ["DomainColor"]
     OSB_INSTRUCTION = f"{OSB_PREFIX}:instruction"
     OSB_SPONSOR_INSTRUCTION = f"{OSB_PREFIX}:sponsorInstruction"
+    DEF_TAG_NAMES = ["FormDef", "ItemGroupDef", "ItemDef", "ConditionDef", "MethodDef"]
 
-    def __init__(self, xml_file: UploadFile, mapper_file: UploadFile | None):
+    def __init__(
+        self,
+        xml_file: UploadFile,
+        mapper_file: UploadFile | None,
+        batch_size: int | None = None,
+        commit_batches: bool = True,
+        dry_run: bool = False,
+    ):
         exceptions.BusinessLogicException.raise_if(
             xml_file.content_type not in ["application/xml", "text/xml"],
             msg="Only XML format is supported.",
@@ -204,17 +230,66 @@ class OdmXmlImporterService:
         self.db_methods = []
         self.db_ct_term_attributes = []
         self.db_unit_definitions = []
+        self.item_uids_by_oid = {}
+        self.item_group_uids_by_oid = {}
 
         self.mapper_file = mapper_file
+        self.batch_size = batch_size or config.ODM_XML_IMPORT_BATCH_SIZE
+        self.commit_batches = commit_batches and not dry_run
+        self.dry_run = dry_run
+        self.committed_def_counts = {}
+        self.pending_relations = defaultdict(list)
+        self.pending_concepts = defaultdict(dict)
+        self.pending_descriptions = {}
 
-        self.xml_document = minidom.parseString(xml_file.file.read())
-
-        map_xml(self.xml_document, mapper_file)
+        self.xml_reader = OdmXmlReader(xml_file.file, read_mapping_rules(mapper_file))
 
-        self._set_def_elements()
+        self._read_def_elements()
 
-    @db.transaction
     def store_odm_xml(self):
+        """
+        Stores the content of the ODM XML file.
+
+        The new definitions and their relations are created and approved in batches of `batch_size` elements,
+        and with `commit_batches` each batch is committed on its own, so that the transactions stay small.
+        The error of a failing import then tells how many definitions were stored before it failed.
+        Without `commit_batches`, the whole import is stored in a single transaction, so that a failing import stores nothing.
+        In dry-run mode, everything is stored in a single transaction which is rolled back,
+        so that the returned content shows what would be created.
+        """
+        db.begin()
+        try:
+            rs = self._store_odm_xml()
+        except BaseException as exc:
+            self._rollback()
+            if self.committed_def_counts:
+                committed = ", ".join(
+                    f"{count}/{self.def_counts[tag_name]} {tag_name}"
+                    for tag_name, count in self.committed_def_counts.items()
+                )
+                note = f"The ODM XML import failed after storing {committed} elements, which were committed."
+                log.error(note)
+                if isinstance(exc, exceptions.MDRApiBaseException):
+                    exc.msg = f"{exc.msg} {note}"
+                    exc.args = (exc.msg,)
+                else:
+                    exc.add_note(note)
+            raise
+
+        if self.dry_run:
+            self._rollback()
+        else:
+            db.commit()
+        return rs
+
+    @staticmethod
+    def _rollback():
+        db.rollback()
+        # Aggregates read or stored within the rolled back transaction must not outlive it
+        with LibraryItemRepositoryImplBase.lock_store_item_by_uid:
+            LibraryItemRepositoryImplBase.cache_store_item_by_uid.clear()
+
+    def _store_odm_xml(self):
         self._set_vendor_namespaces()
         self._create_missing_vendor_namespaces()
         self._set_vendor_attributes()
@@ -228,6 +303,7 @@ class OdmXmlImporterService:
         self._create_item_groups_with_relations()
         self._create_forms_with_relations()
         self._create_study_event_with_relations()
+        self._end_batch()
 
         return {
             "vendor_namespaces": self._get_newly_created_vendor_namespaces(),
@@ -241,19 +317,131 @@ class OdmXmlImporterService:
             "methods": self._get_newly_created_methods(),
         }
 
-    def _set_def_elements(self):
-        self.measurement_units = self.xml_document.getElementsByTagName(
-            "MeasurementUnit"
+    def _read_def_elements(self):
+        """
+        Reads the reference data of the ODM XML file, and counts its definitions.
+
+        The definitions themselves are read again one at a time when they are stored,
+        but the elements they refer to by OID are checked to be defined beforehand.
+        """
+        self.measurement_units = []
+        self.codelists = []
+        self.codelists_by_oid = {}
+        self.item_group_domains = []
+        self.study_name = None
+        self.def_counts = dict.fromkeys(self.DEF_TAG_NAMES, 0)
+
+        def_oids: dict[str, set[str]] = defaultdict(set)
+        referenced_oids: dict[str, set[str]] = defaultdict(set)
+        for element in self.xml_reader.iter_elements(
+            "StudyName", "MeasurementUnit", "CodeList", *self.DEF_TAG_NAMES
+        ):
+            if element.tagName == "StudyName":
+                if self.study_name is None and element.firstChild:
+                    self.study_name = element.firstChild.nodeValue
+            elif element.tagName == "MeasurementUnit":
+                self.measurement_units.append(element)
+            elif element.tagName == "CodeList":
+                self.codelists.append(element)
+                self.codelists_by_oid.setdefault(element.getAttribute("OID"), element)
+            else:
+                self.def_counts[element.tagName] += 1
+                def_oids[element.tagName].add(element.getAttribute("OID"))
+
+                if element.tagName == "ItemGroupDef":
+                    self.item_group_domains.extend(
+                        domain
+                        for domain in element.getAttribute("Domain").split("|")
+                        if domain
+                    )
+                    referenced_oids["ItemDef"].update(
+                        item_ref.getAttribute("ItemOID")
+                        for item_ref in element.getElementsByTagName("ItemRef")
+                    )
+                elif element.tagName == "FormDef":
+                    referenced_oids["ItemGroupDef"].update(
+                        item_group_ref.getAttribute("ItemGroupOID")
+                        for item_group_ref in element.getElementsByTagName(
+                            "ItemGroupRef"
+                        )
+                    )
+
+        for tag_name, oids in referenced_oids.items():
+            missing_oids = oids - def_oids[tag_name]
+            exceptions.BusinessLogicException.raise_if(
+                missing_oids,
+                msg=f"{tag_name}s with OIDs '{sorted(missing_oids)}' are referred to but not provided.",
+            )
+
+    def _store_in_batches(
+        self, tag_name: str, store_def_element: Callable[[minidom.Element], None]
+    ):
+        total = self.def_counts[tag_name]
+        for count, def_element in enumerate(
+            self.xml_reader.iter_elements(tag_name), start=1
+        ):
+            store_def_element(def_element)
+
+            if count % self.batch_size == 0 or count == total:
+                self._end_batch()
+                if self.commit_batches:
+                    self.committed_def_counts[tag_name] = count
+                log.info("Stored %s/%s %s elements of ODM XML", count, total, tag_name)
+
+    def _end_batch(self):
+        for repository in list(self.pending_concepts):
+            self._store_pending_concepts(repository)
+
+        for (
+            repository,
+            relationship_type,
+        ), relations in self.pending_relations.items():
+            repository.add_relations(relations, relationship_type)
+        self.pending_relations.clear()
+
+        if self.commit_batches:
+            db.commit()
+            db.begin()
+
+    def _add_relation(
+        self,
+        repository: OdmGenericRepository,
+        uid: str,
+        relation_uid: str,
+        relationship_type: RelationType,
+        parameters: dict | None = None,
+    ):
+        # Relations are created all at once at the end of the current batch
+        self.pending_relations[(repository, relationship_type)].append(
+            (uid, relation_uid, parameters)
         )
-        self.form_defs = self.xml_document.getElementsByTagName("FormDef")
-        self.item_group_defs = self.xml_document.getElementsByTagName("ItemGroupDef")
-        self.item_defs = self.xml_document.getElementsByTagName("ItemDef")
-        self.condition_defs = self.xml_document.getElementsByTagName("ConditionDef")
-        self.method_defs = self.xml_document.getElementsByTagName("MethodDef")
-        self.codelists = self.xml_document.getElementsByTagName("CodeList")
+
+    def _store_pending_concepts(self, repository: OdmGenericRepository):
+        """
+        Creates and approves the pending new ODM elements of the given repository, along with their descriptions,
+        with a fixed number of queries.
+        """
+        concept_ars = list(self.pending_concepts.pop(repository, {}).values())
+        if not concept_ars:
+            return
+
+        repository.create_all(concept_ars)
+
+        description_ars = []
+        for concept_ar in concept_ars:
+            concept_ar.approve(author_id=user().id())
+            for description_uid in concept_ar.concept_vo.description_uids:
+                if description_ar := self.pending_descriptions.pop(
+                    description_uid, None
+                ):
+                    description_ar.approve(author_id=user().id())
+                    description_ars.append(description_ar)
+
+        self._repos.odm_description_repository.approve_all(description_ars)
+        repository.approve_all(concept_ars)
 
     def _set_vendor_namespaces(self):
-        odm_element = self.xml_document.getElementsByTagName("ODM")[0]
+        odm_element = self.xml_reader.root_element()
         for attribute in odm_element.attributes.values():
             if attribute.prefix and attribute.localName != "odm":
                 self.namespace_prefixes[attribute.localName] = attribute.nodeValue
@@ -524,7 +712,8 @@ class OdmXmlImporterService:
             )
 
         for odm_vendor_relation in odm_vendor_relations:
-            repository.add_relation(
+            self._add_relation(
+                repository,
                 uid=uid,
                 relation_uid=odm_vendor_relation.uid,
                 relationship_type=RelationType.VENDOR_ATTRIBUTE,
@@ -577,7 +766,8 @@ class OdmXmlImporterService:
             )
 
         for odm_vendor_relation in odm_vendor_relations:
-            repository.add_relation(
+            self._add_relation(
+                repository,
                 uid=uid,
                 relation_uid=odm_vendor_relation.uid,
                 relationship_type=RelationType.VENDOR_ELEMENT,
@@ -641,7 +831,8 @@ class OdmXmlImporterService:
                 )
 
             for odm_vendor_relation in odm_vendor_relations:
-                repository.add_relation(
+                self._add_relation(
+                    repository,
                     uid=uid,
                     relation_uid=odm_vendor_relation.uid,
                     relationship_type=RelationType.VENDOR_ELEMENT_ATTRIBUTE,
@@ -735,10 +926,7 @@ class OdmXmlImporterService:
             filter_by={
                 "nci_preferred_name": {
                     "v": [
-                        domain.split(":", 1)[-1]
-                        for item_group_def in self.item_group_defs
-                        for domain in item_group_def.getAttribute("Domain").split("|")
-                        if domain
+                        domain.split(":", 1)[-1] for domain in self.item_group_domains
                     ],
                     "op": "eq",
                 }
@@ -774,232 +962,245 @@ class OdmXmlImporterService:
         return new_formal_expressions
 
     def _create_conditions_with_relations(self):
-        for condition_def in self.condition_defs:
-            descriptions = self._extract_descriptions(condition_def)
-
-            rs = self._create(
-                self._repos.odm_condition_repository,
-                self.odm_condition_service,
-                self.db_conditions,
-                OdmConditionPostInput(
-                    oid=condition_def.getAttribute("OID"),
-                    name=condition_def.getAttribute("Name"),
-                    formal_expressions=[
-                        formal_expression.uid
-                        for formal_expression in self._create_formal_expressions(
-                            condition_def
-                        )
-                    ],
-                    descriptions=[
-                        self._create_description(
-                            name=description["name"],
-                            lang=description["lang"],
-                            description=description["description"],
-                        ).uid
-                        for description in descriptions
-                    ],
-                    alias_uids=[
-                        self._create_alias(
-                            name=alias_element.getAttribute("Name"),
-                            context=alias_element.getAttribute("Context"),
-                        ).uid
-                        for alias_element in condition_def.getElementsByTagName("Alias")
-                    ],
-                ),
-            )
-            self._approve(
-                self._repos.odm_condition_repository, self.odm_condition_service, rs
-            )
+        self._store_in_batches("ConditionDef", self._create_condition_with_relations)
+
+    def _create_condition_with_relations(self, condition_def: minidom.Element):
+        descriptions = self._extract_descriptions(condition_def)
+
+        self._create_approved(
+            self._repos.odm_condition_repository,
+            self.odm_condition_service,
+            self.db_conditions,
+            OdmConditionPostInput(
+                oid=condition_def.getAttribute("OID"),
+                name=condition_def.getAttribute("Name"),
+                formal_expressions=[
+                    formal_expression.uid
+                    for formal_expression in self._create_formal_expressions(
+                        condition_def
+                    )
+                ],
+                descriptions=[
+                    self._create_description(
+                        name=description["name"],
+                        lang=description["lang"],
+                        description=description["description"],
+                    ).uid
+                    for description in descriptions
+                ],
+                alias_uids=[
+                    self._create_alias(
+                        name=alias_element.getAttribute("Name"),
+                        context=alias_element.getAttribute("Context"),
+                    ).uid
+                    for alias_element in condition_def.getElementsByTagName("Alias")
+                ],
+            ),
+        )
 
     def _create_methods_with_relations(self):
-        for method_def in self.method_defs:
-            descriptions = self._extract_descriptions(method_def)
-
-            rs = self._create(
-                self._repos.odm_method_repository,
-                self.odm_method_service,
-                self.db_methods,
-                OdmMethodPostInput(
-                    oid=method_def.getAttribute("OID"),
-                    name=method_def.getAttribute("Name"),
-                    method_type=method_def.getAttribute("Name"),
-                    formal_expressions=[
-                        formal_expression.uid
-                        for formal_expression in self._create_formal_expressions(
-                            method_def
-                        )
-                    ],
-                    descriptions=[
-                        self._create_description(
-                            name=description["name"],
-                            lang=description["lang"],
-                            description=description["description"],
-                        ).uid
-                        for description in descriptions
-                    ],
-                    alias_uids=[
-                        self._create_alias(
-                            name=alias_element.getAttribute("Name"),
-                            context=alias_element.getAttribute("Context"),
-                        ).uid
-                        for alias_element in method_def.getElementsByTagName("Alias")
-                    ],
-                ),
-            )
-            self._approve(
-                self._repos.odm_method_repository, self.odm_method_service, rs
-            )
+        self._store_in_batches("MethodDef", self._create_method_with_relations)
+
+    def _create_method_with_relations(self, method_def: minidom.Element):
+        descriptions = self._extract_descriptions(method_def)
+
+        self._create_approved(
+            self._repos.odm_method_repository,
+            self.odm_method_service,
+            self.db_methods,
+            OdmMethodPostInput(
+                oid=method_def.getAttribute("OID"),
+                name=method_def.getAttribute("Name"),
+                method_type=method_def.getAttribute("Name"),
+                formal_expressions=[
+                    formal_expression.uid
+                    for formal_expression in self._create_formal_expressions(method_def)
+                ],
+                descriptions=[
+                    self._create_description(
+                        name=description["name"],
+                        lang=description["lang"],
+                        description=description["description"],
+                    ).uid
+                    for description in descriptions
+                ],
+                alias_uids=[
+                    self._create_alias(
+                        name=alias_element.getAttribute("Name"),
+                        context=alias_element.getAttribute("Context"),
+                    ).uid
+                    for alias_element in method_def.getElementsByTagName("Alias")
+                ],
+            ),
+        )
 
     def _create_items_with_relations(self):
-        for item_def in self.item_defs:
-            self._create_missing_vendors(item_def)
-
-            (
-                odm_item_post_input,
-                terms,
-                unit_definitions,
-            ) = self._get_odm_item_post_input(item_def)
+        self._store_in_batches("ItemDef", self._create_item_with_relations)
+
+    def _create_item_with_relations(self, item_def: minidom.Element):
+        self._create_missing_vendors(item_def)
+
+        (
+            odm_item_post_input,
+            terms,
+            unit_definitions,
+        ) = self._get_odm_item_post_input(item_def)
+
+        concept_ar = self._create_approved(
+            self._repos.odm_item_repository,
+            self.odm_item_service,
+            self.db_items,
+            odm_item_post_input,
+        )
+        self.item_uids_by_oid.setdefault(concept_ar.concept_vo.oid, concept_ar.uid)
 
-            rs = self._create(
+        if terms:
+            for term_uid, parameters in self.odm_item_service._get_term_relations(
+                terms
+            ):
+                self._add_relation(
+                    self._repos.odm_item_repository,
+                    uid=concept_ar.uid,
+                    relation_uid=term_uid,
+                    relationship_type=RelationType.TERM,
+                    parameters=parameters,
+                )
+        for (
+            unit_definition_uid,
+            parameters,
+        ) in self.odm_item_service._get_unit_definition_relations(unit_definitions):
+            self._add_relation(
                 self._repos.odm_item_repository,
-                self.odm_item_service,
-                self.db_items,
-                odm_item_post_input,
+                uid=concept_ar.uid,
+                relation_uid=unit_definition_uid,
+                relationship_type=RelationType.UNIT_DEFINITION,
+                parameters=parameters,
             )
 
-            if terms:
-                self.odm_item_service._manage_terms(rs.uid, terms)
-            self.odm_item_service._manage_unit_definitions(rs.uid, unit_definitions)
-
-            self._create_relationships_with_vendors(
-                rs.uid,
-                item_def,
-                self._repos.odm_item_repository,
-                VendorAttributeCompatibleType.ITEM_DEF,
-                VendorElementCompatibleType.ITEM_DEF,
-            )
-            self._approve(self._repos.odm_item_repository, self.odm_item_service, rs)
+        self._create_relationships_with_vendors(
+            concept_ar.uid,
+            item_def,
+            self._repos.odm_item_repository,
+            VendorAttributeCompatibleType.ITEM_DEF,
+            VendorElementCompatibleType.ITEM_DEF,
+        )
 
     def _create_item_groups_with_relations(self):
-        for item_group_def in self.item_group_defs:
-            self._create_missing_vendors(item_group_def)
+        self._store_in_batches("ItemGroupDef", self._create_item_group_with_relations)
 
-            rs = self._create(
-                self._repos.odm_item_group_repository,
-                self.odm_item_group_service,
-                self.db_item_groups,
-                self._get_odm_item_group_post_input(item_group_def),
-            )
+    def _create_item_group_with_relations(self, item_group_def: minidom.Element):
+        self._create_missing_vendors(item_group_def)
 
-            self._create_relationships_with_vendors(
-                rs.uid,
-                item_group_def,
-                self._repos.odm_item_group_repository,
-                VendorAttributeCompatibleType.ITEM_GROUP_DEF,
-                VendorElementCompatibleType.ITEM_GROUP_DEF,
-            )
+        concept_ar = self._create_approved(
+            self._repos.odm_item_group_repository,
+            self.odm_item_group_service,
+            self.db_item_groups,
+            self._get_odm_item_group_post_input(item_group_def),
+        )
+        self.item_group_uids_by_oid.setdefault(
+            concept_ar.concept_vo.oid, concept_ar.uid
+        )
 
-            odm_item_group_items: list[OdmItemGroupItemPostInput] = []
-            for item_ref in item_group_def.getElementsByTagName("ItemRef"):
-                self._create_missing_vendor_attributes(item_ref.attributes.values())
+        self._create_relationships_with_vendors(
+            concept_ar.uid,
+            item_group_def,
+            self._repos.odm_item_group_repository,
+            VendorAttributeCompatibleType.ITEM_GROUP_DEF,
+            VendorElementCompatibleType.ITEM_GROUP_DEF,
+        )
 
-                odm_item_group_items.append(
-                    OdmItemGroupItemPostInput(
-                        uid=next(
-                            (
-                                db_item.uid
-                                for db_item in self.db_items
-                                if db_item.oid == item_ref.getAttribute("ItemOID")
-                            ),
-                            None,
-                        ),
-                        order_number=item_ref.getAttribute("OrderNumber"),
-                        mandatory=item_ref.getAttribute("Mandatory"),
-                        key_sequence="None",
-                        method_oid=item_ref.getAttribute("MethodOID") or None,
-                        imputation_method_oid="None",
-                        role="None",
-                        role_codelist_oid="None",
-                        collection_exception_condition_oid=item_ref.getAttribute(
-                            "CollectionExceptionConditionOID"
-                        ),
-                        vendor=OdmRefVendorPostInput(
-                            attributes=self._get_list_of_attributes(
-                                item_ref.attributes.items()
-                            )
-                        ),
-                    )
+        odm_item_group_items: list[OdmItemGroupItemPostInput] = []
+        for item_ref in item_group_def.getElementsByTagName("ItemRef"):
+            self._create_missing_vendor_attributes(item_ref.attributes.values())
+
+            odm_item_group_items.append(
+                OdmItemGroupItemPostInput(
+                    uid=self.item_uids_by_oid.get(item_ref.getAttribute("ItemOID")),
+                    order_number=item_ref.getAttribute("OrderNumber"),
+                    mandatory=item_ref.getAttribute("Mandatory"),
+                    key_sequence="None",
+                    method_oid=item_ref.getAttribute("MethodOID") or None,
+                    imputation_method_oid="None",
+                    role="None",
+                    role_codelist_oid="None",
+                    collection_exception_condition_oid=item_ref.getAttribute(
+                        "CollectionExceptionConditionOID"
+                    ),
+                    vendor=OdmRefVendorPostInput(
+                        attributes=self._get_list_of_attributes(
+                            item_ref.attributes.items()
+                        )
+                    ),
                 )
-
-            self.odm_item_group_service.non_transactional_add_items(
-                rs.uid, odm_item_group_items
             )
 
-            self._approve(
-                self._repos.odm_item_group_repository, self.odm_item_group_service, rs
+        for item_uid, parameters in self.odm_item_group_service._get_item_relations(
+            odm_item_group_items
+        ):
+            self._add_relation(
+                self._repos.odm_item_group_repository,
+                uid=concept_ar.uid,
+                relation_uid=item_uid,
+                relationship_type=RelationType.ITEM,
+                parameters=parameters,
             )
 
     def _create_forms_with_relations(self):
-        for form_def in self.form_defs:
-            self._create_missing_vendors(form_def)
+        self._store_in_batches("FormDef", self._create_form_with_relations)
 
-            rs = self._create(
-                self._repos.odm_form_repository,
-                self.odm_form_service,
-                self.db_forms,
-                self._get_odm_form_post_input(form_def),
-            )
+    def _create_form_with_relations(self, form_def: minidom.Element):
+        self._create_missing_vendors(form_def)
 
-            self._create_relationships_with_vendors(
-                rs.uid,
-                form_def,
-                self._repos.odm_form_repository,
-                VendorAttributeCompatibleType.FORM_DEF,
-                VendorElementCompatibleType.FORM_DEF,
-            )
-            odm_form_item_groups: list[OdmFormItemGroupPostInput] = []
-            for item_group_ref in form_def.getElementsByTagName("ItemGroupRef"):
-                self._create_missing_vendor_attributes(
-                    item_group_ref.attributes.values()
-                )
+        concept_ar = self._create_approved(
+            self._repos.odm_form_repository,
+            self.odm_form_service,
+            self.db_forms,
+            self._get_odm_form_post_input(form_def),
+        )
 
-                odm_form_item_groups.append(
-                    OdmFormItemGroupPostInput(
-                        uid=next(
-                            (
-                                db_item_group.uid
-                                for db_item_group in self.db_item_groups
-                                if db_item_group.oid
-                                == item_group_ref.getAttribute("ItemGroupOID")
-                            ),
-                            None,
-                        ),
-                        order_number=item_group_ref.getAttribute("OrderNumber"),
-                        mandatory=item_group_ref.getAttribute("Mandatory"),
-                        collection_exception_condition_oid=item_group_ref.getAttribute(
-                            "CollectionExceptionConditionOID"
-                        ),
-                        vendor=OdmRefVendorPostInput(
-                            attributes=self._get_list_of_attributes(
-                                item_group_ref.attributes.items()
-                            )
-                        ),
-                    )
+        self._create_relationships_with_vendors(
+            concept_ar.uid,
+            form_def,
+            self._repos.odm_form_repository,
+            VendorAttributeCompatibleType.FORM_DEF,
+            VendorElementCompatibleType.FORM_DEF,
+        )
+        odm_form_item_groups: list[OdmFormItemGroupPostInput] = []
+        for item_group_ref in form_def.getElementsByTagName("ItemGroupRef"):
+            self._create_missing_vendor_attributes(item_group_ref.attributes.values())
+
+            odm_form_item_groups.append(
+                OdmFormItemGroupPostInput(
+                    uid=self.item_group_uids_by_oid.get(
+                        item_group_ref.getAttribute("ItemGroupOID")
+                    ),
+                    order_number=item_group_ref.getAttribute("OrderNumber"),
+                    mandatory=item_group_ref.getAttribute("Mandatory"),
+                    collection_exception_condition_oid=item_group_ref.getAttribute(
+                        "CollectionExceptionConditionOID"
+                    ),
+                    vendor=OdmRefVendorPostInput(
+                        attributes=self._get_list_of_attributes(
+                            item_group_ref.attributes.items()
+                        )
+                    ),
                 )
-
-            self.odm_form_service.non_transactional_add_item_groups(
-                rs.uid, odm_form_item_groups
             )
 
-            self._approve(self._repos.odm_form_repository, self.odm_form_service, rs)
+        for (
+            item_group_uid,
+            parameters,
+        ) in self.odm_form_service._get_item_group_relations(odm_form_item_groups):
+            self._add_relation(
+                self._repos.odm_form_repository,
+                uid=concept_ar.uid,
+                relation_uid=item_group_uid,
+                relationship_type=RelationType.ITEM_GROUP,
+                parameters=parameters,
+            )
 
     def _create_study_event_with_relations(self):
-        if self.xml_document.getElementsByTagName("StudyName"):
-            study_name = self.xml_document.getElementsByTagName("StudyName")[
-                0
-            ].firstChild.nodeValue
-        else:
-            study_name = f"@{int(time() * 1_000)}"
+        study_name = self.study_name or f"@{int(time() * 1_000)}"
 
         rs = self._create(
             self._repos.odm_study_event_repository,
@@ -1020,7 +1221,8 @@ class OdmXmlImporterService:
             )
 
         for odm_study_event_form in odm_study_event_forms:
-            self._repos.odm_study_event_repository.add_relation(
+            self._add_relation(
+                self._repos.odm_study_event_repository,
                 uid=rs.uid,
                 relation_uid=odm_study_event_form.uid,
                 relationship_type=RelationType.FORM,
@@ -1096,6 +1298,8 @@ class OdmXmlImporterService:
             concept_input=concept_input, library=library_vo
         )
         self._repos.odm_description_repository.save(concept_ar)
+        # Approved along with the ODM element it describes
+        self.pending_descriptions[concept_ar.uid] = concept_ar
 
         return self.odm_description_service._transform_aggregate_root_to_pydantic_model(
             concept_ar
@@ -1356,18 +1560,7 @@ class OdmXmlImporterService:
 
         item_unit_definitions = self._get_item_unit_definition_inputs(item_def)
 
-        codelist = next(
-            (
-                codelist
-                for codelist in self.codelists
-                if item_def.getElementsByTagName("CodeListRef")
-                and codelist.getAttribute("OID")
-                == item_def.getElementsByTagName("CodeListRef")[0].getAttribute(
-                    "CodeListOID"
-                )
-            ),
-            None,
-        )
+        codelist = self._get_codelist(item_def)
 
         input_terms = []
         if codelist:
@@ -1424,6 +1617,12 @@ class OdmXmlImporterService:
             item_unit_definitions,
         )
 
+    def _get_codelist(self, item_def) -> minidom.Element | None:
+        codelist_refs = item_def.getElementsByTagName("CodeListRef")
+        if not codelist_refs:
+            return None
+        return self.codelists_by_oid.get(codelist_refs[0].getAttribute("CodeListOID"))
+
     def _get_odm_item_group_post_input(self, item_group_def):
         descriptions = self._extract_descriptions(item_group_def)
 
@@ -1549,8 +1748,54 @@ class OdmXmlImporterService:
         save_to.append(item)
         return item
 
+    def _create_approved(
+        self,
+        repository: OdmGenericRepository,
+        service,
+        save_to: list[OdmARBase],
+        concept_input,
+    ) -> OdmARBase:
+        """
+        Creates an approved ODM element, and returns its aggregate root.
+
+        A new ODM element is created and approved at the end of the current batch, with the other ones of the batch.
+        If the ODM element already exists, a new version of it is created and approved right away instead.
+        """
+        pending_concepts = self.pending_concepts[repository]
+        if concept_input.oid in pending_concepts:
+            # A pending ODM element with the same OID may be the same ODM element
+            self._store_pending_concepts(repository)
+            pending_concepts = self.pending_concepts[repository]
+
+        library_vo = self._get_library(concept_input)
+
+        try:
+            concept_ar = service._create_aggregate_root(
+                concept_input=concept_input, library=library_vo
+            )
+        except exceptions.AlreadyExistsException as e:
+            uid = re.search(r" already exists with UID \((.*)\) and data {", e.msg)
+            if not uid:
+                raise
+
+            concept_ar = repository.find_by_uid_2(uid=uid[1], for_update=True)
+            if concept_ar.item_metadata.status != LibraryItemStatus.DRAFT:
+                concept_ar.create_new_version(author_id=user().id())
+                repository.save(concept_ar)
+            concept_ar = self._approve(repository, service, concept_ar)
+
+            # The descriptions created for the input are not used by the existing ODM element
+            for description_uid in concept_input.descriptions:
+                self.pending_descriptions.pop(description_uid, None)
+        else:
+            pending_concepts[concept_input.oid] = concept_ar
+
+        save_to.append(concept_ar)
+        return concept_ar
+
     def _approve(self, repository, service, item):
         appr = service._find_by_uid_or_raise_not_found(item.uid, for_update=True)
         appr.approve(author_id=user().id())
         repository.save(appr)
         service.cascade_edit_and_approve(appr)
+        return appr
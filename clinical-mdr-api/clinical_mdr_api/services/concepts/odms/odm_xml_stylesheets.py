@@ -1,10 +1,24 @@
 import re
 from os import listdir, path
+from threading import Lock
 
-from common.config import XML_STYLESHEET_DIR_PATH
+from cachetools import LRUCache, cached
+from lxml import etree
+
+from common.config import XML_STYLESHEET_CACHE_MAX_SIZE, XML_STYLESHEET_DIR_PATH
 from common.exceptions import NotFoundException, ValidationException
 
 
+@cached(cache=LRUCache(maxsize=XML_STYLESHEET_CACHE_MAX_SIZE), lock=Lock())
+def _compile_stylesheet(filename: str, modified_time: float) -> etree.XSLT:
+    # The modification time is only part of the cache key, so that modified files are compiled again
+    parser = etree.XMLParser(resolve_entities=False)
+    return etree.XSLT(
+        etree.parse(filename, parser=parser),
+        access_control=etree.XSLTAccessControl.DENY_ALL,
+    )
+
+
 class OdmXmlStylesheetService:
     @staticmethod
     def get_available_stylesheet_names():
@@ -73,3 +87,23 @@ class OdmXmlStylesheetService:
             encoding="utf-8",
         ) as file:
             return file.read()
+
+    @staticmethod
+    def get_compiled_stylesheet(stylesheet: str) -> etree.XSLT:
+        """
+        Returns the XSLT transformation of the XML stylesheet with the given name.
+
+        Compiled stylesheets are cached for the lifetime of the process, and compiled again when their file is modified.
+
+        Args:
+            stylesheet (str): The name of the XML stylesheet.
+
+        Returns:
+            etree.XSLT: The compiled XSLT transformation.
+
+        Raises:
+            ValidationException: If the stylesheet name contains characters other than letters, numbers, and hyphens.
+            NotFoundException: If the stylesheet with the given name is not found.
+        """
+        filename = OdmXmlStylesheetService.get_xml_filename_by_name(stylesheet)
+        return _compile_stylesheet(filename, path.getmtime(filename))
@@ -1,5 +1,7 @@
+import logging
 from datetime import date
 
+from clinical_mdr_api.domains.controlled_terminologies.ct_package import CTPackageAR
 from clinical_mdr_api.models.controlled_terminologies.ct_package import (
     CTPackage,
     CTPackageChanges,
@@ -9,12 +11,17 @@ from clinical_mdr_api.models.controlled_terminologies.ct_package import (
 from clinical_mdr_api.repositories.ct_packages import (
     get_ct_packages_changes,
     get_ct_packages_codelist_changes,
+    load_persisted_ct_packages_changes,
+    save_persisted_ct_packages_changes,
 )
 from clinical_mdr_api.services._meta_repository import MetaRepository  # type: ignore
 from clinical_mdr_api.utils import normalize_string
+from common import config
 from common.auth.user import user
 from common.exceptions import BusinessLogicException, NotFoundException
 
+log = logging.getLogger(__name__)
+
 
 class CTPackageService:
     _repos: MetaRepository
@@ -106,19 +113,67 @@ class CTPackageService:
                 new_package_date=new_package_date,
             )
 
+            persisted = config.CT_PACKAGE_CHANGES_PERSISTED_ENABLED and (
+                self.are_changes_persisted(old_package, new_package)
+            )
+            if persisted:
+                changes = self._load_persisted_ct_packages_changes(
+                    old_package_name=old_package.name,
+                    new_package_name=new_package.name,
+                )
+                if changes is not None:
+                    return changes
+
             result = get_ct_packages_changes(
                 old_package_name=old_package.name,
                 new_package_name=new_package.name,
             )
-
-            return CTPackageChanges.from_repository_output(
+            changes = CTPackageChanges.from_repository_output(
                 old_package_name=old_package.name,
                 new_package_name=new_package.name,
                 query_output=result,
             )
+
+            if persisted:
+                save_persisted_ct_packages_changes(
+                    old_package_name=old_package.name,
+                    new_package_name=new_package.name,
+                    changes=changes.model_dump_json(),
+                )
+            return changes
         finally:
             self._close_all_repos()
 
+    @staticmethod
+    def are_changes_persisted(old_package: CTPackageAR, new_package: CTPackageAR):
+        """
+        Returns whether the changes between two packages are computed once and persisted.
+
+        Packages imported from CDISC never change after their import, unlike sponsor packages extending them.
+        """
+        return (
+            old_package.extends_package is None and new_package.extends_package is None
+        )
+
+    @staticmethod
+    def _load_persisted_ct_packages_changes(
+        old_package_name: str, new_package_name: str
+    ) -> CTPackageChanges | None:
+        changes = load_persisted_ct_packages_changes(
+            old_package_name=old_package_name, new_package_name=new_package_name
+        )
+        if changes is None:
+            return None
+        try:
+            return CTPackageChanges.model_validate_json(changes)
+        except ValueError:
+            log.warning(
+                "Discarding unreadable changes between packages %s and %s",
+                old_package_name,
+                new_package_name,
+            )
+            return None
+
     def get_ct_packages_codelist_changes(
         self,
         catalogue_name: str,
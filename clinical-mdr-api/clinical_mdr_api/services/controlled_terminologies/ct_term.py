@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Any, TypeVar
+from typing import Any, Sequence, TypeVar
 
+from fastapi import status
 from neomodel import db
 
 from clinical_mdr_api.domains.controlled_terminologies.ct_term_attributes import (
@@ -19,16 +20,22 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
 )
 from clinical_mdr_api.models.controlled_terminologies.ct_term import (
     CTTerm,
+    CTTermBatchOutput,
     CTTermCreateInput,
     CTTermNameAndAttributes,
 )
+from clinical_mdr_api.models.error import BatchErrorResponse
 from clinical_mdr_api.models.utils import GenericFilteringReturn
 from clinical_mdr_api.repositories._utils import FilterOperator
 from clinical_mdr_api.services._meta_repository import MetaRepository  # type: ignore
 from clinical_mdr_api.services._utils import is_library_editable
 from clinical_mdr_api.utils import normalize_string
 from common.auth.user import user
-from common.exceptions import BusinessLogicException, NotFoundException
+from common.exceptions import (
+    BusinessLogicException,
+    MDRApiBaseException,
+    NotFoundException,
+)
 
 _AggregateRootType = TypeVar("_AggregateRootType")
 
@@ -160,6 +167,56 @@ class CTTermService:
     ) -> CTTerm:
         return self.non_transactional_create(term_input, start_date=start_date)
 
+    def create_batch(
+        self, term_inputs: Sequence[CTTermCreateInput], approve: bool = False
+    ) -> list[CTTermBatchOutput]:
+        """
+        Creates the terms, and approves the names and attributes of each created term if `approve` is set.
+
+        Each term is created and approved in its own transaction, so that a failing term is rolled back entirely,
+        without preventing the creation of the other terms.
+        The result of each term is returned in the order of the inputs, with the error of the terms that failed.
+        """
+        results = []
+        for term_input in term_inputs:
+            try:
+                term = self._create_batch_item(term_input, approve)
+                results.append(
+                    CTTermBatchOutput(
+                        response_code=status.HTTP_201_CREATED, content=term
+                    )
+                )
+            except MDRApiBaseException as error:
+                results.append(
+                    CTTermBatchOutput.model_construct(
+                        response_code=error.status_code,
+                        content=BatchErrorResponse(message=str(error)),
+                    )
+                )
+        return results
+
+    @db.transaction
+    def _create_batch_item(
+        self, term_input: CTTermCreateInput, approve: bool
+    ) -> CTTerm:
+        term = self.non_transactional_create(term_input)
+        if not approve:
+            return term
+
+        ct_term_name_ar = self._repos.ct_term_name_repository.find_by_uid(
+            term_uid=term.term_uid, for_update=True
+        )
+        ct_term_name_ar.approve(author_id=self.author_id)
+        self._repos.ct_term_name_repository.save(ct_term_name_ar)
+
+        ct_term_attributes_ar = self._repos.ct_term_attributes_repository.find_by_uid(
+            term_uid=term.term_uid, for_update=True
+        )
+        ct_term_attributes_ar.approve(author_id=self.author_id)
+        self._repos.ct_term_attributes_repository.save(ct_term_attributes_ar)
+
+        return CTTerm.from_ct_term_ars(ct_term_name_ar, ct_term_attributes_ar)
+
     def get_all_terms(
         self,
         codelist_uid: str | None,
@@ -1,5 +1,6 @@
 import re
 import uuid
+from dataclasses import dataclass
 from datetime import date
 from itertools import chain
 from typing import Any, Callable
@@ -40,6 +41,7 @@ from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import
     StudyStatus,
 )
 from clinical_mdr_api.models.study_selections.study import Study as OSBStudy
+from clinical_mdr_api.services._utils import run_concurrently
 from clinical_mdr_api.services.ddf.usdm_utils import IdManager
 
 DDF_CT_PACKAGE_EFFECTIVE_DATE = "2023-12-15"
@@ -106,6 +108,22 @@ def _update_ddf_encounter_scheduled_at(encounters, schedule_timelines):
         )
 
 
+@dataclass
+class OSBStudyComponents:
+    """
+    Components of an OSB study which are mapped to the USDM study design, loaded ahead of the mapping.
+    """
+
+    design_cells: list[Any]
+    arms: list[Any]
+    epochs: list[Any]
+    elements: list[Any]
+    endpoints: list[Any]
+    visits: list[Any]
+    activities: list[Any]
+    activity_schedules: list[Any]
+
+
 class USDMMapper:
     def __init__(
         self,
@@ -262,7 +280,46 @@ class USDMMapper:
         )
         return code
 
-    def map(self, study: OSBStudy) -> dict[str, Any]:
+    def _component_loaders(self, study_uid: str) -> list[Callable[[], list[Any]]]:
+        # In the order of the fields of OSBStudyComponents
+        return [
+            lambda: self._get_osb_study_design_cells(study_uid),
+            lambda: self._get_osb_study_arms(study_uid).items,
+            lambda: self._get_osb_study_epochs(study_uid).items,
+            lambda: self._get_osb_study_elements(study_uid).items,
+            lambda: self._get_osb_study_endpoints(study_uid, no_brackets=True).items,
+            lambda: self._get_osb_study_visits(study_uid).items,
+            lambda: self._get_osb_study_activities(study_uid).items,
+            lambda: self._get_osb_activity_schedules(study_uid),
+        ]
+
+    def load_components(self, study_uid: str) -> OSBStudyComponents:
+        """
+        Loads the components of the study which are mapped to the USDM study design.
+
+        The components are independent of each other, so they are loaded concurrently.
+        """
+        return OSBStudyComponents(
+            *run_concurrently(*self._component_loaders(study_uid))
+        )
+
+    def load_study_and_components(
+        self, study_uid: str, get_osb_study: Callable[[str], OSBStudy]
+    ) -> tuple[OSBStudy, OSBStudyComponents]:
+        """
+        Loads the study with `get_osb_study` concurrently with its components.
+        """
+        osb_study, *components = run_concurrently(
+            lambda: get_osb_study(study_uid), *self._component_loaders(study_uid)
+        )
+        return osb_study, OSBStudyComponents(*components)
+
+    def map(
+        self, study: OSBStudy, components: OSBStudyComponents | None = None
+    ) -> dict[str, Any]:
+        if components is None:
+            components = self.load_components(study.uid)
+
         usdm_study = USDMStudy(name=self._get_study_name(study), instanceType="Study")
         usdm_study.id = uuid.uuid4()
         usdm_study.label = self._get_study_label(study)
@@ -296,7 +353,7 @@ class USDMMapper:
         # Set study interventions
         usdm_version.studyInterventions = self._get_study_interventions(study)
         # Set DDF study design
-        usdm_version.studyDesigns = self._get_study_designs(study)
+        usdm_version.studyDesigns = self._get_study_designs(study, components)
 
         # Inject interventions IDs into study design
         usdm_version.studyDesigns[0].studyInterventionIds = [
@@ -331,8 +388,8 @@ class USDMMapper:
             )
         return self.get_void_usdm_code()
 
-    def _get_study_arms(self, study: OSBStudy):
-        osb_study_arms = self._get_osb_study_arms(study.uid).items
+    def _get_study_arms(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_study_arms = components.arms
         return [
             StudyArm(
                 id=self._id_manager.get_id(StudyArm.__name__, sa.arm_uid),
@@ -350,8 +407,8 @@ class USDMMapper:
             for sa in osb_study_arms
         ]
 
-    def _get_study_cells(self, study: OSBStudy):
-        osb_design_cells = self._get_osb_study_design_cells(study.uid)
+    def _get_study_cells(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_design_cells = components.design_cells
         return [
             USDMStudyCell(
                 id=self._id_manager.get_id(USDMStudyCell.__name__, dc.design_cell_uid),
@@ -377,7 +434,7 @@ class USDMMapper:
         )
         return getattr(study_description, "study_title", None)
 
-    def _get_study_designs(self, study: OSBStudy):
+    def _get_study_designs(self, study: OSBStudy, components: OSBStudyComponents):
         # Create DDF study design and set intervention model
         ddf_study_design = USDMStudyDesign(
             id=self._id_manager.get_id(USDMStudyDesign.__name__),
@@ -410,31 +467,33 @@ class USDMMapper:
         # ddf_study_design.intentTypes = self._get_trial_intent_types_codes(study)
 
         # Set study arms
-        ddf_study_design.arms = self._get_study_arms(study)
+        ddf_study_design.arms = self._get_study_arms(study, components)
 
         # Set study elements
-        ddf_study_design.elements = self._get_study_elements(study)
+        ddf_study_design.elements = self._get_study_elements(study, components)
 
         # Set study epochs
-        ddf_study_design.epochs = self._get_study_epochs(study)
+        ddf_study_design.epochs = self._get_study_epochs(study, components)
 
         # Set study cells
-        ddf_study_design.studyCells = self._get_study_cells(study)
+        ddf_study_design.studyCells = self._get_study_cells(study, components)
 
         # Set study indications
         ddf_study_design.indications = self._get_study_indications(study)
 
         # Set study objectives and endpoints
-        ddf_study_design.objectives = self._get_study_objectives(study)
+        ddf_study_design.objectives = self._get_study_objectives(study, components)
 
         # Set study visits/encounters
-        ddf_study_design.encounters = self._get_study_encounters(study)
+        ddf_study_design.encounters = self._get_study_encounters(study, components)
 
         # Set study activities
-        ddf_study_design.activities = self._get_study_activities(study)
+        ddf_study_design.activities = self._get_study_activities(study, components)
 
         # Set schedule timeline
-        ddf_study_design.scheduleTimelines = self._get_study_schedule_timelines(study)
+        ddf_study_design.scheduleTimelines = self._get_study_schedule_timelines(
+            study, components
+        )
 
         _update_ddf_encounter_scheduled_at(
             ddf_study_design.encounters, ddf_study_design.scheduleTimelines
@@ -442,8 +501,8 @@ class USDMMapper:
 
         return [ddf_study_design]
 
-    def _get_study_activities(self, study: OSBStudy):
-        osb_study_activities = self._get_osb_study_activities(study.uid).items
+    def _get_study_activities(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_study_activities = components.activities
         return [
             USDMActivity(
                 id=self._id_manager.get_id(USDMActivity.__name__, a.study_activity_uid),
@@ -475,8 +534,8 @@ class USDMMapper:
             for a in osb_study_activities
         ]
 
-    def _get_study_elements(self, study: OSBStudy):
-        osb_study_elements = self._get_osb_study_elements(study.uid).items
+    def _get_study_elements(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_study_elements = components.elements
         ddf_study_elements = []
         for osb_se in osb_study_elements:
             ddf_se_id = self._id_manager.get_id(
@@ -492,8 +551,8 @@ class USDMMapper:
             ddf_study_elements.append(ddf_se)
         return ddf_study_elements
 
-    def _get_study_epochs(self, study: OSBStudy):
-        osb_study_epochs = self._get_osb_study_epochs(study.uid).items
+    def _get_study_epochs(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_study_epochs = components.epochs
 
         # Since order is not mandatory in StudyEpoch, add next and previous IDs only
         # if order is available for every epoch
@@ -680,10 +739,8 @@ class USDMMapper:
                 return study.current_metadata.study_description.study_short_title
         return None
 
-    def _get_study_objectives(self, study: OSBStudy):
-        osb_study_endpoints = self._get_osb_study_endpoints(
-            study.uid, no_brackets=True
-        ).items
+    def _get_study_objectives(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_study_endpoints = components.endpoints
         return [
             USDMObjective(
                 id=self._id_manager.get_id(
@@ -927,9 +984,9 @@ class USDMMapper:
         ddf_study_definition_document.versions = [ddf_study_definition_document_version]
         return ddf_study_definition_document
 
-    def _get_study_schedule_timelines(self, study):
-        osb_study_activity_schedules = self._get_osb_activity_schedules(study.uid)
-        osb_study_visits = self._get_osb_study_visits(study.uid).items
+    def _get_study_schedule_timelines(self, study, components: OSBStudyComponents):
+        osb_study_activity_schedules = components.activity_schedules
+        osb_study_visits = components.visits
 
         # Create main timeline
         usdm_timeline_id = self._id_manager.get_id(USDMScheduleTimeline.__name__)
@@ -1085,8 +1142,8 @@ class USDMMapper:
             )
         )
 
-    def _get_study_encounters(self, study: OSBStudy):
-        osb_study_visits = self._get_osb_study_visits(study.uid).items
+    def _get_study_encounters(self, study: OSBStudy, components: OSBStudyComponents):
+        osb_study_visits = components.visits
         ordered_osb_study_visits = sorted(
             osb_study_visits, key=lambda sv: sv.visit_number, reverse=False
         )
@@ -1,8 +1,9 @@
-from typing import Any
+from typing import Any, Iterator
 
 from clinical_mdr_api.domains.study_definition_aggregates.study_metadata import (
     StudyComponentEnum,
 )
+from clinical_mdr_api.models.utils import iter_json
 from clinical_mdr_api.services.ddf.usdm_mapper import USDMMapper
 from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_activity_schedule import (
@@ -40,8 +41,27 @@ class USDMService:
             get_osb_activity_schedules=StudyActivityScheduleService().get_all_schedules,
         )
 
+    # Sections of the USDM study which are streamed one member at a time
+    STREAMED_SECTIONS = ("study", "versions", "studyDesigns")
+
     def get_by_uid(self, uid: str) -> dict[str, Any]:
-        osb_study = StudyService().get_by_uid(
+        # The study and its components are independent reads, so they are loaded concurrently
+        osb_study, components = self._usdm_mapper.load_study_and_components(
+            uid, self._get_osb_study
+        )
+
+        usdm_wrapped_study = self._usdm_mapper.map(osb_study, components)
+        return usdm_wrapped_study
+
+    def iter_json(self, uid: str) -> Iterator[bytes]:
+        """
+        Returns the USDM study as JSON, in chunks of one section of the study design at a time.
+        """
+        return iter_json(self.get_by_uid(uid), nested_fields=self.STREAMED_SECTIONS)
+
+    @staticmethod
+    def _get_osb_study(uid: str):
+        return StudyService().get_by_uid(
             uid,
             include_sections=[
                 StudyComponentEnum.IDENTIFICATION_METADATA,
@@ -53,6 +73,3 @@ class USDMService:
                 StudyComponentEnum.STUDY_POPULATION,
             ],
         )
-
-        usdm_wrapped_study = self._usdm_mapper.map(osb_study)
-        return usdm_wrapped_study
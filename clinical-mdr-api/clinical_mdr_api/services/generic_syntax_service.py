@@ -162,6 +162,44 @@ class GenericSyntaxService(Generic[_AggregateRootType], abc.ABC):
             total=total_count,
         )
 
+    def get_all_by_page_token(
+        self,
+        page_token: str,
+        page_size: int,
+        status: str | None = None,
+        return_study_count: bool | None = True,
+        sort_by: dict | None = None,
+        filter_by: dict | None = None,
+        filter_operator: FilterOperator | None = FilterOperator.OR,
+        total_count: bool = False,
+    ) -> tuple[GenericFilteringReturn[BaseModel], str | None]:
+        """
+        Returns a page of items like `get_all`, selected by page token, with the token of the next page.
+        """
+        all_items, total_count, next_page_token = (
+            self.repository.get_all_optimized_by_page_token(
+                page_token=page_token,
+                page_size=page_size,
+                status=LibraryItemStatus(status) if status else None,
+                return_study_count=return_study_count,
+                sort_by=sort_by,
+                filter_by=filter_by,
+                filter_operator=filter_operator,
+                total_count=total_count,
+            )
+        )
+
+        return (
+            GenericFilteringReturn.create(
+                items=[
+                    self._transform_aggregate_root_to_pydantic_model(item)
+                    for item in all_items
+                ],
+                total=total_count,
+            ),
+            next_page_token,
+        )
+
     def get_distinct_values_for_header(
         self,
         field_name: str,
@@ -185,6 +223,9 @@ class GenericSyntaxService(Generic[_AggregateRootType], abc.ABC):
 
     @db.transaction
     def approve(self, uid: str) -> BaseModel:
+        return self.non_transactional_approve(uid)
+
+    def non_transactional_approve(self, uid: str) -> BaseModel:
         item = self.repository.find_by_uid(uid, for_update=True)
 
         self.authorize_user_defined_syntax_write(item.library.name)
@@ -94,6 +94,7 @@ from clinical_mdr_api.services.studies.study_activity_subgroup import (
 )
 from clinical_mdr_api.services.studies.study_soa_footnote import StudySoAFootnoteService
 from clinical_mdr_api.services.studies.study_soa_group import StudySoAGroupService
+from common import config
 from common.auth.user import user
 from common.config import REQUESTED_LIBRARY_NAME
 from common.exceptions import (
@@ -1086,6 +1087,51 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
             study_uid=study_uid, study_activity_selection=study_activity_selection
         )
 
+    def _get_or_create_study_activity_groupings(
+        self,
+        study_uid: str,
+        selection_create_input: StudySelectionActivityCreateInput,
+    ) -> tuple[str, str | None, str | None]:
+        """
+        Returns the uids of the StudySoAGroup, StudyActivityGroup and StudyActivitySubGroup selections
+        a new StudyActivity is linked to, creating the missing ones.
+        """
+        study_soa_group_selection_uid = self._get_or_create_study_soa_group(
+            study_uid=study_uid,
+            soa_group_term_uid=selection_create_input.soa_group_term_uid,
+        ).study_selection_uid
+
+        study_activity_group_selection = self._get_or_create_study_activity_group(
+            study_uid=study_uid,
+            soa_group_term_uid=selection_create_input.soa_group_term_uid,
+            study_soa_group_uid=study_soa_group_selection_uid,
+            activity_group_uid=selection_create_input.activity_group_uid,
+            activity_subgroup_uid=selection_create_input.activity_subgroup_uid,
+        )
+        study_activity_group_selection_uid = (
+            study_activity_group_selection.study_selection_uid
+            if study_activity_group_selection
+            else None
+        )
+
+        study_activity_subgroup_selection = self._get_or_create_study_activity_subgroup(
+            study_uid=study_uid,
+            soa_group_term_uid=selection_create_input.soa_group_term_uid,
+            activity_group_uid=selection_create_input.activity_group_uid,
+            study_activity_group_uid=study_activity_group_selection_uid,
+            activity_subgroup_uid=selection_create_input.activity_subgroup_uid,
+        )
+        study_activity_subgroup_selection_uid = (
+            study_activity_subgroup_selection.study_selection_uid
+            if study_activity_subgroup_selection
+            else None
+        )
+        return (
+            study_soa_group_selection_uid,
+            study_activity_group_selection_uid,
+            study_activity_subgroup_selection_uid,
+        )
+
     @ensure_transaction(db)
     def make_selection(
         self,
@@ -1094,37 +1140,12 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
     ) -> StudySelectionActivity:
         repos = self._repos
         try:
-            study_soa_group_selection_uid = self._get_or_create_study_soa_group(
-                study_uid=study_uid,
-                soa_group_term_uid=selection_create_input.soa_group_term_uid,
-            ).study_selection_uid
-
-            study_activity_group_selection = self._get_or_create_study_activity_group(
-                study_uid=study_uid,
-                soa_group_term_uid=selection_create_input.soa_group_term_uid,
-                study_soa_group_uid=study_soa_group_selection_uid,
-                activity_group_uid=selection_create_input.activity_group_uid,
-                activity_subgroup_uid=selection_create_input.activity_subgroup_uid,
-            )
-            study_activity_group_selection_uid = (
-                study_activity_group_selection.study_selection_uid
-                if study_activity_group_selection
-                else None
-            )
-
-            study_activity_subgroup_selection = (
-                self._get_or_create_study_activity_subgroup(
-                    study_uid=study_uid,
-                    soa_group_term_uid=selection_create_input.soa_group_term_uid,
-                    activity_group_uid=selection_create_input.activity_group_uid,
-                    study_activity_group_uid=study_activity_group_selection_uid,
-                    activity_subgroup_uid=selection_create_input.activity_subgroup_uid,
-                )
-            )
-            study_activity_subgroup_selection_uid = (
-                study_activity_subgroup_selection.study_selection_uid
-                if study_activity_subgroup_selection
-                else None
+            (
+                study_soa_group_selection_uid,
+                study_activity_group_selection_uid,
+                study_activity_subgroup_selection_uid,
+            ) = self._get_or_create_study_activity_groupings(
+                study_uid=study_uid, selection_create_input=selection_create_input
             )
 
             # StudyActivitySelection
@@ -1188,6 +1209,140 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
         finally:
             repos.close()
 
+    def make_selections_in_bulk(
+        self,
+        study_uid: str,
+        selection_create_inputs: Sequence[StudySelectionActivityCreateInput],
+    ) -> list[StudySelectionActivity | MDRApiBaseException]:
+        """
+        Creates several StudyActivity selections at once, as in a sequence of `make_selection` calls.
+
+        All selections are validated in memory against the aggregates they are added to,
+        and the valid ones are persisted with a single query, see `StudySelectionActivityRepository.save_new_selections`.
+
+        Returns:
+            list[StudySelectionActivity | MDRApiBaseException]: For each input, in the same order,
+            either the created selection or the error which prevented its creation.
+        """
+        repos = self._repos
+        try:
+            results: list[StudySelectionActivity | MDRApiBaseException | None] = []
+            groupings: dict[tuple, tuple[str, str | None, str | None]] = {}
+            aggregates: dict[tuple, StudySelectionActivityAR] = {}
+            new_selections: dict[str, StudySelectionActivityVO] = {}
+            for selection_create_input in selection_create_inputs:
+                try:
+                    groupings_key = (
+                        selection_create_input.soa_group_term_uid,
+                        selection_create_input.activity_group_uid,
+                        selection_create_input.activity_subgroup_uid,
+                    )
+                    if groupings_key not in groupings:
+                        groupings[groupings_key] = (
+                            self._get_or_create_study_activity_groupings(
+                                study_uid=study_uid,
+                                selection_create_input=selection_create_input,
+                            )
+                        )
+                    (
+                        study_soa_group_selection_uid,
+                        study_activity_group_selection_uid,
+                        study_activity_subgroup_selection_uid,
+                    ) = groupings[groupings_key]
+
+                    study_activity_selection = self._create_value_object(
+                        study_uid=study_uid,
+                        selection_create_input=selection_create_input,
+                        study_soa_group_selection_uid=study_soa_group_selection_uid,
+                        study_activity_subgroup_selection_uid=study_activity_subgroup_selection_uid,
+                        study_activity_group_selection_uid=study_activity_group_selection_uid,
+                    )
+                    # Selections of a subgroup, or placeholders without subgroup of a SoA group,
+                    # are ordered within the same aggregate as in make_selection
+                    aggregate_key = (
+                        (study_activity_subgroup_selection_uid, None)
+                        if study_activity_subgroup_selection_uid
+                        else (None, study_soa_group_selection_uid)
+                    )
+                    if aggregate_key not in aggregates:
+                        aggregates[aggregate_key] = self.repository.find_by_study(
+                            study_uid=study_uid,
+                            for_update=True,
+                            study_activity_subgroup_uid=study_activity_subgroup_selection_uid,
+                            study_soa_group_uid=study_soa_group_selection_uid,
+                            find_requested_study_activities=study_activity_selection.activity_library_name
+                            == REQUESTED_LIBRARY_NAME,
+                        )
+                    study_activity_aggregate = aggregates[aggregate_key]
+                    previous_selections = (
+                        study_activity_aggregate.study_objects_selection
+                    )
+                    try:
+                        study_activity_aggregate.add_object_selection(
+                            study_activity_selection,
+                            self.selected_object_repository.check_exists_final_version,
+                            self._repos.ct_term_name_repository.term_specific_exists_by_uid,
+                        )
+                        study_activity_aggregate.validate()
+                    except MDRApiBaseException:
+                        study_activity_aggregate.study_objects_selection = (
+                            previous_selections
+                        )
+                        raise
+                    new_selections[study_activity_selection.study_selection_uid] = (
+                        study_activity_selection
+                    )
+                    results.append(None)
+                except MDRApiBaseException as error:
+                    results.append(error)
+
+            # New selections are appended to the aggregates, so their order is their position
+            self.repository.save_new_selections(
+                study_uid=study_uid,
+                selections=[
+                    (order, selection)
+                    for aggregate in aggregates.values()
+                    for order, selection in enumerate(
+                        aggregate.study_objects_selection, start=1
+                    )
+                    if selection.study_selection_uid in new_selections
+                ],
+            )
+
+            for study_activity_selection in new_selections.values():
+                # We are not creating a StudyActivityInstance selection for Activity placeholders
+                if (
+                    study_activity_selection.activity_library_name
+                    != REQUESTED_LIBRARY_NAME
+                ):
+                    self._create_study_activity_instances(
+                        study_uid=study_uid,
+                        study_activity_selection=study_activity_selection,
+                    )
+
+            study_activity_aggregate = self.repository.find_by_study(
+                study_uid=study_uid,
+            )
+            terms_at_specific_datetime = self._extract_study_standards_effective_date(
+                study_uid=study_uid
+            )
+            saved_selections = iter(new_selections)
+            for idx, result in enumerate(results):
+                if result is None:
+                    new_selection, _ = (
+                        study_activity_aggregate.get_specific_object_selection(
+                            next(saved_selections)
+                        )
+                    )
+                    results[idx] = self._transform_from_vo_to_response_model(
+                        study_uid=study_uid,
+                        specific_selection=new_selection,
+                        terms_at_specific_datetime=terms_at_specific_datetime,
+                    )
+            return results
+        finally:
+            repos.close()
+
     @ensure_transaction(db)
     def delete_selection(self, study_uid: str, study_selection_uid: str):
         # StudyActivitySchedule and StudyActivityInstruction Services for cascade delete if any
@@ -1622,6 +1777,34 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
 
         return updated_study_activity_vo
 
+    def _create_pending_batch_selections(
+        self,
+        study_uid: str,
+        pending_creations: dict[int, StudySelectionActivityCreateInput],
+        results: list,
+        output_type: type[StudySelectionActivityBatchOutput | StudySoAEditBatchOutput],
+    ) -> None:
+        """
+        Creates the StudyActivity selections of consecutive POST batch operations with `make_selections_in_bulk`,
+        and sets their outcome at their position in the batch results.
+        """
+        if not pending_creations:
+            return
+        items = self.make_selections_in_bulk(
+            study_uid, list(pending_creations.values())
+        )
+        for idx, item in zip(pending_creations, items):
+            if isinstance(item, MDRApiBaseException):
+                results[idx] = output_type.model_construct(
+                    response_code=item.status_code,
+                    content=BatchErrorResponse(message=str(item)),
+                )
+            else:
+                results[idx] = output_type(
+                    response_code=status.HTTP_201_CREATED, content=item
+                )
+        pending_creations.clear()
+
     @ensure_transaction(db)
     def handle_batch_operations(
         self,
@@ -1629,7 +1812,22 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
         operations: list[StudySelectionActivityBatchInput],
     ) -> list[StudySelectionActivityBatchOutput]:
         results = []
+        pending_creations: dict[int, StudySelectionActivityCreateInput] = {}
         for operation in operations:
+            if (
+                config.STUDY_SELECTION_BULK_WRITE_ENABLED
+                and operation.method == "POST"
+                and isinstance(operation.content, StudySelectionActivityCreateInput)
+            ):
+                pending_creations[len(results)] = operation.content
+                results.append(None)
+                continue
+            self._create_pending_batch_selections(
+                study_uid,
+                pending_creations,
+                results,
+                StudySelectionActivityBatchOutput,
+            )
             result = {}
             item = None
             try:
@@ -1666,6 +1864,9 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
                         content=BatchErrorResponse(message=str(error)),
                     )
                 )
+        self._create_pending_batch_selections(
+            study_uid, pending_creations, results, StudySelectionActivityBatchOutput
+        )
         all_soa_footnotes = (
             self._repos.study_soa_footnote_repository.find_all_footnotes(
                 study_uids=study_uid
@@ -1684,7 +1885,19 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
     ) -> list[StudySoAEditBatchOutput]:
         study_activity_schedules_service = StudyActivityScheduleService()
         results = []
+        pending_creations: dict[int, StudySelectionActivityCreateInput] = {}
         for operation in operations:
+            if (
+                config.STUDY_SELECTION_BULK_WRITE_ENABLED
+                and operation.method == "POST"
+                and operation.object == SoAItemType.STUDY_ACTIVITY.value
+            ):
+                pending_creations[len(results)] = operation.content
+                results.append(None)
+                continue
+            self._create_pending_batch_selections(
+                study_uid, pending_creations, results, StudySoAEditBatchOutput
+            )
             result = {}
             item = None
             try:
@@ -1728,6 +1941,9 @@ class StudyActivitySelectionService(StudyActivitySelectionBaseService):
                         content=BatchErrorResponse(message=str(error)),
                     )
                 )
+        self._create_pending_batch_selections(
+            study_uid, pending_creations, results, StudySoAEditBatchOutput
+        )
         all_soa_footnotes = (
             self._repos.study_soa_footnote_repository.find_all_footnotes(
                 study_uids=study_uid
@@ -1,9 +1,12 @@
+import functools
 import logging
 import os
 from collections import OrderedDict
+from threading import Lock
 from typing import Mapping, MutableMapping
 
 import yattag
+from cachetools import LRUCache, cached
 from colour import Color
 from PIL import ImageFont
 
@@ -136,6 +139,29 @@ STYLES = {
 log = logging.getLogger(__name__)
 
 
+# FreeType faces are not safe to be used concurrently
+_font_lock = Lock()
+
+
+@functools.cache
+def _load_font(font_size: int) -> ImageFont.FreeTypeFont:
+    """Returns the font of the figures in the given size (in pixels), loaded once per process"""
+    return ImageFont.truetype(
+        os.path.join(config.APP_ROOT_DIR, FONT_FILE_NAME), font_size
+    )
+
+
+@cached(
+    cache=LRUCache(maxsize=config.STUDY_DESIGN_FIGURE_TEXT_SIZE_CACHE_MAX_SIZE),
+    lock=Lock(),
+)
+def _measure_text(text: str, font_size: int) -> tuple[int, int]:
+    """Returns width and height (in pixels) of given text if rendered with the font of the figures in the given size"""
+    font = _load_font(font_size)
+    with _font_lock:
+        return font.getbbox(text)[2:4]
+
+
 class StudyDesignFigureService:
     """Draws an SVG image of Study Design Figure
 
@@ -149,10 +175,9 @@ class StudyDesignFigureService:
 
     def __init__(self, debug: bool = False):
         self.debug = debug
-        font_path = os.path.join(config.APP_ROOT_DIR, FONT_FILE_NAME)
         # Although ImageFont.truetype() expects point size, it seems we need to scale it up for calculations in pixels
         self.font_size = int(round(FONT_SIZE * FONT_SIZE_POINT_TO_PIXELS_RATIO))
-        self.font = ImageFont.truetype(font_path, self.font_size)
+        self.font = _load_font(self.font_size)
 
     @trace_calls
     def get_svg_document(self, study_uid: str, study_value_version: str | None = None):
@@ -805,7 +830,8 @@ class StudyDesignFigureService:
 
     def _get_text_size_px(self, text: str) -> tuple[int, int]:
         """Returns width and height (in pixels) of given text if rendered with font and size"""
-        return self.font.getbbox(text)[2:4]
+        # Labels, words and the partial lines measured while flowing text repeat across figures
+        return _measure_text(text, self.font_size)
 
     def _get_words_size_px(self, text: str) -> tuple[tuple[str, int, int]]:
         """Returns a tuple of (word, width, height) in pixels of each word of a text if rendered with font and size"""
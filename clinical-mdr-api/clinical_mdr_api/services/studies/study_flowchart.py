@@ -8,6 +8,7 @@ from neomodel import db
 from openpyxl.workbook import Workbook
 
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
+    DraftSoATable,
     SoALayout,
     StudySoARepository,
 )
@@ -38,7 +39,7 @@ from clinical_mdr_api.models.study_selections.study_soa_footnote import StudySoA
 from clinical_mdr_api.models.study_selections.study_visit import StudyVisit
 from clinical_mdr_api.models.syntax_instances.footnote import Footnote
 from clinical_mdr_api.models.utils import BaseModel
-from clinical_mdr_api.services._utils import ensure_transaction
+from clinical_mdr_api.services._utils import ensure_transaction, run_concurrently
 from clinical_mdr_api.services.studies.study import StudyService
 from clinical_mdr_api.services.studies.study_activity_group import (
     StudyActivityGroupService,
@@ -593,13 +594,25 @@ class StudyFlowchartService:
 
         if study_value_version and layout == SoALayout.PROTOCOL and not force_build:
             # Return protocol SoA from snapshot for a locked study version
-            table = self.load_soa_snapshot(
+            return self.load_soa_snapshot(
                 study_uid=study_uid,
                 study_value_version=study_value_version,
                 layout=layout,
                 time_unit=time_unit,
             )
 
+        if (
+            not study_value_version
+            and config.SOA_DRAFT_TABLE_ENABLED
+            and not force_build
+        ):
+            # SoA of the latest draft version from the table last built, refreshed as needed
+            table = self.get_draft_flowchart_table(
+                study_uid=study_uid,
+                layout=layout,
+                time_unit=time_unit,
+            )
+
         else:
             # Build SoA (of the latest draft version or detailed and operational SoA of locked versions too)
             table = self.build_flowchart_table(
@@ -609,29 +622,34 @@ class StudyFlowchartService:
                 time_unit=time_unit,
             )
 
-            if layout == SoALayout.PROTOCOL:
-                # propagate checkmarks from hidden rows for protocol layout
-                self.propagate_hidden_rows(table.rows)
+        if layout == SoALayout.PROTOCOL:
+            # propagate checkmarks from hidden rows for protocol layout
+            self.propagate_hidden_rows(table.rows)
 
-                # remove hidden rows
-                self.remove_hidden_rows(table)
+            # remove hidden rows
+            self.remove_hidden_rows(table)
 
         return table
 
     @trace_calls
-    def build_flowchart_table(
+    def get_draft_flowchart_table(
         self,
         study_uid: str,
-        study_value_version: str | None,
         layout: SoALayout,
         time_unit: str | None = None,
     ) -> TableWithFootnotes:
         """
-        Builds SoA flowchart table
+        Returns SoA flowchart table of the latest draft version of a study, from the table last built by this worker
+
+        The table is the output of `build_flowchart_table`, kept in memory along with the versions it was built at:
+        the audit trail stamp of the study, which any change to the study alters,
+        and the date of the latest library change, e.g. to the name of an activity or CT term.
+        If only StudyActivitySchedules were created or deleted since (i.e. check-boxes of the SoA editor were clicked),
+        only the affected cells are updated, otherwise the table is rebuilt.
+        Nothing is written to the database.
 
         Args:
             study_uid (str): The unique identifier of the study.
-            study_value_version (str | None): The version of the study to check. Defaults to None.
             layout (SoALayout): The layout of the SoA.
             time_unit (str): The preferred time unit, either "day" or "week".
 
@@ -639,35 +657,184 @@ class StudyFlowchartService:
             TableWithFootnotes: SoA flowchart table with footnotes.
         """
 
-        soa_preferences = self._get_soa_preferences(
-            study_uid, study_value_version=study_value_version
+        version = self.repository.get_draft_soa_version(study_uid)
+        draft_table = (
+            self.repository.load_draft_table(
+                study_uid, layout=layout, time_unit=time_unit
+            )
+            if version is not None
+            else None
         )
 
-        if not time_unit:
-            time_unit = self.get_preferred_time_unit(
-                study_uid, study_value_version=study_value_version
+        table = None
+        if draft_table is not None:
+            table = TableWithFootnotes.model_validate_json(draft_table.table)
+            if draft_table.version == version:
+                return table
+
+            changes = (
+                self.repository.get_activity_schedule_changes(
+                    study_uid,
+                    since=draft_table.version.audit_trail,
+                    until=version.audit_trail,
+                )
+                if draft_table.version.library_date == version.library_date
+                else None
             )
+            if changes is None or not self._update_activity_schedule_cells(
+                study_uid, table, changes, layout
+            ):
+                table = None
 
-        self._validate_parameters(
-            study_uid, study_value_version=study_value_version, time_unit=time_unit
-        )
+        if table is None:
+            table = self.build_flowchart_table(
+                study_uid=study_uid,
+                study_value_version=None,
+                layout=layout,
+                time_unit=time_unit,
+            )
 
-        selection_activities = self._get_study_selection_activities_sorted(
-            study_uid=study_uid,
-            study_value_version=study_value_version,
-            layout=layout,
-        )
+        if version is not None:
+            self.repository.save_draft_table(
+                study_uid,
+                layout=layout,
+                time_unit=time_unit,
+                draft_table=DraftSoATable(
+                    table=table.model_dump_json(), version=version
+                ),
+            )
 
-        activity_schedules: list[StudyActivitySchedule] = (
-            self._get_study_activity_schedules(
+        return table
+
+    @trace_calls
+    def _update_activity_schedule_cells(
+        self,
+        study_uid: str,
+        table: TableWithFootnotes,
+        changes: Iterable[tuple[str, str]],
+        layout: SoALayout,
+    ) -> bool:
+        """
+        Updates in-place the check-mark cells of the changed (StudyActivity.uid, StudyVisit.uid) pairs of an SoA table
+
+        Returns False if the table has to be rebuilt instead.
+        """
+
+        if layout == SoALayout.OPERATIONAL:
+            # Cells of Activity Instance rows are not tracked
+            return False
+
+        # Column index of each StudyVisit, and StudyVisit.uids of each column
+        visit_columns: dict[str, int] = {}
+        column_visits: dict[int, list[str]] = defaultdict(list)
+        for row in table.rows[: table.num_header_rows]:
+            for col, cell in enumerate(row.cells):
+                for ref in cell.refs or []:
+                    if ref.type == SoAItemType.STUDY_VISIT.value:
+                        visit_columns[ref.uid] = col
+                        column_visits[col].append(ref.uid)
+
+        activity_rows: dict[str, TableRow] = {
+            row.cells[0].refs[0].uid: row
+            for row in table.rows[table.num_header_rows :]
+            if row.cells
+            and row.cells[0].refs
+            and row.cells[0].refs[0].type == SoAItemType.STUDY_ACTIVITY.value
+        }
+
+        cells: set[tuple[str, int]] = set()
+        for study_activity_uid, study_visit_uid in changes:
+            if study_activity_uid not in activity_rows:
+                return False
+            # Schedules of hidden visits are not shown
+            if study_visit_uid in visit_columns:
+                cells.add((study_activity_uid, visit_columns[study_visit_uid]))
+
+        if not cells:
+            return True
+
+        schedules = self.repository.get_activity_schedules_of_activities(
+            study_uid, {study_activity_uid for study_activity_uid, _ in cells}
+        )
+
+        for study_activity_uid, col in cells:
+            row = activity_rows[study_activity_uid]
+            if row.cells[col].footnotes:
+                # Footnotes of a removed schedule may be gone from the table too
+                return False
+            row.cells[col] = self._get_activity_schedule_cell(
+                schedules[(study_activity_uid, study_visit_uid)]
+                for study_visit_uid in column_visits[col]
+                if (study_activity_uid, study_visit_uid) in schedules
+            )
+
+        return True
+
+    @trace_calls
+    def build_flowchart_table(
+        self,
+        study_uid: str,
+        study_value_version: str | None,
+        layout: SoALayout,
+        time_unit: str | None = None,
+    ) -> TableWithFootnotes:
+        """
+        Builds SoA flowchart table
+
+        Args:
+            study_uid (str): The unique identifier of the study.
+            study_value_version (str | None): The version of the study to check. Defaults to None.
+            layout (SoALayout): The layout of the SoA.
+            time_unit (str): The preferred time unit, either "day" or "week".
+
+        Returns:
+            TableWithFootnotes: SoA flowchart table with footnotes.
+        """
+
+        operational = layout == SoALayout.OPERATIONAL
+
+        # Independent reads are fetched concurrently, the validation comes first so that its errors take precedence
+        (
+            _,
+            soa_preferences,
+            time_unit,
+            selection_activities,
+            activity_schedules,
+            visits,
+            footnotes,
+        ) = run_concurrently(
+            lambda: self._validate_parameters(
+                study_uid, study_value_version=study_value_version, time_unit=time_unit
+            ),
+            lambda: self._get_soa_preferences(
+                study_uid, study_value_version=study_value_version
+            ),
+            lambda: time_unit
+            or self.get_preferred_time_unit(
+                study_uid, study_value_version=study_value_version
+            ),
+            lambda: self._get_study_selection_activities_sorted(
+                study_uid=study_uid,
+                study_value_version=study_value_version,
+                layout=layout,
+            ),
+            lambda: self._get_study_activity_schedules(
                 study_uid,
                 study_value_version=study_value_version,
-                operational=(layout == SoALayout.OPERATIONAL),
-            )
+                operational=operational,
+            ),
+            lambda: self._get_study_visits_dict_filtered(
+                study_uid, study_value_version
+            ),
+            lambda: (
+                None
+                if operational
+                else self._get_study_footnotes(
+                    study_uid, study_value_version=study_value_version
+                )
+            ),
         )
 
-        visits = self._get_study_visits_dict_filtered(study_uid, study_value_version)
-
         # group visits in nested dict: study_epoch_uid -> [ consecutive_visit_group |  visit_uid ] -> [Visits]
         grouped_visits = self._group_visits(visits.values())
 
@@ -691,11 +858,7 @@ class StudyFlowchartService:
             title=_T("protocol_flowchart"),
         )
 
-        if layout != SoALayout.OPERATIONAL:
-            footnotes: list[StudySoAFootnote] = self._get_study_footnotes(
-                study_uid, study_value_version=study_value_version
-            )
-
+        if not operational:
             self.add_footnotes(table, footnotes)
 
         return table
@@ -1607,30 +1770,39 @@ class StudyFlowchartService:
             study_activity_schedule_uids = map(
                 lambda sas: sas.study_activity_schedule_uid, study_activity_schedules
             )
-            # remove duplicates preserving order
-            study_activity_schedule_uids: list[str] = list(
-                dict.fromkeys(study_activity_schedule_uids)
+            row.cells.append(
+                StudyFlowchartService._get_activity_schedule_cell(
+                    study_activity_schedule_uids
+                )
             )
 
-            # Append a cell with check-mark if Activities are scheduled
-            if study_activity_schedule_uids:
-                row.cells.append(
-                    TableCell(
-                        SOA_CHECK_MARK,
-                        style="activitySchedule",
-                        refs=[
-                            Ref(
-                                type_=SoAItemType.STUDY_ACTIVITY_SCHEDULE.value,
-                                uid=uid,
-                            )
-                            for uid in study_activity_schedule_uids
-                        ],
+    @staticmethod
+    def _get_activity_schedule_cell(
+        study_activity_schedule_uids: Iterable[str],
+    ) -> TableCell:
+        """returns TableCell with check-mark if any Activity Schedule is given, or an empty TableCell"""
+
+        # remove duplicates preserving order
+        study_activity_schedule_uids: list[str] = list(
+            dict.fromkeys(study_activity_schedule_uids)
+        )
+
+        # Cell with check-mark if Activities are scheduled
+        if study_activity_schedule_uids:
+            return TableCell(
+                SOA_CHECK_MARK,
+                style="activitySchedule",
+                refs=[
+                    Ref(
+                        type_=SoAItemType.STUDY_ACTIVITY_SCHEDULE.value,
+                        uid=uid,
                     )
-                )
+                    for uid in study_activity_schedule_uids
+                ],
+            )
 
-            # Append an empty cell if no Activity is scheduled
-            else:
-                row.cells.append(TableCell())
+        # Empty cell if no Activity is scheduled
+        return TableCell()
 
     @staticmethod
     def _get_activity_instance_row(
@@ -1,6 +1,7 @@
 import abc
-from typing import TypeVar
+from typing import Sequence, TypeVar
 
+from fastapi import status
 from neomodel import db
 from neomodel.sync_ import core
 from pydantic import BaseModel
@@ -19,6 +20,8 @@ from clinical_mdr_api.domains.versioned_object_aggregate import (
     LibraryItemStatus,
     LibraryVO,
 )
+from clinical_mdr_api.models.error import BatchErrorResponse
+from clinical_mdr_api.models.syntax_templates.template import SyntaxTemplateBatchOutput
 from clinical_mdr_api.repositories._utils import ComparisonOperator
 from clinical_mdr_api.services._utils import (
     fill_missing_values_in_base_model_from_reference_base_model,
@@ -26,7 +29,11 @@ from clinical_mdr_api.services._utils import (
     process_complex_parameters,
 )
 from clinical_mdr_api.services.generic_syntax_service import GenericSyntaxService
-from common.exceptions import AlreadyExistsException, NotFoundException
+from common.exceptions import (
+    AlreadyExistsException,
+    MDRApiBaseException,
+    NotFoundException,
+)
 
 _AggregateRootType = TypeVar("_AggregateRootType")
 
@@ -66,41 +73,83 @@ class GenericSyntaxTemplateService(GenericSyntaxService[_AggregateRootType], abc
         # are handled manually by "with" statement.
         self.authorize_user_defined_syntax_write(template.library_name)
 
-        try:
-            # Transaction that is performing initial save
-            with db.transaction:
-                filter_by = {
-                    "name": {
-                        "v": [template.name],
-                        "op": ComparisonOperator.EQUALS.value,
-                    },
-                    "library.name": {
-                        "v": [template.library_name],
-                        "op": ComparisonOperator.EQUALS.value,
-                    },
-                }
-                if type_uid := getattr(template, "type_uid", None):
-                    filter_by |= {"type.term_uid": {"v": [type_uid]}}
-
-                if existing_template := self.repository.get_all(filter_by=filter_by)[0]:
-                    if existing_template[0].library.name == "User Defined":
-                        return self._transform_aggregate_root_to_pydantic_model(
-                            existing_template[0]
-                        )
-
-                    raise AlreadyExistsException(
-                        field_value=template.name, field_name="Name"
-                    )
+        # Transaction that is performing initial save
+        with db.transaction:
+            item = self.non_transactional_create(template)
+
+        return self._transform_aggregate_root_to_pydantic_model(item)
 
-                item = self._create_ar_from_input_values(template)
+    def non_transactional_create(
+        self, template: BaseModel
+    ) -> TemplateAggregateRootBase:
+        """Saves the template, or returns the existing 'User Defined' template with the same name."""
+        try:
+            filter_by = {
+                "name": {
+                    "v": [template.name],
+                    "op": ComparisonOperator.EQUALS.value,
+                },
+                "library.name": {
+                    "v": [template.library_name],
+                    "op": ComparisonOperator.EQUALS.value,
+                },
+            }
+            if type_uid := getattr(template, "type_uid", None):
+                filter_by |= {"type.term_uid": {"v": [type_uid]}}
+
+            if existing_template := self.repository.get_all(filter_by=filter_by)[0]:
+                if existing_template[0].library.name == "User Defined":
+                    return existing_template[0]
+
+                raise AlreadyExistsException(
+                    field_value=template.name, field_name="Name"
+                )
 
-                # Save item
-                self.repository.save(item)
+            item = self._create_ar_from_input_values(template)
 
-            return self._transform_aggregate_root_to_pydantic_model(item)
+            # Save item
+            self.repository.save(item)
+            return item
         except core.DoesNotExist as exc:
             raise NotFoundException("Library", template.library_name, "Name") from exc
 
+    def create_batch(
+        self, templates: Sequence[BaseModel], approve: bool = False
+    ) -> list[SyntaxTemplateBatchOutput]:
+        """
+        Creates the templates, and approves each created template if `approve` is set.
+
+        Each template is created and approved in its own transaction, so that a failing template is rolled back
+        entirely, without preventing the creation of the other templates.
+        The result of each template is returned in the order of the inputs, with the error of the templates that failed.
+        """
+        results = []
+        for template in templates:
+            try:
+                self.authorize_user_defined_syntax_write(template.library_name)
+                item = self._create_batch_item(template, approve)
+                results.append(
+                    SyntaxTemplateBatchOutput(
+                        response_code=status.HTTP_201_CREATED, content=item
+                    )
+                )
+            except MDRApiBaseException as error:
+                results.append(
+                    SyntaxTemplateBatchOutput.model_construct(
+                        response_code=error.status_code,
+                        content=BatchErrorResponse(message=str(error)),
+                    )
+                )
+        return results
+
+    @db.transaction
+    def _create_batch_item(self, template: BaseModel, approve: bool) -> BaseModel:
+        item = self.non_transactional_create(template)
+        # An existing 'User Defined' template may already be approved
+        if approve and item.item_metadata.status == LibraryItemStatus.DRAFT:
+            return self.non_transactional_approve(item.uid)
+        return self._transform_aggregate_root_to_pydantic_model(item)
+
     def _create_template_vo(self, template: BaseModel) -> tuple[TemplateVO, LibraryVO]:
         # Create TemplateVO
         template_vo = TemplateVO.from_input_values_2(
@@ -1,5 +1,150 @@
-from clinical_mdr_api.domain_repositories.user_repository import UserRepository
+import logging
+import threading
+from typing import Iterable
+
+from starlette_context import context
+
+from clinical_mdr_api.domain_repositories.user_repository import (
+    UserRepository,
+    cache_get_user,
+)
 from clinical_mdr_api.models.user import UserInfo
+from clinical_mdr_api.repositories.cache_invalidation import (
+    cache_invalidation_bus,
+    register_cache,
+)
+from common import config
+
+log = logging.getLogger(__name__)
+
+AUTHOR_USERNAME_RESOLVER_CONTEXT_KEY = "author_username_resolver"
+
+
+class UsernameMap:
+    """
+    Process-wide map of usernames keyed by user_id.
+
+    All usernames are loaded on first use with a single query,
+    then the map is periodically reloaded in a background thread.
+    Single users are evicted from it through the cache invalidation bus, e.g. after patching a user.
+    """
+
+    def __init__(self, refresh_interval: int):
+        self.refresh_interval = refresh_interval
+        self.lock = threading.Lock()
+        self.usernames: dict[str, str | None] = {}
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.refresh_interval > 0
+
+    def lookup(self, user_id: str) -> tuple[bool, str | None]:
+        """
+        Returns whether the user is known, and its username.
+        """
+        self._ensure_loaded()
+        with self.lock:
+            if user_id in self.usernames:
+                return True, self.usernames[user_id]
+        return False, None
+
+    def update(self, usernames: dict[str, str | None]) -> None:
+        with self.lock:
+            self.usernames.update(usernames)
+
+    def refresh(self) -> None:
+        usernames = UserRepository().get_all_usernames()
+        with self.lock:
+            self.usernames.clear()
+            self.usernames.update(usernames)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self.refresh()
+            self._loaded = True
+            self._thread = threading.Thread(
+                target=self._refresh_periodically,
+                name="username-map-refresh",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _refresh_periodically(self) -> None:
+        while not self._stopped.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Keep serving the previous usernames until the next successful refresh
+                log.exception("Failed to refresh usernames")
+
+
+class AuthorUsernameResolver:
+    """
+    Request-scoped resolver of usernames.
+
+    User ids announced with `add` while building a list of items are only resolved
+    when the first username is requested, together in a single query.
+    """
+
+    def __init__(self, username_map: UsernameMap | None = None):
+        self.username_map = username_map
+        self.usernames: dict[str, str] = {}
+        self.pending: set[str] = set()
+        self.lock = threading.Lock()
+
+    def add(self, user_ids: Iterable[str | None]) -> None:
+        with self.lock:
+            self.pending.update(
+                user_id
+                for user_id in user_ids
+                if user_id and user_id not in self.usernames
+            )
+
+    def resolve(self, user_id: str) -> str:
+        with self.lock:
+            if user_id in self.usernames:
+                return self.usernames[user_id]
+            self.pending.add(user_id)
+            user_ids = list(self.pending)
+            self.pending.clear()
+
+        users = UserInfoService().get_users(user_ids)
+        found = {user.user_id: user.username for user in users}
+        with self.lock:
+            for uid in user_ids:
+                self.usernames[uid] = found.get(uid) or uid
+        if self.username_map is not None:
+            self.username_map.update(found)
+        return self.usernames[user_id]
+
+
+username_map = UsernameMap(config.USERNAME_MAP_REFRESH_SECS)
+register_cache(
+    "UserInfoService.usernames", username_map.usernames, lock=username_map.lock
+)
+
+
+def _get_author_username_resolver() -> AuthorUsernameResolver | None:
+    if not context.exists():
+        return None
+    resolver = context.get(AUTHOR_USERNAME_RESOLVER_CONTEXT_KEY)
+    if resolver is None:
+        resolver = AuthorUsernameResolver(
+            username_map if username_map.enabled else None
+        )
+        context[AUTHOR_USERNAME_RESOLVER_CONTEXT_KEY] = resolver
+    return resolver
 
 
 class UserInfoService:
@@ -24,5 +169,42 @@ class UserInfoService:
 
     @classmethod
     def get_author_username_from_id(cls, user_id: str) -> str:
+        if not user_id:
+            return user_id
+
+        if username_map.enabled:
+            found, username = username_map.lookup(user_id)
+            if found:
+                return username or user_id
+
+        if resolver := _get_author_username_resolver():
+            return resolver.resolve(user_id)
+
         user = cls().repo.get_user(user_id)
         return user.username if user and user.username else user_id
+
+    @classmethod
+    def prefetch_author_usernames(cls, user_ids: Iterable[str | None]) -> None:
+        """
+        Announces the authors of a list of items about to be mapped,
+        so that unknown usernames are resolved with a single query
+        instead of one query per item.
+
+        Outside of a request this is a no-op.
+        """
+        if resolver := _get_author_username_resolver():
+            if username_map.enabled:
+                user_ids = [
+                    user_id
+                    for user_id in user_ids
+                    if user_id and not username_map.lookup(user_id)[0]
+                ]
+            resolver.add(user_ids)
+
+    @classmethod
+    def forget_username(cls, user_id: str) -> None:
+        """
+        Evicts a user from the username caches of all workers, e.g. after its username changed.
+        """
+        cache_invalidation_bus.invalidate(username_map.usernames, [user_id])
+        cache_invalidation_bus.invalidate(cache_get_user, [user_id])
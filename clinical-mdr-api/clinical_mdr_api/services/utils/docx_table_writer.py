@@ -0,0 +1,145 @@
+import re
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.table import Table
+from lxml import etree
+
+from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+
+W_B = qn("w:b")
+W_BR = qn("w:br")
+W_GRID_COL = qn("w:gridCol")
+W_GRID_SPAN = qn("w:gridSpan")
+W_P = qn("w:p")
+W_P_PR = qn("w:pPr")
+W_P_STYLE = qn("w:pStyle")
+W_R = qn("w:r")
+W_R_PR = qn("w:rPr")
+W_T = qn("w:t")
+W_TAB = qn("w:tab")
+W_TBL_HEADER = qn("w:tblHeader")
+W_TC = qn("w:tc")
+W_TC_PR = qn("w:tcPr")
+W_TC_W = qn("w:tcW")
+W_TEXT_DIRECTION = qn("w:textDirection")
+W_TR = qn("w:tr")
+W_TR_PR = qn("w:trPr")
+W_TYPE = qn("w:type")
+W_VAL = qn("w:val")
+W_VERT_ALIGN = qn("w:vertAlign")
+W_W = qn("w:w")
+XML_SPACE = qn("xml:space")
+
+SPECIAL_CHARS = re.compile(r"([\t\r\n])")
+
+
+class DocxTableWriter:
+    """
+    Writer of the rows of a DOCX table, appending their WordprocessingML elements to the table directly.
+
+    The rows are written as python-docx writes them when they are created with the table, then filled in
+    through its object API, e.g. by merging cells and setting their texts and styles, but without building
+    the grid of cell objects and without looking up the cells of every merge, which is slow for large tables.
+
+    The writer must be created before the widths of the table columns are changed, as python-docx sizes
+    the cells by the widths of the columns when the table is created.
+    """
+
+    def __init__(self, docx: DocxBuilder, table: Table):
+        self._document = docx.document
+        # pylint: disable=protected-access
+        self._tbl = table._tbl
+        self._column_widths = [
+            int(grid_col.get(W_W)) for grid_col in self._tbl.iter(W_GRID_COL)
+        ]
+        self._style_ids: dict[str, str | None] = {}
+
+    @property
+    def num_columns(self) -> int:
+        return len(self._column_widths)
+
+    def add_row(self, header: bool = False) -> etree._Element:
+        """Appends an empty row to the table, repeated on each page if `header` is set"""
+        row = etree.SubElement(self._tbl, W_TR)
+        if header:
+            tr_pr = etree.SubElement(row, W_TR_PR)
+            etree.SubElement(tr_pr, W_TBL_HEADER, {W_VAL: "true"})
+        return row
+
+    def add_cell(
+        self,
+        row: etree._Element,
+        column: int,
+        span: int = 1,
+        text: str | None = None,
+        style_name: str | None = None,
+        vertical: bool | None = False,
+        superscript: str | None = None,
+    ) -> etree._Element:
+        """
+        Appends a cell to the row, starting at the given column and spanning `span` columns.
+
+        The cell holds a paragraph with the given style, its text and a bold superscript run, e.g. footnote symbols.
+        If `vertical` is set, the text direction of the cell is bottom to top.
+        """
+        cell = etree.SubElement(row, W_TC)
+        tc_pr = etree.SubElement(cell, W_TC_PR)
+        etree.SubElement(
+            tc_pr,
+            W_TC_W,
+            {
+                W_TYPE: "dxa",
+                W_W: str(sum(self._column_widths[column : column + span])),
+            },
+        )
+        if span > 1:
+            etree.SubElement(tc_pr, W_GRID_SPAN, {W_VAL: str(span)})
+        if vertical:
+            etree.SubElement(tc_pr, W_TEXT_DIRECTION, {W_VAL: "btLr"})
+
+        paragraph = etree.SubElement(cell, W_P)
+        if style_name:
+            p_pr = etree.SubElement(paragraph, W_P_PR)
+            style_id = self._get_style_id(style_name)
+            if style_id:
+                etree.SubElement(p_pr, W_P_STYLE, {W_VAL: style_id})
+        if text:
+            self._add_run(paragraph, text)
+        if superscript:
+            run = self._add_run(paragraph, superscript)
+            r_pr = etree.Element(W_R_PR)
+            etree.SubElement(r_pr, W_B)
+            etree.SubElement(r_pr, W_VERT_ALIGN, {W_VAL: "superscript"})
+            run.insert(0, r_pr)
+
+        return cell
+
+    def fill_row(self, row: etree._Element, column: int) -> None:
+        """Appends empty cells to the row, from the given column to the last column of the table"""
+        for empty_column in range(column, self.num_columns):
+            self.add_cell(row, empty_column)
+
+    def _get_style_id(self, style_name: str) -> str | None:
+        # The default paragraph style is not referenced by paragraphs, leaving their properties empty as with python-docx
+        if style_name not in self._style_ids:
+            self._style_ids[style_name] = self._document.part.get_style_id(
+                style_name, WD_STYLE_TYPE.PARAGRAPH
+            )
+        return self._style_ids[style_name]
+
+    @staticmethod
+    def _add_run(paragraph: etree._Element, text: str) -> etree._Element:
+        # Tabs and line breaks are mapped to elements of their own, as with python-docx
+        run = etree.SubElement(paragraph, W_R)
+        for part in SPECIAL_CHARS.split(text):
+            if part == "\t":
+                etree.SubElement(run, W_TAB)
+            elif part in ("\r", "\n"):
+                etree.SubElement(run, W_BR)
+            elif part:
+                t = etree.SubElement(run, W_T)
+                t.text = part
+                if len(part.strip()) < len(part):
+                    t.set(XML_SPACE, "preserve")
+        return run
@@ -30,11 +30,27 @@ def map_xml(xml_document: Document, mapper: UploadFile | None):
     Returns:
         None
 
+    Raises:
+        BusinessLogicException: If the mapper is not in CSV format, or if the mandatory mapping fields are not present.
+    """
+    apply_mapping_rules(xml_document, read_mapping_rules(mapper))
+
+
+def read_mapping_rules(mapper: UploadFile | None) -> list[dict[str, str]]:
+    """
+    Reads the mapping rules of the provided CSV file.
+
+    Args:
+        mapper (UploadFile | None): The CSV file containing the mapping rules.
+
+    Returns:
+        list[dict[str, str]]: The mapping rules, in the order of the file. Empty if no mapper is provided.
+
     Raises:
         BusinessLogicException: If the mapper is not in CSV format, or if the mandatory mapping fields are not present.
     """
     if not mapper:
-        return
+        return []
 
     BusinessLogicException.raise_if(
         mapper.content_type != "text/csv", msg="Only CSV format is supported."
@@ -47,7 +63,21 @@ def map_xml(xml_document: Document, mapper: UploadFile | None):
         msg=f"These headers must be present: {sorted(MANDATORY_MAPPER_FIELDS)}",
     )
 
-    for mapping in dict_reader:
+    return list(dict_reader)
+
+
+def apply_mapping_rules(xml_document: Document, mapping_rules: list[dict[str, str]]):
+    """
+    Transform XML Elements and Attributes of the XML document according to the mapping rules read by `read_mapping_rules`.
+
+    Args:
+        xml_document (Document): The XML document to modify.
+        mapping_rules (list[dict[str, str]]): The mapping rules to apply, in order.
+
+    Returns:
+        None
+    """
+    for mapping in mapping_rules:
         parent = mapping["parent"] or "*"
 
         if mapping["type"] == "attribute":
@@ -0,0 +1,81 @@
+from typing import BinaryIO, Iterator
+from xml.dom import minidom, pulldom
+from xml.sax import SAXParseException
+
+from clinical_mdr_api.services.utils.odm_xml_mapper import apply_mapping_rules
+from common.exceptions import BusinessLogicException
+
+
+class OdmXmlReader:
+    """
+    Streaming reader of ODM XML files.
+
+    The file is parsed with `xml.dom.pulldom`, so that only the elements being read are held in memory,
+    as minidom elements on which the mapping rules of `odm_xml_mapper` are applied.
+    Each read parses the file again from its start, so the file must be seekable, e.g. an uploaded file.
+    """
+
+    def __init__(
+        self, file: BinaryIO, mapping_rules: list[dict[str, str]] | None = None
+    ):
+        self._file = file
+        self._mapping_rules = mapping_rules or []
+
+    def root_element(self) -> minidom.Element:
+        """
+        Returns the root element of the file, with its attributes but without its children.
+        """
+        try:
+            for event, node in self._parse():
+                if event == pulldom.START_ELEMENT:
+                    return node
+        except SAXParseException as exc:
+            raise BusinessLogicException(
+                msg=f"The XML file is not valid: {exc}"
+            ) from exc
+        raise BusinessLogicException(msg="The XML file doesn't have any element.")
+
+    def iter_elements(self, *tag_names: str) -> Iterator[minidom.Element]:
+        """
+        Yields the elements with any of the given tag names, in document order, with all their children.
+
+        Elements nested in a yielded element are not yielded on their own.
+        """
+        events = self._parse()
+        ancestors: list[str] = []
+        try:
+            for event, node in events:
+                if event == pulldom.START_ELEMENT and node.tagName in tag_names:
+                    events.expandNode(node)
+                    yield self._map(node, ancestors)
+                elif event == pulldom.START_ELEMENT:
+                    ancestors.append(node.tagName)
+                elif event == pulldom.END_ELEMENT:
+                    ancestors.pop()
+        except SAXParseException as exc:
+            raise BusinessLogicException(
+                msg=f"The XML file is not valid: {exc}"
+            ) from exc
+
+    def _parse(self) -> pulldom.DOMEventStream:
+        self._file.seek(0)
+        return pulldom.parse(self._file)
+
+    def _map(self, element: minidom.Element, ancestors: list[str]) -> minidom.Element:
+        if self._mapping_rules:
+            # The mapping rules look up elements from a document, including its root element
+            document = minidom.Document()
+            document.appendChild(element)
+            apply_mapping_rules(
+                document,
+                [
+                    (
+                        # Elements under an ancestor of the element are all part of the element
+                        {**rule, "parent": "*"}
+                        if rule["type"] == "element" and rule["parent"] in ancestors
+                        else rule
+                    )
+                    for rule in self._mapping_rules
+                ],
+            )
+        return element
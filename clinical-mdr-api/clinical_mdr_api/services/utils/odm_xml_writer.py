@@ -0,0 +1,133 @@
+from io import BytesIO
+from typing import Any, Iterator
+
+from lxml import etree
+
+from clinical_mdr_api.domains.concepts.odms.odm_xml_definition import Attribute
+
+
+class OdmXmlWriter:
+    """
+    Incremental writer of ODM XML documents.
+
+    The document is generated from the classes of `odm_xml_definition`, following the same conventions
+    as the `minidom` based generation of `OdmXmlExporterService`, and written with `lxml.etree.xmlfile`,
+    so that it can be sent in chunks while it is being written instead of being built in memory first.
+    """
+
+    XML_PREFIX = "xml"
+    XMLNS_PREFIX = "xmlns"
+    INDENT = "\t"
+    # Chunks are yielded whenever an element of this depth or above is written, e.g. a FormDef
+    CHUNK_DEPTH = 3
+
+    def __init__(self, odm: Any, stylesheet: str | None = None):
+        self.odm = odm
+        self.stylesheet = stylesheet
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """
+        Writes the ODM XML document.
+
+        Returns:
+            Iterator[bytes]: The UTF-8 encoded document, in chunks.
+        """
+        output = BytesIO()
+        with etree.xmlfile(output, encoding="utf-8") as xml_file:
+            xml_file.write_declaration()
+            if self.stylesheet:
+                xml_file.write(
+                    etree.ProcessingInstruction(
+                        "xml-stylesheet", f'type="text/xsl" href="{self.stylesheet}"'
+                    )
+                )
+
+            for _ in self._write_element(xml_file, self.odm, {}, 0):
+                xml_file.flush()
+                yield self._pop(output)
+
+        yield self._pop(output)
+
+    def write(self) -> bytes:
+        """
+        Writes the ODM XML document.
+
+        Returns:
+            bytes: The UTF-8 encoded document.
+        """
+        return b"".join(self.iter_chunks())
+
+    def _write_element(
+        self,
+        xml_file,
+        odm_element: Any,
+        namespaces: dict[str, str],
+        depth: int,
+    ) -> Iterator[None]:
+        custom_element_name = getattr(odm_element, "_custom_element_name", None)
+        if isinstance(custom_element_name, str):
+            name = custom_element_name
+        else:
+            name = odm_element.__class__.__name__
+
+        attributes: dict[str, str] = {}
+        nsmap: dict[str, str] = {}
+        content: list[Any] = []
+        for attribute_name, attribute_value in vars(odm_element).items():
+            if isinstance(attribute_value, Attribute):
+                prefix, _, local_name = attribute_value.name.rpartition(":")
+                if prefix == self.XMLNS_PREFIX:
+                    nsmap[local_name] = str(attribute_value.value)
+                else:
+                    attributes[attribute_value.name] = str(attribute_value.value)
+            elif isinstance(attribute_value, str):
+                if attribute_name != "_custom_element_name":
+                    content.append(attribute_value)
+            elif isinstance(attribute_value, list):
+                content.extend(attribute_value)
+            else:
+                content.append(attribute_value)
+
+        # Prefixes which are not declared by the document are declared on the element using them,
+        # with the prefix as namespace name, as `minidom.Element.setAttributeNS` does
+        namespaces = namespaces | nsmap
+        for qualified_name in [name, *attributes]:
+            prefix, _, _ = qualified_name.rpartition(":")
+            if prefix and prefix != self.XML_PREFIX and prefix not in namespaces:
+                nsmap[prefix] = namespaces[prefix] = prefix
+
+        with xml_file.element(
+            self._clark_name(name, namespaces),
+            {
+                self._clark_name(attribute_name, namespaces): value
+                for attribute_name, value in attributes.items()
+            },
+            nsmap=nsmap or None,
+        ):
+            has_child_elements = any(not isinstance(item, str) for item in content)
+            for item in content:
+                if isinstance(item, str):
+                    xml_file.write(item)
+                    continue
+
+                xml_file.write("\n" + self.INDENT * (depth + 1))
+                yield from self._write_element(xml_file, item, namespaces, depth + 1)
+            if has_child_elements:
+                xml_file.write("\n" + self.INDENT * depth)
+
+        if depth <= self.CHUNK_DEPTH:
+            yield
+
+    def _clark_name(self, qualified_name: str, namespaces: dict[str, str]) -> str:
+        prefix, _, local_name = qualified_name.rpartition(":")
+        # lxml writes the reserved xml prefix as is, without declaring it
+        if not prefix or prefix == self.XML_PREFIX:
+            return qualified_name
+        return f"{{{namespaces[prefix]}}}{local_name}"
+
+    @staticmethod
+    def _pop(output: BytesIO) -> bytes:
+        chunk = output.getvalue()
+        output.seek(0)
+        output.truncate()
+        return chunk
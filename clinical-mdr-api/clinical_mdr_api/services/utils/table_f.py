@@ -1,5 +1,6 @@
 import os
 from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Annotated, Any, Mapping
 
 import yattag
@@ -9,9 +10,10 @@ from openpyxl.styles import NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.worksheet.worksheet import Worksheet
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
 from clinical_mdr_api.services.utils.docx_builder import DocxBuilder
+from clinical_mdr_api.services.utils.docx_table_writer import DocxTableWriter
 from common.telemetry import trace_calls
 
 CHAR_WIDTHS = {
@@ -100,20 +102,25 @@ CHAR_WIDTHS = {
 }
 
 
-class Ref(BaseModel):
+# The rows, cells and references of tables are slotted dataclasses rather than pydantic models, as a large SoA
+# has tens of thousands of cells. TableWithFootnotes neither validates nor copies them, and still serializes them
+# to and validates them from JSON, like pydantic models.
+
+
+@dataclass(frozen=True, slots=True, init=False)
+class Ref:
     type: Annotated[str | None, Field(title="Referenced item type")]
     uid: Annotated[str, Field(title="Referenced item uid")]
-    model_config = ConfigDict(frozen=True)
 
-    def __init__(self, type_=None, uid=None, **kwargs):
-        if type_ is not None:
-            kwargs["type"] = type_
-        if uid is not None:
-            kwargs["uid"] = uid
-        super().__init__(**kwargs)
+    def __init__(self, type_: str | None = None, uid: str | None = None, **kwargs):
+        object.__setattr__(
+            self, "type", type_ if type_ is not None else kwargs.get("type")
+        )
+        object.__setattr__(self, "uid", uid)
 
 
-class TableCell(BaseModel):
+@dataclass(slots=True, init=False)
+class TableCell:
     text: Annotated[str, Field(title="Text contents of cell")] = ""
     span: Annotated[int, Field(title="Horizontal spanning of cell, 1 by default")] = 1
     style: Annotated[
@@ -133,14 +140,28 @@ class TableCell(BaseModel):
         Field(title="Text text direction", json_schema_extra={"nullable": True}),
     ] = None
 
-    def __init__(self, text=None, **kwargs):
-        if text is not None:
-            kwargs["text"] = text
-        super().__init__(**kwargs)
-
-
-class TableRow(BaseModel):
-    cells: list[TableCell] = Field(default_factory=list, title="Table cells in the row")
+    def __init__(
+        self,
+        text: str | None = None,
+        span: int = 1,
+        style: str | None = None,
+        refs: list[Ref] | None = None,
+        footnotes: list[str] | None = None,
+        vertical: bool | None = None,
+    ):
+        self.text = "" if text is None else text
+        self.span = span
+        self.style = style
+        self.refs = refs
+        self.footnotes = footnotes
+        self.vertical = vertical
+
+
+@dataclass(slots=True, init=False)
+class TableRow:
+    cells: Annotated[list[TableCell], Field(title="Table cells in the row")] = field(
+        default_factory=list
+    )
     hide: Annotated[bool, Field(title="Hide row from display")] = False
     order: Annotated[
         int | None,
@@ -151,13 +172,21 @@ class TableRow(BaseModel):
         Field(title="Integer that represents SoAItem associated with given row"),
     ] = None
 
-    def __init__(self, cells=None, **kwargs):
-        if cells is not None:
-            kwargs["cells"] = cells
-        super().__init__(**kwargs)
-
-
-class SimpleFootnote(BaseModel):
+    def __init__(
+        self,
+        cells: list[TableCell] | None = None,
+        hide: bool = False,
+        order: int | None = None,
+        level: int | None = None,
+    ):
+        self.cells = [] if cells is None else cells
+        self.hide = hide
+        self.order = order
+        self.level = level
+
+
+@dataclass(slots=True)
+class SimpleFootnote:
     uid: Annotated[str, Field(title="StudySoAFootnote.uid")]
     text_html: Annotated[
         str, Field(title="HTML text of footnote", json_schema_extra={"format": "html"})
@@ -206,64 +235,50 @@ def table_to_docx(
         styles=styles, landscape=True, margins=[0.5, 0.5, 0.5, 0.5], template=template
     )
 
-    # adds a table to the document
-    x_table = docx.create_table(
-        num_rows=sum(1 for row in table.rows if not row.hide),
-        num_columns=num_cols,
-    )
+    # adds an empty table to the document, its rows are written directly as WordprocessingML
+    x_table = docx.create_table(num_rows=0, num_columns=num_cols)
+    writer = DocxTableWriter(docx, x_table)
 
     # set width of first column
     x_table.columns[0].width = Inches(4)
 
-    # cache porperty for performance issues, see github.com/python-openxml/python-docx/issues/174
-    x_cells = x_table._cells
-    x_rows = x_table.rows
-
     for r, t_row in enumerate((row for row in table.rows if not row.hide)):
-        num_merge, merge_to = 0, None
-
         # set header row to repeat on each page
-        if r < table.num_header_rows:
-            docx.repeat_table_header(x_rows[r])
+        x_row = writer.add_row(header=r < table.num_header_rows)
 
-        for c, t_cell in enumerate(t_row.cells):
-            x_cell = x_cells[r * num_cols + c]
-
-            # merge with previous spanning cell
-            if num_merge:
-                merge_to.merge(x_cell)
-                num_merge -= 1
+        # column of the table where the next cell starts, cells spanning multiple columns merge the following cells
+        column = 0
+        for c, t_cell in enumerate(t_row.cells[:num_cols]):
+            # merged into the previous spanning cell
+            if c < column:
                 continue
 
             # skip invisible cells (should not get here if spans are coherent)
             if t_cell.span < 1:
+                writer.add_cell(x_row, column)
+                column += 1
                 continue
 
-            # when cell span > 1 merge the following N cells into this one
-            num_merge = t_cell.span - 1
-            merge_to = x_cell
-
-            # all docx cells host one or more paragraph for contents
-            x_para = x_cell.paragraphs[0]
-
-            # set cell text in the paragraph
-            if t_cell.text:
-                x_para.text = t_cell.text
-
-            # resolve style name and apply to paragraph
-            style_name = styles.get(t_cell.style, [None])[0] if styles else None
-            if style_name:
-                x_para.style = style_name
-
-            # set vertical text direction
-            if t_cell.vertical:
-                docx.set_vertical_cell_direction(x_cell, "btLr")
-
-            # add footnote symbols to a run within the paragraph
-            if t_cell.footnotes:
-                run = x_para.add_run("\u00A0".join(t_cell.footnotes))
-                run.font.bold = True
-                run.font.superscript = True
+            # a span is limited by the cells of the row
+            span = min(t_cell.span, len(t_row.cells) - c, num_cols - c)
+
+            writer.add_cell(
+                x_row,
+                column,
+                span=span,
+                text=t_cell.text,
+                # resolve style name of the paragraph
+                style_name=styles.get(t_cell.style, [None])[0] if styles else None,
+                vertical=t_cell.vertical,
+                # footnote symbols in a run within the paragraph
+                superscript=(
+                    "\u00A0".join(t_cell.footnotes) if t_cell.footnotes else None
+                ),
+            )
+            column += span
+
+        # rows with less cells are filled in with empty cells
+        writer.fill_row(x_row, column)
 
     # add footnotes
     if table.footnotes:
@@ -80,14 +80,18 @@ def ddf_mapper(tst_study):
 
 
 def test_ddf_study_arms(ddf_mapper, tst_study, study_arms):
-    ddf_arms = ddf_mapper._get_study_arms(tst_study)
+    ddf_arms = ddf_mapper._get_study_arms(
+        tst_study, ddf_mapper.load_components(tst_study.uid)
+    )
     for ddf_arm, sb_arm in zip(ddf_arms, study_arms):
         assert ddf_arm.description == sb_arm.description
         assert ddf_arm.type.code == sb_arm.arm_type.term_uid
 
 
 def test_ddf_study_cells(ddf_mapper, tst_study, study_design_cells):
-    ddf_study_cells = ddf_mapper._get_study_cells(tst_study)
+    ddf_study_cells = ddf_mapper._get_study_cells(
+        tst_study, ddf_mapper.load_components(tst_study.uid)
+    )
     for ddf_study_cell, sb_study_design_cell in zip(
         ddf_study_cells, study_design_cells
     ):
@@ -113,25 +117,33 @@ def test_ddf_study_description(ddf_mapper, tst_study):
 
 
 def test_ddf_study_activities(ddf_mapper, tst_study, study_activities):
-    ddf_study_activities = ddf_mapper._get_study_activities(tst_study)
+    ddf_study_activities = ddf_mapper._get_study_activities(
+        tst_study, ddf_mapper.load_components(tst_study.uid)
+    )
     assert ddf_study_activities is not None
     assert len(ddf_study_activities) > 0
 
 
 def test_study_elements(ddf_mapper, tst_study, study_elements):
-    ddf_study_elements = ddf_mapper._get_study_elements(tst_study)
+    ddf_study_elements = ddf_mapper._get_study_elements(
+        tst_study, ddf_mapper.load_components(tst_study.uid)
+    )
     assert ddf_study_elements is not None
     assert len(ddf_study_elements) > 0
 
 
 def test_study_epochs(ddf_mapper, tst_study, study_epochs):
-    ddf_study_epochs = ddf_mapper._get_study_epochs(tst_study)
+    ddf_study_epochs = ddf_mapper._get_study_epochs(
+        tst_study, ddf_mapper.load_components(tst_study.uid)
+    )
     assert ddf_study_epochs is not None
     assert len(ddf_study_epochs) > 0
 
 
 def test_study_visits(ddf_mapper, tst_study, study_visits):
-    ddf_study_encounters = ddf_mapper._get_study_encounters(tst_study)
+    ddf_study_encounters = ddf_mapper._get_study_encounters(
+        tst_study, ddf_mapper.load_components(tst_study.uid)
+    )
     assert ddf_study_encounters is not None
     assert len(ddf_study_encounters) > 0
 
@@ -554,7 +554,7 @@ class TestUtils:
         if include_study_version:
             expected_fields.add("study_version")
 
-        assert response_json.keys() == expected_fields
+        assert response_json.keys() == expected_fields | {"next_page_token"}
         for field in expected_fields:
             assert response_json[field] is not None, f"Field '{field}' is None"
 
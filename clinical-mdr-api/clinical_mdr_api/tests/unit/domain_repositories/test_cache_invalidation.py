@@ -0,0 +1,268 @@
+import json
+import queue
+import time
+import unittest
+from threading import Lock
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+from clinical_mdr_api.domain_repositories.generic_repository import RepositoryImpl
+from clinical_mdr_api.domain_repositories.library_item_repository import (
+    LibraryItemRepositoryImplBase,
+)
+from clinical_mdr_api.repositories._utils import sb_clear_cache
+from clinical_mdr_api.repositories.cache_invalidation import (
+    CacheInvalidationBus,
+    InProcessCacheInvalidationBackend,
+    RedisCacheInvalidationBackend,
+    cache_invalidation_bus,
+)
+
+
+class FakeRedisServer:
+    """
+    Minimal in-memory stand-in for a Redis server supporting pub/sub.
+    """
+
+    def __init__(self):
+        self.subscribers: dict[str, list[queue.Queue]] = {}
+        self.lock = Lock()
+
+    def client(self) -> "FakeRedis":
+        return FakeRedis(self)
+
+
+class FakePubSub:
+    def __init__(self, server: FakeRedisServer):
+        self.server = server
+        self.messages: queue.Queue = queue.Queue()
+
+    def subscribe(self, channel: str):
+        with self.server.lock:
+            self.server.subscribers.setdefault(channel, []).append(self.messages)
+
+    def get_message(self, timeout: float = 0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        with self.server.lock:
+            for subscribers in self.server.subscribers.values():
+                if self.messages in subscribers:
+                    subscribers.remove(self.messages)
+
+
+class FakeRedis:
+    def __init__(self, server: FakeRedisServer):
+        self.server = server
+
+    def pubsub(self, ignore_subscribe_messages: bool = False):
+        return FakePubSub(self.server)
+
+    def publish(self, channel: str, data: str) -> int:
+        with self.server.lock:
+            subscribers = list(self.server.subscribers.get(channel, []))
+        for subscriber in subscribers:
+            subscriber.put({"type": "message", "data": data.encode("utf-8")})
+        return len(subscribers)
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def new_cache() -> TTLCache:
+    cache = TTLCache(maxsize=100, ttl=3600)
+    cache[hashkey("Repo", "uid_1", None)] = "item 1"
+    cache[hashkey("Repo", "uid_2", None)] = "item 2"
+    cache[hashkey("Repo", "get_all", 1, 10)] = ["item 1", "item 2"]
+    return cache
+
+
+class TestCacheInvalidationBus(unittest.TestCase):
+    def test_invalidate_whole_cache(self):
+        bus = CacheInvalidationBus(InProcessCacheInvalidationBackend())
+        cache = bus.register("Repo.cache", new_cache())
+
+        bus.invalidate(cache)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_uids_evicts_matching_and_shared_entries(self):
+        bus = CacheInvalidationBus(InProcessCacheInvalidationBackend())
+        cache = bus.register(
+            "Repo.cache", new_cache(), lock=Lock(), shared_key_markers=["get_all"]
+        )
+
+        bus.invalidate(cache, ["uid_1"])
+
+        self.assertEqual(list(cache.values()), ["item 2"])
+
+    def test_invalidate_uids_clears_cache_not_evicted_by_uid(self):
+        backend = InProcessCacheInvalidationBackend()
+        bus_1 = CacheInvalidationBus(backend)
+        bus_2 = CacheInvalidationBus(backend)
+        cache_1 = bus_1.register("Repo.cache", new_cache(), evict_by_uid=False)
+        cache_2 = bus_2.register("Repo.cache", new_cache(), evict_by_uid=False)
+
+        bus_1.invalidate(cache_1, ["uid_1"])
+
+        self.assertEqual(len(cache_1), 0)
+        self.assertEqual(len(cache_2), 0)
+
+    def test_repository_caches_are_registered(self):
+        self.assertEqual(
+            cache_invalidation_bus.get_name(RepositoryImpl.cache_store_item_by_uid),
+            "RepositoryImpl.cache_store_item_by_uid",
+        )
+        self.assertEqual(
+            cache_invalidation_bus.get_name(
+                LibraryItemRepositoryImplBase.cache_store_item_by_uid
+            ),
+            "LibraryItemRepositoryImplBase.cache_store_item_by_uid",
+        )
+
+    def test_invalidation_is_broadcast_to_other_buses(self):
+        backend = InProcessCacheInvalidationBackend()
+        bus_1 = CacheInvalidationBus(backend)
+        bus_2 = CacheInvalidationBus(backend)
+        cache_1 = bus_1.register("Repo.cache", new_cache())
+        cache_2 = bus_2.register("Repo.cache", new_cache())
+        other_cache_2 = bus_2.register("Other.cache", new_cache())
+
+        bus_1.invalidate(cache_1, ["uid_2"])
+
+        self.assertNotIn(hashkey("Repo", "uid_2", None), cache_1)
+        self.assertNotIn(hashkey("Repo", "uid_2", None), cache_2)
+        self.assertIn(hashkey("Repo", "uid_1", None), cache_2)
+        self.assertEqual(len(other_cache_2), 3)
+
+    def test_unregistered_cache_is_only_invalidated_locally(self):
+        messages = []
+        backend = InProcessCacheInvalidationBackend()
+        backend.start(messages.append)
+        bus = CacheInvalidationBus(backend)
+        cache = new_cache()
+
+        bus.invalidate(cache, ["uid_1"])
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(messages, [])
+
+
+class TestRedisCacheInvalidationBackend(unittest.TestCase):
+    def test_invalidation_is_broadcast_through_redis(self):
+        server = FakeRedisServer()
+        backend_1 = RedisCacheInvalidationBackend(server.client(), poll_timeout=0.05)
+        backend_2 = RedisCacheInvalidationBackend(server.client(), poll_timeout=0.05)
+        bus_1 = CacheInvalidationBus(backend_1)
+        bus_2 = CacheInvalidationBus(backend_2)
+        try:
+            self.assertTrue(backend_1.wait_until_subscribed(5))
+            self.assertTrue(backend_2.wait_until_subscribed(5))
+            cache_1 = bus_1.register("Repo.cache", new_cache())
+            cache_2 = bus_2.register("Repo.cache", new_cache())
+
+            bus_1.invalidate(cache_1, ["uid_1"])
+
+            self.assertNotIn(hashkey("Repo", "uid_1", None), cache_1)
+            self.assertTrue(
+                wait_for(lambda: hashkey("Repo", "uid_1", None) not in cache_2)
+            )
+            self.assertEqual(len(cache_2), 2)
+
+            bus_2.invalidate(cache_2)
+
+            self.assertTrue(wait_for(lambda: len(cache_1) == 0))
+        finally:
+            bus_1.close()
+            bus_2.close()
+
+    def test_malformed_messages_are_ignored(self):
+        server = FakeRedisServer()
+        backend = RedisCacheInvalidationBackend(server.client(), poll_timeout=0.05)
+        bus = CacheInvalidationBus(backend)
+        try:
+            self.assertTrue(backend.wait_until_subscribed(5))
+            cache = bus.register("Repo.cache", new_cache())
+            client = server.client()
+
+            client.publish(backend._channel, "not json")
+            client.publish(
+                backend._channel,
+                json.dumps({"origin": "other", "cache": "Repo.cache", "uids": None}),
+            )
+
+            self.assertTrue(wait_for(lambda: len(cache) == 0))
+        finally:
+            bus.close()
+
+
+class TestSbClearCache(unittest.TestCase):
+    def test_nested_calls_add_their_uids_to_the_outermost_call(self):
+        class Repository:
+            cache_store_item_by_uid = new_cache()
+
+            @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["uid"])
+            def add_relation(self, uid):
+                pass
+
+            @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
+            def save(self, item):
+                self.add_relation(uid="uid_2")
+                # Not evicted before the outermost call finishes
+                assert hashkey("Repo", "uid_2", None) in self.cache_store_item_by_uid
+
+        class Item:
+            uid = "uid_1"
+
+        Repository().save(Item())
+
+        self.assertEqual(
+            list(Repository.cache_store_item_by_uid.keys()),
+            [hashkey("Repo", "get_all", 1, 10)],
+        )
+
+    def test_nested_call_without_uids_clears_the_whole_cache(self):
+        class Repository:
+            cache_store_item_by_uid = new_cache()
+
+            @sb_clear_cache(caches=["cache_store_item_by_uid"])
+            def _save_node(self):
+                pass
+
+            @sb_clear_cache(caches=["cache_store_item_by_uid"], uid_args=["item"])
+            def save(self, item):
+                self._save_node()
+
+        class Item:
+            uid = "uid_1"
+
+        Repository().save(Item())
+
+        self.assertEqual(len(Repository.cache_store_item_by_uid), 0)
+
+    def test_uids_are_read_from_plain_arguments(self):
+        class Repository:
+            cache_store_item_by_uid = new_cache()
+
+            @sb_clear_cache(
+                caches=["cache_store_item_by_uid"], uid_args=["uid", "relation_uid"]
+            )
+            def add_relation(self, uid, relation_uid):
+                pass
+
+        Repository().add_relation("uid_1", relation_uid="uid_2")
+
+        self.assertEqual(
+            list(Repository.cache_store_item_by_uid.keys()),
+            [hashkey("Repo", "get_all", 1, 10)],
+        )
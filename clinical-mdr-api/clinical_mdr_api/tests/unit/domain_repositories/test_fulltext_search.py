@@ -0,0 +1,128 @@
+import unittest
+from unittest import mock
+
+from clinical_mdr_api.repositories import _utils
+from clinical_mdr_api.repositories._utils import (
+    CypherQueryBuilder,
+    FilterDict,
+    FilterOperator,
+    FulltextIndex,
+    build_fulltext_query,
+)
+from common import config
+from common.exceptions import ValidationException
+
+MATCH_CLAUSE = "CYPHER runtime=slotted MATCH (concept_root:ActivityRoot)-[:LATEST]->(concept_value:ActivityValue)"
+ALIAS_CLAUSE = "concept_root.uid AS uid, concept_value.name AS name, concept_value"
+FULLTEXT_INDEX = FulltextIndex(
+    name="fulltext_ActivityValue", alias="concept_value", match_alias="concept_value"
+)
+MATCHES = {"4:abc:1": 2.5, "4:abc:2": 1.0}
+
+
+class TestFulltextSearch(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            _utils.db, "cypher_query", return_value=(list(MATCHES.items()), None)
+        )
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+
+    def build(self, filter_by: dict, **kwargs) -> CypherQueryBuilder:
+        kwargs.setdefault("fulltext_index", FULLTEXT_INDEX)
+        return CypherQueryBuilder(
+            match_clause=MATCH_CLAUSE,
+            alias_clause=ALIAS_CLAUSE,
+            filter_by=FilterDict(elements=filter_by),
+            wildcard_properties_list=["name"],
+            **kwargs,
+        )
+
+    def test_fulltext_query(self):
+        self.assertEqual(
+            build_fulltext_query(["Blood pressure", "heart-rate", " "]),
+            "((blood^2 OR blood*) AND (pressure^2 OR pressure*))"
+            " OR ((heart^2 OR heart*) AND (rate^2 OR rate*))",
+        )
+        self.assertEqual(build_fulltext_query(["", "(*)"]), "")
+
+    def test_search_is_resolved_through_fulltext_index(self):
+        query = self.build({"*": {"v": ["blood press"], "op": "search"}})
+
+        self.cypher_query.assert_called_once()
+        params = self.cypher_query.call_args.args[1]
+        self.assertEqual(params["index_name"], "fulltext_ActivityValue")
+        self.assertEqual(
+            params["fulltext_query"], "((blood^2 OR blood*) AND (press^2 OR press*))"
+        )
+        # The hits are limited by the pagination of the query, after it filtered them
+        self.assertNotIn("LIMIT", self.cypher_query.call_args.args[0])
+
+        self.assertEqual(
+            query.parameters["fulltext_element_ids"], ["4:abc:1", "4:abc:2"]
+        )
+        self.assertEqual(query.parameters["fulltext_scores"], MATCHES)
+        self.assertTrue(
+            query.full_query.startswith(
+                "CYPHER runtime=slotted MATCH (concept_value) WHERE elementId(concept_value) IN $fulltext_element_ids "
+                "MATCH (concept_root:ActivityRoot)"
+            )
+        )
+        self.assertIn(
+            "WHERE elementId(concept_value) IN $fulltext_element_ids RETURN *",
+            query.full_query,
+        )
+        self.assertNotIn("CONTAINS", query.full_query)
+        self.assertIn(
+            "ORDER BY $fulltext_scores[elementId(concept_value)] DESC",
+            query.full_query,
+        )
+        self.assertTrue(query.count_query.startswith(query.match_clause))
+
+    def test_explicit_sort_overrides_relevance_ranking(self):
+        query = self.build(
+            {"*": {"v": ["blood"], "op": "search"}}, sort_by={"name": True}
+        )
+
+        self.assertIn("ORDER BY name ASC", query.full_query)
+        self.assertNotIn("$fulltext_scores", query.full_query)
+
+    def test_match_clause_is_not_anchored_with_or_operator(self):
+        query = self.build(
+            {
+                "*": {"v": ["blood"], "op": "search"},
+                "uid": {"v": ["Activity_000001"]},
+            },
+            filter_operator=FilterOperator.OR,
+        )
+
+        self.assertEqual(query.match_clause, MATCH_CLAUSE)
+        self.assertIn(
+            "WHERE elementId(concept_value) IN $fulltext_element_ids OR uid=$uid_0",
+            query.full_query,
+        )
+
+    def test_blank_search_matches_everything(self):
+        query = self.build({"*": {"v": [" "], "op": "search"}})
+
+        self.cypher_query.assert_not_called()
+        self.assertEqual(query.filter_clause, "")
+        self.assertEqual(query.match_clause, MATCH_CLAUSE)
+
+    def test_search_falls_back_to_contains_without_fulltext_index(self):
+        query = self.build({"*": {"v": ["Blood"], "op": "search"}}, fulltext_index=None)
+
+        self.cypher_query.assert_not_called()
+        self.assertIn("toLower(name) CONTAINS $wildcard_0", query.full_query)
+        self.assertEqual(query.parameters["wildcard_0"], "blood")
+
+    def test_search_falls_back_to_contains_when_disabled(self):
+        with mock.patch.object(config, "FULLTEXT_SEARCH_ENABLED", False):
+            query = self.build({"*": {"v": ["Blood"], "op": "search"}})
+
+        self.cypher_query.assert_not_called()
+        self.assertIn("toLower(name) CONTAINS $wildcard_0", query.full_query)
+
+    def test_search_operator_is_only_supported_for_wildcard(self):
+        with self.assertRaises(ValidationException):
+            self.build({"name": {"v": ["blood"], "op": "search"}})
@@ -0,0 +1,135 @@
+import unittest
+from unittest import mock
+
+from clinical_mdr_api.domain_repositories import library_item_repository
+from clinical_mdr_api.domain_repositories.syntax_templates.objective_template_repository import (
+    ObjectiveTemplateRepository,
+)
+from common.exceptions import ValidationException
+from common.utils import decode_page_token, encode_page_token
+
+
+class TestLibraryItemPageToken(unittest.TestCase):
+    def setUp(self):
+        self.repository = ObjectiveTemplateRepository()
+        self.rows = []
+
+        patcher = mock.patch.object(
+            library_item_repository.db,
+            "cypher_query",
+            side_effect=lambda query, params, **_: (self.rows, None),
+        )
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+
+        patcher = mock.patch.object(
+            ObjectiveTemplateRepository,
+            "_create_read_only_ars_optimized",
+            side_effect=lambda result, library_name: [row[0] for row in result],
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def query(self) -> tuple[str, dict]:
+        return (
+            self.cypher_query.call_args.args[0],
+            self.cypher_query.call_args.kwargs["params"],
+        )
+
+    def test_page_keys(self):
+        self.assertEqual(self.repository._page_keys(None), [("root.uid", False)])
+        self.assertEqual(
+            self.repository._page_keys({"name": True, "start_date": False}),
+            [
+                ("value.name", True),
+                ("ver_rel.start_date", False),
+                ("root.uid", False),
+            ],
+        )
+        self.assertEqual(
+            self.repository._page_keys({"uid": True}), [("root.uid", True)]
+        )
+        with self.assertRaises(ValidationException):
+            self.repository._page_keys({"unknown": True})
+
+    def test_first_page(self):
+        self.rows = [
+            [
+                "template_2",
+                "ObjectiveTemplate_000002",
+                ["b", "ObjectiveTemplate_000002"],
+            ],
+            [
+                "template_1",
+                "ObjectiveTemplate_000001",
+                ["a", "ObjectiveTemplate_000001"],
+            ],
+        ]
+
+        items, _, next_page_token = self.repository.get_all_optimized_by_page_token(
+            page_size=2, sort_by={"name": False}
+        )
+
+        query, params = self.query()
+        self.assertEqual(items, ["template_2", "template_1"])
+        self.assertEqual(params["page_size"], 2)
+        self.assertNotIn("SKIP", query)
+        self.assertIn("[value.name, root.uid] AS page_key", query)
+        self.assertIn(
+            "ORDER BY value.name DESC, root.uid DESC\n                LIMIT $page_size",
+            query,
+        )
+        self.assertEqual(
+            decode_page_token(next_page_token, "name:desc", 2),
+            ["a", "ObjectiveTemplate_000001"],
+        )
+
+    def test_next_page(self):
+        self.rows = [
+            ["template_3", "ObjectiveTemplate_000003", ["ObjectiveTemplate_000003"]]
+        ]
+
+        items, _, next_page_token = self.repository.get_all_optimized_by_page_token(
+            page_token=encode_page_token("uid:desc", ["ObjectiveTemplate_000004"]),
+            page_size=2,
+        )
+
+        query, params = self.query()
+        self.assertEqual(items, ["template_3"])
+        self.assertIsNone(next_page_token)
+        self.assertIn("WITH * WHERE ((root.uid < $page_key_0))", query)
+        self.assertEqual(params["page_key_0"], "ObjectiveTemplate_000004")
+
+    def test_page_token_of_other_sorting_is_rejected(self):
+        with self.assertRaises(ValidationException):
+            self.repository.get_all_optimized_by_page_token(
+                page_token=encode_page_token("uid:desc", ["ObjectiveTemplate_000004"]),
+                page_size=2,
+                sort_by={"name": True},
+            )
+        self.cypher_query.assert_not_called()
+
+    def test_total_count_includes_items_before_page_token(self):
+        self.rows = [
+            ["template_3", "ObjectiveTemplate_000003", ["ObjectiveTemplate_000003"]]
+        ]
+        self.cypher_query.side_effect = lambda query, params, **_: (
+            ([[4]], None) if "count(DISTINCT ver_rel)" in query else (self.rows, None)
+        )
+
+        _, total, _ = self.repository.get_all_optimized_by_page_token(
+            page_token=encode_page_token("uid:desc", ["ObjectiveTemplate_000004"]),
+            page_size=2,
+            total_count=True,
+        )
+
+        self.assertEqual(total, 4)
+        count_query = self.cypher_query.call_args.kwargs["query"]
+        self.assertTrue(count_query.endswith("RETURN count(DISTINCT ver_rel)"))
+        self.assertNotIn("page_key_0", count_query)
+
+    def test_empty_page_token_returns_first_page(self):
+        self.repository.get_all_optimized_by_page_token(page_token="", page_size=2)
+
+        query, _ = self.query()
+        self.assertNotIn("$page_key_0", query)
@@ -0,0 +1,74 @@
+import unittest
+from unittest import mock
+
+from clinical_mdr_api.domain_repositories.concepts.odms import odm_generic_repository
+from clinical_mdr_api.domain_repositories.concepts.odms.form_repository import (
+    FormRepository,
+)
+from clinical_mdr_api.domains.concepts.utils import RelationType
+from common.exceptions import BusinessLogicException
+
+
+class TestOdmAddRelations(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(odm_generic_repository.db, "cypher_query")
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+        self.repository = FormRepository()
+
+    def test_relations_are_added_in_one_query(self):
+        self.cypher_query.return_value = (
+            [
+                ["OdmForm_000001", "OdmVendorAttribute_000001"],
+                ["OdmForm_000002", "OdmVendorAttribute_000001"],
+            ],
+            ["relation.uid", "relation.relation_uid"],
+        )
+
+        self.repository.add_relations(
+            [
+                ("OdmForm_000001", "OdmVendorAttribute_000001", {"value": "a"}),
+                ("OdmForm_000002", "OdmVendorAttribute_000001", {"value": "b"}),
+                ("OdmForm_000001", "OdmVendorAttribute_000001", {"value": "c"}),
+            ],
+            RelationType.VENDOR_ATTRIBUTE,
+        )
+
+        self.cypher_query.assert_called_once()
+        query, params = self.cypher_query.call_args.args
+        self.assertIn("UNWIND $relations AS relation", query)
+        self.assertIn(
+            "CREATE (origin)-[rel:HAS_VENDOR_ATTRIBUTE]->(related)",
+            " ".join(query.split()),
+        )
+        # The last relation between two nodes replaces the previous ones
+        self.assertEqual(
+            params["relations"],
+            [
+                {
+                    "uid": "OdmForm_000001",
+                    "relation_uid": "OdmVendorAttribute_000001",
+                    "parameters": {"value": "c"},
+                },
+                {
+                    "uid": "OdmForm_000002",
+                    "relation_uid": "OdmVendorAttribute_000001",
+                    "parameters": {"value": "b"},
+                },
+            ],
+        )
+
+    def test_relations_between_missing_nodes_are_reported(self):
+        self.cypher_query.return_value = ([], ["relation.uid", "relation.relation_uid"])
+
+        with self.assertRaises(BusinessLogicException) as context:
+            self.repository.add_relations(
+                [("OdmForm_000001", "OdmItemGroup_000001", None)],
+                RelationType.ITEM_GROUP,
+            )
+        self.assertIn("OdmItemGroup_000001", context.exception.msg)
+
+    def test_nothing_to_add(self):
+        self.repository.add_relations([], RelationType.ITEM_GROUP)
+
+        self.cypher_query.assert_not_called()
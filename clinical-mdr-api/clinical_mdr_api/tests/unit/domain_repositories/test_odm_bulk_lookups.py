@@ -0,0 +1,250 @@
+import datetime
+import unittest
+from itertools import count
+from unittest import mock
+
+from neo4j.graph import Graph, Node, Relationship
+from neo4j.time import DateTime
+
+from clinical_mdr_api.domain_repositories.concepts.odms import odm_generic_repository
+from clinical_mdr_api.domain_repositories.concepts.odms.form_repository import (
+    FormRepository,
+)
+from clinical_mdr_api.domain_repositories.concepts.odms.item_repository import (
+    ItemRepository,
+)
+from clinical_mdr_api.domain_repositories.concepts.odms.vendor_attribute_repository import (
+    VendorAttributeRepository,
+)
+from clinical_mdr_api.domains.concepts.odms.form import OdmFormRefVO
+from clinical_mdr_api.domains.concepts.odms.item import OdmItemTermVO
+from clinical_mdr_api.domains.concepts.odms.vendor_attribute import (
+    OdmVendorAttributeRelationVO,
+)
+from clinical_mdr_api.domains.concepts.utils import RelationType
+from common.exceptions import BusinessLogicException, NotFoundException
+
+GRAPH = Graph()
+IDS = count()
+
+
+def node(label: str, **properties):
+    idx = next(IDS)
+    return Node(GRAPH, f"4:graph:{idx}", idx, [label], properties)
+
+
+def relationship(**properties):
+    idx = next(IDS)
+    return Relationship(GRAPH, f"5:graph:{idx}", idx, properties)
+
+
+def version(status: str, number: str, end_date: DateTime | None = None):
+    return relationship(status=status, version=number, end_date=end_date)
+
+
+class TestOdmBulkLookups(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(odm_generic_repository.db, "cypher_query")
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+
+    def test_forms_of_study_events_are_looked_up_in_one_query(self):
+        self.cypher_query.return_value = (
+            [
+                [
+                    "OdmForm_000001",
+                    "OdmStudyEvent_000001",
+                    node("OdmFormValue", name="form 1"),
+                    relationship(order_number=2, mandatory=True, locked=False),
+                ],
+                [
+                    "OdmForm_000001",
+                    "OdmStudyEvent_000001",
+                    node("OdmFormValue", name="form 1"),
+                    relationship(order_number=3, mandatory=False, locked=False),
+                ],
+                [
+                    "OdmForm_000001",
+                    "OdmStudyEvent_000002",
+                    node("OdmFormValue", name="form 1"),
+                    relationship(order_number=1, mandatory=False, locked=True),
+                ],
+            ],
+            ["related.uid", "origin.uid", "value", "rel"],
+        )
+
+        form_refs = FormRepository().find_with_study_event_relations(
+            ["OdmStudyEvent_000001", "OdmStudyEvent_000002"]
+        )
+
+        self.cypher_query.assert_called_once()
+        query, params = self.cypher_query.call_args.args
+        self.assertIn(
+            "MATCH (origin:OdmStudyEventRoot)-[rel:FORM_REF]->(related:OdmFormRoot)",
+            query,
+        )
+        self.assertIn("MATCH (related)-[:LATEST]->(value)", query)
+        self.assertEqual(
+            params["origin_uids"], ["OdmStudyEvent_000001", "OdmStudyEvent_000002"]
+        )
+        # As with the lookup of a single form, the first relationship between two nodes is used
+        self.assertEqual(
+            form_refs,
+            {
+                ("OdmForm_000001", "OdmStudyEvent_000001"): OdmFormRefVO(
+                    uid="OdmForm_000001",
+                    name="form 1",
+                    study_event_uid="OdmStudyEvent_000001",
+                    order_number=2,
+                    mandatory="Yes",
+                    locked="No",
+                    collection_exception_condition_oid=None,
+                ),
+                ("OdmForm_000001", "OdmStudyEvent_000002"): OdmFormRefVO(
+                    uid="OdmForm_000001",
+                    name="form 1",
+                    study_event_uid="OdmStudyEvent_000002",
+                    order_number=1,
+                    mandatory="No",
+                    locked="Yes",
+                    collection_exception_condition_oid=None,
+                ),
+            },
+        )
+
+    def test_terms_of_items_are_looked_up_in_one_query(self):
+        self.cypher_query.return_value = (
+            [
+                [
+                    "OdmItem_000001",
+                    "CTTerm_000001",
+                    relationship(mandatory=True, order=1, display_text="Yes"),
+                    "term 1",
+                    True,
+                    True,
+                    [
+                        version("Final", "1.0"),
+                        version(
+                            "Draft",
+                            "1.1",
+                            end_date=DateTime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+                        ),
+                        version("Final", "2.0"),
+                    ],
+                ],
+            ],
+            [],
+        )
+
+        terms = ItemRepository().find_terms_with_item_relations(["OdmItem_000001"])
+
+        self.cypher_query.assert_called_once()
+        _, params = self.cypher_query.call_args.args
+        self.assertEqual(params["item_uids"], ["OdmItem_000001"])
+        # A draft which has ended falls back to the latest final version
+        self.assertEqual(
+            terms,
+            {
+                ("OdmItem_000001", "CTTerm_000001"): OdmItemTermVO(
+                    uid="OdmItem_000001",
+                    name="term 1",
+                    mandatory=True,
+                    order=1,
+                    display_text="Yes",
+                    version="2.0",
+                )
+            },
+        )
+
+    def test_terms_without_draft_or_final_version_are_reported(self):
+        self.cypher_query.return_value = (
+            [
+                [
+                    "OdmItem_000001",
+                    "CTTerm_000001",
+                    relationship(mandatory=True, order=1, display_text=None),
+                    "term 1",
+                    False,
+                    False,
+                    [version("Retired", "1.0")],
+                ],
+            ],
+            [],
+        )
+
+        with self.assertRaises(NotFoundException) as context:
+            ItemRepository().find_terms_with_item_relations(["OdmItem_000001"])
+        self.assertIn("CTTerm_000001", context.exception.msg)
+
+    def test_vendor_attributes_of_odm_elements_are_looked_up_with_their_namespaces(
+        self,
+    ):
+        self.cypher_query.side_effect = [
+            (
+                [
+                    [
+                        "OdmVendorAttribute_000001",
+                        "OdmItemGroup_000001",
+                        node(
+                            "OdmVendorAttributeValue",
+                            name="attribute",
+                            compatible_types='["ItemGroupDef"]',
+                            data_type="string",
+                            value_regex=None,
+                        ),
+                        relationship(value="a"),
+                    ],
+                ],
+                [],
+            ),
+            (
+                [["OdmVendorAttribute_000001", "OdmVendorNamespace_000001"]],
+                ["vendor_attribute_root.uid", "parent.uid"],
+            ),
+        ]
+
+        vendor_attributes = VendorAttributeRepository().find_with_odm_element_relations(
+            ["OdmItemGroup_000001"],
+            RelationType.ITEM_GROUP,
+            vendor_element_attribute=False,
+        )
+
+        self.assertEqual(self.cypher_query.call_count, 2)
+        query, _ = self.cypher_query.call_args_list[0].args
+        self.assertIn(
+            "(origin:OdmItemGroupRoot)-[rel:HAS_VENDOR_ATTRIBUTE]->(related:OdmVendorAttributeRoot)",
+            query,
+        )
+        query, params = self.cypher_query.call_args_list[1].args
+        self.assertIn("(parent:OdmVendorNamespaceRoot)", query)
+        self.assertEqual(params["uids"], ["OdmVendorAttribute_000001"])
+        self.assertEqual(
+            vendor_attributes,
+            {
+                (
+                    "OdmVendorAttribute_000001",
+                    "OdmItemGroup_000001",
+                ): OdmVendorAttributeRelationVO(
+                    uid="OdmVendorAttribute_000001",
+                    name="attribute",
+                    compatible_types=["ItemGroupDef"],
+                    data_type="string",
+                    value_regex=None,
+                    value="a",
+                    vendor_namespace_uid="OdmVendorNamespace_000001",
+                )
+            },
+        )
+
+    def test_vendor_attributes_of_invalid_odm_elements_are_rejected(self):
+        with self.assertRaises(BusinessLogicException):
+            VendorAttributeRepository().find_with_odm_element_relations(
+                ["OdmStudyEvent_000001"], RelationType.TERM
+            )
+
+    def test_nothing_to_look_up(self):
+        self.assertEqual(FormRepository().find_with_study_event_relations([]), {})
+        self.assertEqual(ItemRepository().find_terms_with_item_relations([]), {})
+        self.assertEqual(FormRepository().find_all_by_uids([]), {})
+
+        self.cypher_query.assert_not_called()
@@ -0,0 +1,126 @@
+import unittest
+from unittest import mock
+
+from clinical_mdr_api.domain_repositories.concepts.odms import odm_generic_repository
+from clinical_mdr_api.domain_repositories.concepts.odms.form_repository import (
+    FormRepository,
+)
+from clinical_mdr_api.domains.concepts.odms.form import OdmFormAR, OdmFormVO
+from clinical_mdr_api.domains.versioned_object_aggregate import (
+    LibraryItemMetadataVO,
+    LibraryItemStatus,
+    LibraryVO,
+)
+from clinical_mdr_api.services.user_info import UserInfoService
+from common.exceptions import BusinessLogicException
+
+
+def form_ar(uid: str, description_uids: list[str]) -> OdmFormAR:
+    return OdmFormAR.from_repository_values(
+        uid=uid,
+        concept_vo=OdmFormVO.from_repository_values(
+            oid=f"F.{uid}",
+            name=f"Form {uid}",
+            sdtm_version="",
+            repeating=False,
+            scope_uid=None,
+            description_uids=description_uids,
+            alias_uids=[],
+            activity_group_uids=[],
+            item_group_uids=[],
+            vendor_element_uids=[],
+            vendor_attribute_uids=[],
+            vendor_element_attribute_uids=[],
+        ),
+        library=LibraryVO.from_repository_values("Sponsor", True),
+        item_metadata=LibraryItemMetadataVO.get_initial_item_metadata(
+            author_id="author"
+        ),
+    )
+
+
+class TestOdmBulkSave(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(odm_generic_repository.db, "cypher_query")
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+        patcher = mock.patch.object(
+            UserInfoService, "get_author_username_from_id", return_value="author"
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.repository = FormRepository()
+
+    def test_elements_and_their_relations_are_created_with_one_query_each(self):
+        self.cypher_query.side_effect = [
+            ([], []),
+            (
+                [
+                    ["OdmForm_000001", "OdmDescription_000001"],
+                    ["OdmForm_000002", "OdmDescription_000002"],
+                ],
+                ["relation.uid", "relation.relation_uid"],
+            ),
+        ]
+
+        self.repository.create_all(
+            [
+                form_ar("OdmForm_000001", ["OdmDescription_000001"]),
+                form_ar("OdmForm_000002", ["OdmDescription_000002"]),
+            ]
+        )
+
+        self.assertEqual(self.cypher_query.call_count, 2)
+        query, params = self.cypher_query.call_args_list[0].args
+        self.assertIn("UNWIND $items AS item", query)
+        self.assertIn(
+            "CREATE (library)-[:CONTAINS_CONCEPT]->(root:",
+            " ".join(query.split()),
+        )
+        self.assertEqual(
+            [item["uid"] for item in params["items"]],
+            ["OdmForm_000001", "OdmForm_000002"],
+        )
+        self.assertEqual(params["items"][0]["library_name"], "Sponsor")
+        self.assertEqual(params["items"][0]["value"]["oid"], "F.OdmForm_000001")
+        self.assertEqual(params["items"][0]["version"]["status"], "Draft")
+
+        query, params = self.cypher_query.call_args_list[1].args
+        self.assertIn("CREATE (origin)-[:HAS_DESCRIPTION]->(related)", query)
+        self.assertEqual(
+            params["relations"],
+            [
+                {"uid": "OdmForm_000001", "relation_uid": "OdmDescription_000001"},
+                {"uid": "OdmForm_000002", "relation_uid": "OdmDescription_000002"},
+            ],
+        )
+
+    def test_relations_to_missing_nodes_are_reported(self):
+        self.cypher_query.side_effect = [([], []), ([], [])]
+
+        with self.assertRaises(BusinessLogicException) as context:
+            self.repository.create_all(
+                [form_ar("OdmForm_000001", ["OdmDescription_000001"])]
+            )
+        self.assertIn("OdmDescription_000001", context.exception.msg)
+
+    def test_elements_are_approved_with_one_query(self):
+        item = form_ar("OdmForm_000001", [])
+        item.approve(author_id="author")
+
+        self.repository.approve_all([item])
+
+        self.cypher_query.assert_called_once()
+        query, params = self.cypher_query.call_args.args
+        self.assertIn("CREATE (root)-[:LATEST_FINAL]->(value)", query)
+        self.assertEqual(params["items"][0]["uid"], "OdmForm_000001")
+        self.assertEqual(
+            params["items"][0]["version"]["status"], LibraryItemStatus.FINAL.value
+        )
+        self.assertEqual(params["items"][0]["version"]["version"], "1.0")
+
+    def test_nothing_to_save(self):
+        self.repository.create_all([])
+        self.repository.approve_all([])
+
+        self.cypher_query.assert_not_called()
@@ -0,0 +1,132 @@
+import unittest
+from unittest import mock
+
+from clinical_mdr_api.repositories import _utils
+from clinical_mdr_api.repositories._utils import CypherQueryBuilder, FilterDict
+from common import config
+
+MATCH_CLAUSE = "CYPHER runtime=slotted MATCH (concept_root:ActivityRoot)-[:LATEST]->(concept_value:ActivityValue)"
+UNION_MATCH_CLAUSE = "MATCH (concept_root:ActivityInstanceRoot)-[:LATEST]->(concept_value:ActivityInstanceValue)"
+ALIAS_CLAUSE = "concept_root.uid AS uid, concept_value.name AS name"
+
+
+class TestPagedQuery(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(_utils.db, "cypher_query")
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+
+    def build(self, filter_by: dict | None = None, **kwargs) -> CypherQueryBuilder:
+        kwargs.setdefault("total_count", True)
+        return CypherQueryBuilder(
+            match_clause=MATCH_CLAUSE,
+            alias_clause=ALIAS_CLAUSE,
+            filter_by=FilterDict(elements=filter_by or {}),
+            sort_by={"name": True},
+            page_number=2,
+            page_size=10,
+            **kwargs,
+        )
+
+    def test_paged_query(self):
+        query = self.build({"name": {"v": ["Weight"]}})
+
+        self.assertTrue(
+            query.paged_query.startswith(
+                "CYPHER runtime=slotted CALL { MATCH (concept_root:ActivityRoot)"
+            )
+        )
+        self.assertEqual(query.paged_query.count("CYPHER"), 1)
+        self.assertIn(
+            "RETURN count(*) AS total_count } WITH sum(total_count) AS _total_count CALL { MATCH",
+            query.paged_query,
+        )
+        self.assertTrue(
+            query.paged_query.endswith(
+                "ORDER BY name ASC SKIP $page_number * $page_size LIMIT $page_size } RETURN * ORDER BY name ASC"
+            )
+        )
+
+    def test_page_and_total_count_are_read_in_one_query(self):
+        self.cypher_query.return_value = (
+            [["Activity_1", "Weight", 12], ["Activity_2", "Height", 12]],
+            ["uid", "name", "_total_count"],
+        )
+        query = self.build()
+
+        result_array, attributes_names = query.execute()
+
+        self.assertEqual(
+            result_array, [["Activity_1", "Weight"], ["Activity_2", "Height"]]
+        )
+        self.assertEqual(attributes_names, ["uid", "name"])
+        self.assertEqual(query.get_total_count(), 12)
+        self.cypher_query.assert_called_once()
+        self.assertEqual(self.cypher_query.call_args.kwargs["query"], query.paged_query)
+
+    def test_total_count_of_empty_page_is_counted_again(self):
+        self.cypher_query.side_effect = [
+            ([], ["uid", "name", "_total_count"]),
+            ([[12]], ["total_count"]),
+        ]
+        query = self.build()
+
+        self.assertEqual(query.execute(), ([], ["uid", "name"]))
+        self.assertEqual(query.get_total_count(), 12)
+        self.assertEqual(self.cypher_query.call_args.kwargs["query"], query.count_query)
+
+    def test_full_query_is_run_without_total_count(self):
+        self.cypher_query.return_value = ([["Activity_1", "Weight"]], ["uid", "name"])
+        query = self.build(total_count=False)
+
+        self.assertEqual(query.execute(), ([["Activity_1", "Weight"]], ["uid", "name"]))
+        self.assertEqual(self.cypher_query.call_args.kwargs["query"], query.full_query)
+
+    def test_single_query_total_count_can_be_disabled(self):
+        self.cypher_query.side_effect = [
+            ([["Activity_1", "Weight"]], ["uid", "name"]),
+            ([[12]], ["total_count"]),
+        ]
+        query = self.build()
+
+        with mock.patch.object(config, "SINGLE_QUERY_TOTAL_COUNT_ENABLED", False):
+            query.execute()
+        self.assertEqual(query.get_total_count(), 12)
+
+        queries = [call.kwargs["query"] for call in self.cypher_query.call_args_list]
+        self.assertEqual(queries, [query.full_query, query.count_query])
+
+    def test_total_count_of_union_is_summed(self):
+        self.cypher_query.return_value = ([[12], [3]], ["total_count"])
+        query = self.build(union_match_clause=UNION_MATCH_CLAUSE)
+
+        self.assertIn("UNION ALL", query.count_query)
+        self.assertEqual(query.get_total_count(), 15)
+
+    def test_estimated_total_count(self):
+        self.cypher_query.side_effect = [
+            ([["Activity_1", "Weight"]], ["uid", "name"]),
+            ([[12]], ["count(node)"]),
+        ]
+        query = self.build(estimated_count_label="ActivityRoot")
+
+        with mock.patch.object(config, "ESTIMATED_TOTAL_COUNT_ENABLED", True):
+            query.execute()
+            self.assertEqual(query.get_total_count(), 12)
+
+        queries = [call.kwargs["query"] for call in self.cypher_query.call_args_list]
+        self.assertEqual(
+            queries,
+            [query.full_query, "MATCH (node:ActivityRoot) RETURN count(node)"],
+        )
+
+    def test_total_count_is_not_estimated_when_filtered(self):
+        query = self.build(
+            {"name": {"v": ["Weight"]}}, estimated_count_label="ActivityRoot"
+        )
+
+        with mock.patch.object(config, "ESTIMATED_TOTAL_COUNT_ENABLED", True):
+            self.assertFalse(query._is_count_estimated())
+        self.assertFalse(
+            self.build(estimated_count_label="ActivityRoot")._is_count_estimated()
+        )
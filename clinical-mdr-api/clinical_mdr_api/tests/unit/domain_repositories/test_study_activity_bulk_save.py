@@ -0,0 +1,86 @@
+import datetime
+import unittest
+from unittest import mock
+
+from clinical_mdr_api.domain_repositories.study_selections import (
+    study_activity_repository,
+)
+from clinical_mdr_api.domain_repositories.study_selections.study_activity_repository import (
+    StudySelectionActivityRepository,
+)
+from clinical_mdr_api.domains.study_selections.study_selection_activity import (
+    StudySelectionActivityVO,
+)
+from common.exceptions import BusinessLogicException
+
+
+def study_activity(uid: str, study_activity_subgroup_uid: str | None):
+    return StudySelectionActivityVO.from_input_values(
+        study_uid="Study_000001",
+        study_selection_uid=uid,
+        activity_uid="Activity_000001",
+        activity_version="1.0",
+        study_soa_group_uid="StudySoAGroup_000001",
+        soa_group_term_uid="CTTerm_000001",
+        study_activity_subgroup_uid=study_activity_subgroup_uid,
+        show_activity_in_protocol_flowchart=None,
+        start_date=datetime.datetime(
+            2024, 1, 1, 12, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+        ),
+        author_id="unknown-user",
+        author_username="unknown-user@example.com",
+    )
+
+
+class TestStudyActivityBulkSave(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(study_activity_repository.db, "cypher_query")
+        self.addCleanup(patcher.stop)
+        self.cypher_query = patcher.start()
+        self.repository = StudySelectionActivityRepository()
+        self.selections = [
+            (3, study_activity("StudyActivity_000002", "StudyActivitySubGroup_000001")),
+            (1, study_activity("StudyActivity_000003", None)),
+        ]
+
+    def test_new_selections_are_saved_in_one_query(self):
+        self.cypher_query.return_value = (
+            [["StudyActivity_000002"], ["StudyActivity_000003"]],
+            ["sa.uid"],
+        )
+
+        self.repository.save_new_selections("Study_000001", self.selections)
+
+        self.cypher_query.assert_called_once()
+        query, params = self.cypher_query.call_args.args
+        self.assertIn("UNWIND $selections AS selection", query)
+        self.assertEqual(params["study_uid"], "Study_000001")
+        self.assertEqual(
+            params["selections"][0],
+            {
+                "uid": "StudyActivity_000002",
+                "order": 3,
+                "show_activity_in_protocol_flowchart": False,
+                "accepted_version": False,
+                "activity_uid": "Activity_000001",
+                "activity_version": "1.0",
+                "study_soa_group_uid": "StudySoAGroup_000001",
+                "study_activity_subgroup_uid": "StudyActivitySubGroup_000001",
+                "study_activity_group_uid": None,
+                "author_id": "unknown-user",
+                "date": datetime.datetime(2024, 1, 1, 10, tzinfo=datetime.timezone.utc),
+            },
+        )
+        self.assertEqual(params["selections"][1]["order"], 1)
+
+    def test_selections_which_could_not_be_linked_are_reported(self):
+        self.cypher_query.return_value = ([["StudyActivity_000002"]], ["sa.uid"])
+
+        with self.assertRaises(BusinessLogicException) as context:
+            self.repository.save_new_selections("Study_000001", self.selections)
+        self.assertIn("StudyActivity_000003", context.exception.msg)
+
+    def test_nothing_to_save(self):
+        self.repository.save_new_selections("Study_000001", [])
+
+        self.cypher_query.assert_not_called()
@@ -1,4 +1,5 @@
 # pylint: disable=no-member
+from copy import deepcopy
 from typing import Mapping
 
 import bs4
@@ -6,7 +7,12 @@ import docx
 import pytest
 from docx.enum.style import WD_STYLE_TYPE
 
+from clinical_mdr_api.developer_tools.docx_table_benchmark import (
+    document_xml,
+    previous_table_to_docx,
+)
 from clinical_mdr_api.services.utils.table_f import (
+    Ref,
     SimpleFootnote,
     TableCell,
     TableRow,
@@ -34,7 +40,7 @@ TEST_TABLE = TableWithFootnotes(
             hide=False,
             cells=[
                 TableCell(text="hi", style="hi hi", vertical=True, footnotes=["a"]),
-                TableCell(text="Hello", span="2", style="hi"),
+                TableCell(text="Hello", span=2, style="hi"),
                 TableCell(style="foo", span=0),
                 TableCell(text="Hi World"),
             ],
@@ -70,7 +76,7 @@ TEST_TABLE = TableWithFootnotes(
             hide=True,
             cells=[
                 TableCell("some hidden"),
-                TableCell(span="2"),
+                TableCell(span=2),
                 TableCell(span=0),
                 TableCell("contents blah", footnotes=["hello", "a"]),
             ],
@@ -446,3 +452,68 @@ def compare_docx_footnotes(
         assert (
             textx == footnote.text_plain
         ), f"footnote text doesn't match in row {row_idx}"
+
+
+EDGE_CASE_TABLE = TableWithFootnotes(
+    rows=[
+        TableRow(
+            [
+                TableCell("head", style="head", vertical=True),
+                TableCell("spanning", span=3, footnotes=["a", "b"]),
+                TableCell(span=0),
+                TableCell(span=0),
+            ]
+        ),
+        # spanning beyond the cells of the row, with an invisible cell not merged into a spanning cell
+        TableRow([TableCell(span=0), TableCell("\ttab\nnew line ", span=4)]),
+        TableRow([TableCell(" leading space", style="default"), TableCell("short")]),
+        TableRow([TableCell("hidden")], hide=True),
+        TableRow([TableCell(), TableCell(), TableCell("data", style="data")]),
+    ],
+    num_header_rows=1,
+)
+
+
+@pytest.mark.parametrize("test_table", [TEST_TABLE, EDGE_CASE_TABLE])
+def test_table_to_docx_matches_python_docx_rendering(test_table: TableWithFootnotes):
+    styles = {**DOCX_STYLES, "default": ("Normal", WD_STYLE_TYPE.PARAGRAPH)}
+
+    docx_builder = table_to_docx(test_table, styles=styles)
+
+    assert document_xml(docx_builder) == document_xml(
+        previous_table_to_docx(test_table, styles=styles)
+    )
+
+
+def test_table_json_round_trip():
+    table = deepcopy(TEST_TABLE)
+    table.rows[1].cells[0].refs = [
+        Ref(type_="StudyActivity", uid="StudyActivity_000001"),
+        Ref(type="StudyVisit", uid="StudyVisit_000001"),
+    ]
+
+    restored = TableWithFootnotes.model_validate_json(table.model_dump_json())
+
+    assert restored == table
+    assert isinstance(restored.rows[1], TableRow)
+    assert isinstance(restored.rows[1].cells[0], TableCell)
+    assert restored.rows[1].cells[0].refs[1] == Ref("StudyVisit", "StudyVisit_000001")
+    assert isinstance(restored.footnotes["a"], SimpleFootnote)
+    assert restored.model_dump()["rows"][0]["cells"][1] == {
+        "text": "Hello",
+        "span": 2,
+        "style": "hi",
+        "refs": None,
+        "footnotes": None,
+        "vertical": None,
+    }
+
+
+def test_table_rows_are_not_copied():
+    row = TableRow([TableCell("text"), TableCell()])
+
+    table = TableWithFootnotes(rows=[row])
+
+    assert table.rows[0] is row
+    assert row.cells[1].text == ""
+    assert TableRow().cells == []
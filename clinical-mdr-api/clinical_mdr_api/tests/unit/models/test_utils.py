@@ -1,9 +1,24 @@
+import datetime
+import json
+from pathlib import PurePosixPath
 from typing import Annotated
+from unittest import mock
 
 import pytest
-from pydantic import Field
+from pydantic import Field, computed_field
 
+from clinical_mdr_api.developer_tools.model_validate_benchmark import (
+    Node,
+    activity_node,
+    ct_config_node,
+)
+from clinical_mdr_api.models import utils
+from clinical_mdr_api.models.concepts.activities.activity import (
+    ActivityGroupingHierarchySimpleModel,
+)
+from clinical_mdr_api.models.controlled_terminologies.configuration import CTConfigOGM
 from clinical_mdr_api.models.utils import InputModel, sanitize_html
+from clinical_mdr_api.services.user_info import UserInfoService
 
 TEXT_INPUTS = [
     (" HellO", "HellO"),
@@ -105,3 +120,153 @@ def test_input_model(
     assert obj.title == input_string.strip()
     assert obj.body == expected_sanitized_string
     assert obj.tags is None
+
+
+@pytest.fixture
+def author_usernames():
+    with mock.patch.object(
+        UserInfoService,
+        "get_author_username_from_id",
+        side_effect=lambda uid: f"{uid}@example.com",
+    ):
+        yield
+
+
+def test_model_validate_flattens_sources(author_usernames):
+    ct_config = CTConfigOGM.model_validate(ct_config_node(1))
+
+    assert ct_config.uid == "CTConfig_000001"
+    assert ct_config.status == "Final"
+    assert ct_config.author_username == "unknown-user@example.com"
+    assert ct_config.study_field_name == "field_1"
+    assert ct_config.configured_codelist_uid == "CTCodelist_000001"
+    assert ct_config.configured_term_uid is None
+
+
+def test_model_validate_builds_list_of_models(author_usernames):
+    groupings = ActivityGroupingHierarchySimpleModel.model_validate(
+        activity_node(1, groupings=2)
+    )
+
+    assert groupings == [
+        ActivityGroupingHierarchySimpleModel(
+            activity_group_uid="G_0",
+            activity_group_name="group_0",
+            activity_subgroup_uid="SG_0",
+            activity_subgroup_name="subgroup_0",
+        ),
+        ActivityGroupingHierarchySimpleModel(
+            activity_group_uid="G_1",
+            activity_group_name="group_1",
+            activity_subgroup_uid="SG_1",
+            activity_subgroup_name="subgroup_1",
+        ),
+    ]
+
+
+def test_model_validate_plan_is_cached(author_usernames):
+    utils._MODEL_VALIDATE_PLANS.pop(CTConfigOGM, None)
+
+    CTConfigOGM.model_validate(ct_config_node(3))
+    plan = utils._MODEL_VALIDATE_PLANS[CTConfigOGM]
+    CTConfigOGM.model_validate(ct_config_node(4))
+
+    assert utils._MODEL_VALIDATE_PLANS[CTConfigOGM] is plan
+    assert [step.traversal for step in plan.steps[:2]] == [
+        ("latest_version_relationship",),
+        ("latest_version_relationship",),
+    ]
+
+
+def test_model_validate_requires_fetched_relations():
+    with pytest.raises(RuntimeError, match="has_latest_value is not present"):
+        CTConfigOGM.model_validate(Node(uid="CTConfig_000005"))
+
+
+class AliasedModel(utils.BaseModel):
+    name: str
+    start_date: datetime.datetime = Field(alias="startDate")
+
+
+def test_json_response_serializes_models():
+    content = {
+        "model": AliasedModel(
+            name="Ångström",
+            startDate=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        ),
+        "items": [1, None, {"nested": True}],
+    }
+
+    response = utils.json_response(content)
+
+    assert isinstance(response, utils.FastJSONResponse)
+    assert response.media_type == "application/json"
+    assert response.body == (
+        b'{"model":{"name":"\xc3\x85ngstr\xc3\xb6m","startDate":"2024-01-01T00:00:00Z"},'
+        b'"items":[1,null,{"nested":true}]}'
+    )
+
+
+def test_json_response_falls_back_to_jsonable_encoder():
+    response = utils.json_response({"values": {1, 2}, "path": PurePosixPath("/a/b")})
+
+    assert json.loads(response.body) == {"values": [1, 2], "path": "/a/b"}
+
+
+def test_pretty_json_response():
+    content = {"a": [1, 2], "b": "c"}
+
+    response = utils.json_response(content, pretty=True)
+
+    assert isinstance(response, utils.PrettyJSONResponse)
+    assert response.body.decode() == json.dumps(content, indent=4)
+
+
+class Section(utils.BaseModel):
+    title: str
+    hidden: str | None = Field(default=None, exclude=True)
+    subsections: list["Section"] = Field(default_factory=list)
+    periods: list[AliasedModel] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def depth(self) -> int:
+        return 1 + max((section.depth for section in self.subsections), default=0)
+
+
+def test_iter_json_matches_json_response():
+    period = AliasedModel(
+        name="period",
+        startDate=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    content = {
+        "document": Section(
+            title="root",
+            hidden="not serialized",
+            subsections=[
+                Section(title="first", periods=[period]),
+                Section(title="second"),
+            ],
+        ),
+        "values": {1, 2},
+        "empty": [],
+    }
+
+    chunks = list(utils.iter_json(content, nested_fields={"document", "subsections"}))
+
+    assert b"".join(chunks) == utils.json_response(content).body
+    assert b"not serialized" not in b"".join(chunks)
+    # Each member of the nested fields is a chunk of its own
+    assert chunks[:3] == [
+        b'{"document":{"title":"root"',
+        b',"subsections":[{"title":"first"',
+        b',"subsections":[]',
+    ]
+
+
+def test_iter_json_of_scalars_and_empty_containers():
+    for content in (None, "text", 1.5, [], {}, Section(title="leaf")):
+        assert (
+            b"".join(utils.iter_json(content, nested_fields={"subsections"}))
+            == utils.json_response(content).body
+        )
@@ -0,0 +1,248 @@
+import asyncio
+import io
+import unittest
+from typing import Annotated
+from xml.etree import ElementTree
+
+import openpyxl
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from clinical_mdr_api.models.utils import BaseModel, CustomPage
+from clinical_mdr_api.routers import export
+from clinical_mdr_api.routers.export import allow_exports
+
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+EXPORT_DEFINITION = {
+    "defaults": ["uid", "Name=name", "is_active", "tags.name"],
+    "formats": ["text/csv", "text/xml", XLSX],
+}
+
+
+class Item(BaseModel):
+    uid: str
+    name: str | None = None
+    is_active: bool = False
+    tags: list[dict] = []
+
+
+def items(count: int):
+    for index in range(count):
+        yield Item(
+            uid=f"Item_{index:06}",
+            name=f"Name\n{index}",
+            is_active=index % 2 == 0,
+            tags=[{"name": "a"}, {"name": "b"}],
+        )
+
+
+def collect(body_iterator) -> bytes:
+    return b"".join(
+        chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+        for chunk in body_iterator
+    )
+
+
+def collect_response(response) -> bytes:
+    async def read_body():
+        return [chunk async for chunk in response.body_iterator]
+
+    return collect(asyncio.run(read_body()))
+
+
+class TestExportFormats(unittest.TestCase):
+    def test_csv_is_yielded_in_chunks(self):
+        chunks = list(export._export_to_csv(items(5000), EXPORT_DEFINITION["defaults"]))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(
+            all(len(chunk) < 2 * export.EXPORT_CHUNK_SIZE for chunk in chunks)
+        )
+        lines = "".join(chunks).splitlines()
+        self.assertEqual(len(lines), 5001)
+        self.assertEqual(lines[0], '"uid","Name","is_active","tags.name"')
+        self.assertEqual(lines[1], '"Item_000000","Name 0","Yes","a, b"')
+
+    def test_data_is_consumed_lazily(self):
+        consumed = []
+
+        def tracked_items():
+            for item in items(5000):
+                consumed.append(item.uid)
+                yield item
+
+        for export_format in (export._export_to_csv, export._export_to_xml):
+            consumed.clear()
+            chunks = export_format(tracked_items(), EXPORT_DEFINITION["defaults"])
+
+            self.assertEqual(consumed, [])
+            next(chunks)
+            self.assertLess(len(consumed), 5000)
+
+    def test_xml(self):
+        content = "".join(
+            export._export_to_xml(items(3), EXPORT_DEFINITION["defaults"])
+        )
+
+        root = ElementTree.fromstring(content)
+        self.assertEqual(root.tag, "items")
+        self.assertEqual(
+            [item.find("uid").text for item in root],
+            ["Item_000000", "Item_000001", "Item_000002"],
+        )
+
+    def test_xml_of_single_item(self):
+        content = "".join(
+            export._export_to_xml(next(items(1)), EXPORT_DEFINITION["defaults"])
+        )
+
+        root = ElementTree.fromstring(content)
+        self.assertEqual(root.tag, "item")
+        self.assertEqual(root.find("uid").text, "Item_000000")
+
+    def test_xml_of_empty_list(self):
+        content = "".join(export._export_to_xml([], EXPORT_DEFINITION["defaults"]))
+
+        self.assertEqual(content, "<items>\n  <item></item>\n</items>")
+
+    def test_xlsx(self):
+        content = collect(
+            export._export_to_xslx(items(100), EXPORT_DEFINITION["defaults"])
+        )
+
+        worksheet = openpyxl.load_workbook(io.BytesIO(content)).active
+        rows = list(worksheet.iter_rows(values_only=True))
+        self.assertEqual(len(rows), 101)
+        self.assertEqual(rows[0], ("uid", "Name", "is_active", "tags.name"))
+        self.assertEqual(rows[2], ("Item_000001", "Name 1", "No", "a, b"))
+
+    def test_extra_headers_are_detected_on_first_item_of_iterator(self):
+        response = export.export(
+            "text/csv",
+            iter([{"uid": "Item_1", "epoch": "Epoch 1"}]),
+            {"defaults": ["uid"], "include_if_exists": ["epoch", "milestone"]},
+        )
+
+        self.assertEqual(
+            collect_response(response).decode().splitlines(),
+            ['"uid","epoch"', '"Item_1","Epoch 1"'],
+        )
+
+
+class TestAllowExports(unittest.TestCase):
+    def setUp(self):
+        self.page_sizes = []
+        self.page_tokens = []
+        self.total_items = 25
+        self.ignore_page_number = False
+        # Whether the items are the versions of a single item, sharing its uid
+        self.versioned = False
+        app = FastAPI()
+
+        @app.get("/items")
+        @allow_exports(EXPORT_DEFINITION)
+        # pylint: disable=unused-argument
+        def get_items(
+            request: Request,
+            page_number: Annotated[int, Query()] = 1,
+            page_size: Annotated[int, Query()] = 10,
+            total_count: Annotated[bool, Query()] = False,
+            page_token: Annotated[str | None, Query()] = None,
+        ) -> CustomPage[Item]:
+            self.page_sizes.append(page_size)
+            self.page_tokens.append(page_token)
+            all_items = list(items(self.total_items))
+            if self.versioned:
+                all_items = [
+                    item.model_copy(update={"uid": "Item_000000"}) for item in all_items
+                ]
+            if self.ignore_page_number:
+                page_number = 1
+            if page_size:
+                page = all_items[(page_number - 1) * page_size :][:page_size]
+            else:
+                page = all_items
+            return CustomPage.create(
+                items=page,
+                total=len(all_items) if total_count else 0,
+                page=page_number,
+                size=page_size,
+            )
+
+        self.client = TestClient(app)
+
+    def test_export_formats_are_not_accumulated(self):
+        for _ in range(3):
+            response = self.client.get("/items", headers={"Accept": "text/csv"})
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(EXPORT_DEFINITION["formats"], ["text/csv", "text/xml", XLSX])
+
+    def test_json_is_returned_when_no_export_format_is_requested(self):
+        response = self.client.get("/items", params={"page_size": 0})
+
+        self.assertEqual(len(response.json()["items"]), 25)
+        self.assertEqual(self.page_sizes, [0])
+
+    def test_all_items_are_exported_page_by_page(self):
+        export_page_size = export.EXPORT_PAGE_SIZE
+        export.EXPORT_PAGE_SIZE = 10
+        self.addCleanup(setattr, export, "EXPORT_PAGE_SIZE", export_page_size)
+
+        response = self.client.get(
+            "/items",
+            params={"page_size": 0, "total_count": True},
+            headers={"Accept": "text/csv"},
+        )
+
+        self.assertEqual(len(response.text.splitlines()), 26)
+        self.assertEqual(self.page_sizes, [10, 10, 10])
+
+    def test_all_items_are_exported_without_page_token(self):
+        response = self.client.get(
+            "/items",
+            params={"page_size": 0, "page_token": ""},
+            headers={"Accept": "text/csv"},
+        )
+
+        self.assertEqual(len(response.text.splitlines()), 26)
+        self.assertEqual(self.page_tokens, [None])
+
+    def test_export_stops_at_repeated_page(self):
+        export_page_size = export.EXPORT_PAGE_SIZE
+        export.EXPORT_PAGE_SIZE = 10
+        self.addCleanup(setattr, export, "EXPORT_PAGE_SIZE", export_page_size)
+        self.ignore_page_number = True
+
+        response = self.client.get(
+            "/items", params={"page_size": 0}, headers={"Accept": "text/csv"}
+        )
+
+        self.assertEqual(len(response.text.splitlines()), 11)
+        self.assertEqual(self.page_sizes, [10, 10])
+
+    def test_all_versions_of_an_item_are_exported(self):
+        export_page_size = export.EXPORT_PAGE_SIZE
+        export.EXPORT_PAGE_SIZE = 10
+        self.addCleanup(setattr, export, "EXPORT_PAGE_SIZE", export_page_size)
+        self.versioned = True
+
+        response = self.client.get(
+            "/items", params={"page_size": 0}, headers={"Accept": "text/csv"}
+        )
+
+        rows = [line.split(",") for line in response.text.splitlines()[1:]]
+        self.assertEqual({row[0] for row in rows}, {'"Item_000000"'})
+        self.assertEqual(len(rows), 25)
+
+    def test_requested_page_is_exported(self):
+        response = self.client.get(
+            "/items",
+            params={"page_number": 2, "page_size": 5},
+            headers={"Accept": "text/csv"},
+        )
+
+        lines = response.text.splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(lines[1].startswith('"Item_000005"'))
+        self.assertEqual(self.page_sizes, [5])
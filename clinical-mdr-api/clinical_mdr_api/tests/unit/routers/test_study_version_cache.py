@@ -0,0 +1,212 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import Annotated
+from unittest import mock
+
+from fastapi import FastAPI, Query
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from clinical_mdr_api.models.utils import BaseModel
+from clinical_mdr_api.routers import study_version_cache
+from clinical_mdr_api.routers.decorators import allow_exports
+from clinical_mdr_api.routers.study_version_cache import (
+    ImmutableResponseCache,
+    cache_study_version_response,
+)
+
+
+class TestImmutableResponseCache(unittest.TestCase):
+    def test_entries_are_content_addressed(self):
+        cache = ImmutableResponseCache(max_memory_bytes=1000)
+
+        etag_1 = cache.set("key_1", b"payload")
+        etag_2 = cache.set("key_2", b"payload")
+
+        self.assertEqual(etag_1, etag_2)
+        self.assertEqual(cache.get("key_1"), (etag_1, b"payload"))
+        self.assertIsNone(cache.get("key_3"))
+
+    def test_entries_are_shared_through_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            etag = ImmutableResponseCache(
+                max_memory_bytes=1000, directory=directory
+            ).set("key", b"payload")
+
+            other_worker_cache = ImmutableResponseCache(
+                max_memory_bytes=1000, directory=directory
+            )
+
+            self.assertEqual(other_worker_cache.get("key"), (etag, b"payload"))
+
+    def test_memory_is_bounded_by_payload_size(self):
+        cache = ImmutableResponseCache(max_memory_bytes=25)
+
+        cache.set("key_1", b"1" * 10)
+        cache.set("key_2", b"2" * 10)
+        cache.set("key_3", b"3" * 10)
+        cache.set("key_4", b"4" * 30)
+
+        self.assertIsNone(cache.get("key_1"))
+        self.assertIsNotNone(cache.get("key_2"))
+        self.assertIsNotNone(cache.get("key_3"))
+        self.assertIsNone(cache.get("key_4"))
+
+    def test_least_recently_used_entries_are_evicted_from_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ImmutableResponseCache(
+                max_memory_bytes=1000, directory=directory, max_disk_bytes=25
+            )
+            etag_1 = cache.set("key_1", b"1" * 10)
+            etag_2 = cache.set("key_2", b"2" * 10)
+            os.utime(os.path.join(directory, "objects", etag_1), (1, 1))
+            os.utime(os.path.join(directory, "objects", etag_2), (2, 2))
+
+            etag_3 = cache.set("key_3", b"3" * 10)
+
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(directory, "objects"))),
+                sorted([etag_2, etag_3]),
+            )
+            self.assertIsNone(
+                ImmutableResponseCache(max_memory_bytes=1000, directory=directory).get(
+                    "key_1"
+                )
+            )
+
+
+class Item(BaseModel):
+    name: str
+    versions: list[str]
+
+
+class TestCacheStudyVersionResponse(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        cache = ImmutableResponseCache(max_memory_bytes=10000)
+        patcher = mock.patch.object(
+            study_version_cache, "study_version_response_cache", cache
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        app = FastAPI()
+
+        @app.get("/studies/{study_uid}/items")
+        @allow_exports({"defaults": ["name"], "formats": ["text/csv"]})
+        @cache_study_version_response
+        # pylint: disable=unused-argument
+        def get_items(
+            request: Request,
+            study_uid: str,
+            study_value_version: Annotated[str | None, Query()] = None,
+        ) -> list[dict]:
+            self.calls.append((study_uid, study_value_version))
+            return [{"name": f"{study_uid} {study_value_version}"}]
+
+        @app.get("/studies/{study_uid}/document")
+        @cache_study_version_response
+        def get_document(
+            study_uid: str,
+            study_value_version: Annotated[str | None, Query()] = None,
+        ) -> Response:
+            self.calls.append((study_uid, study_value_version))
+            return Response(content=study_uid.encode(), media_type="text/plain")
+
+        @app.get("/studies/{study_uid}/item")
+        @cache_study_version_response
+        def get_item(
+            study_uid: str,
+            study_value_version: Annotated[str | None, Query()] = None,
+        ) -> Item:
+            self.calls.append((study_uid, study_value_version))
+            return Item(name=study_uid, versions=[study_value_version])
+
+        self.client = TestClient(app)
+
+    def test_latest_version_is_not_cached(self):
+        for _ in range(2):
+            response = self.client.get("/studies/Study_000001/items")
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("etag", response.headers)
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_study_version_is_cached(self):
+        responses = [
+            self.client.get(
+                "/studies/Study_000001/items", params={"study_value_version": "1.0"}
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(self.calls, [("Study_000001", "1.0")])
+        self.assertEqual(responses[0].json(), [{"name": "Study_000001 1.0"}])
+        self.assertEqual(responses[1].json(), responses[0].json())
+        self.assertEqual(responses[1].headers["etag"], responses[0].headers["etag"])
+
+        self.client.get(
+            "/studies/Study_000001/items", params={"study_value_version": "2.0"}
+        )
+        self.assertEqual(len(self.calls), 2)
+
+    def test_not_modified_is_returned_for_matching_etag(self):
+        url = "/studies/Study_000001/document?study_value_version=1.0"
+        response = self.client.get(url)
+        self.assertEqual(response.text, "Study_000001")
+
+        not_modified = self.client.get(
+            url, headers={"If-None-Match": response.headers["etag"]}
+        )
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["etag"], response.headers["etag"])
+        self.assertEqual(len(self.calls), 1)
+
+    def test_exports_have_their_own_etag(self):
+        url = "/studies/Study_000001/items?study_value_version=1.0"
+        json_response = self.client.get(url)
+        csv_response = self.client.get(url, headers={"Accept": "text/csv"})
+
+        self.assertEqual(csv_response.status_code, 200)
+        self.assertIn("Study_000001 1.0", csv_response.text)
+        self.assertNotEqual(json_response.headers["etag"], csv_response.headers["etag"])
+
+        not_modified = self.client.get(
+            url,
+            headers={
+                "Accept": "text/csv",
+                "If-None-Match": csv_response.headers["etag"],
+            },
+        )
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_cached_data_is_stored_as_json(self):
+        url = "/studies/Study_000001/item?study_value_version=1.0"
+        response = self.client.get(url)
+
+        cached = self.client.get(url)
+
+        self.assertEqual(cached.json(), {"name": "Study_000001", "versions": ["1.0"]})
+        self.assertEqual(cached.json(), response.json())
+        self.assertEqual(len(self.calls), 1)
+        ((_, payload),) = (
+            study_version_cache.study_version_response_cache._memory.values()
+        )
+        self.assertEqual(
+            json.loads(payload),
+            {"data": {"name": "Study_000001", "versions": ["1.0"]}},
+        )
+
+    def test_cached_response_keeps_its_body_and_headers(self):
+        url = "/studies/Study_000001/document?study_value_version=1.0"
+        self.client.get(url)
+
+        cached = self.client.get(url)
+
+        self.assertEqual(cached.text, "Study_000001")
+        self.assertTrue(cached.headers["content-type"].startswith("text/plain"))
+        self.assertEqual(len(self.calls), 1)
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from neomodel import db
+
+from clinical_mdr_api.models.concepts.activities.activity_group import (
+    ActivityGroupCreateInput,
+)
+from clinical_mdr_api.services.concepts.activities.activity_group_service import (
+    ActivityGroupService,
+)
+from common.exceptions import AlreadyExistsException, BusinessLogicException
+
+
+def create_input(name: str) -> ActivityGroupCreateInput:
+    return ActivityGroupCreateInput(
+        name=name,
+        name_sentence_case=name.lower(),
+        definition="Definition not provided",
+        library_name="Sponsor",
+    )
+
+
+@pytest.fixture(name="service")
+def fixture_service():
+    with mock.patch.object(ActivityGroupService, "__init__", return_value=None):
+        service = ActivityGroupService()
+    service._repos = mock.Mock()
+    service.author_id = "unknown-user"
+    created = []
+
+    def create(concept_input, preview=False):
+        if concept_input.name == "Existing":
+            raise AlreadyExistsException(msg="Activity group already exists.")
+        created.append(concept_input.name)
+        return SimpleNamespace(uid=f"ActivityGroup_{concept_input.name}")
+
+    def approve(uid, cascade_edit_and_approve=False):
+        if uid == "ActivityGroup_Locked":
+            raise BusinessLogicException(msg="The library doesn't allow to approve.")
+        return SimpleNamespace(uid=uid, status="Final")
+
+    # Each item is created in its own transaction
+    with (
+        mock.patch.object(db, "driver", mock.Mock()),
+        mock.patch.object(db, "begin"),
+        mock.patch.object(db, "commit"),
+        mock.patch.object(db, "rollback"),
+        mock.patch.object(service, "non_transactional_create", side_effect=create),
+        mock.patch.object(service, "non_transactional_approve", side_effect=approve),
+    ):
+        yield service
+
+
+def test_create_batch_and_approve(service):
+    results = service.create_batch(
+        [
+            create_input("Vital Signs"),
+            create_input("Existing"),
+            create_input("Locked"),
+            create_input("Laboratory"),
+        ],
+        approve=True,
+    )
+
+    assert [result.response_code for result in results] == [201, 409, 400, 201]
+    assert results[0].content == SimpleNamespace(
+        uid="ActivityGroup_Vital Signs", status="Final"
+    )
+    assert results[1].content.message == "Activity group already exists."
+    # The draft of an item that can't be approved is rolled back with its approval
+    assert results[2].content.message == "The library doesn't allow to approve."
+    assert results[3].content.status == "Final"
+    assert db.begin.call_count == 4
+    assert db.commit.call_count == 2
+    assert db.rollback.call_count == 2
+    assert [
+        call.args[0] for call in service.non_transactional_approve.call_args_list
+    ] == [
+        "ActivityGroup_Vital Signs",
+        "ActivityGroup_Locked",
+        "ActivityGroup_Laboratory",
+    ]
+
+
+def test_create_batch_without_approval(service):
+    results = service.create_batch(
+        [create_input("Vital Signs"), create_input("Laboratory")]
+    )
+
+    assert [result.response_code for result in results] == [201, 201]
+    assert [result.content.uid for result in results] == [
+        "ActivityGroup_Vital Signs",
+        "ActivityGroup_Laboratory",
+    ]
+    service.non_transactional_approve.assert_not_called()
@@ -0,0 +1,174 @@
+import datetime
+from unittest import mock
+
+import pytest
+from neo4j.time import DateTime
+
+from clinical_mdr_api.domains.controlled_terminologies.ct_package import CTPackageAR
+from clinical_mdr_api.services.controlled_terminologies import ct_package
+from clinical_mdr_api.services.controlled_terminologies.ct_package import (
+    CTPackageService,
+)
+
+IMPORT_DATE = datetime.datetime(2024, 4, 2, tzinfo=datetime.timezone.utc)
+CHANGE_DATE = DateTime(2024, 3, 29, tzinfo=datetime.timezone.utc)
+
+
+def package(name: str, extends_package: str | None = None) -> CTPackageAR:
+    return CTPackageAR.from_repository_values(
+        uid=name,
+        catalogue_name="SDTM CT",
+        name=name,
+        label=None,
+        description=None,
+        href=None,
+        registration_status=None,
+        source=None,
+        extends_package=extends_package,
+        import_date=IMPORT_DATE,
+        effective_date=IMPORT_DATE.date(),
+        author_id="unknown-user",
+        author_username="unknown-user@example.com",
+    )
+
+
+def repository_output() -> dict:
+    return {
+        "new_codelists": [
+            {
+                "uid": "C66737",
+                "value_node": {"name": "Trial Phase", "submissionValue": "TPHASE"},
+                "change_date": CHANGE_DATE,
+            }
+        ],
+        "deleted_codelists": [],
+        "updated_codelists": [
+            {
+                "uid": "C66738",
+                "value_node": {"name": "Trial Summary Parameter"},
+                "change_date": CHANGE_DATE,
+                "is_change_of_codelist": False,
+            }
+        ],
+        "new_terms": [],
+        "deleted_terms": [],
+        "updated_terms": [
+            {
+                "uid": "C48262",
+                "value_node": {
+                    "right_only": {},
+                    "left_only": {},
+                    "in_common": {"code_submission_value": "TPHASE"},
+                    "different": {
+                        "definition": {"left": "Phase", "right": "Phäse"},
+                        "synonyms": {"left": None, "right": ["Trial Phase"]},
+                    },
+                },
+                "change_date": CHANGE_DATE,
+                "codelists": ["C66738"],
+            }
+        ],
+    }
+
+
+@pytest.fixture(name="service")
+def fixture_service():
+    with mock.patch.object(CTPackageService, "__init__", return_value=None):
+        service = CTPackageService()
+    service._repos = mock.Mock()
+    return service
+
+
+@pytest.fixture(name="persisted")
+def fixture_persisted():
+    # In-memory stand-in of the CTPackageChanges nodes
+    store = {}
+    with (
+        mock.patch.object(
+            ct_package,
+            "load_persisted_ct_packages_changes",
+            side_effect=lambda old_package_name, new_package_name: store.get(
+                (old_package_name, new_package_name)
+            ),
+        ),
+        mock.patch.object(
+            ct_package,
+            "save_persisted_ct_packages_changes",
+            side_effect=lambda old_package_name, new_package_name, changes: store.__setitem__(
+                (old_package_name, new_package_name), changes
+            ),
+        ),
+    ):
+        yield store
+
+
+def get_changes(service: CTPackageService, old_package, new_package):
+    with (
+        mock.patch.object(
+            service,
+            "validate_input_and_get_packages",
+            return_value=(old_package, new_package),
+        ),
+        mock.patch.object(
+            ct_package, "get_ct_packages_changes", return_value=repository_output()
+        ) as get_ct_packages_changes,
+    ):
+        changes = service.get_ct_packages_changes(
+            catalogue_name="SDTM CT",
+            old_package_date=old_package.effective_date,
+            new_package_date=new_package.effective_date,
+        )
+    return changes, get_ct_packages_changes.call_count
+
+
+def test_changes_between_cdisc_packages_are_computed_once(service, persisted):
+    old_package = package("SDTM CT 2023-03-31")
+    new_package = package("SDTM CT 2024-03-29")
+
+    computed, computations = get_changes(service, old_package, new_package)
+    assert computations == 1
+    assert list(persisted) == [("SDTM CT 2023-03-31", "SDTM CT 2024-03-29")]
+
+    loaded, computations = get_changes(service, old_package, new_package)
+    assert computations == 0
+    assert loaded == computed
+    assert loaded.model_dump_json() == computed.model_dump_json()
+
+
+def test_changes_of_sponsor_packages_are_not_persisted(service, persisted):
+    old_package = package("SDTM CT 2024-03-29")
+    new_package = package(
+        "Sponsor SDTM CT 2024-06-01", extends_package="SDTM CT 2024-03-29"
+    )
+
+    for _ in range(2):
+        _, computations = get_changes(service, old_package, new_package)
+        assert computations == 1
+    assert not persisted
+
+
+def test_unreadable_persisted_changes_are_recomputed(service, persisted):
+    old_package = package("SDTM CT 2023-03-31")
+    new_package = package("SDTM CT 2024-03-29")
+    persisted[(old_package.name, new_package.name)] = '{"from_package": "SDTM'
+
+    changes, computations = get_changes(service, old_package, new_package)
+
+    assert computations == 1
+    assert changes.to_package == new_package.name
+    assert persisted[(old_package.name, new_package.name)] == changes.model_dump_json()
+
+
+def test_changes_are_computed_on_each_request_when_disabled(
+    service, persisted, monkeypatch
+):
+    monkeypatch.setattr(
+        ct_package.config, "CT_PACKAGE_CHANGES_PERSISTED_ENABLED", False
+    )
+    old_package = package("SDTM CT 2023-03-31")
+    new_package = package("SDTM CT 2024-03-29")
+
+    for _ in range(2):
+        _, computations = get_changes(service, old_package, new_package)
+        assert computations == 1
+    assert not persisted
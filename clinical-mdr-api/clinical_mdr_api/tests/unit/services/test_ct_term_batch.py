@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+from neomodel import db
+
+from clinical_mdr_api.models.controlled_terminologies.ct_term import (
+    CTTerm,
+    CTTermCreateInput,
+)
+from clinical_mdr_api.services.controlled_terminologies.ct_term import CTTermService
+from common.exceptions import BusinessLogicException
+
+
+def create_input(name: str) -> CTTermCreateInput:
+    return CTTermCreateInput(
+        catalogue_name="SDTM CT",
+        codelist_uid="C66726",
+        code_submission_value=name.upper(),
+        definition="Definition not provided",
+        sponsor_preferred_name=name,
+        sponsor_preferred_name_sentence_case=name.lower(),
+        library_name="Sponsor",
+    )
+
+
+def term_ar(term_uid: str) -> mock.Mock:
+    def approve(author_id):
+        if term_uid == "CTTerm_Locked":
+            raise BusinessLogicException(msg="The library doesn't allow to approve.")
+        ar.status = "Final"
+
+    ar = mock.Mock(uid=term_uid, status="Draft")
+    ar.approve.side_effect = approve
+    return ar
+
+
+@pytest.fixture(name="service")
+def fixture_service():
+    with mock.patch.object(CTTermService, "__init__", return_value=None):
+        service = CTTermService()
+    service._repos = mock.Mock()
+    service._repos.ct_term_name_repository.find_by_uid.side_effect = (
+        lambda term_uid, for_update: term_ar(term_uid)
+    )
+    service._repos.ct_term_attributes_repository.find_by_uid.side_effect = (
+        lambda term_uid, for_update: term_ar(term_uid)
+    )
+    service.author_id = "unknown-user"
+
+    def create(term_input):
+        if term_input.sponsor_preferred_name == "Existing":
+            raise BusinessLogicException(msg="Term already exists.")
+        return CTTerm.model_construct(
+            term_uid=f"CTTerm_{term_input.sponsor_preferred_name}"
+        )
+
+    # Each term is created in its own transaction
+    with (
+        mock.patch.object(db, "driver", mock.Mock()),
+        mock.patch.object(db, "begin"),
+        mock.patch.object(db, "commit"),
+        mock.patch.object(db, "rollback"),
+        mock.patch.object(service, "non_transactional_create", side_effect=create),
+        mock.patch.object(
+            CTTerm,
+            "from_ct_term_ars",
+            side_effect=lambda name_ar, attributes_ar: CTTerm.model_construct(
+                term_uid=name_ar.uid,
+                name_status=name_ar.status,
+                attributes_status=attributes_ar.status,
+            ),
+        ),
+    ):
+        yield service
+
+
+def test_create_batch_and_approve(service):
+    results = service.create_batch(
+        [create_input("Alive"), create_input("Existing"), create_input("Locked")],
+        approve=True,
+    )
+
+    assert [result.response_code for result in results] == [201, 400, 400]
+    assert results[0].content == CTTerm.model_construct(
+        term_uid="CTTerm_Alive", name_status="Final", attributes_status="Final"
+    )
+    assert results[1].content.message == "Term already exists."
+    # The term that can't be approved is rolled back with its approval
+    assert results[2].content.message == "The library doesn't allow to approve."
+    assert db.commit.call_count == 1
+    assert db.rollback.call_count == 2
+
+
+def test_create_batch_without_approval(service):
+    results = service.create_batch([create_input("Alive"), create_input("Dead")])
+
+    assert [result.response_code for result in results] == [201, 201]
+    assert [result.content.term_uid for result in results] == [
+        "CTTerm_Alive",
+        "CTTerm_Dead",
+    ]
+    service._repos.ct_term_name_repository.find_by_uid.assert_not_called()
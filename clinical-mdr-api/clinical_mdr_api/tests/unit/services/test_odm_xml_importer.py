@@ -0,0 +1,149 @@
+from io import BytesIO
+from unittest import mock
+
+import pytest
+from cachetools.keys import hashkey
+from starlette.datastructures import Headers, UploadFile
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.domain_repositories.library_item_repository import (
+    LibraryItemRepositoryImplBase,
+)
+from clinical_mdr_api.services.concepts.odms import odm_xml_importer
+from clinical_mdr_api.services.concepts.odms.odm_xml_importer import (
+    OdmXmlImporterService,
+)
+from clinical_mdr_api.tests.data.odm_xml import import_input1
+from common.auth.dependencies import dummy_access_token_claims, dummy_auth_object
+from common.exceptions import BusinessLogicException
+
+
+@pytest.fixture(name="db")
+def fixture_db():
+    with request_cycle_context(
+        {"auth": dummy_auth_object(dummy_access_token_claims())}
+    ), mock.patch.object(odm_xml_importer, "db") as db:
+        yield db
+
+
+def importer(**kwargs) -> OdmXmlImporterService:
+    xml_file = UploadFile(
+        BytesIO(import_input1.encode("utf-8")),
+        headers=Headers({"content-type": "application/xml"}),
+    )
+    return OdmXmlImporterService(xml_file, None, batch_size=1, **kwargs)
+
+
+def store_forms(service: OdmXmlImporterService, exception: Exception | None = None):
+    """Stores the form definitions of the file, failing on the second one if an exception is given."""
+
+    stored = []
+
+    def store_form(form_def):
+        if stored and exception:
+            raise exception
+        stored.append(form_def)
+
+    with mock.patch.object(
+        service,
+        "_store_odm_xml",
+        side_effect=lambda: service._store_in_batches("FormDef", store_form),
+    ):
+        service.store_odm_xml()
+
+
+def test_import_is_stored_in_a_single_transaction_without_batch_commits(db):
+    service = importer(commit_batches=False)
+
+    with pytest.raises(BusinessLogicException) as exc_info:
+        store_forms(service, BusinessLogicException(msg="Invalid form."))
+
+    assert exc_info.value.msg == "Invalid form."
+    db.begin.assert_called_once()
+    db.commit.assert_not_called()
+    db.rollback.assert_called_once()
+
+
+def test_failing_import_tells_what_was_stored_by_committed_batches(db):
+    service = importer()
+
+    with pytest.raises(BusinessLogicException) as exc_info:
+        store_forms(service, BusinessLogicException(msg="Invalid form."))
+
+    assert exc_info.value.msg == (
+        "Invalid form. The ODM XML import failed after storing 1/2 FormDef elements, which were committed."
+    )
+    assert str(exc_info.value) == exc_info.value.msg
+    db.commit.assert_called_once()
+    db.rollback.assert_called_once()
+
+
+def test_unexpected_errors_of_committed_batches_are_noted(db):
+    service = importer()
+
+    with pytest.raises(KeyError) as exc_info:
+        store_forms(service, KeyError("OID"))
+
+    assert exc_info.value.__notes__ == [
+        "The ODM XML import failed after storing 1/2 FormDef elements, which were committed."
+    ]
+
+
+def test_dry_run_never_commits_batches(db):
+    service = importer(dry_run=True)
+
+    store_forms(service)
+
+    db.commit.assert_not_called()
+    db.rollback.assert_called_once()
+
+
+def test_dry_run_leaves_nothing_in_the_cache(db):
+    service = importer(dry_run=True)
+    cache = LibraryItemRepositoryImplBase.cache_store_item_by_uid
+    cache[hashkey("FormRepository", "OdmForm_000001", None)] = "Rolled back form"
+    try:
+        store_forms(service)
+
+        assert hashkey("FormRepository", "OdmForm_000001", None) not in cache
+    finally:
+        cache.pop(hashkey("FormRepository", "OdmForm_000001", None), None)
+
+
+def test_new_elements_are_created_and_approved_at_the_end_of_a_batch(db):
+    service = importer()
+    repository = mock.Mock()
+    concept_service = mock.Mock()
+    concept_service._create_aggregate_root.side_effect = (
+        lambda concept_input, library: mock.Mock(
+            uid=f"{concept_input.oid}_uid",
+            concept_vo=mock.Mock(description_uids=["OdmDescription_000001"]),
+        )
+    )
+    description_ar = mock.Mock()
+    service.pending_descriptions = {"OdmDescription_000001": description_ar}
+    service._repos = mock.Mock()
+    stored = []
+
+    with mock.patch.object(service, "_get_library"):
+        concept_ar = service._create_approved(
+            repository, concept_service, stored, mock.Mock(oid="F.1")
+        )
+        repository.create_all.assert_not_called()
+
+        # The same OID may be the same element, so the pending elements are stored first
+        service._create_approved(
+            repository, concept_service, stored, mock.Mock(oid="F.1")
+        )
+        repository.create_all.assert_called_once_with([concept_ar])
+        repository.approve_all.assert_called_once_with([concept_ar])
+        concept_ar.approve.assert_called_once()
+        service._repos.odm_description_repository.approve_all.assert_called_once_with(
+            [description_ar]
+        )
+
+        service._end_batch()
+
+    assert repository.create_all.call_count == 2
+    assert [ar.uid for ar in stored] == ["F.1_uid", "F.1_uid"]
+    assert not service.pending_concepts
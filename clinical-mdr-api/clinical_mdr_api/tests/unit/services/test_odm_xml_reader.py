@@ -0,0 +1,103 @@
+from io import BytesIO
+from xml.dom import minidom
+
+import pytest
+
+from clinical_mdr_api.services.utils.odm_xml_mapper import apply_mapping_rules
+from clinical_mdr_api.services.utils.odm_xml_reader import OdmXmlReader
+from clinical_mdr_api.tests.data.odm_xml import import_input1, import_input2
+from common.exceptions import BusinessLogicException
+
+DEF_TAG_NAMES = ["FormDef", "ItemGroupDef", "ItemDef", "CodeList", "MeasurementUnit"]
+
+MAPPING_RULES = [
+    {
+        "type": "attribute",
+        "parent": "",
+        "from_name": "Repeated",
+        "to_name": "Repeating",
+        "to_alias": "",
+        "from_alias": "",
+        "alias_context": "",
+    },
+    {
+        "type": "element",
+        "parent": "",
+        "from_name": "NameOne",
+        "to_name": "cs:nameOne",
+        "to_alias": "",
+        "from_alias": "",
+        "alias_context": "",
+    },
+    {
+        "type": "element",
+        "parent": "MetaDataVersion",
+        "from_name": "Alias",
+        "to_name": "",
+        "to_alias": "",
+        "from_alias": "true",
+        "alias_context": "CompletionInstructions",
+    },
+    {
+        "type": "attribute",
+        "parent": "FormDef",
+        "from_name": "ImplementationNotes",
+        "to_name": "osb:sponsorInstruction",
+        "to_alias": "",
+        "from_alias": "",
+        "alias_context": "",
+    },
+]
+
+
+def parsed_elements(xml: str, mapping_rules=None) -> list[str]:
+    xml_document = minidom.parseString(xml)
+    apply_mapping_rules(xml_document, mapping_rules or [])
+    return [
+        element.toxml()
+        for element in xml_document.getElementsByTagName("*")
+        if element.tagName in DEF_TAG_NAMES
+    ]
+
+
+def read_elements(xml: str, mapping_rules=None) -> list[str]:
+    reader = OdmXmlReader(BytesIO(xml.encode("utf-8")), mapping_rules)
+    return [element.toxml() for element in reader.iter_elements(*DEF_TAG_NAMES)]
+
+
+def test_elements_are_read_as_parsed_by_minidom():
+    assert read_elements(import_input1) == parsed_elements(import_input1)
+
+
+def test_mapping_rules_are_applied_to_read_elements():
+    elements = read_elements(import_input2, MAPPING_RULES)
+
+    assert elements == parsed_elements(import_input2, MAPPING_RULES)
+    assert "<cs:nameOne>" in elements[0]
+    assert 'Repeating="Yes"' in elements[0]
+    assert 'osb:sponsorInstruction="sponsor_instruction1"' in elements[0]
+    assert 'CompletionInstructions="instruction1"' in elements[0]
+
+
+def test_file_can_be_read_several_times():
+    reader = OdmXmlReader(BytesIO(import_input1.encode("utf-8")))
+
+    root_element = reader.root_element()
+    form_oids = [
+        element.getAttribute("OID") for element in reader.iter_elements("FormDef")
+    ]
+
+    assert root_element.tagName == "ODM"
+    assert root_element.getAttribute("xmlns:osb")
+    assert not root_element.childNodes
+    assert form_oids == [
+        element.getAttribute("OID") for element in reader.iter_elements("FormDef")
+    ]
+    assert form_oids
+
+
+def test_invalid_xml_raises_business_logic_exception():
+    reader = OdmXmlReader(BytesIO(b"<ODM><Study></ODM>"))
+
+    with pytest.raises(BusinessLogicException, match="The XML file is not valid"):
+        list(reader.iter_elements("FormDef"))
@@ -0,0 +1,61 @@
+import os
+from unittest import mock
+
+import pytest
+from lxml import etree
+
+from clinical_mdr_api.services.concepts.odms import odm_xml_stylesheets
+from clinical_mdr_api.services.concepts.odms.odm_xml_stylesheets import (
+    OdmXmlStylesheetService,
+)
+from common.exceptions import NotFoundException
+
+STYLESHEET = """<?xml version="1.0" encoding="utf-8"?>
+<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+    <xsl:template match="/">
+        <html><body>{}</body></html>
+    </xsl:template>
+</xsl:stylesheet>"""
+
+
+@pytest.fixture(name="stylesheet_dir")
+def fixture_stylesheet_dir(tmp_path):
+    with mock.patch.object(
+        odm_xml_stylesheets, "XML_STYLESHEET_DIR_PATH", f"{tmp_path}/"
+    ):
+        yield tmp_path
+
+
+def transform(stylesheet: str) -> str:
+    return str(
+        OdmXmlStylesheetService.get_compiled_stylesheet(stylesheet)(
+            etree.fromstring("<ODM/>")
+        )
+    )
+
+
+def test_compiled_stylesheets_are_cached(stylesheet_dir):
+    (stylesheet_dir / "cached.xsl").write_text(STYLESHEET.format("first"))
+
+    assert OdmXmlStylesheetService.get_compiled_stylesheet(
+        "cached"
+    ) is OdmXmlStylesheetService.get_compiled_stylesheet("cached")
+    assert "first" in transform("cached")
+
+
+def test_modified_stylesheets_are_compiled_again(stylesheet_dir):
+    stylesheet_file = stylesheet_dir / "modified.xsl"
+    stylesheet_file.write_text(STYLESHEET.format("first"))
+    assert "first" in transform("modified")
+
+    stylesheet_file.write_text(STYLESHEET.format("second"))
+    modified_time = os.stat(stylesheet_file).st_mtime + 1
+    os.utime(stylesheet_file, (modified_time, modified_time))
+
+    assert "second" in transform("modified")
+
+
+@pytest.mark.usefixtures("stylesheet_dir")
+def test_missing_stylesheet():
+    with pytest.raises(NotFoundException):
+        OdmXmlStylesheetService.get_compiled_stylesheet("missing")
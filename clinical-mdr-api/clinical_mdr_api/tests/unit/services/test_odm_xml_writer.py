@@ -0,0 +1,157 @@
+from xml.dom import minidom
+
+from clinical_mdr_api.domains.concepts.odms.odm_xml_definition import (
+    ODM,
+    Alias,
+    Attribute,
+    BasicDefinitions,
+    Description,
+    Element,
+    FormDef,
+    GlobalVariables,
+    ItemGroupRef,
+    MetaDataVersion,
+    ProtocolName,
+    Study,
+    StudyDescription,
+    StudyName,
+    TranslatedText,
+)
+from clinical_mdr_api.services.utils.odm_xml_writer import OdmXmlWriter
+
+
+def form_def(oid: str) -> FormDef:
+    return FormDef(
+        oid=Attribute("OID", oid),
+        name=Attribute("Name", f"name of {oid}"),
+        repeating=Attribute("Repeating", "No"),
+        version=Attribute("osb:version", "1.0"),
+        vendor_element=Element(
+            _custom_element_name="prefix:nameOne",
+            _string="value & more",
+            attribute=Attribute("prefix:nameTwo", "<value>"),
+        ),
+        description=Description(
+            [
+                TranslatedText(
+                    "description",
+                    lang=Attribute("xml:lang", "en"),
+                    version=Attribute("osb:version", "1.0"),
+                )
+            ]
+        ),
+        aliases=[
+            Alias(
+                name=Attribute("Name", "alias"), context=Attribute("Context", "context")
+            )
+        ],
+        item_group_refs=[
+            ItemGroupRef(
+                item_group_oid=Attribute("ItemGroupOID", "oid2"),
+                mandatory=Attribute("Mandatory", "Yes"),
+                order_number=Attribute("OrderNumber", 1),
+                collection_exception_condition_oid=Attribute(
+                    "CollectionExceptionConditionOID", None
+                ),
+            )
+        ],
+    )
+
+
+def odm(*form_defs: FormDef, **namespaces: Attribute) -> ODM:
+    return ODM(
+        odm_ns=Attribute("xmlns:odm", "http://www.cdisc.org/ns/odm/v1.3"),
+        odm_version=Attribute("ODMVersion", "1.3.2"),
+        file_type=Attribute("FileType", "Snapshot"),
+        file_oid=Attribute("FileOID", "OID.1"),
+        creation_date_time=Attribute("CreationDateTime", "2024-01-01T00:00:00"),
+        granularity=Attribute("Granularity", "All"),
+        study=Study(
+            oid=Attribute("OID", "study"),
+            global_variables=GlobalVariables(
+                protocol_name=ProtocolName("study"),
+                study_name=StudyName("study"),
+                study_description=StudyDescription("study"),
+            ),
+            basic_definitions=BasicDefinitions(measurement_units=[]),
+            meta_data_version=MetaDataVersion(
+                oid=Attribute("OID", "MDV.0.1"),
+                name=Attribute("Name", "MDV.0.1"),
+                description=Attribute("Description", "Draft version"),
+                form_defs=list(form_defs),
+                item_group_defs=[],
+                item_defs=[],
+                condition_defs=[],
+                method_defs=[],
+                codelists=[],
+            ),
+        ),
+        **namespaces,
+    )
+
+
+EXPECTED_FORM_DEF = """<FormDef OID="oid1" Name="name of oid1" Repeating="No" osb:version="1.0">
+\t\t\t\t<Description>
+\t\t\t\t\t<TranslatedText xml:lang="en" osb:version="1.0">description</TranslatedText>
+\t\t\t\t</Description>
+\t\t\t\t<Alias Name="alias" Context="context"></Alias>
+\t\t\t\t<ItemGroupRef ItemGroupOID="oid2" Mandatory="Yes" OrderNumber="1"></ItemGroupRef>
+\t\t\t\t<prefix:nameOne prefix:nameTwo="&lt;value&gt;">value &amp; more</prefix:nameOne>
+\t\t\t</FormDef>"""
+
+
+def test_odm_is_written_as_pretty_printed_xml():
+    written = OdmXmlWriter(
+        odm(
+            form_def("oid1"),
+            osb=Attribute("xmlns:osb", "url2"),
+            prefix=Attribute("xmlns:prefix", "url1"),
+        ),
+        stylesheet="sdtm.xsl",
+    ).write()
+
+    assert written.startswith(
+        b"<?xml version='1.0' encoding='utf-8'?>\n"
+        b'<?xml-stylesheet type="text/xsl" href="sdtm.xsl"?>'
+        b'<ODM xmlns:odm="http://www.cdisc.org/ns/odm/v1.3" xmlns:osb="url2" xmlns:prefix="url1" '
+        b'ODMVersion="1.3.2" FileType="Snapshot" FileOID="OID.1" '
+        b'CreationDateTime="2024-01-01T00:00:00" Granularity="All">\n'
+        b'\t<Study OID="study">\n'
+        b"\t\t<GlobalVariables>\n"
+        b"\t\t\t<ProtocolName>study</ProtocolName>\n"
+    )
+    assert EXPECTED_FORM_DEF.encode() in written
+
+    form_element = minidom.parseString(written).getElementsByTagName("FormDef")[0]
+    assert form_element.getAttributeNS("url2", "version") == "1.0"
+    assert (
+        form_element.getElementsByTagNameNS("url1", "nameOne")[0].firstChild.nodeValue
+        == "value & more"
+    )
+
+
+def test_undeclared_prefixes_are_declared_where_they_are_used():
+    written = OdmXmlWriter(odm(form_def("oid1"))).write()
+
+    assert b'<FormDef xmlns:osb="osb" OID="oid1"' in written
+    assert (
+        b'<prefix:nameOne xmlns:prefix="prefix" prefix:nameTwo="&lt;value&gt;">'
+        in written
+    )
+    minidom.parseString(written)
+
+
+def test_odm_is_written_in_chunks_per_definition():
+    chunks = list(
+        OdmXmlWriter(
+            odm(
+                form_def("oid1"),
+                form_def("oid2"),
+                osb=Attribute("xmlns:osb", "url2"),
+                prefix=Attribute("xmlns:prefix", "url1"),
+            )
+        ).iter_chunks()
+    )
+
+    assert [chunk.count(b"</FormDef>") for chunk in chunks].count(1) == 2
+    assert b"".join(chunks).endswith(b"</ODM>")
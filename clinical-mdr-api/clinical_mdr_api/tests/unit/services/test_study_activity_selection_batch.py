@@ -0,0 +1,199 @@
+import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from clinical_mdr_api.domains.study_selections.study_selection_activity import (
+    StudySelectionActivityAR,
+    StudySelectionActivityVO,
+)
+from clinical_mdr_api.models.study_selections.study_selection import (
+    StudySelectionActivityBatchInput,
+    StudySelectionActivityCreateInput,
+)
+from clinical_mdr_api.services.studies import study_activity_selection
+from clinical_mdr_api.services.studies.study_activity_selection import (
+    StudyActivitySelectionService,
+)
+from common import config
+from common.exceptions import AlreadyExistsException
+
+STUDY_UID = "Study_000001"
+
+
+def study_activity(uid: str, activity_name: str, subgroup: str, order: int = 0):
+    return StudySelectionActivityVO.from_input_values(
+        study_uid=STUDY_UID,
+        study_selection_uid=uid,
+        activity_uid=f"Activity_{activity_name}",
+        activity_name=activity_name,
+        activity_version="1.0",
+        activity_library_name="Sponsor",
+        study_soa_group_uid="StudySoAGroup_000001",
+        soa_group_term_uid="CTTerm_000001",
+        study_activity_subgroup_uid=f"StudyActivitySubGroup_{subgroup}",
+        activity_subgroup_uid=f"ActivitySubGroup_{subgroup}",
+        study_activity_group_uid="StudyActivityGroup_000001",
+        activity_group_uid="ActivityGroup_000001",
+        order=order,
+        start_date=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        author_id="unknown-user",
+        author_username="unknown-user@example.com",
+    )
+
+
+class MockStudyActivitySelectionService(StudyActivitySelectionService):
+    # pylint: disable=super-init-not-called
+    def __init__(self):
+        self._repos = mock.MagicMock()
+        self.author = "unknown-user"
+        self.repository_mock = mock.MagicMock()
+        self.repository_interface = lambda: self.repository_mock
+        self.selected_object_repository_interface = mock.MagicMock
+        self.created_uids = iter(f"StudyActivity_00000{i}" for i in range(2, 10))
+        self.aggregates = {
+            "StudyActivitySubGroup_A": StudySelectionActivityAR.from_repository_values(
+                study_uid=STUDY_UID,
+                study_objects_selection=(
+                    study_activity("StudyActivity_000001", "Weight", "A", order=1),
+                ),
+            )
+        }
+        self.repository_mock.find_by_study.side_effect = self._find_by_study
+
+    def _find_by_study(self, study_uid, for_update=False, **kwargs):
+        if not for_update:
+            return StudySelectionActivityAR.from_repository_values(
+                study_uid=study_uid,
+                study_objects_selection=tuple(
+                    selection
+                    for aggregate in self.aggregates.values()
+                    for selection in aggregate.study_objects_selection
+                ),
+            )
+        aggregate = self.aggregates.setdefault(
+            kwargs["study_activity_subgroup_uid"],
+            StudySelectionActivityAR.from_repository_values(
+                study_uid=study_uid, study_objects_selection=()
+            ),
+        )
+        aggregate.repository_closure_data = aggregate.study_objects_selection
+        return aggregate
+
+    def _get_or_create_study_activity_groupings(
+        self, study_uid, selection_create_input
+    ):
+        return (
+            "StudySoAGroup_000001",
+            "StudyActivityGroup_000001",
+            f"StudyActivitySubGroup_{selection_create_input.activity_subgroup_uid}",
+        )
+
+    def _create_value_object(self, study_uid, selection_create_input, **kwargs):
+        return study_activity(
+            next(self.created_uids),
+            selection_create_input.activity_uid,
+            selection_create_input.activity_subgroup_uid,
+            order=None,
+        )
+
+    def _create_study_activity_instances(self, *_args, **_kwargs):
+        pass
+
+    def _extract_study_standards_effective_date(self, *_args, **_kwargs):
+        return None
+
+    def _transform_from_vo_to_response_model(
+        self, study_uid, specific_selection, **_kwargs
+    ):
+        return specific_selection.study_selection_uid
+
+
+class BatchOutput(SimpleNamespace):
+    model_construct = classmethod(lambda cls, **kwargs: cls(**kwargs))
+
+
+def create_input(activity_name: str, subgroup: str):
+    return StudySelectionActivityCreateInput(
+        soa_group_term_uid="CTTerm_000001",
+        activity_uid=activity_name,
+        activity_subgroup_uid=subgroup,
+        activity_group_uid="ActivityGroup_000001",
+    )
+
+
+def test_make_selections_in_bulk():
+    service = MockStudyActivitySelectionService()
+    groupings = mock.patch.object(
+        service,
+        "_get_or_create_study_activity_groupings",
+        wraps=service._get_or_create_study_activity_groupings,
+    )
+
+    with groupings as get_or_create_groupings:
+        results = service.make_selections_in_bulk(
+            STUDY_UID,
+            [
+                create_input("Height", "A"),
+                create_input("Weight", "A"),
+                create_input("Pulse", "B"),
+                create_input("Temperature", "A"),
+            ],
+        )
+
+    assert results[0] == "StudyActivity_000002"
+    assert isinstance(results[1], AlreadyExistsException)
+    assert results[2:] == ["StudyActivity_000004", "StudyActivity_000005"]
+    # Groupings are only looked up once per distinct grouping
+    assert get_or_create_groupings.call_count == 2
+
+    service.repository_mock.save_new_selections.assert_called_once()
+    saved = service.repository_mock.save_new_selections.call_args.kwargs["selections"]
+    assert [(order, selection.study_selection_uid) for order, selection in saved] == [
+        (2, "StudyActivity_000002"),
+        (3, "StudyActivity_000005"),
+        (1, "StudyActivity_000004"),
+    ]
+    # The StudyActivity already selected is not written again
+    service.repository_mock.save.assert_not_called()
+
+
+@pytest.mark.parametrize("bulk_write_enabled", [True, False])
+def test_batch_operations_keep_their_order(bulk_write_enabled):
+    service = MockStudyActivitySelectionService()
+    operations = [
+        StudySelectionActivityBatchInput(
+            method="POST", content=create_input("Height", "A")
+        ),
+        StudySelectionActivityBatchInput(
+            method="DELETE", content={"study_activity_uid": "StudyActivity_000001"}
+        ),
+        StudySelectionActivityBatchInput(
+            method="POST", content=create_input("Pulse", "A")
+        ),
+    ]
+
+    with mock.patch.object(
+        config, "STUDY_SELECTION_BULK_WRITE_ENABLED", bulk_write_enabled
+    ), mock.patch.object(
+        service, "make_selection", side_effect=lambda _, item: item.activity_uid
+    ), mock.patch.object(
+        service, "delete_selection"
+    ) as delete_selection, mock.patch.object(
+        study_activity_selection, "StudySoAFootnoteService"
+    ) as footnote_service, mock.patch.object(
+        study_activity_selection, "StudySelectionActivityBatchOutput", BatchOutput
+    ):
+        results = service.handle_batch_operations.__wrapped__(
+            service, STUDY_UID, operations
+        )
+
+    assert [result.response_code for result in results] == [201, 204, 201]
+    delete_selection.assert_called_once_with(STUDY_UID, "StudyActivity_000001")
+    footnote_service.return_value.synchronize_footnotes.assert_called_once()
+    if bulk_write_enabled:
+        # Creations before and after the deletion are written separately
+        assert service.repository_mock.save_new_selections.call_count == 2
+    else:
+        service.repository_mock.save_new_selections.assert_not_called()
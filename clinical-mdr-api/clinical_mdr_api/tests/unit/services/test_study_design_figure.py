@@ -1,5 +1,8 @@
 import datetime
 from collections import OrderedDict
+from unittest import mock
+
+from PIL import ImageFont
 
 from clinical_mdr_api.models.controlled_terminologies.ct_term import CTTermName
 from clinical_mdr_api.models.study_selections.study import StudySoaPreferences
@@ -10,6 +13,7 @@ from clinical_mdr_api.models.study_selections.study_selection import (
     StudySelectionElement,
 )
 from clinical_mdr_api.models.study_selections.study_visit import StudyVisit
+from clinical_mdr_api.services.studies import study_design_figure
 from clinical_mdr_api.services.studies.study_design_figure import (
     StudyDesignFigureService,
 )
@@ -2471,3 +2475,30 @@ def test_get_svg_document():
     assert "markerWidth" in doc, '"markerWidth" found, missing arrowhead markers?'
 
     assert doc == SVG_DOCUMENT
+
+
+def test_font_is_shared_and_text_sizes_are_cached():
+    assert MockStudyDesignFigureService().font is StudyDesignFigureService().font
+
+    # Figure measuring each text with the font, without cache
+    with mock.patch.object(
+        StudyDesignFigureService,
+        "_get_text_size_px",
+        lambda self, text: self.font.getbbox(text)[2:4],
+    ):
+        expected = MockStudyDesignFigureService().get_svg_document("")
+
+    study_design_figure._measure_text.cache_clear()
+    with mock.patch.object(
+        ImageFont.FreeTypeFont,
+        "getbbox",
+        autospec=True,
+        side_effect=ImageFont.FreeTypeFont.getbbox,
+    ) as getbbox:
+        assert MockStudyDesignFigureService().get_svg_document("") == expected
+        measured = getbbox.call_count
+        assert measured > 0
+
+        # Rendering the figure again measures no text at all
+        assert MockStudyDesignFigureService().get_svg_document("") == expected
+        assert getbbox.call_count == measured
@@ -7,6 +7,8 @@ import pytest
 from pydantic import BaseModel
 
 from clinical_mdr_api.domain_repositories.study_selections.study_soa_repository import (
+    AuditTrailStamp,
+    DraftSoAVersion,
     SoALayout,
 )
 from clinical_mdr_api.domains.study_selections.study_selection_base import SoAItemType
@@ -798,3 +800,153 @@ def test_add_protocol_section_column(test_table, expected_table):
     table = deepcopy(test_table)
     StudyFlowchartService.add_protocol_section_column(table)
     assert table.dict() == expected_table.dict()
+
+
+class FakeStudySoARepository:
+    def __init__(self):
+        self.draft_tables = {}
+        self.version = DraftSoAVersion(
+            AuditTrailStamp(action_count=1, last_action_date=1), library_date=1
+        )
+        self.changes = []
+        self.schedules = []
+
+    # pylint: disable=unused-argument
+    def get_draft_soa_version(self, study_uid):
+        return self.version
+
+    def load_draft_table(self, study_uid, layout, time_unit):
+        return self.draft_tables.get((layout, time_unit))
+
+    def save_draft_table(self, study_uid, layout, time_unit, draft_table):
+        self.draft_tables[(layout, time_unit)] = draft_table
+
+    def get_activity_schedule_changes(self, study_uid, since, until):
+        return self.changes
+
+    def get_activity_schedules_of_activities(self, study_uid, study_activity_uids):
+        return {
+            (
+                sas.study_activity_uid,
+                sas.study_visit_uid,
+            ): sas.study_activity_schedule_uid
+            for sas in self.schedules
+            if sas.study_activity_uid in study_activity_uids
+        }
+
+
+class MockDraftStudyFlowchartService(MockStudyFlowchartService):
+    def __init__(self, schedules):
+        super().__init__()
+        self._repository = FakeStudySoARepository()
+        self._repository.schedules = schedules
+        self.builds = 0
+
+    def _get_study_activity_schedules(self, *_args, **_kwargs):
+        return self._repository.schedules
+
+    def build_flowchart_table(self, *args, **kwargs):
+        self.builds += 1
+        return super().build_flowchart_table(*args, **kwargs)
+
+    def get_draft_table(self):
+        return self.get_draft_flowchart_table(
+            study_uid="", layout=SoALayout.DETAILED, time_unit="day"
+        )
+
+
+def get_schedule_without_footnotes():
+    """Returns a StudyActivitySchedule shown in the detailed SoA and not referenced by footnotes"""
+
+    referenced_uids = {
+        item.item_uid for footnote in FOOTNOTES for item in footnote.referenced_items
+    }
+    shown_uids = {
+        ref.uid
+        for row in DETAILED_SOA_TABLE.rows
+        for cell in row.cells
+        for ref in cell.refs or []
+    }
+    return next(
+        sas
+        for sas in STUDY_ACTIVITY_SCHEDULES
+        if sas.study_activity_schedule_uid in shown_uids
+        and sas.study_activity_schedule_uid not in referenced_uids
+    )
+
+
+def test_draft_flowchart_table_is_built_once():
+    service = MockDraftStudyFlowchartService(STUDY_ACTIVITY_SCHEDULES)
+
+    tables = [service.get_draft_table() for _ in range(3)]
+
+    assert service.builds == 1
+    for table in tables:
+        assert table.model_dump() == DETAILED_SOA_TABLE.model_dump()
+
+
+@pytest.mark.parametrize("added", [True, False])
+def test_draft_flowchart_table_is_updated_on_schedule_changes(added):
+    schedule = get_schedule_without_footnotes()
+    other_schedules = [sas for sas in STUDY_ACTIVITY_SCHEDULES if sas != schedule]
+    schedules_before, schedules_after = (
+        (other_schedules, STUDY_ACTIVITY_SCHEDULES)
+        if added
+        else (STUDY_ACTIVITY_SCHEDULES, other_schedules)
+    )
+    service = MockDraftStudyFlowchartService(schedules_before)
+    service.get_draft_table()
+
+    # WHEN a check-box is clicked
+    service._repository.schedules = schedules_after
+    service._repository.version = DraftSoAVersion(
+        AuditTrailStamp(action_count=2, last_action_date=2), library_date=1
+    )
+    service._repository.changes = [
+        (schedule.study_activity_uid, schedule.study_visit_uid)
+    ]
+    table = service.get_draft_table()
+
+    # THEN the table is updated without being rebuilt
+    assert service.builds == 1
+    expected_table = MockDraftStudyFlowchartService(schedules_after).get_draft_table()
+    assert table.model_dump() == expected_table.model_dump()
+    assert (
+        service._repository.draft_tables[(SoALayout.DETAILED, "day")].version
+        == service._repository.version
+    )
+
+
+def test_draft_flowchart_table_is_rebuilt_on_other_changes():
+    service = MockDraftStudyFlowchartService(STUDY_ACTIVITY_SCHEDULES)
+    service.get_draft_table()
+
+    service._repository.version = DraftSoAVersion(
+        AuditTrailStamp(action_count=2, last_action_date=2), library_date=1
+    )
+    service._repository.changes = None
+    service.get_draft_table()
+
+    assert service.builds == 2
+
+
+def test_draft_flowchart_table_is_rebuilt_on_library_changes():
+    schedule = get_schedule_without_footnotes()
+    service = MockDraftStudyFlowchartService(STUDY_ACTIVITY_SCHEDULES)
+    service.get_draft_table()
+
+    # WHEN a check-box is clicked and a library item is changed
+    service._repository.version = DraftSoAVersion(
+        AuditTrailStamp(action_count=2, last_action_date=2), library_date=2
+    )
+    service._repository.changes = [
+        (schedule.study_activity_uid, schedule.study_visit_uid)
+    ]
+    service.get_draft_table()
+
+    # THEN the table is rebuilt
+    assert service.builds == 2
+
+    # AND the rebuilt table is served until the next change
+    service.get_draft_table()
+    assert service.builds == 2
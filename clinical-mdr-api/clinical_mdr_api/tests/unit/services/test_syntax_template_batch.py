@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from neomodel import db
+
+from clinical_mdr_api.domains.versioned_object_aggregate import LibraryItemStatus
+from clinical_mdr_api.models.syntax_templates.timeframe_template import (
+    TimeframeTemplateCreateInput,
+)
+from clinical_mdr_api.services.syntax_templates.timeframe_templates import (
+    TimeframeTemplateService,
+)
+from common.exceptions import AlreadyExistsException, BusinessLogicException
+
+
+def template_item(name: str, status: LibraryItemStatus) -> SimpleNamespace:
+    return SimpleNamespace(
+        uid=f"TimeframeTemplate_{name}",
+        item_metadata=SimpleNamespace(status=status),
+    )
+
+
+@pytest.fixture(name="service")
+def fixture_service():
+    with mock.patch.object(TimeframeTemplateService, "__init__", return_value=None):
+        service = TimeframeTemplateService()
+
+    def create(template):
+        if template.name == "Existing":
+            raise AlreadyExistsException(msg="Template already exists.")
+        if template.name == "Approved":
+            return template_item(template.name, LibraryItemStatus.FINAL)
+        return template_item(template.name, LibraryItemStatus.DRAFT)
+
+    def approve(uid):
+        if uid == "TimeframeTemplate_Locked":
+            raise BusinessLogicException(msg="The library doesn't allow to approve.")
+        return SimpleNamespace(uid=uid, status="Final")
+
+    # Each template is created in its own transaction
+    with (
+        mock.patch.object(db, "driver", mock.Mock()),
+        mock.patch.object(db, "begin"),
+        mock.patch.object(db, "commit"),
+        mock.patch.object(db, "rollback"),
+        mock.patch.object(service, "authorize_user_defined_syntax_write"),
+        mock.patch.object(service, "non_transactional_create", side_effect=create),
+        mock.patch.object(service, "non_transactional_approve", side_effect=approve),
+        mock.patch.object(
+            service,
+            "_transform_aggregate_root_to_pydantic_model",
+            side_effect=lambda item: SimpleNamespace(
+                uid=item.uid, status=item.item_metadata.status.value
+            ),
+        ),
+    ):
+        yield service
+
+
+def test_create_batch_and_approve(service):
+    results = service.create_batch(
+        [
+            TimeframeTemplateCreateInput(name=name, library_name="Sponsor")
+            for name in ["Alive", "Existing", "Approved", "Locked"]
+        ],
+        approve=True,
+    )
+
+    assert [result.response_code for result in results] == [201, 409, 201, 400]
+    assert results[0].content == SimpleNamespace(
+        uid="TimeframeTemplate_Alive", status="Final"
+    )
+    assert results[1].content.message == "Template already exists."
+    # The existing 'User Defined' template is returned as it is
+    assert results[2].content == SimpleNamespace(
+        uid="TimeframeTemplate_Approved", status="Final"
+    )
+    # The template that can't be approved is rolled back with its approval
+    assert results[3].content.message == "The library doesn't allow to approve."
+    assert db.commit.call_count == 2
+    assert db.rollback.call_count == 2
+    service.non_transactional_approve.assert_has_calls(
+        [mock.call("TimeframeTemplate_Alive"), mock.call("TimeframeTemplate_Locked")]
+    )
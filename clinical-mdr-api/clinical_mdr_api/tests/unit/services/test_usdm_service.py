@@ -0,0 +1,136 @@
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+
+from usdm_info import __model_version__ as usdm_package_version
+from usdm_model import (
+    Code,
+    Study,
+    StudyArm,
+    StudyDesign,
+    StudyDesignPopulation,
+    StudyTitle,
+    StudyVersion,
+)
+
+from clinical_mdr_api.models.utils import iter_json, json_response
+from clinical_mdr_api.services.ddf.usdm_mapper import OSBStudyComponents, USDMMapper
+from clinical_mdr_api.services.ddf.usdm_service import USDMService
+
+STUDY_UID = "Study_000001"
+
+
+def paginated(*items):
+    return SimpleNamespace(items=list(items))
+
+
+def code(code_id: str) -> Code:
+    return Code(
+        id=code_id,
+        code="C123",
+        codeSystem="CDISC",
+        codeSystemVersion="2024-01-01",
+        decode="Ångström",
+        instanceType="Code",
+    )
+
+
+def test_study_and_components_are_loaded_together():
+    getters = {
+        "get_osb_study_design_cells": mock.Mock(return_value=["design cell"]),
+        "get_osb_study_arms": mock.Mock(return_value=paginated("arm")),
+        "get_osb_study_epochs": mock.Mock(return_value=paginated("epoch")),
+        "get_osb_study_elements": mock.Mock(return_value=paginated("element")),
+        "get_osb_study_endpoints": mock.Mock(return_value=paginated("endpoint")),
+        "get_osb_study_visits": mock.Mock(return_value=paginated("visit")),
+        "get_osb_study_activities": mock.Mock(return_value=paginated("activity")),
+        "get_osb_activity_schedules": mock.Mock(return_value=["schedule"]),
+    }
+    get_osb_study = mock.Mock(return_value="study")
+
+    study, components = USDMMapper(**getters).load_study_and_components(
+        STUDY_UID, get_osb_study
+    )
+
+    assert study == "study"
+    assert components == OSBStudyComponents(
+        design_cells=["design cell"],
+        arms=["arm"],
+        epochs=["epoch"],
+        elements=["element"],
+        endpoints=["endpoint"],
+        visits=["visit"],
+        activities=["activity"],
+        activity_schedules=["schedule"],
+    )
+    get_osb_study.assert_called_once_with(STUDY_UID)
+    getters["get_osb_study_endpoints"].assert_called_once_with(
+        STUDY_UID, no_brackets=True
+    )
+    for name, getter in getters.items():
+        if name != "get_osb_study_endpoints":
+            getter.assert_called_once_with(STUDY_UID)
+
+
+def test_streamed_usdm_study_matches_json_response():
+    study_design = StudyDesign(
+        id="StudyDesign_1",
+        name="Study Design  1",
+        arms=[
+            StudyArm(
+                id=f"StudyArm_{idx}",
+                name=f"Arm {idx}",
+                type=code(f"Code_{idx}"),
+                dataOriginDescription="",
+                dataOriginType=code(f"Code_origin_{idx}"),
+                instanceType="StudyArm",
+            )
+            for idx in range(3)
+        ],
+        studyCells=[],
+        rationale="",
+        epochs=[],
+        population=StudyDesignPopulation(
+            id="StudyDesignPopulation_1",
+            name="Population",
+            includesHealthySubjects=True,
+            instanceType="StudyDesignPopulation",
+        ),
+        instanceType="StudyDesign",
+    )
+    study = Study(
+        id=uuid.uuid4(),
+        name="Study",
+        versions=[
+            StudyVersion(
+                id="StudyVersion_1",
+                versionIdentifier="1",
+                rationale="",
+                studyIdentifiers=[],
+                titles=[
+                    StudyTitle(
+                        id="StudyTitle_1",
+                        text="Title",
+                        type=code("Code_title"),
+                        instanceType="StudyTitle",
+                    )
+                ],
+                instanceType="StudyVersion",
+            )
+        ],
+        instanceType="Study",
+    )
+    # As in USDMMapper.map, the study design is set after the study version is created
+    study.versions[0].studyDesigns = [study_design]
+    content = {
+        "study": study,
+        "usdmVersion": usdm_package_version,
+        "systemName": None,
+        "systemVersion": None,
+    }
+
+    chunks = list(iter_json(content, nested_fields=USDMService.STREAMED_SECTIONS))
+
+    assert b"".join(chunks) == json_response(content).body
+    # The arms of the study design are streamed on their own
+    assert any(chunk.startswith(b',"arms":[') for chunk in chunks)
@@ -0,0 +1,116 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from starlette_context import request_cycle_context
+
+from clinical_mdr_api.domain_repositories.user_repository import UserRepository
+from clinical_mdr_api.models.user import UserInfo
+from clinical_mdr_api.services import user_info
+from clinical_mdr_api.services.user_info import UserInfoService, UsernameMap
+
+
+def user(user_id: str, username: str | None) -> UserInfo:
+    return UserInfo(
+        user_id=user_id,
+        username=username,
+        name="",
+        email="",
+        azp=None,
+        oid=user_id,
+        roles=[],
+        created=datetime.now(),
+        updated=None,
+    )
+
+
+class TestAuthorUsernameResolution(unittest.TestCase):
+    def setUp(self):
+        self.users = {"id_1": "alice", "id_2": "bob", "id_3": None}
+        self.get_all_usernames = self.patch_repo(
+            "get_all_usernames", side_effect=lambda: dict(self.users)
+        )
+        self.get_users_by_ids = self.patch_repo(
+            "get_users_by_ids",
+            side_effect=lambda ids: [
+                user(uid, self.users[uid]) for uid in ids if uid in self.users
+            ],
+        )
+        self.get_user = self.patch_repo(
+            "get_user", side_effect=lambda uid: user(uid, self.users.get(uid))
+        )
+
+    def patch_repo(self, method: str, **kwargs) -> mock.Mock:
+        patcher = mock.patch.object(UserRepository, method, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def use_username_map(self, refresh_interval: int) -> UsernameMap:
+        username_map = UsernameMap(refresh_interval)
+        self.addCleanup(username_map.stop)
+        patcher = mock.patch.object(user_info, "username_map", username_map)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        return username_map
+
+    def test_usernames_are_read_from_process_map(self):
+        self.use_username_map(refresh_interval=3600)
+
+        usernames = [
+            UserInfoService.get_author_username_from_id(user_id)
+            for user_id in ["id_1", "id_2", "id_3", "id_1"] * 10
+        ]
+
+        self.assertEqual(usernames[:4], ["alice", "bob", "id_3", "alice"])
+        self.get_all_usernames.assert_called_once()
+        self.get_users_by_ids.assert_not_called()
+        self.get_user.assert_not_called()
+
+    def test_forgotten_username_is_resolved_again(self):
+        username_map = self.use_username_map(refresh_interval=3600)
+        self.assertEqual(UserInfoService.get_author_username_from_id("id_1"), "alice")
+
+        self.users["id_1"] = "alice.smith"
+        UserInfoService.forget_username("id_1")
+
+        self.assertNotIn("id_1", username_map.usernames)
+        self.assertEqual(
+            UserInfoService.get_author_username_from_id("id_1"), "alice.smith"
+        )
+
+    def test_prefetched_authors_are_resolved_in_one_query(self):
+        self.use_username_map(refresh_interval=0)
+
+        with request_cycle_context({}):
+            UserInfoService.prefetch_author_usernames(["id_1", "id_2", None, "id_4"])
+            usernames = [
+                UserInfoService.get_author_username_from_id(user_id)
+                for user_id in ["id_1", "id_2", "id_4", "id_1"]
+            ]
+
+        self.assertEqual(usernames, ["alice", "bob", "id_4", "alice"])
+        self.get_users_by_ids.assert_called_once()
+        self.assertCountEqual(
+            self.get_users_by_ids.call_args.args[0], ["id_1", "id_2", "id_4"]
+        )
+        self.get_user.assert_not_called()
+
+    def test_new_users_missing_from_process_map_are_added_to_it(self):
+        username_map = self.use_username_map(refresh_interval=3600)
+        username_map.lookup("id_1")
+        self.users["id_5"] = "eve"
+
+        with request_cycle_context({}):
+            UserInfoService.prefetch_author_usernames(["id_1", "id_5"])
+            self.assertEqual(UserInfoService.get_author_username_from_id("id_5"), "eve")
+
+        self.get_users_by_ids.assert_called_once_with(["id_5"])
+        self.assertEqual(username_map.usernames["id_5"], "eve")
+
+    def test_usernames_are_resolved_one_by_one_outside_of_request(self):
+        self.use_username_map(refresh_interval=0)
+
+        self.assertEqual(UserInfoService.get_author_username_from_id("id_2"), "bob")
+        self.assertIsNone(UserInfoService.get_author_username_from_id(None))
+
+        self.get_user.assert_called_once_with("id_2")
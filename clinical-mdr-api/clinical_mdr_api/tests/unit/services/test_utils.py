@@ -1,8 +1,11 @@
+import threading
+import time
 import unittest
 import uuid
 from unittest import mock
 
 from parameterized import parameterized
+from starlette_context import context, request_cycle_context
 
 from clinical_mdr_api.models.utils import BaseModel
 from clinical_mdr_api.repositories._utils import ComparisonOperator, FilterOperator
@@ -266,3 +269,59 @@ class TestServiceUtils(unittest.TestCase):
             item, filter_key, filter_values, filter_operator
         )
         assert out == expected
+
+
+class TestRunConcurrently(unittest.TestCase):
+    def test_calls_run_concurrently_and_results_are_in_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def call(value):
+            barrier.wait()
+            return value
+
+        results = _utils.run_concurrently(
+            lambda: call(1), lambda: call(2), lambda: call(3)
+        )
+
+        self.assertEqual(results, [1, 2, 3])
+
+    def test_calls_run_in_context_of_caller(self):
+        with request_cycle_context({"user": "user_1"}):
+            results = _utils.run_concurrently(
+                lambda: context.get("user"), lambda: context.get("user")
+            )
+
+        self.assertEqual(results, ["user_1", "user_1"])
+
+    def test_exception_of_first_failed_call_is_raised(self):
+        def fail(exception, delay=0.0):
+            time.sleep(delay)
+            raise exception
+
+        with self.assertRaises(KeyError):
+            _utils.run_concurrently(
+                lambda: fail(KeyError(), delay=0.05), lambda: fail(ValueError())
+            )
+
+    def test_calls_run_sequentially_in_active_transaction(self):
+        threads = []
+
+        with mock.patch.object(
+            _utils.neomodel.sync_.core.db, "_active_transaction", object(), create=True
+        ):
+            _utils.run_concurrently(
+                lambda: threads.append(threading.current_thread()),
+                lambda: threads.append(threading.current_thread()),
+            )
+
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+
+    def test_nested_calls_run_sequentially(self):
+        results = _utils.run_concurrently(
+            lambda: _utils.run_concurrently(
+                threading.current_thread, threading.current_thread
+            ),
+            lambda: None,
+        )
+
+        self.assertEqual(len(set(results[0])), 1)
@@ -36,6 +36,16 @@ NUMBER_OF_UID_DIGITS = 6
 
 CACHE_MAX_SIZE = int(environ.get("CACHE_MAX_SIZE", 1000))
 CACHE_TTL = int(environ.get("CACHE_TTL", 3600))
+# Transport used to broadcast repository cache invalidations to all workers: "local" or "redis"
+CACHE_INVALIDATION_BACKEND = environ.get("CACHE_INVALIDATION_BACKEND", "local")
+CACHE_INVALIDATION_REDIS_URL = environ.get(
+    "CACHE_INVALIDATION_REDIS_URL", "redis://localhost:6379/0"
+)
+CACHE_INVALIDATION_CHANNEL = environ.get(
+    "CACHE_INVALIDATION_CHANNEL", "clinical-mdr-api:cache-invalidation"
+)
+# Interval of the background refresh of the process-wide map of usernames, 0 disables the map
+USERNAME_MAP_REFRESH_SECS = int(environ.get("USERNAME_MAP_REFRESH_SECS", 60))
 
 MAX_INT_NEO4J = 9223372036854775807
 DEFAULT_PAGE_NUMBER = 1
@@ -51,6 +61,12 @@ FIXED_WEEK_PERIOD = 7
 
 OPERATIONAL_SOA_DOCX_TEMPLATE = "operational-soa-template.docx"
 XML_STYLESHEET_DIR_PATH = "xml_stylesheets/"
+# Number of compiled XML stylesheets kept in memory for ODM PDF exports
+XML_STYLESHEET_CACHE_MAX_SIZE = int(environ.get("XML_STYLESHEET_CACHE_MAX_SIZE", "32"))
+# Number of text sizes (labels, words and partial lines) kept in memory for study design figures
+STUDY_DESIGN_FIGURE_TEXT_SIZE_CACHE_MAX_SIZE = int(
+    environ.get("STUDY_DESIGN_FIGURE_TEXT_SIZE_CACHE_MAX_SIZE", "16384")
+)
 
 SDTM_CT_CATALOGUE_NAME = "SDTM CT"
 ADAM_CT_CATALOGUE_NAME = "ADAM CT"
@@ -161,3 +177,66 @@ ALLOW_CREDENTIALS = environ.get("ALLOW_CREDENTIALS", "true").upper().strip() not
 ALLOW_METHODS = environ.get("ALLOW_METHODS", "*").split(",")
 ALLOW_HEADERS = environ.get("ALLOW_HEADERS", "*").split(",")
 SLOW_QUERY_TIME_SECS = 1
+
+# Cache of responses for reads of locked or released study versions, see clinical_mdr_api/routers/study_version_cache.py
+STUDY_VERSION_CACHE_ENABLED = environ.get(
+    "STUDY_VERSION_CACHE_ENABLED", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+# In-memory budget of the cached responses, in bytes
+STUDY_VERSION_CACHE_MAX_MEMORY_BYTES = int(
+    environ.get("STUDY_VERSION_CACHE_MAX_MEMORY_BYTES", str(256 * 1024**2))
+)
+STUDY_VERSION_CACHE_DIR = environ.get("STUDY_VERSION_CACHE_DIR")
+STUDY_VERSION_CACHE_MAX_DISK_BYTES = int(
+    environ.get("STUDY_VERSION_CACHE_MAX_DISK_BYTES", str(1024**3))
+)
+
+# Maximum number of blocking database calls that the consumer API runs concurrently per worker
+CONSUMER_API_DB_CONCURRENCY = int(environ.get("CONSUMER_API_DB_CONCURRENCY", "10"))
+
+# In-memory cache of SoA tables of the latest draft of studies, see StudyFlowchartService.get_draft_flowchart_table
+SOA_DRAFT_TABLE_ENABLED = environ.get(
+    "SOA_DRAFT_TABLE_ENABLED", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+SOA_DRAFT_TABLE_CACHE_MAX_BYTES = int(
+    environ.get("SOA_DRAFT_TABLE_CACHE_MAX_BYTES", str(128 * 1024**2))
+)
+
+# Wildcard filters with the 'search' operator are resolved through Neo4j full-text indexes, see FULLTEXT_INDEXES in db_schema.py
+FULLTEXT_SEARCH_ENABLED = environ.get(
+    "FULLTEXT_SEARCH_ENABLED", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+
+# Paginated queries of CypherQueryBuilder return the page and the total count in a single query
+SINGLE_QUERY_TOTAL_COUNT_ENABLED = environ.get(
+    "SINGLE_QUERY_TOTAL_COUNT_ENABLED", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+
+# Unfiltered total counts are read from the count store of the listed label, which may differ from the exact count
+ESTIMATED_TOTAL_COUNT_ENABLED = environ.get(
+    "ESTIMATED_TOTAL_COUNT_ENABLED", "false"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+
+# Maximum number of independent read queries run concurrently by a single request, e.g. when building a SoA, 1 disables it
+DB_READ_CONCURRENCY = int(environ.get("DB_READ_CONCURRENCY", "4"))
+
+# Study activities created by batch operations are validated together and persisted with a single query
+STUDY_SELECTION_BULK_WRITE_ENABLED = environ.get(
+    "STUDY_SELECTION_BULK_WRITE_ENABLED", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+
+# Changes between two CDISC CT packages are computed once and persisted, see CTPackageService.get_ct_packages_changes
+CT_PACKAGE_CHANGES_PERSISTED_ENABLED = environ.get(
+    "CT_PACKAGE_CHANGES_PERSISTED_ENABLED", "true"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
+
+# Maximum number of library items created, and optionally approved, by a single batch request
+LIBRARY_ITEM_BATCH_MAX_ITEMS = int(environ.get("LIBRARY_ITEM_BATCH_MAX_ITEMS", "1000"))
+
+# Number of definitions of an imported ODM XML file which are stored, and by default committed, together
+ODM_XML_IMPORT_BATCH_SIZE = int(environ.get("ODM_XML_IMPORT_BATCH_SIZE", "500"))
+
+# JSON responses are serialized by pydantic-core instead of the standard library json module
+FAST_JSON_RESPONSE_ENABLED = environ.get(
+    "FAST_JSON_RESPONSE_ENABLED", "false"
+).upper().strip() not in (_UPPERCASE_FALSE_STRINGS)
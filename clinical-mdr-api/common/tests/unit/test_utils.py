@@ -1,7 +1,17 @@
+from datetime import datetime, timezone
+
+import neo4j.time
 import pytest
 
 from common import config, exceptions
-from common.utils import load_env, strtobool, validate_page_number_and_page_size
+from common.utils import (
+    build_keyset_predicate,
+    decode_page_token,
+    encode_page_token,
+    load_env,
+    strtobool,
+    validate_page_number_and_page_size,
+)
 
 
 def test_strtobool():
@@ -50,6 +60,91 @@ def test_validate_page_number_and_page_size_negative(page_number, page_size):
     )
 
 
+def test_page_token():
+    start_date = neo4j.time.DateTime(
+        2024, 1, 2, 3, 4, 5, 123456789, tzinfo=timezone.utc
+    )
+    page_token = encode_page_token(
+        "name:asc", ["Weight", 1.5, None, start_date, "Activity_000001"]
+    )
+
+    assert page_token.isascii() and "=" not in page_token
+    assert decode_page_token(page_token, "name:asc", 5) == [
+        "Weight",
+        1.5,
+        None,
+        {"datetime": "2024-01-02T03:04:05.123456789+00:00"},
+        "Activity_000001",
+    ]
+    assert decode_page_token(
+        encode_page_token("uid:desc", [datetime(2024, 1, 2, tzinfo=timezone.utc)]),
+        "uid:desc",
+        1,
+    ) == [{"datetime": "2024-01-02T00:00:00+00:00"}]
+
+
+@pytest.mark.parametrize(
+    "page_token, sort_signature, length",
+    [
+        ["invalid", "name:asc", 2],
+        ["", "name:asc", 2],
+        [encode_page_token("name:asc", ["a", "b"]), "name:desc", 2],
+        [encode_page_token("name:asc", ["a", "b"]), "name:asc", 3],
+    ],
+)
+def test_decode_page_token_negative(page_token, sort_signature, length):
+    with pytest.raises(exceptions.ValidationException) as exc_info:
+        decode_page_token(page_token, sort_signature, length)
+    assert (
+        str(exc_info.value)
+        == "Invalid page_token, it does not match the requested sorting."
+    )
+
+
+def test_build_keyset_predicate():
+    predicate, params = build_keyset_predicate(
+        [("value.name", True), ("root.uid", True)], ["Weight", "Activity_000001"]
+    )
+    assert predicate == (
+        "(((value.name > $page_key_0 OR value.name IS NULL))"
+        " OR (value.name = $page_key_0 AND (root.uid > $page_key_1 OR root.uid IS NULL)))"
+    )
+    assert params == {"page_key_0": "Weight", "page_key_1": "Activity_000001"}
+
+    predicate, params = build_keyset_predicate(
+        [("ver_rel.start_date", False), ("root.uid", False)],
+        [{"datetime": "2024-01-02T00:00:00+00:00"}, "Activity_000001"],
+    )
+    assert predicate == (
+        "((ver_rel.start_date < datetime($page_key_0))"
+        " OR (ver_rel.start_date = datetime($page_key_0) AND root.uid < $page_key_1))"
+    )
+    assert params == {
+        "page_key_0": "2024-01-02T00:00:00+00:00",
+        "page_key_1": "Activity_000001",
+    }
+
+
+def test_build_keyset_predicate_with_null_sort_value():
+    # Null values are sorted last in ascending order
+    predicate, params = build_keyset_predicate(
+        [("value.name", True), ("root.uid", True)], [None, "Activity_000001"]
+    )
+    assert predicate == (
+        "((value.name IS NULL AND (root.uid > $page_key_1 OR root.uid IS NULL)))"
+    )
+    assert params == {"page_key_1": "Activity_000001"}
+
+    # Null values are sorted first in descending order
+    predicate, _ = build_keyset_predicate(
+        [("value.name", False), ("root.uid", False)], [None, "Activity_000001"]
+    )
+    assert predicate == (
+        "((value.name IS NOT NULL)"
+        " OR (value.name IS NULL AND root.uid < $page_key_1))"
+    )
+
+
 def test_load_env():
     env_var1 = load_env("VAR1", "value1")
     assert env_var1 == "value1"
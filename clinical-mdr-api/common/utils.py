@@ -1,4 +1,6 @@
+import base64
 import datetime
+import json
 import logging
 import os
 from datetime import datetime
@@ -97,6 +99,104 @@ def validate_max_skip_clause(page_number: int, page_size: int) -> None:
     )
 
 
+def encode_page_token(sort_signature: str, sort_values: list[Any]) -> str:
+    """
+    Encodes the sort key values of the last item of a page into an opaque page token.
+
+    Args:
+        sort_signature (str): Identifies the sorting the token was created for, e.g. `name:asc`.
+        sort_values (list[Any]): Values of the sort keys of the last item, ending with a unique key.
+
+    Returns:
+        str: URL-safe page token.
+    """
+    values = [
+        (
+            {"datetime": value.isoformat()}
+            if isinstance(value, (datetime, neo4j.time.DateTime))
+            else value
+        )
+        for value in sort_values
+    ]
+    payload = json.dumps({"s": sort_signature, "k": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_page_token(page_token: str, sort_signature: str, length: int) -> list[Any]:
+    """
+    Decodes a page token created by `encode_page_token` for the same sorting.
+
+    Datetime values are returned as `{"datetime": "<ISO 8601 string>"}` dictionaries,
+    which `build_keyset_predicate` converts back to Cypher datetimes.
+
+    Raises:
+        ValidationException: If the page token is malformed or was created for another sorting.
+    """
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(page_token + "=" * (-len(page_token) % 4))
+        )
+        sort_values = payload["k"]
+        valid = (
+            payload["s"] == sort_signature
+            and isinstance(sort_values, list)
+            and len(sort_values) == length
+        )
+    except (ValueError, TypeError, KeyError):
+        valid = False
+    ValidationException.raise_if_not(
+        valid, msg="Invalid page_token, it does not match the requested sorting."
+    )
+    return sort_values
+
+
+def build_keyset_predicate(
+    sort_keys: list[tuple[str, bool]],
+    sort_values: list[Any],
+    param_prefix: str = "page_key",
+) -> tuple[str, dict[str, Any]]:
+    """
+    Builds the Cypher predicate matching the rows sorted after a given row, for keyset pagination.
+
+    Rows are expected to be sorted by `ORDER BY` on the given keys, which puts null values
+    last in ascending order and first in descending order.
+
+    Args:
+        sort_keys (list[tuple[str, bool]]): Cypher expressions of the sort keys with their ascending flag.
+            The last key must be unique, e.g. the uid, so that rows never tie.
+        sort_values (list[Any]): Values of the sort keys of the last row of the previous page, see `decode_page_token`.
+        param_prefix (str): Prefix of the names of the returned query parameters.
+
+    Returns:
+        tuple[str, dict[str, Any]]: The predicate and its query parameters.
+    """
+    params = {}
+    equal_predicates: list[str] = []
+    predicates = []
+    for idx, ((expression, ascending), value) in enumerate(zip(sort_keys, sort_values)):
+        if value is None:
+            after = None if ascending else f"{expression} IS NOT NULL"
+            equal = f"{expression} IS NULL"
+        else:
+            param = f"${param_prefix}_{idx}"
+            if isinstance(value, dict) and "datetime" in value:
+                params[f"{param_prefix}_{idx}"] = value["datetime"]
+                param = f"datetime({param})"
+            else:
+                params[f"{param_prefix}_{idx}"] = value
+            after = f"{expression} {'>' if ascending else '<'} {param}"
+            if ascending:
+                after = f"({after} OR {expression} IS NULL)"
+            equal = f"{expression} = {param}"
+        if after:
+            predicates.append(" AND ".join(equal_predicates + [after]))
+        equal_predicates.append(equal)
+
+    if not predicates:
+        return "false", params
+    return "(" + " OR ".join(f"({predicate})" for predicate in predicates) + ")", params
+
+
 def load_env(key: str, default: str | None = None):
     value = os.environ.get(key)
     log.info("ENV variable fetched: %s=%s", key, value)
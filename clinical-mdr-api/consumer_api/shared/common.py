@@ -1,16 +1,30 @@
+import asyncio
+import functools
 import logging
 import os
 import urllib.parse
+import weakref
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, TypeVar
 
+import anyio
 from neomodel.sync_.core import db
 
+from common import config
+from common.utils import build_keyset_predicate, decode_page_token, encode_page_token
+
 APP_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
 
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# One capacity limiter per event loop, bounding the number of threads running blocking database calls
+_db_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, anyio.CapacityLimiter
+] = weakref.WeakKeyDictionary()
+
 
 class SortByType(Enum):
     STRING = "string"
@@ -46,6 +60,32 @@ def query(
     return rows, columns
 
 
+def get_db_limiter() -> anyio.CapacityLimiter:
+    """
+    Returns the capacity limiter of the running event loop,
+    which allows at most `config.CONSUMER_API_DB_CONCURRENCY` concurrent blocking database calls.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _db_limiters.get(loop)
+    if limiter is None:
+        limiter = anyio.CapacityLimiter(config.CONSUMER_API_DB_CONCURRENCY)
+        _db_limiters[loop] = limiter
+    return limiter
+
+
+async def run_in_db_threadpool(function: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs a blocking function, e.g. one issuing Cypher queries with `query()`, in a worker thread.
+
+    This keeps the event loop free to serve other requests while the database call is in progress.
+    The number of concurrently running calls is bounded by `get_db_limiter()`,
+    further calls wait for a free thread without blocking the event loop.
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(function, *args, **kwargs), limiter=get_db_limiter()
+    )
+
+
 def urlencode_link(link: str) -> str:
     """URL encodes a link"""
 
@@ -67,13 +107,120 @@ def db_pagination_clause(page_size: int, page_number: int) -> str:
     return f"SKIP {page_number - 1} * {page_size} LIMIT {page_size}"
 
 
+def db_sort_key(sort_by: str, sort_by_type: SortByType = SortByType.STRING) -> str:
+    if sort_by_type == SortByType.NUMBER:
+        return f"toFloat({sort_by})"
+
+    return f"toLower(toString({sort_by}))"
+
+
 def db_sort_clause(
     sort_by: str, sort_order: str = "ASC", sort_by_type: SortByType = SortByType.STRING
 ) -> str:
-    if sort_by_type == SortByType.NUMBER:
-        return f"ORDER BY toFloat({sort_by}) {sort_order}"
+    return f"ORDER BY {db_sort_key(sort_by, sort_by_type)} {sort_order}"
+
+
+def db_paginated_query(
+    base_query: str,
+    sort_by: str,
+    sort_order: str,
+    page_size: int,
+    page_number: int = 1,
+    page_token: str | None = None,
+    sort_by_type: SortByType = SortByType.STRING,
+    unique_key: str = "uid",
+    anchor_match: str | None = None,
+    anchor_key: str | None = None,
+) -> tuple[str, dict]:
+    """
+    Wraps a query returning all items into a query returning a single page of them.
 
-    return f"ORDER BY toLower(toString({sort_by})) {sort_order}"
+    Items are sorted by `sort_by`, then by `unique_key` so that the order is stable.
+    Each returned item has a `_page_key` holding its sort keys, see `get_next_page_token`.
+
+    When `page_token` is provided, the page starts right after the item the token was created from,
+    and `page_number` is ignored.
+
+    `anchor_match` is the first MATCH of the query, followed by `base_query`.
+    When the items are sorted by `unique_key` and `anchor_key` is provided, the page is selected
+    by `anchor_match` on its indexed `anchor_key` property (e.g. `study_root.uid` for `uid`),
+    before `base_query` runs for the items of the page only.
+    The items of the page are then read from the index instead of sorting all items,
+    `base_query` must therefore return exactly one row per row of `anchor_match`.
+    Otherwise the page is selected after sorting all items.
+
+    Returns:
+    tuple[str, dict]: The query and the additional query parameters.
+    """
+    ascending = sort_order.upper() == "ASC"
+    direction = "ASC" if ascending else "DESC"
+    sort_keys = [
+        (db_sort_key(sort_by, sort_by_type), ascending),
+        (unique_key, ascending),
+    ]
+    sort_values = (
+        decode_page_token(page_token, f"{sort_by}:{sort_order}", len(sort_keys))
+        if page_token is not None
+        else None
+    )
+    pagination_clause = (
+        f"LIMIT {page_size}"
+        if page_token is not None
+        else db_pagination_clause(page_size, page_number)
+    )
+
+    params = {}
+    where_clause = ""
+    if anchor_key is not None and sort_by == unique_key:
+        anchor_where_clause = ""
+        if sort_values is not None:
+            anchor_where_clause = (
+                f"WHERE {anchor_key} {'>' if ascending else '<'} $page_cursor"
+            )
+            params["page_cursor"] = sort_values[-1]
+        base_query = f"""
+            {anchor_match}
+            {anchor_where_clause}
+            WITH * ORDER BY {anchor_key} {direction} {pagination_clause}
+            {base_query}
+            """
+        # The page is already selected, the items are only sorted
+        pagination_clause = ""
+    else:
+        if anchor_match is not None:
+            base_query = f"""
+            {anchor_match}
+            {base_query}
+            """
+        if sort_values is not None:
+            predicate, params = build_keyset_predicate(sort_keys, sort_values)
+            where_clause = f"WHERE {predicate}"
+
+    order_by = ", ".join(
+        f"{key} {'ASC' if key_ascending else 'DESC'}"
+        for key, key_ascending in sort_keys
+    )
+    full_query = f"""
+        CALL {{
+            {base_query}
+        }}
+        WITH *, [{", ".join(key for key, _ in sort_keys)}] AS _page_key
+        {where_clause}
+        RETURN * ORDER BY {order_by} {pagination_clause}
+        """
+    return full_query, params
+
+
+def get_next_page_token(
+    items: list[dict], sort_by: str, sort_order: str, page_size: int
+) -> str | None:
+    """
+    Returns the token of the page following the given items returned by a `db_paginated_query`,
+    or None when they are the last page, i.e. fewer than `page_size` items.
+    """
+    if len(items) < page_size:
+        return None
+    return encode_page_token(f"{sort_by}:{sort_order}", items[-1]["_page_key"])
 
 
 def get_api_version() -> str:
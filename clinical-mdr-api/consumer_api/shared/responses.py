@@ -69,6 +69,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
         str, Field(description="Pagination link pointing to the previous page")
     ]
     next: Annotated[str, Field(description="Pagination link pointing to the next page")]
+    next_page_token: Annotated[
+        str | None,
+        Field(
+            description="Token to pass as `page_token` to get the next page, or null when there are no more items",
+            json_schema_extra={"nullable": True},
+        ),
+    ] = None
     items: Annotated[list[T], Field(description="List of items")]
 
     @classmethod
@@ -81,6 +88,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page_number: int,
         items: list[T],
         query_param_names: list[str] | None = None,
+        page_token: str | None = None,
+        next_page_token: str | None = None,
     ) -> Self:
         path = request.url.path
 
@@ -101,11 +110,23 @@ class PaginatedResponse(BaseModel, Generic[T]):
         prev_link = f"{path}?{query_params}sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}&page_number={prev_page_number}"
         next_link = f"{path}?{query_params}sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}&page_number={page_number + 1}"
 
+        # Pages requested by token can only be followed forward, the previous link then points to the first page
+        if page_token is not None:
+            base_link = f"{path}?{query_params}sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}"
+            self_link = f"{base_link}&page_token={page_token}"
+            prev_link = f"{base_link}&page_number=1"
+            next_link = (
+                f"{base_link}&page_token={next_page_token}"
+                if next_page_token
+                else self_link
+            )
+
         # pylint: disable=kwarg-superseded-by-positional-arg
         return cls(
             self=urlencode_link(self_link),
             prev=urlencode_link(prev_link),
             next=urlencode_link(next_link),
+            next_page_token=next_page_token,
             items=items,
         )
 
@@ -131,6 +152,8 @@ class PaginatedResponseWithStudyVersion(PaginatedResponse):
         page_number: int,
         items: list[T],
         query_param_names: list[str] | None = None,
+        page_token: str | None = None,
+        next_page_token: str | None = None,
     ) -> Self:
         it = super().from_input(
             request=request,
@@ -140,6 +163,8 @@ class PaginatedResponseWithStudyVersion(PaginatedResponse):
             page_number=page_number,
             items=items,
             query_param_names=query_param_names,
+            page_token=page_token,
+            next_page_token=next_page_token,
         )
 
         it.study_version = StudyVersionSimple.from_input(
@@ -293,7 +293,7 @@ def test_get_studies_pagination_sorting(api_client):
     response = api_client.get(f"{BASE_URL}/studies")
     assert_response_status_code(response, 200)
     res = response.json()
-    assert res.keys() == {"self", "next", "prev", "items"}
+    assert res.keys() == {"self", "next", "prev", "next_page_token", "items"}
     assert len(res["items"]) == page_size_default
     TestUtils.assert_sort_order(res["items"], "uid", False)
 
@@ -301,7 +301,7 @@ def test_get_studies_pagination_sorting(api_client):
     response = api_client.get(f"{BASE_URL}/studies?page_size=2")
     assert_response_status_code(response, 200)
     res = response.json()
-    assert res.keys() == {"self", "next", "prev", "items"}
+    assert res.keys() == {"self", "next", "prev", "next_page_token", "items"}
     assert len(res["items"]) == 2
     TestUtils.assert_sort_order(res["items"], "uid", False)
 
@@ -309,7 +309,7 @@ def test_get_studies_pagination_sorting(api_client):
     response = api_client.get(f"{BASE_URL}/studies?page_size=100")
     assert_response_status_code(response, 200)
     res = response.json()
-    assert res.keys() == {"self", "next", "prev", "items"}
+    assert res.keys() == {"self", "next", "prev", "next_page_token", "items"}
     assert len(res["items"]) == total_studies
     TestUtils.assert_sort_order(res["items"], "uid", False)
 
@@ -317,7 +317,7 @@ def test_get_studies_pagination_sorting(api_client):
     response = api_client.get(f"{BASE_URL}/studies?page_size=3&page_number=2")
     assert_response_status_code(response, 200)
     res = response.json()
-    assert res.keys() == {"self", "next", "prev", "items"}
+    assert res.keys() == {"self", "next", "prev", "next_page_token", "items"}
     assert len(res["items"]) == 3
     TestUtils.assert_sort_order(res["items"], "uid", False)
 
@@ -333,7 +333,7 @@ def test_get_studies_pagination_sorting(api_client):
     response = api_client.get(f"{BASE_URL}/studies?sort_order=desc&sort_by=id_prefix")
     assert_response_status_code(response, 200)
     res = response.json()
-    assert res.keys() == {"self", "next", "prev", "items"}
+    assert res.keys() == {"self", "next", "prev", "next_page_token", "items"}
     assert len(res["items"]) == page_size_default
     TestUtils.assert_sort_order(res["items"], "id_prefix", True)
 
@@ -358,6 +358,46 @@ def test_get_all_studies(api_client, page_size):
     TestUtils.assert_sort_order(all_fetched_studies, "uid", False)
 
 
+@pytest.mark.parametrize("page_size", [8, 100])
+@pytest.mark.parametrize("sort_by, sort_order", [("uid", "asc"), ("id_prefix", "desc")])
+def test_get_all_studies_by_page_token(api_client, page_size, sort_by, sort_order):
+    params = f"sort_by={sort_by}&sort_order={sort_order}&page_size={page_size}"
+    response = api_client.get(f"{BASE_URL}/studies?{params}")
+    assert_response_status_code(response, 200)
+    all_fetched_studies = response.json()["items"]
+
+    while response.json()["next_page_token"]:
+        response = api_client.get(
+            f"{BASE_URL}/studies?{params}&page_token={response.json()['next_page_token']}"
+        )
+        assert_response_status_code(response, 200)
+        # The last page has no token, there is no trailing empty page
+        assert 0 < len(response.json()["items"]) <= page_size
+        all_fetched_studies.extend(response.json()["items"])
+
+    assert len(all_fetched_studies) == total_studies
+    assert {study["uid"] for study in all_fetched_studies} == {
+        study.uid for study in studies
+    }
+    TestUtils.assert_sort_order(all_fetched_studies, sort_by, sort_order == "desc")
+
+
+def test_get_studies_invalid_page_token(api_client):
+    response = api_client.get(f"{BASE_URL}/studies?page_size=2")
+    next_page_token = response.json()["next_page_token"]
+
+    for url in [
+        f"{BASE_URL}/studies?page_size=2&page_token=invalid",
+        f"{BASE_URL}/studies?page_size=2&sort_by=number&page_token={next_page_token}",
+    ]:
+        response = api_client.get(url)
+        assert_response_status_code(response, 400)
+        assert (
+            response.json()["message"]
+            == "Invalid page_token, it does not match the requested sorting."
+        )
+
+
 def test_get_studies_filtering(api_client):
     # Find a study
     response = api_client.get(f"{BASE_URL}/studies")
@@ -516,6 +556,23 @@ def test_get_all_study_visits(api_client, page_size):
     TestUtils.assert_sort_order(all_fetched_study_visits, "uid", False)
 
 
+def test_get_all_study_visits_by_page_token(api_client):
+    url = f"{BASE_URL}/studies/{studies[0].uid}/study-visits?sort_by=unique_visit_number&page_size=3"
+    response = api_client.get(url)
+    all_fetched_study_visits = response.json()["items"]
+
+    while response.json()["next_page_token"]:
+        response = api_client.get(
+            f"{url}&page_token={response.json()['next_page_token']}"
+        )
+        assert_response_status_code(response, 200)
+        all_fetched_study_visits.extend(response.json()["items"])
+
+    assert [
+        study_visit["unique_visit_number"] for study_visit in all_fetched_study_visits
+    ] == sorted(study_visit.unique_visit_number for study_visit in study_visits)
+
+
 def test_get_study_activities(api_client):
     response = api_client.get(f"{BASE_URL}/studies/{studies[0].uid}/study-activities")
     assert_response_status_code(response, 200)
@@ -609,6 +666,25 @@ def test_get_all_study_activities(api_client, page_size):
     TestUtils.assert_sort_order(all_fetched_study_activities, "uid", False)
 
 
+def test_get_all_study_activities_by_page_token(api_client):
+    url = f"{BASE_URL}/studies/{studies[0].uid}/study-activities?sort_by=activity_name&page_size=3"
+    response = api_client.get(url)
+    all_fetched_study_activities = response.json()["items"]
+
+    while response.json()["next_page_token"]:
+        response = api_client.get(
+            f"{url}&page_token={response.json()['next_page_token']}"
+        )
+        assert_response_status_code(response, 200)
+        all_fetched_study_activities.extend(response.json()["items"])
+
+    assert len(all_fetched_study_activities) == total_study_activities
+    assert len({item["uid"] for item in all_fetched_study_activities}) == len(
+        all_fetched_study_activities
+    )
+    TestUtils.assert_sort_order(all_fetched_study_activities, "activity_name", False)
+
+
 def test_get_study_detailed_soa(api_client):
     response = api_client.get(f"{BASE_URL}/studies/{studies[0].uid}/detailed-soa")
     assert_response_status_code(response, 200)
@@ -0,0 +1,117 @@
+"""
+Load test showing that slow database calls don't stall other requests served by the same worker.
+
+Database access is replaced by functions sleeping for a fixed amount of time,
+so that the test measures the behaviour of the API layer only.
+"""
+
+# pylint: disable=redefined-outer-name
+import asyncio
+import statistics
+import time
+
+import httpx
+import neo4j.time
+import pytest
+
+from common.auth import dependencies
+from consumer_api.consumer_api import app
+from consumer_api.v1 import db as DB
+
+BASE_URL = "/v1"
+
+FAST_QUERY_SECS = 0.01
+SLOW_QUERY_SECS = 1.0
+FAST_CLIENTS = 4
+FAST_REQUESTS = 50
+SLOW_REQUESTS = 4
+
+
+def p99(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=100, method="inclusive")[98]
+
+
+@pytest.fixture
+def simulated_db(monkeypatch):
+    def get_study_version(study_uid: str, study_version_number: str | None):
+        time.sleep(FAST_QUERY_SECS)
+        return {
+            "version_status": "DRAFT",
+            "version_number": study_version_number,
+            "version_started_at": neo4j.time.DateTime(2024, 1, 1),
+        }
+
+    def get_studies(**_kwargs):
+        time.sleep(FAST_QUERY_SECS)
+        return []
+
+    def get_study_visits(**_kwargs):
+        time.sleep(FAST_QUERY_SECS)
+        return []
+
+    def get_study_detailed_soa(**_kwargs):
+        time.sleep(SLOW_QUERY_SECS)
+        return []
+
+    monkeypatch.setattr(dependencies, "persist_user", lambda user_info: None)
+    monkeypatch.setattr(DB, "get_study_version", get_study_version)
+    monkeypatch.setattr(DB, "get_studies", get_studies)
+    monkeypatch.setattr(DB, "get_study_visits", get_study_visits)
+    monkeypatch.setattr(DB, "get_study_detailed_soa", get_study_detailed_soa)
+
+
+async def timed_get(client: httpx.AsyncClient, url: str) -> float:
+    start = time.perf_counter()
+    response = await client.get(url)
+    assert response.status_code == 200, response.text
+    return time.perf_counter() - start
+
+
+async def run_fast_requests(client: httpx.AsyncClient) -> list[float]:
+    latencies = []
+    for i in range(FAST_REQUESTS):
+        url = (
+            f"{BASE_URL}/studies"
+            if i % 2
+            else f"{BASE_URL}/studies/Study_000001/study-visits"
+        )
+        latencies.append(await timed_get(client, url))
+    return latencies
+
+
+async def run_slow_requests(client: httpx.AsyncClient, done: asyncio.Event):
+    while not done.is_set():
+        latency = await timed_get(
+            client, f"{BASE_URL}/studies/Study_000001/detailed-soa"
+        )
+        assert latency >= SLOW_QUERY_SECS
+
+
+async def measure_fast_request_latencies(with_slow_requests: bool) -> list[float]:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        done = asyncio.Event()
+        slow_requests = [
+            asyncio.create_task(run_slow_requests(client, done))
+            for _ in range(SLOW_REQUESTS if with_slow_requests else 0)
+        ]
+
+        fast_latencies = await asyncio.gather(
+            *(run_fast_requests(client) for _ in range(FAST_CLIENTS))
+        )
+
+        done.set()
+        await asyncio.gather(*slow_requests)
+
+    return [latency for latencies in fast_latencies for latency in latencies]
+
+
+@pytest.mark.asyncio
+async def test_p99_latency_is_flat_with_concurrent_slow_queries(simulated_db):
+    baseline_p99 = p99(await measure_fast_request_latencies(with_slow_requests=False))
+    mixed_p99 = p99(await measure_fast_request_latencies(with_slow_requests=True))
+
+    # Blocking the event loop would delay fast requests by a whole slow query
+    assert mixed_p99 < SLOW_QUERY_SECS / 3
+    assert mixed_p99 < baseline_p99 + 0.2
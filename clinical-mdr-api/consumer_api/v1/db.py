@@ -6,6 +6,7 @@ from common.exceptions import NotFoundException
 from common.utils import validate_page_number_and_page_size
 from consumer_api.shared.common import (
     SortByType,
+    db_paginated_query,
     db_pagination_clause,
     db_sort_clause,
     query,
@@ -33,6 +34,7 @@ def get_studies(
     page_size: int = 10,
     page_number: int = 1,
     id: str = None,
+    page_token: str | None = None,
 ) -> list[dict]:
     validate_page_number_and_page_size(page_number, page_size)
 
@@ -44,7 +46,6 @@ def get_studies(
         filter_clause = "WHERE id CONTAINS toUpper($id)"
 
     base_query = f"""
-        MATCH (study_root:StudyRoot)-[:LATEST]->(study_value:StudyValue)
         OPTIONAL MATCH (study_root)-[hv:HAS_VERSION]->(:StudyValue)
         OPTIONAL MATCH (author:User) WHERE author.user_id = hv.author_id
         WITH *,
@@ -77,14 +78,18 @@ def get_studies(
         RETURN *
         """
 
-    full_query = " ".join(
-        [
-            base_query,
-            db_sort_clause(sort_by.value, sort_order.value),
-            db_pagination_clause(page_size, page_number),
-        ]
+    full_query, pagination_params = db_paginated_query(
+        base_query,
+        sort_by=sort_by.value,
+        sort_order=sort_order.value,
+        page_size=page_size,
+        page_number=page_number,
+        page_token=page_token,
+        # Without the id filter, every study is returned, the page can be read from the StudyRoot uid index
+        anchor_match="MATCH (study_root:StudyRoot)-[:LATEST]->(study_value:StudyValue)",
+        anchor_key="study_root.uid" if id is None else None,
     )
-    return query(full_query, params)
+    return query(full_query, params | pagination_params)
 
 
 def get_study_version(
@@ -123,6 +128,7 @@ def get_study_visits(
     page_size: int = 10,
     page_number: int = 1,
     study_version_number: str | None = None,
+    page_token: str | None = None,
 ) -> list[dict]:
     validate_page_number_and_page_size(page_number, page_size)
 
@@ -162,22 +168,20 @@ def get_study_visits(
         RETURN *
         """
 
-    full_query = " ".join(
-        [
-            base_query,
-            db_sort_clause(
-                sort_by.value,
-                sort_order.value,
-                sort_by_type=(
-                    SortByType.NUMBER
-                    if sort_by == models.SortByStudyVisits.UNIQUE_VISIT_NUMBER
-                    else SortByType.STRING
-                ),
-            ),
-            db_pagination_clause(page_size, page_number),
-        ]
+    full_query, pagination_params = db_paginated_query(
+        base_query,
+        sort_by=sort_by.value,
+        sort_order=sort_order.value,
+        page_size=page_size,
+        page_number=page_number,
+        page_token=page_token,
+        sort_by_type=(
+            SortByType.NUMBER
+            if sort_by == models.SortByStudyVisits.UNIQUE_VISIT_NUMBER
+            else SortByType.STRING
+        ),
     )
-    return query(full_query, params)
+    return query(full_query, params | pagination_params)
 
 
 def get_study_activities(
@@ -187,6 +191,7 @@ def get_study_activities(
     page_size: int = 10,
     page_number: int = 1,
     study_version_number: str | None = None,
+    page_token: str | None = None,
 ) -> list[dict]:
     validate_page_number_and_page_size(page_number, page_size)
 
@@ -244,14 +249,15 @@ def get_study_activities(
             coalesce(av.is_data_collected, False) AS is_data_collected
         """
 
-    full_query = " ".join(
-        [
-            base_query,
-            db_sort_clause(sort_by.value, sort_order.value),
-            db_pagination_clause(page_size, page_number),
-        ]
+    full_query, pagination_params = db_paginated_query(
+        base_query,
+        sort_by=sort_by.value,
+        sort_order=sort_order.value,
+        page_size=page_size,
+        page_number=page_number,
+        page_token=page_token,
     )
-    return query(full_query, params)
+    return query(full_query, params | pagination_params)
 
 
 def get_study_detailed_soa(
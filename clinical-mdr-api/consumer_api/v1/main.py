@@ -8,6 +8,7 @@ from fastapi import APIRouter, Path, Query, Request
 from common import config
 from common.auth import rbac
 from common.models.error import ErrorResponse
+from consumer_api.shared.common import get_next_page_token, run_in_db_threadpool
 from consumer_api.shared.responses import (
     PaginatedResponse,
     PaginatedResponseWithStudyVersion,
@@ -17,6 +18,15 @@ from consumer_api.v1 import models
 
 router = APIRouter()
 
+PageToken = Annotated[
+    str | None,
+    Query(
+        description="Token of the page to return, as returned in `next_page_token` of the previous page. "
+        "Pages requested by token stay consistent while items are added or removed, "
+        "and are faster to get than deep pages requested by `page_number`, which is then ignored."
+    ),
+]
+
 
 # GET endpoint to retrieve a list of studies
 @router.get(
@@ -38,6 +48,7 @@ async def get_studies(
         int, Query(ge=1, le=config.MAX_PAGE_SIZE)
     ] = config.DEFAULT_PAGE_SIZE,
     page_number: Annotated[int, Query(ge=1)] = 1,
+    page_token: PageToken = None,
     id: Annotated[
         str,
         Query(
@@ -53,12 +64,14 @@ async def get_studies(
     Returned `version_number` value can be used in other endpoints to retrieve study entities (e.g. visits, activities, etc.)
     associated with a specific study version.
     """
-    studies = DB.get_studies(
+    studies = await run_in_db_threadpool(
+        DB.get_studies,
         sort_by=sort_by,
         sort_order=sort_order,
         page_size=page_size,
         page_number=page_number,
         id=id,
+        page_token=page_token,
     )
 
     return PaginatedResponse.from_input(
@@ -69,6 +82,10 @@ async def get_studies(
         page_number=page_number,
         items=[models.Study.from_input(study) for study in studies],
         query_param_names=["id"],
+        page_token=page_token,
+        next_page_token=get_next_page_token(
+            studies, sort_by.value, sort_order.value, page_size
+        ),
     )
 
 
@@ -97,6 +114,7 @@ async def get_study_visits(
         int, Query(ge=1, le=config.MAX_PAGE_SIZE)
     ] = config.PAGE_SIZE_100,
     page_number: Annotated[int, Query(ge=1)] = 1,
+    page_token: PageToken = None,
     study_version_number: Annotated[
         str | None, Query(description="Study Version Number", example="2.1")
     ] = None,
@@ -108,18 +126,21 @@ async def get_study_visits(
     associated with the specified study version will be returned.
     Otherwise, visits for the latest study version will be returned.
     """
-    study_version = DB.get_study_version(
+    study_version = await run_in_db_threadpool(
+        DB.get_study_version,
         study_uid=uid,
         study_version_number=study_version_number,
     )
 
-    study_visits = DB.get_study_visits(
+    study_visits = await run_in_db_threadpool(
+        DB.get_study_visits,
         study_uid=uid,
         sort_by=sort_by,
         sort_order=sort_order,
         page_size=page_size,
         page_number=page_number,
         study_version_number=study_version_number,
+        page_token=page_token,
     )
 
     return PaginatedResponseWithStudyVersion.from_input(
@@ -133,6 +154,10 @@ async def get_study_visits(
             models.StudyVisit.from_input(study_visit) for study_visit in study_visits
         ],
         query_param_names=["study_version_number"],
+        page_token=page_token,
+        next_page_token=get_next_page_token(
+            study_visits, sort_by.value, sort_order.value, page_size
+        ),
     )
 
 
@@ -161,6 +186,7 @@ async def get_study_activities(
         int, Query(ge=1, le=config.MAX_PAGE_SIZE)
     ] = config.PAGE_SIZE_100,
     page_number: Annotated[int, Query(ge=1)] = 1,
+    page_token: PageToken = None,
     study_version_number: Annotated[
         str | None, Query(description="Study Version Number", example="2.1")
     ] = None,
@@ -172,18 +198,21 @@ async def get_study_activities(
     associated with the specified study version will be returned.
     Otherwise, activities for the latest study version will be returned.
     """
-    study_version = DB.get_study_version(
+    study_version = await run_in_db_threadpool(
+        DB.get_study_version,
         study_uid=uid,
         study_version_number=study_version_number,
     )
 
-    study_activities = DB.get_study_activities(
+    study_activities = await run_in_db_threadpool(
+        DB.get_study_activities,
         study_uid=uid,
         sort_by=sort_by,
         sort_order=sort_order,
         page_size=page_size,
         page_number=page_number,
         study_version_number=study_version_number,
+        page_token=page_token,
     )
 
     return PaginatedResponseWithStudyVersion.from_input(
@@ -198,6 +227,10 @@ async def get_study_activities(
             for study_activity in study_activities
         ],
         query_param_names=["study_version_number"],
+        page_token=page_token,
+        next_page_token=get_next_page_token(
+            study_activities, sort_by.value, sort_order.value, page_size
+        ),
     )
 
 
@@ -238,12 +271,14 @@ async def get_study_detailed_soa(
     associated with the specified study version will be returned.
     Otherwise, detailed SoA items for the latest study version will be returned.
     """
-    study_version = DB.get_study_version(
+    study_version = await run_in_db_threadpool(
+        DB.get_study_version,
         study_uid=uid,
         study_version_number=study_version_number,
     )
 
-    study_detailed_soas = DB.get_study_detailed_soa(
+    study_detailed_soas = await run_in_db_threadpool(
+        DB.get_study_detailed_soa,
         study_uid=uid,
         sort_by=sort_by,
         sort_order=sort_order,
@@ -304,12 +339,14 @@ async def get_study_operational_soa(
     associated with the specified study version will be returned.
     Otherwise, operational SoA items for the latest study version will be returned.
     """
-    study_version = DB.get_study_version(
+    study_version = await run_in_db_threadpool(
+        DB.get_study_version,
         study_uid=uid,
         study_version_number=study_version_number,
     )
 
-    study_operational_soas = DB.get_study_operational_soa(
+    study_operational_soas = await run_in_db_threadpool(
+        DB.get_study_operational_soa,
         study_uid=uid,
         sort_by=sort_by,
         sort_order=sort_order,
@@ -7,7 +7,13 @@ from migrations.utils.utils import (
     api_get,
     get_db_result_as_dict,
 )
-from neo4j_mdr_db.db_schema import CONSTRAINTS, INDEXES, REL_INDEXES, TEXT_INDEXES
+from neo4j_mdr_db.db_schema import (
+    CONSTRAINTS,
+    FULLTEXT_INDEXES,
+    INDEXES,
+    REL_INDEXES,
+    TEXT_INDEXES,
+)
 
 # pylint: disable=invalid-name
 
@@ -56,6 +62,22 @@ def test_indexes_and_constraints(db, logger):
             is not None
         ), f"Index {index_name} does not exist"
 
+    for item in FULLTEXT_INDEXES:
+        index_name = f"fulltext_{item[0]}"
+        assert (
+            next(
+                (
+                    x
+                    for x in all_db_indexes_and_constraints
+                    if x["name"] == index_name
+                    and x["type"] == "FULLTEXT"
+                    and x["entityType"] == "NODE"
+                ),
+                None,
+            )
+            is not None
+        ), f"Index {index_name} does not exist"
+
     for item in REL_INDEXES:
         index_name = f"index_{item[0]}_{item[1]}"
         assert (
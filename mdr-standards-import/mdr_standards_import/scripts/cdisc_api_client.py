@@ -0,0 +1,200 @@
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from os import chmod, environ, path, replace
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mdr_standards_import.scripts.utils import CDISC_DIR
+
+# Number of concurrent requests to the CDISC REST API
+CDISC_API_WORKERS = int(environ.get("CDISC_API_WORKERS", "8"))
+# Number of retries of a failed request, waiting for backoff_factor * 2 ** (retry - 1) seconds in between
+CDISC_API_RETRIES = int(environ.get("CDISC_API_RETRIES", "5"))
+CDISC_API_BACKOFF_FACTOR = float(environ.get("CDISC_API_BACKOFF_FACTOR", "1"))
+CDISC_API_TIMEOUT = float(environ.get("CDISC_API_TIMEOUT", "300"))
+# Directory of the responses of the CDISC REST API, revalidated by conditional requests
+CDISC_API_CACHE_DIR = environ.get(
+    "CDISC_API_CACHE_DIR", path.join(CDISC_DIR, ".cdisc_api_cache")
+)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CdiscApiClient:
+    """
+    Client of the CDISC REST API, sending concurrent GET requests with retries and caching their responses on disc.
+
+    A cached response is revalidated by a conditional request with its `ETag` and `Last-Modified` headers,
+    so that it is only downloaded again if it changed.
+    The responses are stored by the SHA-256 hash of their content, and the `ETag` and `Last-Modified` headers
+    and the hash of the response of each URL in an index file. Both are written atomically,
+    so that an interrupted download leaves the cache consistent and resumes with the cached responses.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict,
+        cache_directory: str = CDISC_API_CACHE_DIR,
+        workers: int = CDISC_API_WORKERS,
+        retries: int = CDISC_API_RETRIES,
+        backoff_factor: float = CDISC_API_BACKOFF_FACTOR,
+        timeout: float = CDISC_API_TIMEOUT,
+    ):
+        self.base_url = base_url
+        self.headers = headers
+        self.cache_directory = cache_directory
+        self.workers = workers
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        # requests sessions are not thread-safe, each thread uses its own
+        self._local = threading.local()
+        # Bounds the requests in flight, also when the downloads of nested resources run concurrently
+        self._requests = threading.BoundedSemaphore(workers)
+        # Shared by all calls of run_concurrently, nested ones included
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def get_json(self, href: str) -> Any:
+        """
+        Gets the JSON response of the href, relative to the base URL of the API.
+
+        Raises the `requests` exceptions, e.g. `HTTPError` if the response is still failing after the retries.
+        """
+        url = self.base_url + href
+        index_file = path.join(
+            self.cache_directory, "index", f"{_sha256(url.encode())}.json"
+        )
+        cached = _read_cached_index(index_file)
+        content = None
+        headers = dict(self.headers)
+        if cached is not None:
+            content = _read_file(self._get_content_file(cached["sha256"]))
+            if content is not None:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+        with self._requests:
+            response = self._get_session().get(
+                url, headers=headers, timeout=self.timeout
+            )
+        if response.status_code == 304 and content is not None:
+            return json.loads(content)
+        response.raise_for_status()
+
+        content = response.content
+        sha256 = _sha256(content)
+        content_file = self._get_content_file(sha256)
+        if not path.exists(content_file):
+            write_file_atomically(content_file, content)
+        write_file_atomically(
+            index_file,
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "sha256": sha256,
+                }
+            ).encode(),
+        )
+        return json.loads(content)
+
+    def run_concurrently(
+        self, function: Callable[[Any], Any], items: Iterable[Any]
+    ) -> list:
+        """
+        Calls the function for each item, in a pool of `workers` threads shared by all calls.
+        The function may itself call `run_concurrently`: the nested calls use the same pool,
+        so that the number of threads and of requests in flight stays bounded.
+
+        Returns the results in the order of the items, raises the first exception raised by the function.
+        """
+        items = list(items)
+        futures = [self._get_executor().submit(function, item) for item in items]
+        results = []
+        try:
+            for item, future in zip(items, futures):
+                # The items not started yet are run by the waiting thread itself, so that nested calls
+                # waiting in the threads of the pool never leave their own items without a thread to run them
+                if future.cancel():
+                    results.append(function(item))
+                else:
+                    results.append(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+        return results
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="cdisc-api"
+                )
+            return self._executor
+
+    def _get_content_file(self, sha256: str) -> str:
+        return path.join(self.cache_directory, "objects", sha256[:2], f"{sha256}.json")
+
+    def _get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            retry = Retry(
+                total=self.retries,
+                backoff_factor=self.backoff_factor,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=["GET"],
+                # the last failing response is returned, to be reported by raise_for_status
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(max_retries=retry))
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+            self._local.session = session
+        return session
+
+
+def write_file_atomically(file_path: str, content: bytes):
+    """
+    Writes the content to a temporary file next to the file, then renames it to the file.
+
+    A file is therefore either complete or not present, even if the process is interrupted while writing it.
+    """
+    directory = path.dirname(file_path)
+    Path(directory).mkdir(0o750, True, True)
+    with NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as tmp_file:
+        tmp_file.write(content)
+    chmod(tmp_file.name, 0o640)
+    replace(tmp_file.name, file_path)
+
+
+def write_json_file_atomically(file_path: str, data: Any):
+    write_file_atomically(file_path, (json.dumps(data) + "\n").encode())
+
+
+def _read_cached_index(index_file: str) -> dict | None:
+    content = _read_file(index_file)
+    return json.loads(content) if content is not None else None
+
+
+def _read_file(file_path: str) -> bytes | None:
+    try:
+        with open(file_path, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
@@ -1,12 +1,15 @@
 import json
 from typing import Sequence
-import requests
 from requests.exceptions import HTTPError
 from os import listdir
 from os import environ
 from os import mkdir
 from os import path
 from pathlib import Path
+from mdr_standards_import.scripts.cdisc_api_client import (
+    CdiscApiClient,
+    write_json_file_atomically,
+)
 from mdr_standards_import.scripts.entities.cdisc_ct.package import Package
 from mdr_standards_import.scripts.entities.cdisc_ct.ct_import import CTImport
 from mdr_standards_import.scripts.entities.cdisc_data_models.version import Version
@@ -29,6 +32,7 @@ CDISC_IMPORT_DATABASE = environ.get("NEO4J_CDISC_IMPORT_DATABASE", "neo4j")
 AUTH_TOKEN = environ.get("CDISC_AUTH_TOKEN")
 HEADERS = {"api-key": AUTH_TOKEN, "Accept": "application/json"}
 BASE_URL = environ.get("CDISC_BASE_URL")
+CDISC_API_CLIENT = CdiscApiClient(BASE_URL, HEADERS)
 
 
 def download_newer_packages_than(last_effective_date: str, to_directory: str):
@@ -98,10 +102,9 @@ def get_available_packages_meta_data_from_api() -> json:
         }
     }
     """
-    response = requests.get(BASE_URL + "/mdr/ct/packages", headers=HEADERS)
-    response.raise_for_status()
-    print(json.dumps(response.json(), indent=2))
-    return response.json()
+    packages = CDISC_API_CLIENT.get_json("/mdr/ct/packages")
+    print(json.dumps(packages, indent=2))
+    return packages
 
 
 def download_packages_data(packages_to_download: Sequence[Package], to_directory: str):
@@ -110,6 +113,7 @@ def download_packages_data(packages_to_download: Sequence[Package], to_directory
     Stores the data in JSON files on disc.
 
     If the corresponding JSON files are already present for one or more packages, those packages will be skipped.
+    The packages are downloaded concurrently, each file is written once its package is completely downloaded.
 
     :param packages_to_download: a list of those packages that shall be downloaded.
     """
@@ -124,9 +128,9 @@ def download_packages_data(packages_to_download: Sequence[Package], to_directory
             if path.splitext(x)[1] == ".json"
         ]
     )
-    step = 1
     number_of_packages = len(packages_to_download)
-    for package in packages_to_download:
+
+    def download_package(step: int, package: Package):
         package_id = (
             package.catalogue_name + "-" + package.get_ct_import().effective_date
         )
@@ -134,24 +138,24 @@ def download_packages_data(packages_to_download: Sequence[Package], to_directory
             print(
                 f"  Step: {step}/{number_of_packages} - Package '{package_id}' already downloaded."
             )
+            return
+        print(
+            f"  Step: {step}/{number_of_packages} - Downloading package '{package_id}'."
+        )
+        try:
+            package_data = CDISC_API_CLIENT.get_json(package.href)
+        except HTTPError as http_err:
+            print(f"    HTTP error occurred: {http_err}")
+        except Exception as err:
+            print(f"    Other error occurred: {err}")
         else:
-            print(
-                f"  Step: {step}/{number_of_packages} - Downloading package '{package_id}'."
-            )
-            try:
-                response = requests.get(BASE_URL + package.href, headers=HEADERS)
-                response.raise_for_status()
-                package_data = response.json()
-            except HTTPError as http_err:
-                print(f"    HTTP error occurred: {http_err}")
-            except Exception as err:
-                print(f"    Other error occurred: {err}")
-            else:
-                filename = package_id.split("/")[-1].lower() + ".json"
-                with open(path.join(to_directory, filename), "w") as ctpkg_file:
-                    ctpkg_file.write(json.dumps(package_data))
-                    ctpkg_file.write("\n")
-        step += 1
+            filename = package_id.split("/")[-1].lower() + ".json"
+            write_json_file_atomically(path.join(to_directory, filename), package_data)
+
+    CDISC_API_CLIENT.run_concurrently(
+        lambda args: download_package(*args),
+        enumerate(packages_to_download, start=1),
+    )
 
 
 def get_available_model_versions_meta_data_from_api() -> json:
@@ -189,9 +193,7 @@ def get_available_model_versions_meta_data_from_api() -> json:
         Note : _links top level and self objects are removed before concatenating to prevent conflicts
     """
     # Get data tabulation (SDTM, SEND)
-    response = requests.get(BASE_URL + "/mdr/products/DataTabulation", headers=HEADERS)
-    response.raise_for_status()
-    data_tabulation = response.json()
+    data_tabulation = CDISC_API_CLIENT.get_json("/mdr/products/DataTabulation")
     if "self" in data_tabulation["_links"]:
         del data_tabulation["_links"]["self"]
 
@@ -279,6 +281,8 @@ def download_versions_data(
     Stores the data in JSON files on disc.
 
     If the corresponding JSON files are already present for one or more versions, those versions will be skipped.
+    The versions are downloaded concurrently, each file is written once its version including its classes
+    is completely downloaded, so that an interrupted download is resumed with the incomplete versions.
 
     :param catalogue: name of the catalogue
     :param type: type of the model (Foundational Model or Implementation Guide)
@@ -296,49 +300,47 @@ def download_versions_data(
             if path.splitext(x)[1] == ".json"
         ]
     )
-    step = 1
     number_of_versions = len(versions_to_download)
-    for version in versions_to_download:
+
+    def download_version(step: int, version: Version):
         version_number = version.get_version_number()
         if version_number in existing_versions:
             print(
                 f" Catalogue {catalogue} - Step: {step}/{number_of_versions} - Version '{version_number}' already downloaded."
             )
-        else:
-            print(
-                f"  Catalogue {catalogue} - Step: {step}/{number_of_versions} - Downloading version '{version_number}'."
+            return
+        print(
+            f"  Catalogue {catalogue} - Step: {step}/{number_of_versions} - Downloading version '{version_number}'."
+        )
+        # The version is only written once its classes are, so that a failed download is retried by the next run
+        try:
+            version_data = CDISC_API_CLIENT.get_json(version.href)
+            url_suffix = _map_classes_or_datasets_url_suffix(
+                catalogue=catalogue, data_model_type=data_model_type
             )
-            try:
-                response = requests.get(BASE_URL + version.href, headers=HEADERS)
-                response.raise_for_status()
-                version_data = response.json()
-            except HTTPError as http_err:
-                print(f"    HTTP error occurred: {http_err}")
-            except Exception as err:
-                print(f"    Other error occurred: {err}")
-            else:
-                filename = f"{version_number}.json"
-                with open(path.join(sub_directory, filename), "w") as version_file:
-                    version_file.write(json.dumps(version_data))
-                    version_file.write("\n")
-
-                url_suffix = _map_classes_or_datasets_url_suffix(
-                    catalogue=catalogue, data_model_type=data_model_type
-                )
-                classes_datasets_sub_directory = get_classes_directory_name(
-                    data_model_type
-                )
-                download_classes_data(
-                    base_version_href=version.href,
-                    suffix=url_suffix,
-                    to_directory=path.join(
-                        to_directory,
-                        catalogue,
-                        classes_datasets_sub_directory,
-                        version_number,
-                    ),
-                )
-        step += 1
+            classes_datasets_sub_directory = get_classes_directory_name(data_model_type)
+            download_classes_data(
+                base_version_href=version.href,
+                suffix=url_suffix,
+                to_directory=path.join(
+                    to_directory,
+                    catalogue,
+                    classes_datasets_sub_directory,
+                    version_number,
+                ),
+            )
+        except HTTPError as http_err:
+            print(f"    HTTP error occurred: {http_err}")
+        except Exception as err:
+            print(f"    Other error occurred: {err}")
+        else:
+            filename = f"{version_number}.json"
+            write_json_file_atomically(path.join(sub_directory, filename), version_data)
+
+    CDISC_API_CLIENT.run_concurrently(
+        lambda args: download_version(*args),
+        enumerate(versions_to_download, start=1),
+    )
 
 
 def download_classes_data(base_version_href: str, suffix: str, to_directory: str):
@@ -348,50 +350,47 @@ def download_classes_data(base_version_href: str, suffix: str, to_directory: str
     :param base_version_href: base href for the version for which to download classes
     :param suffix: url suffix for downloading classes/datasets
     :param to_directory: directory in which to download the classes, including version_number
+    :raises HTTPError: if the classes, or one of them, could not be downloaded
     """
     print(" * Downloading classes/datasets.")
-    try:
-        classes_url = f"{BASE_URL}{base_version_href}/{suffix.lower()}"
-        response = requests.get(classes_url, headers=HEADERS)
-        response.raise_for_status()
-        classes_data = response.json()
-    except HTTPError as http_err:
-        print(f"    HTTP error occurred: {http_err}")
-    except Exception as err:
-        print(f"    Other error occurred: {err}")
+    classes_data = CDISC_API_CLIENT.get_json(f"{base_version_href}/{suffix.lower()}")
+    if suffix in classes_data["_links"]:
+        classes = classes_data["_links"][suffix]
+        CDISC_API_CLIENT.run_concurrently(
+            lambda _class: _download_class(to_directory=to_directory, class_ref=_class),
+            classes,
+        )
     else:
-        if suffix in classes_data["_links"]:
-            classes = classes_data["_links"][suffix]
-            for _class in classes:
-                class_data = _download_element(
-                    to_directory=to_directory, element_ref=_class
-                )
-
-                if "scenarios" in class_data["_links"]:
-                    scenarios = class_data["_links"]["scenarios"]
-                    for _scenario in scenarios:
-                        _download_element(
-                            to_directory=path.join(to_directory, "scenarios"),
-                            element_ref=_scenario,
-                        )
-        else:
-            print(f" -- No {suffix} found for version.")
+        print(f" -- No {suffix} found for version.")
+
+
+def _download_class(to_directory: str, class_ref: dict):
+    # The class is written after its scenarios, so that an interrupted download leaves no class without them
+    class_data = CDISC_API_CLIENT.get_json(class_ref["href"])
+    if "scenarios" in class_data["_links"]:
+        CDISC_API_CLIENT.run_concurrently(
+            lambda _scenario: _download_element(
+                to_directory=path.join(to_directory, "scenarios"),
+                element_ref=_scenario,
+            ),
+            class_data["_links"]["scenarios"],
+        )
+    _write_element(to_directory, class_ref, class_data)
 
 
 def _download_element(to_directory: str, element_ref: dict) -> dict:
-    href = element_ref["href"]
-    response = requests.get(BASE_URL + href, headers=HEADERS)
-    response.raise_for_status()
-    download_data = response.json()
-    _file = Path(path.join(to_directory, f"{path.basename(href)}.json"))
-    _file.parent.mkdir(exist_ok=True, parents=True)
-    with open(_file, "w") as download_file:
-        download_file.write(json.dumps(download_data))
-        download_file.write("\n")
-
+    download_data = CDISC_API_CLIENT.get_json(element_ref["href"])
+    _write_element(to_directory, element_ref, download_data)
     return download_data
 
 
+def _write_element(to_directory: str, element_ref: dict, download_data: dict):
+    write_json_file_atomically(
+        path.join(to_directory, f"{path.basename(element_ref['href'])}.json"),
+        download_data,
+    )
+
+
 def _map_classes_or_datasets_url_suffix(catalogue: str, data_model_type: str) -> str:
     """
     Returns the suffix to use for datasets download for the given catalogue
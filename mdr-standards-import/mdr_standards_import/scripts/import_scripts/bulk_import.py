@@ -1,11 +1,15 @@
+from os import environ, path
 
-from os import path
-
+from mdr_standards_import.scripts.import_scripts.cdisc_ct.import_json_data_into_cdisc_db import (
+    create_cdisc_db_if_not_existent,
+    import_json_data_into_cdisc_db,
+)
+from mdr_standards_import.scripts.repositories.repository import get_import_states
+from mdr_standards_import.scripts.scheduler import DONE, Scheduler
 from mdr_standards_import.scripts.utils import (
+    get_cdisc_neo4j_driver,
     get_ordered_package_dates,
-)
-from mdr_standards_import.scripts.wrapper.cdisc_ct.wrapper_import_into_cdisc_db import (
-    wrapper_import_cdisc_ct_into_cdisc_db,
+    string_to_boolean,
 )
 from mdr_standards_import.scripts.wrapper.cdisc_ct.wrapper_import_from_cdisc_db_into_mdr import (
     wrapper_import_cdisc_ct_from_cdisc_db_into_mdr,
@@ -17,36 +21,153 @@ from mdr_standards_import.scripts.wrapper.cdisc_data_models.wrapper_import_from_
     wrapper_import_cdisc_data_models_from_cdisc_db_into_mdr,
 )
 
+CDISC_IMPORT_DATABASE = environ.get("NEO4J_CDISC_IMPORT_DATABASE", "neo4j")
+# Number of processes running the independent import steps concurrently
+BULK_IMPORT_WORKERS = int(environ.get("BULK_IMPORT_WORKERS", "4"))
+# Skips the CT packages already imported into the MDR DB, up to the first effective date that is not
+BULK_IMPORT_RESUME = string_to_boolean(environ.get("BULK_IMPORT_RESUME", "false"))
+
 
 def bulk_import(
-    author_id: str, json_data_directory: str = "", import_ct: bool = True, import_data_models: bool = True
+    author_id: str,
+    json_data_directory: str = "",
+    import_ct: bool = True,
+    import_data_models: bool = True,
+    workers: int = BULK_IMPORT_WORKERS,
+    resume: bool = BULK_IMPORT_RESUME,
 ):
-    # Import into CDISC db
-    # CDISC CT
-    if import_ct:
-        wrapper_import_cdisc_ct_into_cdisc_db(
-            author_id, path.join(json_data_directory, "cdisc_ct")
-        )
+    """
+    Imports the CDISC CT packages and data models into the CDISC DB, and from the CDISC DB into the MDR DB.
 
-    # CDISC Data models
-    if import_data_models:
-        wrapper_import_cdisc_data_models_into_cdisc_db(
-            author_id, path.join(json_data_directory, "cdisc_data_models")
-        )
+    The steps that are independent of each other run concurrently, in a pool of `workers` processes:
+    the import of the CT packages of each effective date into the CDISC DB, and of the data models.
+    The imports into the MDR DB keep their order: the CT packages of each effective date are imported
+    after the ones of the previous date, and the data models after all CT packages, as they refer to their terms.
+
+    If `resume` is set, the CT packages of the effective dates that were already imported into the MDR DB
+    according to their `Import` node are skipped, up to the first date that was not.
+    """
+
+    cdisc_neo4j_driver = get_cdisc_neo4j_driver()
+    create_cdisc_db_if_not_existent(cdisc_neo4j_driver, CDISC_IMPORT_DATABASE)
+    with cdisc_neo4j_driver.session(database=CDISC_IMPORT_DATABASE) as session:
+        import_states = session.read_transaction(get_import_states)
+    cdisc_neo4j_driver.close()
+
+    scheduler = Scheduler(workers)
+    last_ct_import_into_mdr = None
 
-    # Import from CDISC db into MDR db
     # CDISC CT
     if import_ct:
-        package_dates = get_ordered_package_dates(
-            path.join(json_data_directory, "cdisc_ct")
+        ct_directory = path.join(json_data_directory, "cdisc_ct")
+        package_dates = get_ordered_package_dates(ct_directory)
+        imported_dates = (
+            get_dates_imported_into_mdr(package_dates, import_states) if resume else []
         )
+        if imported_dates:
+            print(
+                f"== Resuming after the effective_date='{imported_dates[-1]}' already imported into the MDR DB."
+            )
         for effective_date in package_dates:
-            wrapper_import_cdisc_ct_from_cdisc_db_into_mdr(
-                author_id=author_id, effective_date=effective_date
+            depends_on = []
+            if effective_date not in import_states:
+                depends_on.append(
+                    scheduler.add(
+                        f"CT {effective_date} into CDISC DB",
+                        import_cdisc_ct_into_cdisc_db,
+                        author_id=author_id,
+                        json_data_directory=ct_directory,
+                        effective_date=effective_date,
+                    )
+                )
+            if effective_date in imported_dates:
+                continue
+            if last_ct_import_into_mdr is not None:
+                depends_on.append(last_ct_import_into_mdr)
+            last_ct_import_into_mdr = scheduler.add(
+                f"CT {effective_date} into MDR DB",
+                import_cdisc_ct_from_cdisc_db_into_mdr,
+                depends_on=depends_on,
+                author_id=author_id,
+                effective_date=effective_date,
             )
 
     # CDISC Data models
     if import_data_models:
-        wrapper_import_cdisc_data_models_from_cdisc_db_into_mdr(
-            author_id=author_id, json_data_directory=json_data_directory
+        data_models_into_cdisc_db = scheduler.add(
+            "Data models into CDISC DB",
+            wrapper_import_cdisc_data_models_into_cdisc_db,
+            author_id=author_id,
+            json_data_directory=path.join(json_data_directory, "cdisc_data_models"),
+        )
+        scheduler.add(
+            "Data models into MDR DB",
+            wrapper_import_cdisc_data_models_from_cdisc_db_into_mdr,
+            depends_on=[data_models_into_cdisc_db]
+            + ([last_ct_import_into_mdr] if last_ct_import_into_mdr else []),
+            author_id=author_id,
+            json_data_directory=json_data_directory,
         )
+
+    states = scheduler.run()
+    incomplete_steps = [name for name, state in states.items() if state != DONE]
+    if incomplete_steps:
+        raise RuntimeError(
+            f"The bulk import did not complete the following steps: {incomplete_steps}"
+        )
+
+
+def get_dates_imported_into_mdr(package_dates, import_states):
+    """
+    Returns the leading effective dates of the ordered package dates that were imported into the MDR DB.
+    """
+
+    imported_dates = []
+    for effective_date in package_dates:
+        import_state = import_states.get(effective_date)
+        if import_state is None or not import_state["imported_into_mdr"]:
+            break
+        imported_dates.append(effective_date)
+    return imported_dates
+
+
+def import_cdisc_ct_into_cdisc_db(
+    author_id: str, json_data_directory: str, effective_date: str
+):
+    cdisc_neo4j_driver = get_cdisc_neo4j_driver()
+    print(f"============================================")
+    print(
+        f"== Importing JSON data into the cdisc-DB='{CDISC_IMPORT_DATABASE}' for the effective_date='{effective_date}'."
+    )
+    print(f"==")
+    import_json_data_into_cdisc_db(
+        effective_date,
+        json_data_directory,
+        cdisc_neo4j_driver,
+        CDISC_IMPORT_DATABASE,
+        author_id,
+    )
+    cdisc_neo4j_driver.close()
+
+
+def import_cdisc_ct_from_cdisc_db_into_mdr(author_id: str, effective_date: str):
+    # The import into the CDISC DB reports its errors without raising them,
+    # so its `Import` node is checked to not import an incomplete package into the MDR DB
+    cdisc_neo4j_driver = get_cdisc_neo4j_driver()
+    with cdisc_neo4j_driver.session(database=CDISC_IMPORT_DATABASE) as session:
+        import_state = session.read_transaction(get_import_states).get(effective_date)
+    cdisc_neo4j_driver.close()
+
+    if import_state is None:
+        raise RuntimeError(
+            f"The import into the CDISC DB for the effective_date='{effective_date}' failed."
+        )
+    if import_state["running"]:
+        raise RuntimeError(
+            f"The import into the CDISC DB for the effective_date='{effective_date}' did not complete. "
+            "Its `Import` node needs to be deleted before importing it again."
+        )
+
+    wrapper_import_cdisc_ct_from_cdisc_db_into_mdr(
+        author_id=author_id, effective_date=effective_date
+    )
@@ -1,5 +1,7 @@
 import time
 import re
+from collections import defaultdict
+from os import environ
 from mdr_standards_import.scripts.utils import (
     are_lists_equal,
     get_sentence_case_string,
@@ -9,6 +11,9 @@ from mdr_standards_import.scripts.utils import (
 
 AUTHOR_ID = "CDISC_IMPORT"
 
+# Number of rows written, or codelists and terms looked up, by a single UNWIND statement
+BATCH_SIZE = int(environ.get("CDISC_CT_IMPORT_BATCH_SIZE", "1000"))
+
 
 def print_ignored_stats(tx, effective_date):
     result = tx.run(
@@ -170,91 +175,134 @@ def merge_codelist_terms_version_independent_data(tx, codelist_data):
     )
 
 
-def update_has_term_and_had_term_relationships(tx, codelists_data, effective_date):
-    nbr_added_terms = 0
-    nbr_removed_terms = 0
-    nbr_unchanged_terms = 0
-    for codelist_data in codelists_data:
-        codelist = codelist_data.get("codelist", None)
+def _run_in_batches(tx, query, rows, batch_size=BATCH_SIZE, **parameters):
+    # Runs the query, which unwinds the $rows parameter, for chunks of at most batch_size rows
+    for offset in range(0, len(rows), batch_size):
+        tx.run(query, rows=rows[offset : offset + batch_size], **parameters).consume()
 
-        codelist_term_uids = [
-            terms_data["term"]["uid"] for terms_data in codelist_data["terms_data"]
-        ]
 
+def _fetch_codelist_term_uids(tx, codelist_uids, effective_date, batch_size):
+    active_term_uids = defaultdict(list)
+    retired_term_uids = defaultdict(set)
+    for offset in range(0, len(codelist_uids), batch_size):
         result = tx.run(
             """
-            MATCH (:CTCodelistRoot{uid: $codelist_uid})-[ht:HAS_TERM]->(term_root)
+            UNWIND $codelist_uids AS codelist_uid
+            MATCH (:CTCodelistRoot{uid: codelist_uid})-[ht:HAS_TERM]->(term_root)
             WHERE ht.start_date <= datetime($effective_date)
-            RETURN DISTINCT term_root.uid AS uid, ht.start_date as start_date
+            RETURN DISTINCT codelist_uid, term_root.uid AS uid, ht.start_date as start_date
             """,
-            codelist_uid=codelist["concept_id"],
+            codelist_uids=codelist_uids[offset : offset + batch_size],
             effective_date=effective_date,
         )
-        matching_active_term_uids = list(result.value())
+        for record in result:
+            active_term_uids[record["codelist_uid"]].append(record["uid"])
 
         result = tx.run(
             """
-            MATCH (:CTCodelistRoot{uid: $codelist_uid})-[ht:HAD_TERM]->(term_root)
+            UNWIND $codelist_uids AS codelist_uid
+            MATCH (:CTCodelistRoot{uid: codelist_uid})-[ht:HAD_TERM]->(term_root)
             WHERE ht.start_date <= datetime($effective_date) AND ht.end_date > datetime($effective_date)
-            RETURN DISTINCT term_root.uid AS uid
+            RETURN DISTINCT codelist_uid, term_root.uid AS uid
             """,
-            codelist_uid=codelist["concept_id"],
+            codelist_uids=codelist_uids[offset : offset + batch_size],
             effective_date=effective_date,
         )
-        retired_term_uids = list(result.value())
+        for record in result:
+            retired_term_uids[record["codelist_uid"]].add(record["uid"])
+    return active_term_uids, retired_term_uids
+
+
+def update_has_term_and_had_term_relationships(
+    tx, codelists_data, effective_date, batch_size=BATCH_SIZE
+):
+    nbr_added_terms = 0
+    nbr_removed_terms = 0
+    nbr_unchanged_terms = 0
+
+    # The current terms of all codelists are fetched at once, and the changes are written in batches
+    active_term_uids, retired_term_uids = _fetch_codelist_term_uids(
+        tx,
+        [codelist_data["codelist"]["concept_id"] for codelist_data in codelists_data],
+        effective_date,
+        batch_size,
+    )
+    terms_to_deactivate = []
+    terms_to_add = []
+    for codelist_data in codelists_data:
+        codelist_uid = codelist_data["codelist"]["concept_id"]
+
+        codelist_term_uids = [
+            terms_data["term"]["uid"] for terms_data in codelist_data["terms_data"]
+        ]
+        matching_active_term_uids = active_term_uids[codelist_uid]
+        retired_uids = retired_term_uids[codelist_uid]
+        codelist_term_uid_set = set(codelist_term_uids)
+        matching_active_term_uid_set = set(matching_active_term_uids)
 
         term_uids_to_deactivate = [
             term_uid
             for term_uid in matching_active_term_uids
-            if term_uid not in codelist_term_uids and term_uid not in retired_term_uids
+            if term_uid not in codelist_term_uid_set and term_uid not in retired_uids
         ]
-
         nbr_removed_terms += len(term_uids_to_deactivate)
-        tx.run(
-            """
-            MATCH (codelist_root:CTCodelistRoot{uid: $codelist_uid})-[has_term:HAS_TERM]->(term_root)
-            WHERE term_root.uid IN $term_uids_to_deactivate
-
-            CREATE (codelist_root)-[had_term:HAD_TERM]->(term_root)
-            SET
-                had_term.start_date = has_term.start_date,
-                had_term.end_date = datetime($end_date),
-                had_term.author_id = has_term.author_id
-            DELETE has_term
-            """,
-            end_date=effective_date,
-            codelist_uid=codelist["concept_id"],
-            term_uids_to_deactivate=term_uids_to_deactivate,
+        terms_to_deactivate.extend(
+            {"codelist_uid": codelist_uid, "term_uid": term_uid}
+            for term_uid in dict.fromkeys(term_uids_to_deactivate)
         )
 
         term_uids_to_add = [
             term_uid
             for term_uid in codelist_term_uids
-            if term_uid not in matching_active_term_uids
-            and term_uid not in retired_term_uids
+            if term_uid not in matching_active_term_uid_set
+            and term_uid not in retired_uids
         ]
         nbr_added_terms += len(term_uids_to_add)
-        tx.run(
-            """
-            MATCH (codelist_root:CTCodelistRoot{uid: $codelist_uid})
-            MATCH (term_root:CTTermRoot)
-            WHERE term_root.uid IN $new_term_uids
-
-            CREATE (codelist_root)-[:HAS_TERM{
-                start_date: datetime($start_date),
-                author_id: $author_id
-            }]->(term_root)
-            """,
-            start_date=effective_date,
-            codelist_uid=codelist["concept_id"],
-            new_term_uids=term_uids_to_add,
-            author_id=AUTHOR_ID,
+        terms_to_add.extend(
+            {"codelist_uid": codelist_uid, "term_uid": term_uid}
+            for term_uid in dict.fromkeys(term_uids_to_add)
         )
+
         nbr_unchanged_terms += (
             len(codelist_term_uids)
             - len(term_uids_to_add)
             - len(term_uids_to_deactivate)
         )
+
+    _run_in_batches(
+        tx,
+        """
+        UNWIND $rows AS row
+        MATCH (codelist_root:CTCodelistRoot{uid: row.codelist_uid})-[has_term:HAS_TERM]->(term_root{uid: row.term_uid})
+
+        CREATE (codelist_root)-[had_term:HAD_TERM]->(term_root)
+        SET
+            had_term.start_date = has_term.start_date,
+            had_term.end_date = datetime($end_date),
+            had_term.author_id = has_term.author_id
+        DELETE has_term
+        """,
+        terms_to_deactivate,
+        batch_size,
+        end_date=effective_date,
+    )
+    _run_in_batches(
+        tx,
+        """
+        UNWIND $rows AS row
+        MATCH (codelist_root:CTCodelistRoot{uid: row.codelist_uid})
+        MATCH (term_root:CTTermRoot{uid: row.term_uid})
+
+        CREATE (codelist_root)-[:HAS_TERM{
+            start_date: datetime($start_date),
+            author_id: $author_id
+        }]->(term_root)
+        """,
+        terms_to_add,
+        batch_size,
+        start_date=effective_date,
+        author_id=AUTHOR_ID,
+    )
     # delete_contains_term_relationships(tx)
     return nbr_added_terms, nbr_removed_terms, nbr_unchanged_terms
 
@@ -525,7 +573,7 @@ def _fetch_all_codelists(tx, concept_ids, effective_date):
     return codelists
 
 
-def update_attributes(tx, codelists_data, effective_date):
+def update_attributes(tx, codelists_data, effective_date, batch_size=BATCH_SIZE):
     new_terms = 0
     updated_terms = 0
     unchanged_terms = 0
@@ -536,6 +584,17 @@ def update_attributes(tx, codelists_data, effective_date):
 
     cl_concept_ids = [cl["codelist"]["concept_id"] for cl in codelists_data]
     all_existing_codelists = _fetch_all_codelists(tx, cl_concept_ids, effective_date)
+    # The terms of all codelists are fetched at once, and their values are written in batches
+    term_uids = list(
+        dict.fromkeys(
+            term_data["term"]["uid"]
+            for codelist_data in codelists_data
+            for term_data in codelist_data.get("terms_data", {})
+        )
+    )
+    term_values_merge = TermValuesMerge(
+        _fetch_all_terms(tx, term_uids, effective_date, batch_size), effective_date
+    )
     for codelist_data in codelists_data:
         codelist = codelist_data.get("codelist", None)
         terms_data = codelist_data.get("terms_data", {})
@@ -577,12 +636,11 @@ def update_attributes(tx, codelists_data, effective_date):
                 use_existing_codelist_attributes_value(tx, codelist, packages)
                 unchanged_codelists += 1
 
-        new_t, upd_t, unch_t = merge_term_values(
-            tx, codelist, effective_date, terms_data
-        )
+        new_t, upd_t, unch_t = term_values_merge.merge(codelist, terms_data)
         new_terms += new_t
         updated_terms += upd_t
         unchanged_terms += unch_t
+    term_values_merge.apply(tx, batch_size)
     return {
         "new_codelists": new_codelists,
         "updated_codelists": updated_codelists,
@@ -725,82 +783,141 @@ def _are_term_attribute_values_equal(a, b):
     return result
 
 
-def _fetch_all_terms(tx, term_uids, effective_date):
+def _fetch_all_terms(tx, term_uids, effective_date, batch_size=BATCH_SIZE):
     query = """
-        MATCH (root:CTTermRoot)-[:HAS_ATTRIBUTES_ROOT]->(attr_root)-[:LATEST]->(t_attributes_value)
-        WHERE root.uid IN $term_uids
+        UNWIND $term_uids AS term_uid
+        MATCH (root:CTTermRoot{uid: term_uid})-[:HAS_ATTRIBUTES_ROOT]->(attr_root)-[:LATEST]->(t_attributes_value)
         OPTIONAL MATCH (attr_root)-[hv:HAS_VERSION]->(t_attributes_value_for_date)
         WHERE hv.end_date IS NOT NULL AND hv.start_date <= datetime($effective_date) AND hv.end_date > datetime($effective_date)
         RETURN root.uid AS uid, t_attributes_value, t_attributes_value_for_date
     """
-    result = tx.run(query, effective_date=effective_date, term_uids=term_uids)
     terms = {}
-    for term in result:
-        terms[term["uid"]] = term
+    for offset in range(0, len(term_uids), batch_size):
+        result = tx.run(
+            query,
+            effective_date=effective_date,
+            term_uids=term_uids[offset : offset + batch_size],
+        )
+        for term in result:
+            terms[term["uid"]] = term
     # print(f"got {len(terms)} terms")
     return terms
 
 
-def merge_term_values(tx, codelist, effective_date_string, terms_data):
-    new_terms = 0
-    updated_terms = 0
-    unchanged_terms = 0
-    term_uids = [term["term"]["uid"] for term in terms_data]
-    all_existing_terms = _fetch_all_terms(tx, term_uids, effective_date_string)
-    for term_data in terms_data:
-        term = term_data.get("term", None)
-        packages = term_data.get("packages", None)
-
-        record = all_existing_terms.get(term["uid"])
+class TermValuesMerge:
+    """
+    Merges the attributes values of the terms of imported codelists.
 
-        if record is None:
-            create_initial_term_attributes_value(
-                tx, effective_date_string, term, packages
-            )
-            create_initial_term_names(
-                tx,
-                term,
-                sponsor_specific_parse_term_name(codelist, term),
-                "Initial import from CDISC",
-            )
-            new_terms += 1
-        else:
-            value = record["t_attributes_value"]
-            value_for_date = record["t_attributes_value_for_date"]
+    The terms are compared with their values fetched beforehand, as updated by the terms of the previous codelists,
+    and the resulting writes are collected to be applied in batches by `apply`.
+    The writes of a term are applied in the order of its codelists, in rounds of at most one write per term.
+    """
 
-            if value_for_date is not None:
-                if _are_term_attribute_values_equal(value_for_date, term):
-                    unchanged_terms += 1
+    def __init__(self, existing_terms, effective_date_string):
+        self.effective_date_string = effective_date_string
+        self._terms = {
+            uid: (record["t_attributes_value"], record["t_attributes_value_for_date"])
+            for uid, record in existing_terms.items()
+        }
+        self._rounds = []
+        self._names = []
+
+    def merge(self, codelist, terms_data):
+        new_terms = 0
+        updated_terms = 0
+        unchanged_terms = 0
+        for term_data in terms_data:
+            term = term_data.get("term", None)
+            packages = term_data.get("packages", None)
+
+            record = self._terms.get(term["uid"])
+
+            if record is None:
+                self._add_write(term, "initial", {"term": term, "packages": packages})
+                name = sponsor_specific_parse_term_name(codelist, term)
+                self._names.append(
+                    {
+                        "term_uid": term["uid"],
+                        "name": name,
+                        "name_sentence_case": get_sentence_case_string(name),
+                    }
+                )
+                self._terms[term["uid"]] = (term, None)
+                new_terms += 1
+            else:
+                value, value_for_date = record
+
+                if value_for_date is not None:
+                    if _are_term_attribute_values_equal(value_for_date, term):
+                        unchanged_terms += 1
+                    else:
+                        print(term)
+                        print(value_for_date)
+                        raise RuntimeError(
+                            f"Oh my god! Term {term['concept_id']} already has a version for {self.effective_date_string} but the definition has changed!"
+                        )
+
+                elif not _are_term_attribute_values_equal(value, term):
+                    self._add_write(
+                        term, "new_version", {"term": term, "packages": packages}
+                    )
+                    self._terms[term["uid"]] = (term, None)
+                    updated_terms += 1
                 else:
-                    print(term)
-                    print(value_for_date)
-                    raise RuntimeError(
-                        f"Oh my god! Term {term['concept_id']} already has a version for {effective_date_string} but the definition has changed!"
+                    self._add_write(
+                        term,
+                        "existing",
+                        {"term_uid": term["uid"], "packages": packages},
                     )
+                    unchanged_terms += 1
+        return new_terms, updated_terms, unchanged_terms
 
-            elif not _are_term_attribute_values_equal(value, term):
-                create_new_version_term_attributes_value(
-                    tx, effective_date_string, term, packages
-                )
-                updated_terms += 1
-            else:
-                use_existing_term_attributes_value(tx, term, packages)
-                unchanged_terms += 1
-    return new_terms, updated_terms, unchanged_terms
+    def _add_write(self, term, kind, row):
+        uid = term["uid"]
+        for writes in self._rounds:
+            if uid not in writes["uids"]:
+                break
+        else:
+            writes = {
+                "uids": set(),
+                "initial": [],
+                "new_version": [],
+                "existing": [],
+            }
+            self._rounds.append(writes)
+        writes["uids"].add(uid)
+        writes[kind].append(row)
+
+    def apply(self, tx, batch_size=BATCH_SIZE):
+        for writes in self._rounds:
+            create_initial_term_attributes_values(
+                tx, self.effective_date_string, writes["initial"], batch_size
+            )
+            create_new_version_term_attributes_values(
+                tx, self.effective_date_string, writes["new_version"], batch_size
+            )
+            use_existing_term_attributes_values(tx, writes["existing"], batch_size)
+        create_initial_term_names(
+            tx, self._names, "Initial import from CDISC", batch_size
+        )
 
 
-def create_initial_term_attributes_value(tx, effective_date_string, term, packages):
-    tx.run(
+def create_initial_term_attributes_values(
+    tx, effective_date_string, rows, batch_size=BATCH_SIZE
+):
+    _run_in_batches(
+        tx,
         """
-        MATCH (:CTTermRoot{uid: $term.uid})-[:HAS_ATTRIBUTES_ROOT]->(t_attributes_root)
+        UNWIND $rows AS row
+        MATCH (:CTTermRoot{uid: row.term.uid})-[:HAS_ATTRIBUTES_ROOT]->(t_attributes_root)
         CREATE (t_attributes_value: CTTermAttributesValue)
         SET
-            t_attributes_value.code_submission_value = $term.code_submission_value,
-            t_attributes_value.name_submission_value = $term.name_submission_value,
-            t_attributes_value.preferred_term = $term.preferred_term,
-            t_attributes_value.definition = $term.definition,
-            t_attributes_value.synonyms = $term.synonyms,
-            t_attributes_value.concept_id = $term.concept_id
+            t_attributes_value.code_submission_value = row.term.code_submission_value,
+            t_attributes_value.name_submission_value = row.term.name_submission_value,
+            t_attributes_value.preferred_term = row.term.preferred_term,
+            t_attributes_value.definition = row.term.definition,
+            t_attributes_value.synonyms = row.term.synonyms,
+            t_attributes_value.concept_id = row.term.concept_id
         CREATE (t_attributes_root)-[:LATEST]->(t_attributes_value)
         CREATE (t_attributes_root)-[:LATEST_FINAL]->(t_attributes_value)
         CREATE (t_attributes_root)-[:HAS_VERSION{
@@ -811,28 +928,30 @@ def create_initial_term_attributes_value(tx, effective_date_string, term, packag
             author_id: $author_id
         }]->(t_attributes_value)
 
-        WITH t_attributes_value
-        FOREACH (package IN $packages |
-            MERGE (package_term:CTPackageTerm{uid: package.name + "_" + $term.uid})
+        WITH row, t_attributes_value
+        FOREACH (package IN row.packages |
+            MERGE (package_term:CTPackageTerm{uid: package.name + "_" + row.term.uid})
             CREATE (package_term)-[:CONTAINS_ATTRIBUTES]->(t_attributes_value)
         )
         """,
+        rows,
+        batch_size,
         effective_date_string=effective_date_string,
-        term=term,
-        packages=packages,
         author_id=AUTHOR_ID,
     )
 
 
-def create_initial_term_names(tx, term, name, change_description):
-    tx.run(
+def create_initial_term_names(tx, rows, change_description, batch_size=BATCH_SIZE):
+    _run_in_batches(
+        tx,
         """
-        MATCH (term_root:CTTermRoot{uid: $term_uid})-[:HAS_NAME_ROOT]->(name_root)
+        UNWIND $rows AS row
+        MATCH (term_root:CTTermRoot{uid: row.term_uid})-[:HAS_NAME_ROOT]->(name_root)
         WHERE NOT (name_root)-[:LATEST]->()
         CREATE (name_root)-[:LATEST]->(name_value:CTTermNameValue)
         SET
-            name_value.name = $name,
-            name_value.name_sentence_case = $name_sentence_case
+            name_value.name = row.name,
+            name_value.name_sentence_case = row.name_sentence_case
         CREATE (name_root)-[:LATEST_FINAL]->(name_value)
         CREATE (name_root)-[:HAS_VERSION{
             start_date: datetime(),
@@ -842,68 +961,76 @@ def create_initial_term_names(tx, term, name, change_description):
             author_id: $author_id
         }]->(name_value)
         """,
-        term_uid=term["uid"],
-        name=name,
-        name_sentence_case=get_sentence_case_string(name),
+        rows,
+        batch_size,
         author_id=AUTHOR_ID,
         change_description=change_description,
-    ).consume()
+    )
 
 
-def create_new_version_term_attributes_value(tx, effective_date_string, term, packages):
-    tx.run(
+def create_new_version_term_attributes_values(
+    tx, effective_date_string, rows, batch_size=BATCH_SIZE
+):
+    # The subquery ends the previous version of each term on its own, as it is limited to one row
+    _run_in_batches(
+        tx,
         """
-        MATCH (:CTTermRoot{uid: $term.uid})-[:HAS_ATTRIBUTES_ROOT]
-            ->(t_attributes_root)-[latest_final:LATEST_FINAL]->(t_old_attributes_value)
-            <-[latest:LATEST]-(t_attributes_root)
-        WITH t_attributes_root, t_old_attributes_value, latest, latest_final
-        MATCH (t_attributes_root)-[has_version:HAS_VERSION]->(t_old_attributes_value)
-        SET has_version.end_date = datetime($effective_date_string)
-        DELETE latest, latest_final
-
-        WITH t_attributes_root, has_version.version AS version LIMIT 1
-        CREATE (t_new_attributes_value:CTTermAttributesValue)
-        SET
-            t_new_attributes_value.code_submission_value = $term.code_submission_value,
-            t_new_attributes_value.name_submission_value = $term.name_submission_value,
-            t_new_attributes_value.preferred_term = $term.preferred_term,
-            t_new_attributes_value.definition = $term.definition,
-            t_new_attributes_value.synonyms = $term.synonyms,
-            t_new_attributes_value.concept_id = $term.concept_id
-        CREATE (t_attributes_root)-[:LATEST_FINAL]->(t_new_attributes_value)
-        CREATE (t_attributes_root)-[:HAS_VERSION{
-            start_date: datetime($effective_date_string),
-            status: 'Final',
-            version: toString(coalesce(toInteger(split(version, '.')[0]), 0) + 1) + '.0',
-            change_description: 'Imported from CDISC',
-            author_id: $author_id
-        }]->(t_new_attributes_value)
-        CREATE (t_attributes_root)-[:LATEST]->(t_new_attributes_value)
+        UNWIND $rows AS row
+        CALL { WITH row
+            MATCH (:CTTermRoot{uid: row.term.uid})-[:HAS_ATTRIBUTES_ROOT]
+                ->(t_attributes_root)-[latest_final:LATEST_FINAL]->(t_old_attributes_value)
+                <-[latest:LATEST]-(t_attributes_root)
+            WITH row, t_attributes_root, t_old_attributes_value, latest, latest_final
+            MATCH (t_attributes_root)-[has_version:HAS_VERSION]->(t_old_attributes_value)
+            SET has_version.end_date = datetime($effective_date_string)
+            DELETE latest, latest_final
+
+            WITH row, t_attributes_root, has_version.version AS version LIMIT 1
+            CREATE (t_new_attributes_value:CTTermAttributesValue)
+            SET
+                t_new_attributes_value.code_submission_value = row.term.code_submission_value,
+                t_new_attributes_value.name_submission_value = row.term.name_submission_value,
+                t_new_attributes_value.preferred_term = row.term.preferred_term,
+                t_new_attributes_value.definition = row.term.definition,
+                t_new_attributes_value.synonyms = row.term.synonyms,
+                t_new_attributes_value.concept_id = row.term.concept_id
+            CREATE (t_attributes_root)-[:LATEST_FINAL]->(t_new_attributes_value)
+            CREATE (t_attributes_root)-[:HAS_VERSION{
+                start_date: datetime($effective_date_string),
+                status: 'Final',
+                version: toString(coalesce(toInteger(split(version, '.')[0]), 0) + 1) + '.0',
+                change_description: 'Imported from CDISC',
+                author_id: $author_id
+            }]->(t_new_attributes_value)
+            CREATE (t_attributes_root)-[:LATEST]->(t_new_attributes_value)
 
-        WITH t_new_attributes_value
-        FOREACH (package IN $packages |
-            MERGE (package_term:CTPackageTerm{uid: package.name + "_" + $term.uid})
-            CREATE (package_term)-[:CONTAINS_ATTRIBUTES]->(t_new_attributes_value)
-        )
+            WITH row, t_new_attributes_value
+            FOREACH (package IN row.packages |
+                MERGE (package_term:CTPackageTerm{uid: package.name + "_" + row.term.uid})
+                CREATE (package_term)-[:CONTAINS_ATTRIBUTES]->(t_new_attributes_value)
+            )
+        }
         """,
+        rows,
+        batch_size,
         effective_date_string=effective_date_string,
-        term=term,
-        packages=packages,
         author_id=AUTHOR_ID,
     )
 
 
-def use_existing_term_attributes_value(tx, term, packages):
-    tx.run(
+def use_existing_term_attributes_values(tx, rows, batch_size=BATCH_SIZE):
+    _run_in_batches(
+        tx,
         """
-        MATCH (:CTTermRoot{uid: $term.uid})-[:HAS_ATTRIBUTES_ROOT]->()-[:LATEST]->(t_attributes_value)
-        WITH t_attributes_value
-        UNWIND $packages AS package
-            MATCH (package_term:CTPackageTerm{uid: package.name + "_" + $term.uid})
+        UNWIND $rows AS row
+        MATCH (:CTTermRoot{uid: row.term_uid})-[:HAS_ATTRIBUTES_ROOT]->()-[:LATEST]->(t_attributes_value)
+        WITH row, t_attributes_value
+        UNWIND row.packages AS package
+            MATCH (package_term:CTPackageTerm{uid: package.name + "_" + row.term_uid})
             MERGE (package_term)-[:CONTAINS_ATTRIBUTES]->(t_attributes_value)
         """,
-        term=term,
-        packages=packages,
+        rows,
+        batch_size,
     )
 
 
@@ -1050,6 +1177,22 @@ def sponsor_specific_parse_term_name(codelist, term):
     return newname
 
 
+def finish_mdr_import(tx, effective_date):
+    # Records the import into the MDR DB on the `Import` node, to resume bulk imports after it
+    tx.run(
+        """
+        MATCH (import:Import{effective_date: date($effective_date)})
+        SET import.mdr_import_date_time = datetime()
+        """,
+        effective_date=effective_date,
+    ).consume()
+
+
+def print_stage_duration(stage, stage_start_time):
+    elapsed_time = time.time() - stage_start_time
+    print(f"==      {stage} took {round(elapsed_time, 1)} seconds")
+
+
 def import_from_cdisc_db_into_mdr(
     effective_date,
     cdisc_ct_neo4j_driver,
@@ -1073,8 +1216,10 @@ def import_from_cdisc_db_into_mdr(
             tx.commit()
 
         # read from the CDISC DB
+        stage_start_time = time.time()
         packages_data = session.read_transaction(get_packages, effective_date)
         codelists_data = session.read_transaction(get_codelists, effective_date)
+        print_stage_duration("Reading the CDISC DB", stage_start_time)
 
         session.close()
 
@@ -1085,13 +1230,16 @@ def import_from_cdisc_db_into_mdr(
         # session.write_transaction(retire_codelists, packages_data, effective_date)
 
         print("==  * Merging structure nodes and relationships.")
+        stage_start_time = time.time()
         session.write_transaction(
             merge_catalogues_and_packages,
             packages_data,
             effective_date,
         )
+        print_stage_duration("Merging structure", stage_start_time)
         session.close()
     print("==  * Merging version independant codelist data.")
+    stage_start_time = time.time()
     with mdr_neo4j_driver.session(database=mdr_db_name) as session:
         for data in codelists_data:
             # This is split into three separate transactions to reduce ram footprint
@@ -1107,19 +1255,23 @@ def import_from_cdisc_db_into_mdr(
                 data,
             )
         session.close()
+    print_stage_duration("Merging version independent data", stage_start_time)
 
     with mdr_neo4j_driver.session(database=mdr_db_name) as session:
         print("==  * Updating HAS_TERM and HAD_TERM relationships.")
+        stage_start_time = time.time()
         added_terms, removed_terms, unchanged_terms = session.write_transaction(
             update_has_term_and_had_term_relationships, codelists_data, effective_date
         )
         print(f"==      Terms added to codelists:     {added_terms:6}")
         print(f"==      Terms removed from codelists: {removed_terms:6}")
         print(f"==      Unchanged terms in codelists: {unchanged_terms:6}")
+        print_stage_duration("Updating HAS_TERM and HAD_TERM", stage_start_time)
         session.close()
 
     with mdr_neo4j_driver.session(database=mdr_db_name) as session:
         print("==  * Updating attributes.")
+        stage_start_time = time.time()
         summary = session.write_transaction(
             update_attributes, codelists_data, effective_date
         )
@@ -1129,9 +1281,14 @@ def import_from_cdisc_db_into_mdr(
         print(f"==      New terms:           {summary['new_terms']:6}")
         print(f"==      Updated terms:       {summary['updated_terms']:6}")
         print(f"==      Unchanged terms:     {summary['unchanged_terms']:6}")
+        print_stage_duration("Updating attributes", stage_start_time)
 
         session.close()
 
+    with cdisc_ct_neo4j_driver.session(database=cdisc_db_name) as session:
+        session.write_transaction(finish_mdr_import, effective_date)
+        session.close()
+
     end_time = time.time()
     elapsed_time = end_time - start_time
     print(f"== Duration: {round(elapsed_time, 1)} seconds")
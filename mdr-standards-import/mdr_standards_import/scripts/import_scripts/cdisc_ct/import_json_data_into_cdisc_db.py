@@ -75,6 +75,25 @@ def finish_import(tx, import_id):
     ).single()
 
 
+def create_cdisc_db_if_not_existent(cdisc_import_neo4j_driver, cdisc_import_db_name):
+    """
+    Creates the CDISC DB and its indexes if they don't exist yet.
+    """
+
+    # If using a staging database, it might not exist yet
+    # so we need to create it first
+    if cdisc_import_db_name != NEO4J_MDR_DATABASE:
+        with cdisc_import_neo4j_driver.session(database="system") as session:
+            session.run(
+                "CREATE DATABASE $database IF NOT EXISTS",
+                database=cdisc_import_db_name,
+            )
+
+    with cdisc_import_neo4j_driver.session(database=cdisc_import_db_name) as session:
+        session.write_transaction(create_indexes_if_not_existent)
+        session.write_transaction(await_indexes)
+
+
 def import_json_data_into_cdisc_db(
     effective_date,
     data_directory,
@@ -98,20 +117,11 @@ def import_json_data_into_cdisc_db(
         start_time = time.time()
         ct_import = CTImport(effective_date, author_id)
 
-        # If using a staging database, it might not exist yet
-        # so we need to create it first
-        if cdisc_import_db_name != NEO4J_MDR_DATABASE:
-            with cdisc_import_neo4j_driver.session(database="system") as session:
-                session.run(
-                    "CREATE DATABASE $database IF NOT EXISTS",
-                    database=cdisc_import_db_name,
-                )
+        create_cdisc_db_if_not_existent(cdisc_import_neo4j_driver, cdisc_import_db_name)
 
         with cdisc_import_neo4j_driver.session(
             database=cdisc_import_db_name
         ) as session:
-            session.write_transaction(create_indexes_if_not_existent)
-            session.write_transaction(await_indexes)
             import_id = session.write_transaction(create_import_node, ct_import)
 
             file_names = [
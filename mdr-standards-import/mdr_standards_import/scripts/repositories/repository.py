@@ -91,6 +91,31 @@ def _does_import_node_exists(tx, ct_import: CTImport):
     return result is not None and result["does_import_exist"] == True
 
 
+def get_import_states(tx):
+    """
+    Returns the state of the `Import` node of each effective date (in ISO 8601 format) found in the CDISC DB:
+    whether its import into the CDISC DB is still running (or did not complete),
+    and whether it was imported into the MDR DB.
+    """
+
+    result = tx.run(
+        """
+        MATCH (import:Import)
+        RETURN
+            toString(import.effective_date) AS effective_date,
+            import:Running AS running,
+            import.mdr_import_date_time IS NOT NULL AS imported_into_mdr
+        """
+    )
+    return {
+        record["effective_date"]: {
+            "running": record["running"],
+            "imported_into_mdr": record["imported_into_mdr"],
+        }
+        for record in result
+    }
+
+
 def create_ct_import(ct_import: CTImport, session):
     effective_date = ct_import.effective_date
 
@@ -0,0 +1,85 @@
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass
+class Task:
+    name: str
+    function: Callable[..., Any]
+    kwargs: dict = field(default_factory=dict)
+    depends_on: list = field(default_factory=list)
+
+
+class Scheduler:
+    """
+    Runs tasks concurrently in a pool of workers, each task as soon as all the tasks it depends on are done.
+
+    The tasks are run in separate processes by default, their functions and arguments need to be picklable.
+    A task is skipped if any of the tasks it depends on failed or was skipped.
+    """
+
+    def __init__(self, workers: int, executor_class=ProcessPoolExecutor):
+        self.workers = workers
+        self.executor_class = executor_class
+        self._tasks: dict[str, Task] = {}
+
+    def add(self, name: str, function: Callable[..., Any], depends_on=(), **kwargs):
+        """
+        Adds a task calling the function with the given keyword arguments, returns the name of the task.
+
+        The tasks it depends on have to be added before.
+        """
+        if name in self._tasks:
+            raise ValueError(f"The task '{name}' already exists.")
+        for dependency in depends_on:
+            if dependency not in self._tasks:
+                raise ValueError(
+                    f"The task '{name}' depends on the unknown task '{dependency}'."
+                )
+        self._tasks[name] = Task(name, function, kwargs, list(depends_on))
+        return name
+
+    def run(self):
+        """
+        Runs all tasks, returns the state of each task by its name: DONE, FAILED or SKIPPED.
+        """
+        states = {}
+        pending = dict(self._tasks)
+        running = {}
+        with self.executor_class(max_workers=self.workers) as executor:
+            while pending or running:
+                # The tasks are added after the tasks they depend on, so a single pass skips all dependents
+                for name, task in list(pending.items()):
+                    dependency_states = [states.get(d) for d in task.depends_on]
+                    if FAILED in dependency_states or SKIPPED in dependency_states:
+                        print(f"== Skipping '{name}'.")
+                        states[name] = SKIPPED
+                        del pending[name]
+                    elif all(state == DONE for state in dependency_states):
+                        print(f"== Starting '{name}'.")
+                        future = executor.submit(task.function, **task.kwargs)
+                        running[future] = name
+                        del pending[name]
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    exception = future.exception()
+                    if exception is None:
+                        print(f"== Finished '{name}'.")
+                        states[name] = DONE
+                    else:
+                        print(f"== Exception in '{name}':")
+                        traceback.print_exception(
+                            type(exception), exception, exception.__traceback__
+                        )
+                        states[name] = FAILED
+        return states
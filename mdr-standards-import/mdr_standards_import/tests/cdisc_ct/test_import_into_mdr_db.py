@@ -0,0 +1,152 @@
+import pytest
+
+from mdr_standards_import.scripts.import_scripts.cdisc_ct.import_into_mdr_db import (
+    TermValuesMerge,
+    update_has_term_and_had_term_relationships,
+)
+
+EFFECTIVE_DATE = "2024-03-29"
+
+
+class Result(list):
+    def consume(self):
+        pass
+
+
+class Transaction:
+    """Records the statements run, returning the given results of the statements reading data"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    def run(self, query, **parameters):
+        self.statements.append((query, parameters))
+        if "RETURN" in query:
+            return Result(self.results.pop(0))
+        return Result()
+
+    def writes(self):
+        return [
+            (query, parameters)
+            for query, parameters in self.statements
+            if "RETURN" not in query
+        ]
+
+
+def codelist_data(concept_id, *term_uids):
+    return {
+        "codelist": {"concept_id": concept_id},
+        "terms_data": [
+            {"term": term(uid), "packages": [{"name": "SDTM CT 2024-03-29"}]}
+            for uid in term_uids
+        ],
+    }
+
+
+def term(uid, definition="definition"):
+    return {
+        "uid": uid,
+        "concept_id": uid.split("_")[0],
+        "code_submission_value": uid.split("_")[1],
+        "name_submission_value": None,
+        "preferred_term": f"Preferred {uid}",
+        "definition": definition,
+        "synonyms": [],
+    }
+
+
+class TestImportIntoMdrDb:
+    def test__update_has_term_and_had_term_relationships__batched(self):
+        # given
+        tx = Transaction(
+            [
+                {"codelist_uid": "C1", "uid": "C10_A", "start_date": None},
+                {"codelist_uid": "C1", "uid": "C11_B", "start_date": None},
+                {"codelist_uid": "C1", "uid": "C12_C", "start_date": None},
+                {"codelist_uid": "C2", "uid": "C20_D", "start_date": None},
+            ],
+            [{"codelist_uid": "C1", "uid": "C12_C"}],
+        )
+
+        # when
+        added, removed, unchanged = update_has_term_and_had_term_relationships(
+            tx,
+            [
+                codelist_data("C1", "C10_A", "C13_E", "C14_F", "C15_G"),
+                codelist_data("C2", "C20_D"),
+            ],
+            EFFECTIVE_DATE,
+            batch_size=2,
+        )
+
+        # then
+        assert (added, removed, unchanged) == (3, 1, 1)
+        # the terms of all codelists are read by one statement per relationship type
+        assert len(tx.statements) - len(tx.writes()) == 2
+        deactivations, *additions = tx.writes()
+        assert "HAD_TERM" in deactivations[0]
+        assert deactivations[1]["rows"] == [{"codelist_uid": "C1", "term_uid": "C11_B"}]
+        assert [parameters["rows"] for _, parameters in additions] == [
+            [
+                {"codelist_uid": "C1", "term_uid": "C13_E"},
+                {"codelist_uid": "C1", "term_uid": "C14_F"},
+            ],
+            [{"codelist_uid": "C1", "term_uid": "C15_G"}],
+        ]
+
+    def test__term_values_merge__writes_in_order_of_codelists(self):
+        # given
+        merge = TermValuesMerge(
+            {
+                "C10_A": {
+                    "t_attributes_value": term("C10_A"),
+                    "t_attributes_value_for_date": None,
+                },
+                "C11_B": {
+                    "t_attributes_value": term("C11_B", definition="old"),
+                    "t_attributes_value_for_date": None,
+                },
+            },
+            EFFECTIVE_DATE,
+        )
+
+        # when
+        first = merge.merge(
+            {"concept_id": "C1"},
+            codelist_data("C1", "C10_A", "C11_B", "C12_C")["terms_data"],
+        )
+        second = merge.merge(
+            {"concept_id": "C2"}, codelist_data("C2", "C12_C")["terms_data"]
+        )
+        tx = Transaction()
+        merge.apply(tx, batch_size=1000)
+
+        # then
+        assert first == (1, 1, 1)
+        assert second == (0, 0, 1)
+        # the new term is only used by the second codelist once it is created
+        writes = [
+            [row.get("term_uid") or row["term"]["uid"] for row in parameters["rows"]]
+            for _, parameters in tx.writes()
+        ]
+        assert writes == [["C12_C"], ["C11_B"], ["C10_A"], ["C12_C"], ["C12_C"]]
+        assert "CTTermNameValue" in tx.writes()[-1][0]
+
+    def test__term_values_merge__changed_version_for_date(self):
+        # given
+        merge = TermValuesMerge(
+            {
+                "C10_A": {
+                    "t_attributes_value": term("C10_A"),
+                    "t_attributes_value_for_date": term("C10_A", definition="old"),
+                }
+            },
+            EFFECTIVE_DATE,
+        )
+
+        # when, then
+        with pytest.raises(RuntimeError):
+            merge.merge(
+                {"concept_id": "C1"}, codelist_data("C1", "C10_A")["terms_data"]
+            )
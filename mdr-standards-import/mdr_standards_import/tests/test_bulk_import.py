@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from unittest import mock
+
+import pytest
+
+from mdr_standards_import.scripts.import_scripts import bulk_import
+from mdr_standards_import.scripts.scheduler import Scheduler
+
+PACKAGE_DATES = ["2014-09-26", "2014-12-19", "2015-03-27"]
+
+
+def state(running=False, imported_into_mdr=False):
+    return {"running": running, "imported_into_mdr": imported_into_mdr}
+
+
+@pytest.fixture(name="steps")
+def fixture_steps():
+    """Runs the bulk import with the steps recorded in their order, instead of importing anything"""
+    steps = []
+
+    def record(step, **kwargs):
+        steps.append((step, kwargs.get("effective_date")))
+
+    with (
+        mock.patch.object(bulk_import, "get_cdisc_neo4j_driver"),
+        mock.patch.object(bulk_import, "create_cdisc_db_if_not_existent"),
+        mock.patch.object(
+            bulk_import, "get_ordered_package_dates", return_value=PACKAGE_DATES
+        ),
+        mock.patch.object(
+            bulk_import,
+            "Scheduler",
+            partial(Scheduler, executor_class=ThreadPoolExecutor),
+        ),
+        mock.patch.object(
+            bulk_import,
+            "import_cdisc_ct_into_cdisc_db",
+            partial(record, "ct into cdisc"),
+        ),
+        mock.patch.object(
+            bulk_import,
+            "import_cdisc_ct_from_cdisc_db_into_mdr",
+            partial(record, "ct into mdr"),
+        ),
+        mock.patch.object(
+            bulk_import,
+            "wrapper_import_cdisc_data_models_into_cdisc_db",
+            partial(record, "data models into cdisc"),
+        ),
+        mock.patch.object(
+            bulk_import,
+            "wrapper_import_cdisc_data_models_from_cdisc_db_into_mdr",
+            partial(record, "data models into mdr"),
+        ),
+    ):
+        yield steps
+
+
+def run_bulk_import(import_states, resume):
+    session = bulk_import.get_cdisc_neo4j_driver.return_value.session.return_value
+    session.__enter__.return_value.read_transaction.return_value = import_states
+    bulk_import.bulk_import("TEST", workers=4, resume=resume)
+
+
+class TestBulkImport:
+    def test__get_dates_imported_into_mdr(self):
+        # given
+        import_states = {
+            "2014-09-26": state(imported_into_mdr=True),
+            "2014-12-19": state(),
+            "2015-03-27": state(imported_into_mdr=True),
+        }
+
+        # when, then
+        assert bulk_import.get_dates_imported_into_mdr(
+            PACKAGE_DATES, import_states
+        ) == ["2014-09-26"]
+        assert bulk_import.get_dates_imported_into_mdr(PACKAGE_DATES, {}) == []
+
+    def test__bulk_import__keeps_order_of_imports_into_mdr(self, steps):
+        # when
+        run_bulk_import({}, resume=False)
+
+        # then
+        ct_into_mdr = [date for step, date in steps if step == "ct into mdr"]
+        assert ct_into_mdr == PACKAGE_DATES
+        for effective_date in PACKAGE_DATES:
+            assert steps.index(("ct into cdisc", effective_date)) < steps.index(
+                ("ct into mdr", effective_date)
+            )
+        assert steps[-1] == ("data models into mdr", None)
+        assert steps.index(("data models into cdisc", None)) < len(steps) - 1
+
+    def test__bulk_import__resumes_after_dates_imported_into_mdr(self, steps):
+        # when
+        run_bulk_import(
+            {
+                "2014-09-26": state(imported_into_mdr=True),
+                "2014-12-19": state(),
+            },
+            resume=True,
+        )
+
+        # then
+        assert sorted(steps[:-1]) == [
+            ("ct into cdisc", "2015-03-27"),
+            ("ct into mdr", "2014-12-19"),
+            ("ct into mdr", "2015-03-27"),
+            ("data models into cdisc", None),
+        ]
+        assert steps[-1] == ("data models into mdr", None)
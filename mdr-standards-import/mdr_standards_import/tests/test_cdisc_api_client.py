@@ -0,0 +1,324 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import listdir, path
+from unittest import mock
+
+import pytest
+from requests.exceptions import HTTPError
+
+from mdr_standards_import.scripts import download_json_data_from_cdisc_api
+from mdr_standards_import.scripts.cdisc_api_client import CdiscApiClient
+from mdr_standards_import.scripts.entities.cdisc_ct.ct_import import CTImport
+from mdr_standards_import.scripts.entities.cdisc_ct.package import Package
+from mdr_standards_import.scripts.entities.cdisc_data_models.data_model_import import (
+    DataModelImport,
+)
+from mdr_standards_import.scripts.entities.cdisc_data_models.data_model_type import (
+    DataModelType,
+)
+from mdr_standards_import.scripts.entities.cdisc_data_models.version import Version
+
+LAST_MODIFIED = "Fri, 29 Mar 2024 00:00:00 GMT"
+
+
+def etag(href: str, data) -> str:
+    return f'"{href}-{len(json.dumps(data))}"'
+
+
+class StubCdiscApi(ThreadingHTTPServer):
+    """
+    Serves the JSON data of the hrefs, with an `ETag` and `Last-Modified` header.
+
+    The hrefs of `failures` fail with the given number of 503 responses before succeeding.
+    """
+
+    def __init__(self, data: dict, failures: dict = None, delay: float = 0):
+        super().__init__(("127.0.0.1", 0), StubCdiscApiHandler)
+        self.data = data
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class StubCdiscApiHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server: StubCdiscApi = self.server
+        href = self.path.removeprefix("/api")
+        with server.lock:
+            server.requests.append((href, dict(self.headers)))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            failing = server.failures.get(href, 0) > 0
+            if failing:
+                server.failures[href] -= 1
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+
+        current_etag = etag(href, server.data.get(href))
+        if failing:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif href not in server.data:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.headers.get("If-None-Match") == current_etag:
+            self.send_response(304)
+            self.end_headers()
+        else:
+            content = json.dumps(server.data[href]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.send_header("ETag", current_etag)
+            self.send_header("Last-Modified", LAST_MODIFIED)
+            self.end_headers()
+            self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(name="stub_api")
+def fixture_stub_api():
+    servers = []
+
+    def start(data: dict, failures: dict = None, delay: float = 0):
+        server = StubCdiscApi(data, failures, delay)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def client(server: StubCdiscApi, cache_directory, workers: int = 4):
+    return CdiscApiClient(
+        server.base_url,
+        {"Accept": "application/json"},
+        cache_directory=str(cache_directory),
+        workers=workers,
+        retries=2,
+        backoff_factor=0,
+        timeout=5,
+    )
+
+
+def package(catalogue: str, effective_date: str) -> Package:
+    href = f"/mdr/ct/packages/{catalogue}-{effective_date}"
+    package = Package(CTImport(effective_date, "TMP"))
+    package.set_catalogue_name(href)
+    package.set_href(href)
+    return package
+
+
+class TestCdiscApiClient:
+    def test__get_json__revalidates_cached_response(self, stub_api, tmp_path):
+        # given
+        server = stub_api({"/mdr/ct/packages": {"packages": ["sdtmct"]}})
+        api_client = client(server, tmp_path)
+
+        # when
+        first = api_client.get_json("/mdr/ct/packages")
+        # a new client, e.g. of the next run, uses the responses cached on disc
+        second = client(server, tmp_path).get_json("/mdr/ct/packages")
+
+        # then
+        assert first == second == {"packages": ["sdtmct"]}
+        (_, first_headers), (_, second_headers) = server.requests
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == etag(
+            "/mdr/ct/packages", {"packages": ["sdtmct"]}
+        )
+        assert second_headers["If-Modified-Since"] == LAST_MODIFIED
+        # the response is stored by the hash of its content
+        (objects_directory,) = listdir(tmp_path / "objects")
+        (content_file,) = listdir(tmp_path / "objects" / objects_directory)
+        assert content_file.startswith(objects_directory)
+
+    def test__get_json__downloads_changed_response(self, stub_api, tmp_path):
+        # given
+        server = stub_api({"/mdr/ct/packages": {"packages": ["sdtmct"]}})
+        api_client = client(server, tmp_path)
+        api_client.get_json("/mdr/ct/packages")
+
+        # when
+        server.data["/mdr/ct/packages"] = {"packages": ["sdtmct", "adamct"]}
+        changed = api_client.get_json("/mdr/ct/packages")
+
+        # then
+        assert changed == {"packages": ["sdtmct", "adamct"]}
+        assert server.requests[-1][1]["If-None-Match"] == etag(
+            "/mdr/ct/packages", {"packages": ["sdtmct"]}
+        )
+        # both contents are stored, the index refers to the latest one
+        assert len(list((tmp_path / "objects").glob("*/*.json"))) == 2
+        assert client(server, tmp_path).get_json("/mdr/ct/packages") == changed
+
+    def test__get_json__retries_failing_requests(self, stub_api, tmp_path):
+        # given
+        server = stub_api(
+            {"/mdr/ct/packages": {"packages": []}, "/mdr/sdtm/1-8": {}},
+            failures={"/mdr/ct/packages": 2, "/mdr/sdtm/1-8": 3},
+        )
+        api_client = client(server, tmp_path)
+
+        # when
+        packages = api_client.get_json("/mdr/ct/packages")
+
+        # then
+        assert packages == {"packages": []}
+        assert len(server.requests) == 3
+        with pytest.raises(HTTPError):
+            api_client.get_json("/mdr/sdtm/1-8")
+
+    def test__run_concurrently__bounds_requests_in_flight(self, stub_api, tmp_path):
+        # given
+        hrefs = [f"/mdr/sdtm/1-8/classes/{i}" for i in range(12)]
+        server = stub_api({href: {"href": href} for href in hrefs}, delay=0.05)
+        api_client = client(server, tmp_path, workers=3)
+
+        # when
+        results = api_client.run_concurrently(
+            lambda batch: api_client.run_concurrently(api_client.get_json, batch),
+            [hrefs[:6], hrefs[6:]],
+        )
+
+        # then
+        assert [result["href"] for batch in results for result in batch] == hrefs
+        assert 1 < server.max_in_flight <= 3
+
+    def test__run_concurrently__shares_threads_of_nested_calls(self, tmp_path):
+        # given
+        api_client = CdiscApiClient(
+            "http://127.0.0.1/api", {}, cache_directory=str(tmp_path), workers=2
+        )
+        threads = set()
+
+        def leaf(item):
+            threads.add(threading.current_thread())
+            time.sleep(0.01)
+            return item
+
+        # when
+        results = api_client.run_concurrently(
+            lambda outer: api_client.run_concurrently(
+                lambda inner: api_client.run_concurrently(
+                    leaf, range(inner, inner + 3)
+                ),
+                range(outer, outer + 3),
+            ),
+            range(3),
+        )
+
+        # then
+        assert results == [
+            [list(range(inner, inner + 3)) for inner in range(outer, outer + 3)]
+            for outer in range(3)
+        ]
+        # the threads of the pool, and the calling thread running the items not started yet
+        assert len(threads) <= 3
+
+
+class TestDownloadPackagesData:
+    def test__download_packages_data__resumes_with_missing_packages(
+        self, stub_api, tmp_path
+    ):
+        # given
+        packages = [
+            package("sdtmct", "2024-03-29"),
+            package("adamct", "2024-03-29"),
+            package("sendct", "2024-03-29"),
+        ]
+        server = stub_api(
+            {package.href: {"name": package.href} for package in packages},
+            failures={packages[1].href: 3},
+        )
+        to_directory = tmp_path / "cdisc_ct"
+
+        # when
+        with mock.patch.object(
+            download_json_data_from_cdisc_api,
+            "CDISC_API_CLIENT",
+            client(server, tmp_path / "cache"),
+        ):
+            download_json_data_from_cdisc_api.download_packages_data(
+                packages, str(to_directory)
+            )
+            downloaded = sorted(listdir(to_directory))
+            server.requests.clear()
+            download_json_data_from_cdisc_api.download_packages_data(
+                packages, str(to_directory)
+            )
+
+        # then
+        assert downloaded == ["sdtmct-2024-03-29.json", "sendct-2024-03-29.json"]
+        assert [href for href, _ in server.requests] == [packages[1].href]
+        assert sorted(listdir(to_directory)) == [
+            "adamct-2024-03-29.json",
+            "sdtmct-2024-03-29.json",
+            "sendct-2024-03-29.json",
+        ]
+        with open(path.join(to_directory, "adamct-2024-03-29.json")) as file:
+            assert json.load(file) == {"name": packages[1].href}
+
+
+class TestDownloadVersionsData:
+    def test__download_versions_data__skips_version_with_failing_classes(
+        self, stub_api, tmp_path
+    ):
+        # given
+        version = Version(
+            DataModelImport(
+                library="CDISC", catalogue="SDTM", version_number="2-0", author_id="TMP"
+            ),
+            "2-0",
+        )
+        version.set_catalogue_name("SDTM")
+        version.set_href("/mdr/sdtm/2-0")
+        class_href = "/mdr/sdtm/2-0/classes/Events"
+        server = stub_api(
+            {
+                version.href: {"name": "SDTM v2.0"},
+                f"{version.href}/classes": {
+                    "_links": {"classes": [{"href": class_href}]}
+                },
+                class_href: {"name": "Events", "_links": {}},
+            },
+            failures={f"{version.href}/classes": 3},
+        )
+        to_directory = tmp_path / "cdisc_data_models"
+        models_directory = to_directory / "SDTM" / "models"
+
+        # when
+        with mock.patch.object(
+            download_json_data_from_cdisc_api,
+            "CDISC_API_CLIENT",
+            client(server, tmp_path / "cache"),
+        ):
+            download_json_data_from_cdisc_api.download_versions_data(
+                "SDTM", DataModelType.FOUNDATIONAL.value, [version], str(to_directory)
+            )
+            downloaded = sorted(listdir(models_directory))
+            download_json_data_from_cdisc_api.download_versions_data(
+                "SDTM", DataModelType.FOUNDATIONAL.value, [version], str(to_directory)
+            )
+
+        # then
+        assert downloaded == []
+        assert sorted(listdir(models_directory)) == ["2-0.json"]
+        assert listdir(to_directory / "SDTM" / "classes" / "2-0") == ["Events.json"]
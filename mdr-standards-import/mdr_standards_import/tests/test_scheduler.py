@@ -0,0 +1,87 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mdr_standards_import.scripts.scheduler import DONE, FAILED, SKIPPED, Scheduler
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+
+    def record(self, step, fail=False, wait_for=None):
+        if wait_for is not None:
+            assert wait_for.wait(timeout=5)
+        with self.lock:
+            self.events.append(step)
+        if fail:
+            raise ValueError(step)
+
+
+class TestScheduler:
+    def test__run__tasks_after_their_dependencies(self):
+        # given
+        recorder = Recorder()
+        scheduler = Scheduler(4, executor_class=ThreadPoolExecutor)
+        first = scheduler.add("first", recorder.record, step="first")
+        second = scheduler.add(
+            "second", recorder.record, depends_on=[first], step="second"
+        )
+        scheduler.add("third", recorder.record, depends_on=[second], step="third")
+
+        # when
+        states = scheduler.run()
+
+        # then
+        assert states == {"first": DONE, "second": DONE, "third": DONE}
+        assert recorder.events == ["first", "second", "third"]
+
+    def test__run__independent_tasks_concurrently(self):
+        # given
+        recorder = Recorder()
+        started = threading.Event()
+        scheduler = Scheduler(2, executor_class=ThreadPoolExecutor)
+        # the first task only finishes once the second one started
+        scheduler.add("waiting", recorder.record, step="waiting", wait_for=started)
+        scheduler.add("starting", started.set)
+
+        # when
+        states = scheduler.run()
+
+        # then
+        assert states == {"waiting": DONE, "starting": DONE}
+
+    def test__run__skips_dependents_of_failed_tasks(self):
+        # given
+        recorder = Recorder()
+        scheduler = Scheduler(2, executor_class=ThreadPoolExecutor)
+        failing = scheduler.add("failing", recorder.record, step="failing", fail=True)
+        dependent = scheduler.add(
+            "dependent", recorder.record, depends_on=[failing], step="dependent"
+        )
+        scheduler.add(
+            "transitive", recorder.record, depends_on=[dependent], step="transitive"
+        )
+        scheduler.add("independent", recorder.record, step="independent")
+
+        # when
+        states = scheduler.run()
+
+        # then
+        assert states == {
+            "failing": FAILED,
+            "dependent": SKIPPED,
+            "transitive": SKIPPED,
+            "independent": DONE,
+        }
+        assert sorted(recorder.events) == ["failing", "independent"]
+
+    def test__add__unknown_dependency(self):
+        # given
+        scheduler = Scheduler(1)
+
+        # when, then
+        with pytest.raises(ValueError):
+            scheduler.add("task", print, depends_on=["unknown"])
@@ -120,6 +120,19 @@ TEXT_INDEXES = [
     ("Brand", "name"),
 ]
 
+# array of full-text indexes to create [label, properties]
+# The names are referenced by the API, see FulltextIndex in clinical_mdr_api/repositories/_utils.py
+FULLTEXT_INDEXES = [
+    ("ActivityValue", ["name", "name_sentence_case", "abbreviation"]),
+    ("ActivityInstanceValue", ["name", "name_sentence_case", "abbreviation"]),
+    ("ActivityGroupValue", ["name", "name_sentence_case", "abbreviation"]),
+    ("ActivitySubGroupValue", ["name", "name_sentence_case", "abbreviation"]),
+    ("CTTermNameValue", ["name", "name_sentence_case"]),
+    ("CTCodelistNameValue", ["name"]),
+    ("SyntaxTemplateValue", ["name", "name_plain"]),
+    ("DictionaryTermValue", ["name", "name_sentence_case", "abbreviation"]),
+]
+
 # array of relation indexes to create [type, property]
 REL_INDEXES = [
     ("CONTAINS_DATASET", "href"),
@@ -237,6 +250,13 @@ def build_create_node_text_index_query(data):
     return query
 
 
+def build_create_fulltext_index_query(data):
+    label, props = data
+    properties = ", ".join(f"n.{prop}" for prop in props)
+    query = f"CREATE FULLTEXT INDEX fulltext_{label} IF NOT EXISTS FOR (n:{label}) ON EACH [{properties}]"
+    return query
+
+
 def build_create_rel_index_query(data):
     label, prop = data
     name = label + "_" + prop
@@ -277,6 +297,10 @@ def build_schema_queries():
         query = build_create_node_text_index_query(idx)
         queries.append(query)
 
+    for idx in FULLTEXT_INDEXES:
+        query = build_create_fulltext_index_query(idx)
+        queries.append(query)
+
     for idx in REL_INDEXES:
         query = build_create_rel_index_query(idx)
         queries.append(query)
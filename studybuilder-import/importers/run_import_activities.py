@@ -244,7 +244,7 @@ class Activities(BaseImporter):
     async def handle_activity_groups(self, csvfile, session):
         # Populate then activity groups in sponsor library
         csv_data = csv.DictReader(csvfile)
-        api_tasks = []
+        new_groups = []
 
         existing_rows = self.api.get_all_identifiers(
             self.api.get_all_from_api(ACTIVITY_GROUPS_PATH),
@@ -273,16 +273,16 @@ class Activities(BaseImporter):
                 self.log.info(
                     f"Add activity group '{data['body']['name']}' to library '{data['body']['library_name']}'"
                 )
-                api_tasks.append(
-                    self.api.post_then_approve(data=data, session=session, approve=True)
-                )  # TODO Verify if activity groups can be approved?
+                new_groups.append(data["body"])
             else:
                 # Already exists, skip.
                 # Do we need patch functionality here?
                 self.log.info(
                     f"Item '{data['body']['name']}' already exists in library '{data['body']['library_name']}'"
                 )
-        await asyncio.gather(*api_tasks)
+        await self.api.post_batch_then_approve(
+            ACTIVITY_GROUPS_PATH, new_groups, session=session, approve=True
+        )
 
     @open_file_async()
     async def handle_activity_subgroups(self, csvfile, session):
@@ -307,6 +307,7 @@ class Activities(BaseImporter):
             }
 
         api_tasks = []
+        new_subgroups = []
 
         unique_subgroups = {}
 
@@ -389,10 +390,13 @@ class Activities(BaseImporter):
                 self.log.info(
                     f"Adding subgroup '{subgroup_name}' to groups '{group_name}'"
                 )
-                api_tasks.append(
-                    self.api.post_then_approve(data=data, session=session, approve=True)
-                )
-        await asyncio.gather(*api_tasks)
+                new_subgroups.append(data["body"])
+        await asyncio.gather(
+            *api_tasks,
+            self.api.post_batch_then_approve(
+                ACTIVITY_SUBGROUPS_PATH, new_subgroups, session=session, approve=True
+            ),
+        )
 
     def _are_groupings_equal(self, old, new):
         # Convert both old and new to lists of tuples, (group_uid, subgroup_uid)
@@ -453,6 +457,7 @@ class Activities(BaseImporter):
             }
 
         api_tasks = []
+        new_activities = []
 
         unique_activities = {}
 
@@ -576,17 +581,18 @@ class Activities(BaseImporter):
                         "body": item_data,
                     }
                     self.log.info(f"Adding activity '{activity_name}'")
-                    api_tasks.append(
-                        self.api.post_then_approve(
-                            data=data, session=session, approve=True
-                        )
-                    )
+                    new_activities.append(data["body"])
             except ConflictingItemError as e:
                 self.log.warning(
                     f"Activity '{activity_name}' already exists as {e}, skipping"
                 )
 
-        await asyncio.gather(*api_tasks)
+        await asyncio.gather(
+            *api_tasks,
+            self.api.post_batch_then_approve(
+                ACTIVITIES_PATH, new_activities, session=session, approve=True
+            ),
+        )
 
     def get_existing_activity(self, activity_name, existing_activities):
         if activity_name in existing_activities:
@@ -1151,6 +1157,7 @@ class Activities(BaseImporter):
     async def handle_activity_instances(self, csvfile, session):
         readCSV = csv.DictReader(csvfile, delimiter=",")
         api_tasks = []
+        new_instances = []
 
         # get only Final activities in Sponsor library
         activity_filters = {
@@ -1391,11 +1398,7 @@ class Activities(BaseImporter):
                 and topic_code not in existing_rows_by_tc
             ):
                 self.log.info(f"Adding activity instance '{activity_instance_name}'")
-                api_tasks.append(
-                    self.api.post_then_approve(
-                        data=activity_instance_data, session=session, approve=True
-                    )
-                )
+                new_instances.append(activity_instance_data["body"])
             elif (
                 activity_instance_name in existing_rows_by_name
                 and existing_rows_by_name[activity_instance_name]["topic_code"]
@@ -1431,7 +1434,12 @@ class Activities(BaseImporter):
                 self.log.info(
                     f"Identical activity instance '{activity_instance_name}' already exists"
                 )
-        await asyncio.gather(*api_tasks)
+        await asyncio.gather(
+            *api_tasks,
+            self.api.post_batch_then_approve(
+                ACTIVITY_INSTANCES_PATH, new_instances, session=session, approve=True
+            ),
+        )
 
     # Get the item class for combination of column name and domain
     def _get_item_class(self, col, domain):
@@ -189,6 +189,7 @@ class Units(BaseImporter):
         readCSV = csv.reader(csvfile, delimiter=",")
         headers = next(readCSV)
         api_tasks = []
+        new_units = []
         existing_units = self.api.get_all_from_api("/concepts/unit-definitions")
         if existing_units is None:
             existing_units = []
@@ -378,11 +379,14 @@ class Units(BaseImporter):
                 self.log.info(
                     f"Adding unit '{name}' with ct codes: {ct_units}, part of subsets: {unit_subsets}"
                 )
-                api_tasks.append(
-                    self.api.post_then_approve(data=data, session=session, approve=True)
-                )
+                new_units.append(data["body"])
 
-        await asyncio.gather(*api_tasks)
+        await asyncio.gather(
+            *api_tasks,
+            self.api.post_batch_then_approve(
+                "/concepts/unit-definitions", new_units, session=session, approve=True
+            ),
+        )
 
     def are_units_equal(self, new, existing):
         simple_fields = [
@@ -85,6 +85,9 @@ UNIT_SUBSET_ENDPOINT_UNIT = "Endpoint Unit"
 
 SLEEP_BEFORE_APPROVE = 0.05
 
+# Number of library items created, and approved, by a single batch request
+POST_BATCH_SIZE = 100
+
 
 def status_ok(status):
     return 200 <= status < 300
@@ -868,6 +871,45 @@ class ApiBinding:
             self.log.error("No uid returned, unable to approve")
         return response
 
+    async def post_batch_then_approve(
+        self,
+        path: str,
+        items: Sequence[dict],
+        session: aiohttp.ClientSession,
+        approve: bool,
+    ):
+        """
+        Creates the items with the batch endpoint of the path, approving them if `approve` is set.
+
+        The items are posted by batches of POST_BATCH_SIZE items, each item is created and approved in its own transaction.
+        Returns the created items. The items that failed, to be created or approved, are not created and are logged.
+        """
+        created = []
+        url = path_join(path, "batch") + ("?approve=true" if approve else "")
+        for start in range(0, len(items), POST_BATCH_SIZE):
+            batch = items[start : start + POST_BATCH_SIZE]
+            self.log.debug(f"Post batch of {len(batch)} items to {path}")
+            status, response = await self.post_to_api_async(
+                url=url, body=list(batch), session=session
+            )
+            if not status_ok(status):
+                self.log.error(
+                    f"Failed to post batch of {len(batch)} items to '{path}', error: {get_error_message(response)}"
+                )
+                self.metrics.icrement(path + "--BatchError", len(batch))
+                continue
+            for body, result in zip(batch, response):
+                if status_ok(result["response_code"]):
+                    created.append(result["content"])
+                    self.metrics.icrement(path + "--Batch")
+                else:
+                    name = body.get("name", str(body))
+                    self.log.error(
+                        f"Failed to post '{name}' to '{path}', error: {get_error_message(result['content'])}"
+                    )
+                    self.metrics.icrement(path + "--BatchError")
+        return created
+
     async def new_version_patch_then_approve(
         self, data: dict, session: aiohttp.ClientSession, approve: bool
     ):